@@ -0,0 +1 @@
+"""Performance benchmarks for engine internals."""
@@ -0,0 +1,126 @@
+"""Benchmark evicting a cache directory down to a target size.
+
+Fills a directory with N small files spread over subdirectories, then evicts half of its
+contents two ways:
+
+- "rescan per delete": the previous OSManager cleanup, which re-measured the whole directory
+  after every deleted file (O(files^2)); only run up to --legacy-max-files
+- "managed": ManagedCacheDirectory, which ranks the files once and keeps a running total
+
+For the managed strategy it also reports the cost of indexing the directory on first use
+("index") and of checking the size of an already indexed directory ("size check"), which is
+what a WriteFileRequest into a managed directory pays.
+
+Usage:
+    python scripts/benchmarks/bench_cache_directory_eviction.py --sizes 1000 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from griptape_nodes.common.managed_cache_directory import ManagedCacheDirectory
+
+console = Console()
+
+FILES_PER_SUBDIRECTORY = 1000
+
+
+def _fill(directory: Path, size: int, file_bytes: int) -> int:
+    payload = b"x" * file_bytes
+    for i in range(size):
+        subdirectory = directory / f"batch_{i // FILES_PER_SUBDIRECTORY}"
+        if i % FILES_PER_SUBDIRECTORY == 0:
+            subdirectory.mkdir(parents=True, exist_ok=True)
+        path = subdirectory / f"file_{i}.bin"
+        path.write_bytes(payload)
+        os.utime(path, (1_000_000 + i, 1_000_000 + i))
+    return size * file_bytes
+
+
+def _directory_size(directory: Path) -> int:
+    return sum((Path(root) / name).stat().st_size for root, _, names in os.walk(directory) for name in names)
+
+
+def _rescan_per_delete(directory: Path, target_bytes: int) -> float:
+    start = time.perf_counter()
+    files = sorted((path for path in directory.rglob("*") if path.is_file()), key=lambda path: path.stat().st_mtime)
+    for path in files:
+        path.unlink()
+        if _directory_size(directory) <= target_bytes:
+            break
+    return time.perf_counter() - start
+
+
+def _managed(directory: Path, target_bytes: int, index_path: Path) -> dict[str, float]:
+    managed = ManagedCacheDirectory(directory, index_path=index_path)
+
+    start = time.perf_counter()
+    managed.reconcile()
+    index_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        _ = managed.size_bytes
+    size_check_s = (time.perf_counter() - start) / 1000
+
+    start = time.perf_counter()
+    managed.evict_to(target_bytes)
+    evict_s = time.perf_counter() - start
+
+    return {"index": index_s, "size_check": size_check_s, "evict": evict_s}
+
+
+def bench(size: int, file_bytes: int, *, run_legacy: bool) -> dict[str, float | None]:
+    """Return the time in seconds of each step for a directory of `size` files."""
+    results: dict[str, float | None] = {"rescan_per_delete": None}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        if run_legacy:
+            legacy_directory = root / "legacy"
+            total = _fill(legacy_directory, size, file_bytes)
+            results["rescan_per_delete"] = _rescan_per_delete(legacy_directory, total // 2)
+
+        managed_directory = root / "managed"
+        total = _fill(managed_directory, size, file_bytes)
+        results.update(_managed(managed_directory, total // 2, root / "index.json"))
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--file-bytes", type=int, default=1024)
+    parser.add_argument("--legacy-max-files", type=int, default=2000)
+    args = parser.parse_args()
+
+    table = Table(title="Evicting half of a cache directory of N files (ms)")
+    table.add_column("files", justify="right")
+    table.add_column("rescan per delete", justify="right")
+    table.add_column("managed index", justify="right")
+    table.add_column("managed size check", justify="right")
+    table.add_column("managed evict", justify="right")
+    for size in args.sizes:
+        results = bench(size, args.file_bytes, run_legacy=size <= args.legacy_max_files)
+        legacy = results["rescan_per_delete"]
+        table.add_row(
+            str(size),
+            "skipped" if legacy is None else f"{legacy * 1000:.1f}",
+            f"{results['index'] * 1000:.1f}",  # type: ignore[operator]
+            f"{results['size_check'] * 1000:.4f}",  # type: ignore[operator]
+            f"{results['evict'] * 1000:.1f}",  # type: ignore[operator]
+        )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
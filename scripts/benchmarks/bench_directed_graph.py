@@ -0,0 +1,105 @@
+"""Micro-benchmark DirectedGraph degree queries, successor lookups and node removal.
+
+Builds layered graphs of increasing size and reports the mean cost per call. With the
+successor index these should stay flat as the graph grows; the "scan" column shows what
+out_degree cost when it had to walk every predecessor set in the graph.
+
+Usage:
+    python scripts/benchmarks/bench_directed_graph.py --sizes 1000 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from griptape_nodes.common.directed_graph import DirectedGraph
+
+console = Console()
+
+FAN_OUT = 4
+SAMPLES = 1000
+
+
+def build_layered(size: int) -> DirectedGraph:
+    """Build a graph where each node has edges to FAN_OUT nodes further along."""
+    graph = DirectedGraph()
+    for i in range(size):
+        graph.add_node(f"n{i}")
+        for j in range(1, FAN_OUT + 1):
+            if i + j < size:
+                graph.add_edge(f"n{i}", f"n{i + j}")
+    return graph
+
+
+def _scan_out_degree(graph: DirectedGraph, node: str) -> int:
+    return sum(1 for predecessors in graph._predecessors.values() if node in predecessors)
+
+
+def _mean_ns(total_seconds: float, calls: int) -> float:
+    return total_seconds / calls * 1e9
+
+
+def bench(size: int) -> dict[str, float]:
+    """Return the mean nanoseconds per call for each operation on a graph of `size` nodes."""
+    graph = build_layered(size)
+    rng = random.Random(size)  # noqa: S311
+    sample = [f"n{rng.randrange(size)}" for _ in range(SAMPLES)]
+
+    start = time.perf_counter()
+    for node in sample:
+        graph.out_degree(node)
+    out_degree = _mean_ns(time.perf_counter() - start, SAMPLES)
+
+    scan_samples = sample[: max(1, SAMPLES // 100)]
+    start = time.perf_counter()
+    for node in scan_samples:
+        _scan_out_degree(graph, node)
+    scan = _mean_ns(time.perf_counter() - start, len(scan_samples))
+
+    start = time.perf_counter()
+    for node in sample:
+        graph.successors(node)
+    successors = _mean_ns(time.perf_counter() - start, SAMPLES)
+
+    to_remove = list(dict.fromkeys(sample))
+    start = time.perf_counter()
+    for node in to_remove:
+        graph.remove_node(node)
+    remove = _mean_ns(time.perf_counter() - start, len(to_remove))
+
+    return {"out_degree": out_degree, "scan": scan, "successors": successors, "remove_node": remove}
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    table = Table(title="DirectedGraph mean cost per call (ns)")
+    table.add_column("nodes", justify="right")
+    table.add_column("out_degree", justify="right")
+    table.add_column("out_degree (scan)", justify="right")
+    table.add_column("successors", justify="right")
+    table.add_column("remove_node", justify="right")
+
+    for size in args.sizes:
+        results = bench(size)
+        table.add_row(
+            str(size),
+            f"{results['out_degree']:.0f}",
+            f"{results['scan']:.0f}",
+            f"{results['successors']:.0f}",
+            f"{results['remove_node']:.0f}",
+        )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
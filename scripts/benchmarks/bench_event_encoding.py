@@ -0,0 +1,111 @@
+"""Benchmark encoding engine events into WebSocket frames.
+
+Encodes N ParameterValueUpdateEvent execution events (the ExecutionEvent that executors
+publish as "execution_event") into the frame Client sends, and reports throughput in
+events/sec:
+
+- "previous": pydantic's generic dict() for the event envelope, a fresh JSON encoder per
+  event, then parsing that JSON and encoding the whole message again (the old path through
+  SubprocessWebSocketSender/RequestClient and Client.publish)
+- "json": BaseEvent.json() spliced into the message by Client.publish_json, encoded once
+- "msgpack": BaseEvent.dict() packed into a binary frame, as on a connection that negotiated
+  msgpack (only when the optional msgpack package is installed)
+
+Usage:
+    python scripts/benchmarks/bench_event_encoding.py --sizes 10000 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from griptape_nodes.api_client.wire_encoding import WireEncoding, encode_json_payload_message, encode_message
+from griptape_nodes.retained_mode.events.base_events import ExecutionEvent
+from griptape_nodes.retained_mode.events.execution_events import ParameterValueUpdateEvent
+
+console = Console()
+
+TOPIC = "sessions/bench/response"
+
+
+def _make_events(size: int) -> list[ExecutionEvent]:
+    return [
+        ExecutionEvent(
+            payload=ParameterValueUpdateEvent(
+                node_name=f"Node_{i % 50}",
+                parameter_name="output",
+                data_type="dict",
+                value={"step": i, "progress": i / size, "label": "denoising", "tags": ["a", "b"]},
+            )
+        )
+        for i in range(size)
+    ]
+
+
+def _time_previous(events: list[ExecutionEvent]) -> float:
+    start = time.perf_counter()
+    for event in events:
+        # Passing an argument to dict() takes pydantic's generic serializer, as dict() always did.
+        payload_json = json.dumps(event.dict(exclude=set()), default=str)
+        json.dumps({"type": "execution_event", "payload": json.loads(payload_json), "topic": TOPIC})
+    return time.perf_counter() - start
+
+
+def _time_json(events: list[ExecutionEvent]) -> float:
+    start = time.perf_counter()
+    for event in events:
+        encode_json_payload_message("execution_event", event.json(), TOPIC)
+    return time.perf_counter() - start
+
+
+def _time_msgpack(events: list[ExecutionEvent]) -> float:
+    start = time.perf_counter()
+    for event in events:
+        encode_message({"type": "execution_event", "payload": event.dict(), "topic": TOPIC}, WireEncoding.MSGPACK)
+    return time.perf_counter() - start
+
+
+def bench(size: int) -> dict[str, float | None]:
+    """Return the throughput in events/sec of each encoding path for `size` events."""
+    events = _make_events(size)
+    # Warm the per-class caches and converter hooks so every path is measured steady-state.
+    _time_previous(events[:10])
+    _time_json(events[:10])
+    return {
+        "previous": size / _time_previous(events),
+        "json": size / _time_json(events),
+        "msgpack": size / _time_msgpack(events) if WireEncoding.MSGPACK.is_available() else None,
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000])
+    args = parser.parse_args()
+
+    table = Table(title="Encoding ParameterValueUpdateEvent frames (events/sec)")
+    table.add_column("events", justify="right")
+    table.add_column("previous", justify="right")
+    table.add_column("json", justify="right")
+    table.add_column("msgpack", justify="right")
+    for size in args.sizes:
+        results = bench(size)
+        msgpack_rate = results["msgpack"]
+        table.add_row(
+            str(size),
+            f"{results['previous']:,.0f}",
+            f"{results['json']:,.0f}",
+            f"{msgpack_rate:,.0f}" if msgpack_rate is not None else "n/a (msgpack not installed)",
+        )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
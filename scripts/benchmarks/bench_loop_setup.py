@@ -0,0 +1,235 @@
+"""Benchmark the per-iteration setup cost of local loop execution.
+
+Local loop execution deserializes one copy of the loop body per iteration and then sets
+the iteration's values on each copy's Start node. This replays that setup for N
+iterations of a small body (Start -> --body-nodes data nodes -> End) and reports the
+setup cost per iteration. "first 10%" and "last 10%" are the mean cost of deserializing
+the earliest and latest copies: they should match, since a copy shouldn't get more
+expensive just because more copies already exist.
+
+Start node values are set both ways: one SetParameterValueRequest per parameter and one
+BatchSetParameterValuesRequest per Start node.
+
+Usage:
+    python scripts/benchmarks/bench_loop_setup.py --sizes 20 100 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Any
+
+from rich.console import Console
+from rich.table import Table
+
+from griptape_nodes.exe_types.core_types import Parameter, ParameterMode
+from griptape_nodes.exe_types.node_types import DataNode, EndNode, StartNode
+from griptape_nodes.node_library.library_registry import LibraryMetadata, LibraryRegistry, LibrarySchema, NodeMetadata
+from griptape_nodes.retained_mode.events.connection_events import CreateConnectionRequest
+from griptape_nodes.retained_mode.events.flow_events import (
+    CreateFlowRequest,
+    DeleteFlowRequest,
+    DeserializeFlowFromCommandsRequest,
+    DeserializeFlowFromCommandsResultSuccess,
+    SerializeFlowToCommandsRequest,
+    SerializeFlowToCommandsResultSuccess,
+)
+from griptape_nodes.retained_mode.events.node_events import CreateNodeRequest
+from griptape_nodes.retained_mode.events.parameter_events import (
+    BatchSetParameterValuesRequest,
+    SetParameterValueRequest,
+)
+from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
+
+console = Console()
+
+LIBRARY_NAME = "bench_loop_setup"
+START_PARAMETERS = ("index", "item", "label")
+
+
+class BenchStart(StartNode):
+    """Start node with one output per iteration value."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        for name in START_PARAMETERS:
+            self.add_parameter(
+                Parameter(
+                    name=name,
+                    type="str",
+                    default_value="",
+                    allowed_modes={ParameterMode.OUTPUT, ParameterMode.PROPERTY},
+                )
+            )
+
+
+class BenchBody(DataNode):
+    """Body node that passes its input through."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        for name in ("value", "prompt", "model", "seed"):
+            self.add_parameter(Parameter(name=name, type="str", default_value=""))
+        self.add_parameter(Parameter(name="output", type="str", allowed_modes={ParameterMode.OUTPUT}))
+
+    def process(self) -> None:
+        self.parameter_output_values["output"] = self.get_parameter_value("value")
+
+
+class BenchEnd(EndNode):
+    """End node collecting the body's output."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.add_parameter(
+            Parameter(name="result", type="str", allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY})
+        )
+
+
+def _register_library() -> None:
+    library = LibraryRegistry.generate_new_library(
+        library_data=LibrarySchema(
+            name=LIBRARY_NAME,
+            library_schema_version=LibrarySchema.LATEST_SCHEMA_VERSION,
+            metadata=LibraryMetadata(
+                author="bench", description="bench", library_version="1.0.0", engine_version="1.0.0", tags=[]
+            ),
+            categories=[],
+            nodes=[],
+        )
+    )
+    for node_class in (BenchStart, BenchBody, BenchEnd):
+        library.register_new_node_type(
+            node_class, NodeMetadata(category="bench", description="bench", display_name=node_class.__name__)
+        )
+
+
+def _serialize_body(body_nodes: int) -> Any:
+    """Build the loop body flow and return its serialized commands."""
+    GriptapeNodes.handle_request(CreateFlowRequest(parent_flow_name=None, flow_name="body", set_as_new_context=True))
+    GriptapeNodes.handle_request(
+        CreateNodeRequest(node_type="BenchStart", node_name="Start", specific_library_name=LIBRARY_NAME)
+    )
+    source, source_parameter = "Start", "index"
+    for i in range(body_nodes):
+        node_name = f"Body{i}"
+        GriptapeNodes.handle_request(
+            CreateNodeRequest(node_type="BenchBody", node_name=node_name, specific_library_name=LIBRARY_NAME)
+        )
+        GriptapeNodes.handle_request(SetParameterValueRequest(node_name=node_name, parameter_name="prompt", value="p"))
+        GriptapeNodes.handle_request(
+            CreateConnectionRequest(
+                source_node_name=source,
+                source_parameter_name=source_parameter,
+                target_node_name=node_name,
+                target_parameter_name="value",
+            )
+        )
+        source, source_parameter = node_name, "output"
+    GriptapeNodes.handle_request(
+        CreateNodeRequest(node_type="BenchEnd", node_name="End", specific_library_name=LIBRARY_NAME)
+    )
+    GriptapeNodes.handle_request(
+        CreateConnectionRequest(
+            source_node_name=source,
+            source_parameter_name=source_parameter,
+            target_node_name="End",
+            target_parameter_name="result",
+        )
+    )
+    result = GriptapeNodes.handle_request(SerializeFlowToCommandsRequest(flow_name="body"))
+    if not isinstance(result, SerializeFlowToCommandsResultSuccess):
+        msg = f"Failed to serialize the loop body: {result.result_details}"
+        raise RuntimeError(msg)  # noqa: TRY004
+    return result.serialized_flow_commands
+
+
+async def _set_start_values(start_node_names: list[str], *, batched: bool) -> None:
+    for index, node_name in enumerate(start_node_names):
+        values = {name: f"{name}-{index}" for name in START_PARAMETERS}
+        if batched:
+            await GriptapeNodes.ahandle_request(
+                BatchSetParameterValuesRequest(node_name=node_name, parameter_values=values)
+            )
+        else:
+            for name, value in values.items():
+                await GriptapeNodes.ahandle_request(
+                    SetParameterValueRequest(node_name=node_name, parameter_name=name, value=value)
+                )
+
+
+def bench(size: int, commands: Any) -> dict[str, float]:
+    """Return per-iteration setup costs in seconds for `size` iterations."""
+    context_manager = GriptapeNodes.ContextManager()
+    flow_names = []
+    start_node_names = []
+    durations = []
+    for _ in range(size):
+        start = time.perf_counter()
+        result = GriptapeNodes.handle_request(DeserializeFlowFromCommandsRequest(serialized_flow_commands=commands))
+        durations.append(time.perf_counter() - start)
+        if not isinstance(result, DeserializeFlowFromCommandsResultSuccess):
+            msg = f"Failed to deserialize the loop body: {result.result_details}"
+            raise RuntimeError(msg)  # noqa: TRY004
+        # Keep every copy at the same level, as local loop execution does.
+        if context_manager.get_current_flow().name == result.flow_name:
+            context_manager.pop_flow()
+        flow_names.append(result.flow_name)
+        start_node_names.append(result.node_name_mappings["Start"])
+
+    start = time.perf_counter()
+    asyncio.run(_set_start_values(start_node_names, batched=False))
+    per_parameter_s = time.perf_counter() - start
+    start = time.perf_counter()
+    asyncio.run(_set_start_values(start_node_names, batched=True))
+    batched_s = time.perf_counter() - start
+
+    for flow_name in flow_names:
+        GriptapeNodes.handle_request(DeleteFlowRequest(flow_name=flow_name))
+
+    tenth = max(size // 10, 1)
+    return {
+        "deserialize": sum(durations) / size,
+        "first": sum(durations[:tenth]) / tenth,
+        "last": sum(durations[-tenth:]) / tenth,
+        "per_parameter": per_parameter_s / size,
+        "batched": batched_s / size,
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20, 100, 300])
+    parser.add_argument("--body-nodes", type=int, default=5)
+    args = parser.parse_args()
+
+    _register_library()
+    GriptapeNodes.ContextManager().push_workflow("bench_loop_setup")
+    commands = _serialize_body(args.body_nodes)
+
+    table = Table(title=f"Loop setup cost per iteration, {args.body_nodes + 2}-node body (ms)")
+    table.add_column("iterations", justify="right")
+    table.add_column("deserialize", justify="right")
+    table.add_column("first 10%", justify="right")
+    table.add_column("last 10%", justify="right")
+    table.add_column("set values, per parameter", justify="right")
+    table.add_column("set values, batched", justify="right")
+    for size in args.sizes:
+        results = bench(size, commands)
+        table.add_row(
+            str(size),
+            f"{results['deserialize'] * 1000:.2f}",
+            f"{results['first'] * 1000:.2f}",
+            f"{results['last'] * 1000:.2f}",
+            f"{results['per_parameter'] * 1000:.3f}",
+            f"{results['batched'] * 1000:.3f}",
+        )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Benchmark NodePriorityQueue scheduling decisions with many ready nodes.
+
+Fills the queue with N ready nodes scattered over a canvas, then simulates the parallel
+resolver draining it: each tick pops up to --parallel nodes, "resolves" them one by one
+(updating the last resolved node and its successors and marking priorities stale), and
+enqueues a couple of newly unblocked nodes. Reports the mean cost per scheduling decision.
+
+Usage:
+    python scripts/benchmarks/bench_node_priority_queue.py --sizes 250 500 1000 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from types import SimpleNamespace
+
+from rich.console import Console
+from rich.table import Table
+
+from griptape_nodes.machines.dag_builder import DagBuilder, DagNode
+from griptape_nodes.machines.parallel_resolution import ParallelResolutionContext
+
+console = Console()
+
+CANVAS_SIZE = 10_000
+NEW_NODES_PER_RESOLUTION = 2
+SUCCESSORS_PER_RESOLUTION = 3
+
+
+def _add_node(context: ParallelResolutionContext, name: str, rng: random.Random) -> DagNode:
+    node = SimpleNamespace(
+        name=name,
+        metadata={"position": {"x": rng.randrange(CANVAS_SIZE), "y": rng.randrange(CANVAS_SIZE)}},
+        can_queue_for_execution=lambda: True,
+    )
+    dag_node = DagNode(node_reference=node)  # type: ignore[arg-type]
+    context.node_to_reference[name] = dag_node
+    return dag_node
+
+
+def bench(size: int, parallel: int) -> tuple[float, float, int]:
+    """Return (seconds to fill, seconds to drain, scheduling decisions) for `size` ready nodes."""
+    rng = random.Random(size)  # noqa: S311
+    context = ParallelResolutionContext("bench", dag_builder=DagBuilder())
+    queue = context.node_priority_queue
+
+    start = time.perf_counter()
+    for i in range(size):
+        queue.add_node(_add_node(context, f"n{i}", rng))
+    fill = time.perf_counter() - start
+
+    # Half as many nodes again get unblocked while the queue drains
+    pending = [f"late{i}" for i in range(size // 2)]
+    decisions = 0
+    start = time.perf_counter()
+    while True:
+        running = []
+        for _ in range(parallel):
+            name = queue.get_next_node()
+            if name is None:
+                break
+            running.append(name)
+            decisions += 1
+        if not running:
+            break
+        for name in running:
+            context.last_resolved_node = context.node_to_reference[name].node_reference
+            for _ in range(NEW_NODES_PER_RESOLUTION):
+                if pending:
+                    queue.add_node(_add_node(context, pending.pop(), rng))
+            queued = list(queue._entries)
+            queue.set_last_resolved_successors(set(rng.sample(queued, min(SUCCESSORS_PER_RESOLUTION, len(queued)))))
+            queue.mark_priorities_stale()
+    drain = time.perf_counter() - start
+    return fill, drain, decisions
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[250, 500, 1000, 2000])
+    parser.add_argument("--parallel", type=int, default=5)
+    args = parser.parse_args()
+
+    table = Table(title="NodePriorityQueue scheduling cost")
+    table.add_column("ready nodes", justify="right")
+    table.add_column("fill (ms)", justify="right")
+    table.add_column("drain (ms)", justify="right")
+    table.add_column("decisions", justify="right")
+    table.add_column("µs / decision", justify="right")
+
+    for size in args.sizes:
+        fill, drain, decisions = bench(size, args.parallel)
+        table.add_row(
+            str(size),
+            f"{fill * 1000:.2f}",
+            f"{drain * 1000:.2f}",
+            str(decisions),
+            f"{drain / decisions * 1e6:.1f}" if decisions else "-",
+        )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark parameter lookups on nodes with many parameters.
+
+Builds a node with N parameters, split between top-level parameters and the items of
+one ParameterList, then times:
+
+- "build": adding every parameter (each add checks for duplicate names)
+- "by name": get_parameter_by_name for every parameter
+- "parameters": reading node.parameters once per parameter, as per-parameter loops
+  over a node do
+- "rename": renaming every parameter and looking it up under its new name
+
+Every column is the total in milliseconds; with indexed lookups each should grow
+roughly linearly with N.
+
+Usage:
+    python scripts/benchmarks/bench_parameter_lookup.py --sizes 500 1000 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from griptape_nodes.exe_types.core_types import Parameter, ParameterList
+from griptape_nodes.exe_types.node_types import DataNode
+
+console = Console()
+
+
+def _build_node(size: int) -> DataNode:
+    node = DataNode(name="bench")
+    top_level = size // 2
+    for i in range(top_level):
+        node.add_parameter(Parameter(name=f"param_{i}", type="str", tooltip="bench"))
+    items = ParameterList(name="items", input_types=["str"], tooltip="bench")
+    node.add_parameter(items)
+    for _ in range(size - top_level - 1):
+        items.add_child_parameter()
+    return node
+
+
+def bench(size: int) -> dict[str, float]:
+    """Return the total time in seconds of each lookup pattern for a node with `size` parameters."""
+    start = time.perf_counter()
+    node = _build_node(size)
+    build_s = time.perf_counter() - start
+    names = [parameter.name for parameter in node.parameters]
+
+    start = time.perf_counter()
+    for name in names:
+        node.get_parameter_by_name(name)
+    by_name_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in names:
+        node.parameters  # noqa: B018
+    parameters_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for name in names:
+        parameter = node.get_parameter_by_name(name)
+        if parameter is not None:
+            parameter.name = f"{name}_renamed"
+            node.get_parameter_by_name(parameter.name)
+    rename_s = time.perf_counter() - start
+
+    return {"build": build_s, "by_name": by_name_s, "parameters": parameters_s, "rename": rename_s}
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 1000, 2000])
+    args = parser.parse_args()
+
+    # The first node pays one-time engine initialization; keep that out of the timings.
+    _build_node(2)
+
+    table = Table(title="Parameter lookups on a node with N parameters (ms total)")
+    table.add_column("parameters", justify="right")
+    table.add_column("build", justify="right")
+    table.add_column("by name", justify="right")
+    table.add_column("parameters", justify="right")
+    table.add_column("rename", justify="right")
+    for size in args.sizes:
+        results = bench(size)
+        table.add_row(
+            str(size),
+            f"{results['build'] * 1000:.1f}",
+            f"{results['by_name'] * 1000:.1f}",
+            f"{results['parameters'] * 1000:.1f}",
+            f"{results['rename'] * 1000:.1f}",
+        )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Benchmark running N CPU-bound nodes concurrently with and without THREAD process offload.
+
+Each node's synchronous process() compresses a buffer with zlib, which releases the GIL
+while it works, the way image, array and hashing libraries do. With the default
+EVENT_LOOP offload the nodes run one after another on the event loop; with THREAD they
+run in the node thread pool and overlap. The "loop stall" columns report the longest
+gap a 5ms ticker coroutine saw, i.e. how long event delivery would have been blocked.
+
+Pass --work python to use a pure-Python loop instead. Those bodies hold the GIL, so they
+don't overlap in threads, but they stop stalling the event loop. --work sleep uses a
+blocking sleep, standing in for synchronous network or disk calls; it overlaps even on a
+single core.
+
+Usage:
+    python scripts/benchmarks/bench_process_offload.py --sizes 1 2 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import time
+import zlib
+
+from rich.console import Console
+from rich.table import Table
+
+from griptape_nodes.exe_types.node_types import BaseNode
+from griptape_nodes.node_library.library_declarations import ProcessOffload
+from griptape_nodes.utils.node_thread_pool import get_node_thread_pool, shutdown_node_thread_pool
+
+console = Console()
+
+TICK_S = 0.005
+PAYLOAD = os.urandom(1 << 20) * 16
+PYTHON_ITERATIONS = 3_000_000
+SLEEP_S = 0.25
+
+
+class CompressNode(BaseNode):
+    """Node whose process() is GIL-releasing CPU work."""
+
+    def process(self) -> None:
+        self.parameter_output_values["size"] = len(zlib.compress(PAYLOAD, 6))
+
+
+class PythonLoopNode(BaseNode):
+    """Node whose process() is pure-Python CPU work."""
+
+    def process(self) -> None:
+        total = 0
+        for i in range(PYTHON_ITERATIONS):
+            total += i * i
+        self.parameter_output_values["total"] = total
+
+
+class BlockingSleepNode(BaseNode):
+    """Node whose process() blocks without using the CPU."""
+
+    def process(self) -> None:
+        time.sleep(SLEEP_S)
+        self.parameter_output_values["slept"] = SLEEP_S
+
+
+WORK = {"zlib": CompressNode, "python": PythonLoopNode, "sleep": BlockingSleepNode}
+
+
+async def _run_nodes(nodes: list[BaseNode]) -> tuple[float, float]:
+    """Run every node's aprocess concurrently, returning (wall seconds, longest ticker gap in seconds)."""
+    stop = asyncio.Event()
+    longest_gap = 0.0
+
+    async def ticker() -> None:
+        nonlocal longest_gap
+        last = time.perf_counter()
+        while not stop.is_set():
+            await asyncio.sleep(TICK_S)
+            now = time.perf_counter()
+            longest_gap = max(longest_gap, now - last - TICK_S)
+            last = now
+
+    ticker_task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await asyncio.gather(*(node.aprocess() for node in nodes))
+    wall = time.perf_counter() - start
+    stop.set()
+    await ticker_task
+    return wall, longest_gap
+
+
+def bench(size: int, node_class: type[BaseNode]) -> dict[str, float]:
+    """Return wall time and loop stall for `size` nodes run with each offload mode."""
+    results = {}
+    for offload in (ProcessOffload.EVENT_LOOP, ProcessOffload.THREAD):
+        nodes = [node_class(name=f"node_{i}") for i in range(size)]
+        for node in nodes:
+            node.process_offload = offload
+        wall, stall = asyncio.run(_run_nodes(nodes))
+        results[f"{offload}_wall"] = wall
+        results[f"{offload}_stall"] = stall
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--work", choices=sorted(WORK), default="zlib")
+    args = parser.parse_args()
+    node_class = WORK[args.work]
+
+    table = Table(title=f"{args.work} process() bodies run concurrently on {os.cpu_count()} CPUs (ms)")
+    table.add_column("nodes", justify="right")
+    table.add_column("event loop wall", justify="right")
+    table.add_column("thread wall", justify="right")
+    table.add_column("speedup", justify="right")
+    table.add_column("event loop stall", justify="right")
+    table.add_column("thread stall", justify="right")
+
+    # Create the pool (and the engine config it's sized from) before timing anything.
+    get_node_thread_pool()
+    try:
+        for size in args.sizes:
+            results = bench(size, node_class)
+            table.add_row(
+                str(size),
+                f"{results['EVENT_LOOP_wall'] * 1000:.0f}",
+                f"{results['THREAD_wall'] * 1000:.0f}",
+                f"{results['EVENT_LOOP_wall'] / results['THREAD_wall']:.1f}x",
+                f"{results['EVENT_LOOP_stall'] * 1000:.0f}",
+                f"{results['THREAD_stall'] * 1000:.0f}",
+            )
+    finally:
+        shutdown_node_thread_pool()
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Benchmark sync handle_request dispatch of async handlers.
+
+Sync EventManager.handle_request drives async handlers on a side loop. This times N
+sync calls to a trivial async handler three ways:
+
+- "asyncio.run": a new event loop per call (the old path when no loop is running)
+- "ThreadRunner": a new thread and event loop per call (the old path from inside a running loop)
+- "handle_request": EventManager.handle_request, which reuses its sync bridge's long-lived loops
+
+handle_request is measured from a plain thread and again from inside a running loop
+("in loop"), and includes the rest of the dispatch work (result wrapping, logging,
+flushes). "dispatch mean/max" is the bridge's own latency from its metrics: the time from
+submitting a handler coroutine until it starts running on a side loop.
+
+Usage:
+    python scripts/benchmarks/bench_sync_bridge.py --sizes 1000 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from dataclasses import dataclass
+
+from asyncio_thread_runner import ThreadRunner
+from rich.console import Console
+from rich.table import Table
+
+from griptape_nodes.retained_mode.events.base_events import RequestPayload, ResultPayloadSuccess
+from griptape_nodes.retained_mode.managers.event_manager import EventManager
+
+console = Console()
+
+
+@dataclass(kw_only=True)
+class BenchRequest(RequestPayload):
+    """Request handled by the benchmark's async handler."""
+
+
+@dataclass(kw_only=True)
+class BenchResult(ResultPayloadSuccess):
+    """Result returned by the benchmark's async handler."""
+
+
+async def _handler(_request: BenchRequest) -> BenchResult:
+    return BenchResult(result_details="ok")
+
+
+def _time_asyncio_run(size: int) -> float:
+    start = time.perf_counter()
+    for _ in range(size):
+        asyncio.run(_handler(BenchRequest()))
+    return time.perf_counter() - start
+
+
+def _time_thread_runner(size: int) -> float:
+    start = time.perf_counter()
+    for _ in range(size):
+        with ThreadRunner() as runner:
+            runner.run(_handler(BenchRequest()))
+    return time.perf_counter() - start
+
+
+def _time_handle_request(event_manager: EventManager, size: int) -> float:
+    start = time.perf_counter()
+    for _ in range(size):
+        event_manager.handle_request(BenchRequest())
+    return time.perf_counter() - start
+
+
+async def _time_handle_request_in_loop(event_manager: EventManager, size: int) -> float:
+    return _time_handle_request(event_manager, size)
+
+
+def bench(size: int) -> dict[str, float]:
+    """Return per-call dispatch costs in seconds for `size` sync calls."""
+    event_manager = EventManager()
+    event_manager.assign_manager_to_request_type(BenchRequest, _handler)
+    # The first dispatch initializes the engine singletons; keep that out of the timings.
+    event_manager.handle_request(BenchRequest())
+
+    results = {
+        "asyncio_run": _time_asyncio_run(size) / size,
+        "thread_runner": _time_thread_runner(size) / size,
+        "handle_request": _time_handle_request(event_manager, size) / size,
+        "handle_request_in_loop": asyncio.run(_time_handle_request_in_loop(event_manager, size)) / size,
+    }
+    stats = event_manager.sync_bridge_stats()
+    results["bridge_dispatch"] = stats.mean_dispatch_s
+    results["bridge_max_dispatch"] = stats.max_dispatch_s
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    args = parser.parse_args()
+
+    table = Table(title="Sync dispatch of an async handler, per call (us)")
+    table.add_column("calls", justify="right")
+    table.add_column("asyncio.run", justify="right")
+    table.add_column("ThreadRunner", justify="right")
+    table.add_column("handle_request", justify="right")
+    table.add_column("in loop", justify="right")
+    table.add_column("dispatch mean", justify="right")
+    table.add_column("dispatch max", justify="right")
+    for size in args.sizes:
+        results = bench(size)
+        table.add_row(
+            str(size),
+            f"{results['asyncio_run'] * 1e6:.1f}",
+            f"{results['thread_runner'] * 1e6:.1f}",
+            f"{results['handle_request'] * 1e6:.1f}",
+            f"{results['handle_request_in_loop'] * 1e6:.1f}",
+            f"{results['bridge_dispatch'] * 1e6:.1f}",
+            f"{results['bridge_max_dispatch'] * 1e6:.1f}",
+        )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Benchmark finding the metadata blocks of many workflow files at registration time.
+
+Writes N workflow files, each with a metadata header followed by --payload-kb kilobytes of
+inlined values (as saved workflows embed pickled parameter values), then times one
+registration scan over all of them three ways:
+
+- "full read": reading every file in full and searching it, as registration used to
+- "index cold": WorkflowMetadataIndex with no persisted index (first startup, or all files changed)
+- "index warm": a fresh WorkflowMetadataIndex loading the index persisted by the cold pass
+  (a later startup with no changed files)
+
+Usage:
+    python scripts/benchmarks/bench_workflow_metadata_index.py --sizes 100 500 1000 --payload-kb 512
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from griptape_nodes.common.workflow_metadata_index import WORKFLOW_METADATA_BLOCK_REGEX, WorkflowMetadataIndex
+
+console = Console()
+
+METADATA_HEADER = """# /// script
+# dependencies = []
+#
+# [tool.griptape-nodes]
+# name = "{name}"
+# schema_version = "0.7.0"
+# engine_version_created_with = "0.50.0"
+# node_libraries_referenced = [["Griptape Nodes Library", "0.50.0"]]
+# ///
+
+import pickle
+
+from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
+"""
+
+
+def _write_workflows(directory: Path, size: int, payload_kb: int) -> list[Path]:
+    payload = "x" * (payload_kb * 1024)
+    paths = []
+    for i in range(size):
+        path = directory / f"workflow_{i}.py"
+        path.write_text(METADATA_HEADER.format(name=f"workflow_{i}") + f'\nvalue = b"{payload}"\n', encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def _full_read(paths: list[Path]) -> float:
+    start = time.perf_counter()
+    for path in paths:
+        content = path.read_text(encoding="utf-8")
+        list(WORKFLOW_METADATA_BLOCK_REGEX.finditer(content))
+    return time.perf_counter() - start
+
+
+def _indexed(paths: list[Path], index_path: Path) -> float:
+    start = time.perf_counter()
+    index = WorkflowMetadataIndex(index_path)
+    for path in paths:
+        list(WORKFLOW_METADATA_BLOCK_REGEX.finditer(index.get_metadata_blocks(path)))
+    index.flush()
+    return time.perf_counter() - start
+
+
+def bench(size: int, payload_kb: int) -> dict[str, float]:
+    """Return the scan time in seconds of each strategy over `size` workflow files."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        directory = Path(temp_dir)
+        paths = _write_workflows(directory, size, payload_kb)
+        index_path = directory / "index" / "workflow_metadata_index.json"
+        return {
+            "full_read": _full_read(paths),
+            "index_cold": _indexed(paths, index_path),
+            "index_warm": _indexed(paths, index_path),
+        }
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 1000])
+    parser.add_argument("--payload-kb", type=int, default=512)
+    args = parser.parse_args()
+
+    table = Table(title=f"Metadata scan over N workflow files with {args.payload_kb} KB of values each (ms)")
+    table.add_column("workflows", justify="right")
+    table.add_column("full read", justify="right")
+    table.add_column("index cold", justify="right")
+    table.add_column("index warm", justify="right")
+    for size in args.sizes:
+        results = bench(size, args.payload_kb)
+        table.add_row(
+            str(size),
+            f"{results['full_read'] * 1000:.1f}",
+            f"{results['index_cold'] * 1000:.1f}",
+            f"{results['index_warm'] * 1000:.1f}",
+        )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Benchmark saving and loading workflows that hold large parameter values.
+
+Builds a flow of --nodes nodes whose values add up to --total-mb megabytes of
+incompressible bytes, saves it with SaveWorkflowFileFromSerializedFlowRequest, then loads
+it back the way WorkflowManager.run_workflow does (read, exec with __file__, await
+build_workflow). Each workflow is saved twice: with every value embedded in the .py file,
+and with workflow_value_blob_threshold_bytes set so large values go to the content-addressed
+blob directory next to it. "resave" saves the same flow again under a new name, which reuses
+the existing blobs.
+
+Usage:
+    python scripts/benchmarks/bench_workflow_value_blobs.py --total-mb 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from rich.console import Console
+from rich.table import Table
+
+from griptape_nodes.exe_types.core_types import Parameter
+from griptape_nodes.exe_types.node_types import DataNode
+from griptape_nodes.node_library.library_registry import LibraryMetadata, LibraryRegistry, LibrarySchema, NodeMetadata
+from griptape_nodes.retained_mode.events.flow_events import (
+    CreateFlowRequest,
+    SerializeFlowToCommandsRequest,
+    SerializeFlowToCommandsResultSuccess,
+)
+from griptape_nodes.retained_mode.events.node_events import CreateNodeRequest
+from griptape_nodes.retained_mode.events.parameter_events import SetParameterValueRequest
+from griptape_nodes.retained_mode.events.workflow_events import (
+    SaveWorkflowFileFromSerializedFlowRequest,
+    SaveWorkflowFileFromSerializedFlowResultSuccess,
+)
+from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
+from griptape_nodes.retained_mode.managers.settings import WORKFLOW_VALUE_BLOB_THRESHOLD_KEY
+
+console = Console()
+
+LIBRARY_NAME = "bench_workflow_value_blobs"
+FLOW_NAME = "bench_flow"
+BLOB_THRESHOLD_BYTES = 64 * 1024
+
+
+class BenchHolder(DataNode):
+    """Node holding one large value."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.add_parameter(Parameter(name="data", type="any", tooltip="data"))
+
+    def process(self) -> None:
+        pass
+
+
+def _register_library() -> None:
+    library = LibraryRegistry.generate_new_library(
+        library_data=LibrarySchema(
+            name=LIBRARY_NAME,
+            library_schema_version=LibrarySchema.LATEST_SCHEMA_VERSION,
+            metadata=LibraryMetadata(
+                author="bench", description="bench", library_version="1.0.0", engine_version="1.0.0", tags=[]
+            ),
+            categories=[],
+            nodes=[],
+        )
+    )
+    library.register_new_node_type(
+        BenchHolder, NodeMetadata(category="bench", description="bench", display_name="BenchHolder")
+    )
+
+
+def _build_flow(nodes: int, total_bytes: int) -> Any:
+    """Create the flow and return its serialized commands."""
+    GriptapeNodes.ContextManager().push_workflow(workflow_name="bench_workflow")
+    GriptapeNodes.handle_request(CreateFlowRequest(parent_flow_name=None, flow_name=FLOW_NAME))
+    for i in range(nodes):
+        node_name = f"Holder{i}"
+        GriptapeNodes.handle_request(
+            CreateNodeRequest(
+                node_type="BenchHolder",
+                node_name=node_name,
+                specific_library_name=LIBRARY_NAME,
+                override_parent_flow_name=FLOW_NAME,
+            )
+        )
+        GriptapeNodes.handle_request(
+            SetParameterValueRequest(node_name=node_name, parameter_name="data", value=os.urandom(total_bytes // nodes))
+        )
+    result = GriptapeNodes.handle_request(SerializeFlowToCommandsRequest(flow_name=FLOW_NAME))
+    if not isinstance(result, SerializeFlowToCommandsResultSuccess):
+        msg = f"Failed to serialize the flow: {result.result_details}"
+        raise RuntimeError(msg)  # noqa: TRY004
+    return result.serialized_flow_commands
+
+
+def _save(commands: Any, file_path: Path) -> float:
+    start = time.perf_counter()
+    result = GriptapeNodes.handle_request(
+        SaveWorkflowFileFromSerializedFlowRequest(
+            serialized_flow_commands=commands, file_name=file_path.stem, file_path=str(file_path)
+        )
+    )
+    elapsed = time.perf_counter() - start
+    if not isinstance(result, SaveWorkflowFileFromSerializedFlowResultSuccess):
+        msg = f"Failed to save {file_path}: {result.result_details}"
+        raise RuntimeError(msg)  # noqa: TRY004
+    return elapsed
+
+
+def _load(file_path: Path) -> float:
+    start = time.perf_counter()
+    content = file_path.read_text(encoding="utf-8")
+    namespace: dict[str, Any] = {"__file__": str(file_path), "__name__": "__gtn_workflow__"}
+    exec(content, namespace)  # noqa: S102
+    asyncio.run(namespace["build_workflow"]())
+    return time.perf_counter() - start
+
+
+def _count_loaded_values() -> int:
+    holders = GriptapeNodes.ObjectManager().get_filtered_subset(type=BenchHolder)
+    return sum(1 for node in holders.values() if node.get_parameter_value("data") is not None)
+
+
+def bench(commands: Any, directory: Path, *, blobs: bool) -> dict[str, float]:
+    """Return save, resave and load times in seconds, and the workflow file size in bytes."""
+    config_manager = GriptapeNodes.ConfigManager()
+    config_manager.set_config_value(WORKFLOW_VALUE_BLOB_THRESHOLD_KEY, BLOB_THRESHOLD_BYTES if blobs else None)
+    label = "blobs" if blobs else "embedded"
+    file_path = directory / f"{label}.py"
+    save_s = _save(commands, file_path)
+    resave_s = _save(commands, directory / f"{label}_copy.py")
+    # The loaded flow and nodes get fresh names next to the originals; check every value came back.
+    loaded_before = _count_loaded_values()
+    load_s = _load(file_path)
+    if _count_loaded_values() - loaded_before != len(commands.unique_parameter_uuid_to_values):
+        msg = f"Loading {file_path} did not restore every parameter value."
+        raise RuntimeError(msg)
+    return {"save": save_s, "resave": resave_s, "load": load_s, "file_size": file_path.stat().st_size}
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--total-mb", type=int, default=50)
+    parser.add_argument("--nodes", type=int, default=10)
+    args = parser.parse_args()
+
+    _register_library()
+    commands = _build_flow(args.nodes, args.total_mb * 1024 * 1024)
+
+    table = Table(title=f"Workflow with {args.total_mb} MB of values across {args.nodes} nodes")
+    table.add_column("mode")
+    table.add_column("file size (MB)", justify="right")
+    table.add_column("save (s)", justify="right")
+    table.add_column("resave (s)", justify="right")
+    table.add_column("load (s)", justify="right")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for blobs in (False, True):
+            results = bench(commands, Path(temp_dir), blobs=blobs)
+            table.add_row(
+                "blobs" if blobs else "embedded",
+                f"{results['file_size'] / 1024 / 1024:.2f}",
+                f"{results['save']:.2f}",
+                f"{results['resave']:.2f}",
+                f"{results['load']:.2f}",
+            )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,12 +15,22 @@ from urllib.parse import urljoin
 from websockets.asyncio.client import connect
 from websockets.exceptions import ConnectionClosed, InvalidStatus, InvalidURI
 
+from griptape_nodes.api_client.wire_encoding import (
+    WireEncoding,
+    decode_message,
+    encode_json_payload_message,
+    encode_message,
+    encoding_for_subprotocol,
+    get_default_wire_encodings,
+)
 from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Awaitable, Callable
+    from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
     from types import TracebackType
 
+    from griptape_nodes.retained_mode.events.base_events import BaseEvent
+
 logger = logging.getLogger("griptape_nodes_client")
 
 # Payload size (in bytes) above which a warning is logged before sending.
@@ -46,20 +56,35 @@ class Client:
 
     Provides connection management, topic-based pub/sub, and message routing.
     Handles WebSocket reconnection and async event streaming.
+
+    Messages are JSON unless a more compact wire encoding is negotiated for the
+    connection (see griptape_nodes.api_client.wire_encoding).
     """
 
     def __init__(
         self,
         api_key: str | None = None,
         url: str | None = None,
+        wire_encodings: Sequence[WireEncoding] | None = None,
     ):
         """Initialize Nodes API client.
 
         Args:
             api_key: API key for authentication (defaults to GT_CLOUD_API_KEY from SecretsManager)
             url: WebSocket URL to connect to (defaults to Nodes API endpoint)
+            wire_encodings: Encodings to offer the server, in preference order (defaults to
+                GRIPTAPE_NODES_API_WIRE_ENCODING). Unavailable encodings are skipped, and JSON is
+                used if the server accepts none of them.
         """
         self.url = url if url is not None else get_default_websocket_url()
+        if wire_encodings is None:
+            wire_encodings = get_default_wire_encodings()
+        self._offered_subprotocols = [
+            encoding.subprotocol
+            for encoding in wire_encodings
+            if encoding is not WireEncoding.JSON and encoding.is_available()
+        ]
+        self._wire_encoding = WireEncoding.JSON
 
         # Get API key from SecretsManager if not provided
         if api_key is None:
@@ -79,6 +104,11 @@ class Client:
         self._connection_ready = asyncio.Event()
         self._reconnect_delay = 2.0
 
+    @property
+    def wire_encoding(self) -> WireEncoding:
+        """The encoding negotiated for the current connection."""
+        return self._wire_encoding
+
     async def __aenter__(self) -> Self:
         """Async context manager entry: connect to WebSocket server."""
         await self.connect()
@@ -175,6 +205,35 @@ class Client:
         message = {"type": event_type, "payload": payload, "topic": topic}
         await self._send_message(message)
 
+    async def publish_json(self, event_type: str, payload_json: str, topic: str) -> None:
+        """Publish an event whose payload is already serialized as JSON.
+
+        On a JSON connection the payload text is sent as-is instead of being parsed
+        and serialized again.
+
+        Args:
+            event_type: Type of event to publish
+            payload_json: JSON text of the event payload
+            topic: Topic to publish to
+        """
+        if self._wire_encoding is WireEncoding.JSON:
+            await self._send_frame(encode_json_payload_message(event_type, payload_json, topic), event_type)
+            return
+        await self.publish(event_type, json.loads(payload_json), topic)
+
+    async def publish_event(self, event_type: str, event: BaseEvent, topic: str) -> None:
+        """Publish an engine event, encoding it once for the negotiated wire encoding.
+
+        Args:
+            event_type: Type of event to publish
+            event: The event to publish
+            topic: Topic to publish to
+        """
+        if self._wire_encoding is WireEncoding.JSON:
+            await self.publish_json(event_type, event.json(), topic)
+            return
+        await self.publish(event_type, event.dict(), topic)
+
     async def connect(self) -> None:
         """Connect to the WebSocket server and start receiving messages.
 
@@ -221,7 +280,11 @@ class Client:
         automatically reconnecting on failures.
         """
         try:
-            async for websocket in connect(self.url, additional_headers=self.headers):
+            async for websocket in connect(
+                self.url,
+                additional_headers=self.headers,
+                subprotocols=self._offered_subprotocols or None,  # pyright: ignore[reportArgumentType]
+            ):
                 should_reconnect = await self._handle_websocket_session(websocket)
                 if not should_reconnect:
                     break
@@ -268,6 +331,7 @@ class Client:
             True if the connection should be retried, False if it should not
         """
         self._websocket = websocket
+        self._wire_encoding = encoding_for_subprotocol(websocket.subprotocol)
         self._connection_ready.set()
         if self._subscribed_topics:
             logger.info("WebSocket reconnected successfully")
@@ -275,7 +339,7 @@ class Client:
             for topic in self._subscribed_topics:
                 await self._send_subscribe_command(topic)
         else:
-            logger.debug("WebSocket connection established: %s", self.url)
+            logger.debug("WebSocket connection established: %s (%s)", self.url, self._wire_encoding)
 
         try:
             await self._receive_messages(websocket)
@@ -297,7 +361,7 @@ class Client:
         try:
             async for message in websocket:
                 try:
-                    data = json.loads(message)
+                    data = decode_message(message, self._wire_encoding)
                     claimed = False
                     for f in self._message_filters:
                         if await f(data):
@@ -305,7 +369,7 @@ class Client:
                             break
                     if not claimed:
                         await self._message_queue.put(data)
-                except json.JSONDecodeError:
+                except ValueError:
                     logger.error("Failed to parse message: %s", message)
                 except Exception as e:
                     logger.error("Error receiving message: %s", e)
@@ -319,6 +383,23 @@ class Client:
         Args:
             message: Message dictionary to send
 
+        Raises:
+            ConnectionError: If not connected
+        """
+        await self._send_frame(
+            encode_message(message, self._wire_encoding),
+            message.get("type"),
+            message.get("payload", {}).get("result_type"),
+        )
+
+    async def _send_frame(self, frame: str | bytes, event_type: str | None, result_type: str | None = None) -> None:
+        """Send an encoded frame through the WebSocket connection.
+
+        Args:
+            frame: Encoded message
+            event_type: Message type, for logging
+            result_type: Result type of the payload if known, for logging
+
         Raises:
             ConnectionError: If not connected
         """
@@ -326,18 +407,17 @@ class Client:
             msg = "Not connected to WebSocket"
             raise ConnectionError(msg)
 
-        serialized = json.dumps(message)
         # TODO: Block large payloads https://github.com/griptape-ai/griptape-nodes/issues/4124
-        if len(serialized) > LARGE_PAYLOAD_WARNING_THRESHOLD:
+        if len(frame) > LARGE_PAYLOAD_WARNING_THRESHOLD:
             logger.warning(
                 "Sending large WebSocket message: type=%s (%s), size=%d bytes. "
                 "Large messages can saturate the send buffer and cause connected clients (e.g. the editor) to stall or disconnect.",
-                message.get("type"),
-                message.get("payload", {}).get("result_type"),
-                len(serialized),
+                event_type,
+                result_type,
+                len(frame),
             )
         try:
-            await self._websocket.send(serialized)
+            await self._websocket.send(frame)
         except Exception as e:
             logger.error("Failed to send message: %s", e)
 
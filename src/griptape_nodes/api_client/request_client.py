@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import uuid
 from dataclasses import dataclass
@@ -203,12 +202,10 @@ class RequestClient:
             await self.client.subscribe(worker_response_topic)
             self._subscribed_response_topics.add(worker_response_topic)
 
-        payload_dict = json.loads(event_request.json())
-
         logger.debug("Forwarding request %s to orchestrator on %s", request_id, orchestrator_request_topic)
 
         try:
-            await self.client.publish("EventRequest", payload_dict, orchestrator_request_topic)
+            await self.client.publish_event("EventRequest", event_request, orchestrator_request_topic)
 
             if timeout_ms:
                 timeout_sec = timeout_ms / 1000
@@ -0,0 +1,92 @@
+"""Wire encodings for Nodes API WebSocket messages.
+
+Messages are JSON text frames unless the client and server agree on something more compact.
+Agreement happens once per connection through the WebSocket subprotocol handshake: the client
+offers one subprotocol per encoding it supports, in preference order, and the server accepts at
+most one. A server that accepts none (or predates the handshake) gets JSON, exactly as before.
+
+The msgpack encoding sends binary frames and is available only when the optional `msgpack`
+package is installed, e.g. through the engine's `msgpack` extra.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+from enum import StrEnum
+from typing import Any
+
+WIRE_ENCODING_ENV_VAR = "GRIPTAPE_NODES_API_WIRE_ENCODING"
+
+_SUBPROTOCOL_PREFIX = "griptape-nodes."
+
+
+class WireEncoding(StrEnum):
+    """Encoding of the messages exchanged over one WebSocket connection."""
+
+    JSON = "json"
+    MSGPACK = "msgpack"
+
+    @property
+    def subprotocol(self) -> str:
+        """The WebSocket subprotocol that selects this encoding."""
+        return f"{_SUBPROTOCOL_PREFIX}{self.value}"
+
+    def is_available(self) -> bool:
+        """Whether the packages this encoding needs are installed."""
+        if self is WireEncoding.MSGPACK:
+            return importlib.util.find_spec("msgpack") is not None
+        return True
+
+
+def get_default_wire_encodings() -> list[WireEncoding]:
+    """Get the encodings to offer, from the comma-separated GRIPTAPE_NODES_API_WIRE_ENCODING.
+
+    Returns:
+        The configured encodings in preference order; empty (plain JSON, no negotiation) if unset.
+    """
+    configured = os.getenv(WIRE_ENCODING_ENV_VAR, "")
+    return [WireEncoding(name.strip()) for name in configured.split(",") if name.strip()]
+
+
+def encoding_for_subprotocol(subprotocol: str | None) -> WireEncoding:
+    """Get the encoding selected by the subprotocol the server accepted (JSON if none)."""
+    if subprotocol is None or not subprotocol.startswith(_SUBPROTOCOL_PREFIX):
+        return WireEncoding.JSON
+    return WireEncoding(subprotocol.removeprefix(_SUBPROTOCOL_PREFIX))
+
+
+def encode_message(message: dict[str, Any], encoding: WireEncoding) -> str | bytes:
+    """Encode a message as a text (JSON) or binary (msgpack) frame."""
+    if encoding is WireEncoding.MSGPACK:
+        import msgpack  # pyright: ignore[reportMissingImports]
+
+        return msgpack.packb(message, default=str)
+    return json.dumps(message)
+
+
+def encode_json_payload_message(event_type: str, payload_json: str, topic: str) -> str:
+    """Encode a JSON message around an already-serialized JSON payload.
+
+    Produces the same text as encode_message({"type": ..., "payload": json.loads(payload_json),
+    "topic": ...}, WireEncoding.JSON) without parsing and re-serializing the payload.
+    """
+    return f'{{"type": {json.dumps(event_type)}, "payload": {payload_json}, "topic": {json.dumps(topic)}}}'
+
+
+def decode_message(frame: str | bytes, encoding: WireEncoding) -> dict[str, Any]:
+    """Decode a received frame. Text frames are always JSON; binary frames use the connection's encoding.
+
+    Raises:
+        ValueError: If the frame cannot be decoded.
+    """
+    if isinstance(frame, str) or encoding is not WireEncoding.MSGPACK:
+        return json.loads(frame)
+    import msgpack  # pyright: ignore[reportMissingImports]
+
+    try:
+        return msgpack.unpackb(frame)
+    except Exception as err:
+        msg = f"Failed to decode msgpack frame: {err}"
+        raise ValueError(msg) from err
@@ -7,6 +7,7 @@ import sys
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import MutableSequence
     from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -33,7 +34,7 @@ class PythonSubprocessExecutor:
         self,
         stream: asyncio.StreamReader | None,
         stream_name: str,
-        collected_lines: list[str],
+        collected_lines: MutableSequence[str],
     ) -> None:
         """Read from a stream line-by-line, printing each line in real-time.
 
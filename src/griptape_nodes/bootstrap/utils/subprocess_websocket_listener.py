@@ -13,6 +13,7 @@ import uuid
 from typing import TYPE_CHECKING
 
 from griptape_nodes.bootstrap.utils.subprocess_websocket_base import SubprocessWebSocketBaseMixin
+from griptape_nodes.bootstrap.utils.websocket_event_coalescer import unpack_batch
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -27,6 +28,7 @@ class SubprocessWebSocketListenerMixin(SubprocessWebSocketBaseMixin):
     - Starting/stopping a WebSocket listener as a background task
     - Subscribing to session-specific topics
     - Processing incoming events and calling callbacks
+    - Expanding batched events from the sender into individual events
 
     Subclasses should implement _handle_subprocess_event() for custom event handling.
     """
@@ -74,16 +76,17 @@ class SubprocessWebSocketListenerMixin(SubprocessWebSocketBaseMixin):
             return
 
         try:
-            async for message in self._ws_client.messages:
-                try:
-                    logger.debug("Received WebSocket message: %s", message.get("type"))
-                    await self._process_listener_event(message)
-                except Exception:
-                    logger.exception(
-                        "Error processing WebSocket message of type '%s' for session %s",
-                        message.get("type", "unknown"),
-                        self._session_id,
-                    )
+            async for received in self._ws_client.messages:
+                for message in unpack_batch(received):
+                    try:
+                        logger.debug("Received WebSocket message: %s", message.get("type"))
+                        await self._process_listener_event(message)
+                    except Exception:
+                        logger.exception(
+                            "Error processing WebSocket message of type '%s' for session %s",
+                            message.get("type", "unknown"),
+                            self._session_id,
+                        )
         except asyncio.CancelledError:
             logger.debug("WebSocket listener cancelled for session %s", self._session_id)
         except Exception as e:
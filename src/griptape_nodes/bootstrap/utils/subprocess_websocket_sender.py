@@ -7,10 +7,19 @@ from subprocess executions back to the parent process using native asyncio.
 from __future__ import annotations
 
 import asyncio
-import json
+import itertools
 import logging
+from typing import TYPE_CHECKING
 
 from griptape_nodes.bootstrap.utils.subprocess_websocket_base import SubprocessWebSocketBaseMixin, WebSocketMessage
+from griptape_nodes.bootstrap.utils.websocket_event_coalescer import (
+    EVENT_BATCH_TYPE,
+    WebSocketEventCoalescer,
+    encode_batch_payload,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
 
 logger = logging.getLogger(__name__)
 
@@ -22,19 +31,22 @@ class SubprocessWebSocketSenderMixin(SubprocessWebSocketBaseMixin):
     - Starting/stopping a WebSocket connection as a background task
     - Queuing and sending events to the parent process
     - Non-blocking event emission from the main event loop
+    - Coalescing superseded events and sending them in batches (see WebSocketEventCoalescer)
     """
 
-    _ws_send_queue: asyncio.Queue[WebSocketMessage]
+    _ws_send_queue: WebSocketEventCoalescer
     _ws_shutdown_event: asyncio.Event
 
-    def _init_websocket_sender(self, session_id: str) -> None:
+    def _init_websocket_sender(self, session_id: str, coalesce_window_seconds: float | None = None) -> None:
         """Initialize WebSocket sender state.
 
         Args:
             session_id: Unique session ID for WebSocket topic.
+            coalesce_window_seconds: How long to gather events into one batch
+                (defaults to GRIPTAPE_NODES_EVENT_COALESCE_WINDOW_MS; 0 sends each event on its own).
         """
         self._init_websocket_base(session_id)
-        self._ws_send_queue = asyncio.Queue()
+        self._ws_send_queue = WebSocketEventCoalescer(window_seconds=coalesce_window_seconds)
         self._ws_shutdown_event = asyncio.Event()
 
     async def _start_websocket_connection(self) -> None:
@@ -53,7 +65,7 @@ class SubprocessWebSocketSenderMixin(SubprocessWebSocketBaseMixin):
 
         while not self._ws_shutdown_event.is_set():
             try:
-                message = await asyncio.wait_for(self._ws_send_queue.get(), timeout=1.0)
+                messages = await asyncio.wait_for(self._ws_send_queue.get_batch(), timeout=1.0)
             except TimeoutError:
                 continue
             except asyncio.CancelledError:
@@ -61,26 +73,39 @@ class SubprocessWebSocketSenderMixin(SubprocessWebSocketBaseMixin):
 
             try:
                 if self._ws_client is None:
-                    logger.warning("WebSocket client not available, message dropped")
+                    logger.warning("WebSocket client not available, %d message(s) dropped", len(messages))
                     continue
 
-                topic = message.topic or f"sessions/{self._session_id}/response"
-                payload_dict = json.loads(message.payload)
-                await self._ws_client.publish(message.event_type, payload_dict, topic)
-                logger.debug("DELIVERED: %s event", message.event_type)
+                await self._send_websocket_batch(messages)
             except Exception as e:
                 logger.error("Error sending WebSocket message: %s", e)
             finally:
-                self._ws_send_queue.task_done()
+                self._ws_send_queue.batch_done()
 
         logger.debug("WebSocket send loop ended for session %s", self._session_id)
 
-    def send_event(self, event_type: str, payload: str) -> None:
+    async def _send_websocket_batch(self, messages: list[WebSocketMessage]) -> None:
+        """Send a batch of queued messages, wrapping runs of more than one message per topic in one envelope."""
+        if self._ws_client is None:
+            return
+
+        default_topic = f"sessions/{self._session_id}/response"
+        for topic, group in itertools.groupby(messages, key=lambda m: m.topic or default_topic):
+            run = list(group)
+            if len(run) == 1:
+                await self._ws_client.publish_json(run[0].event_type, run[0].payload, topic)
+            else:
+                await self._ws_client.publish_json(EVENT_BATCH_TYPE, encode_batch_payload(run), topic)
+            logger.debug("DELIVERED: %s", ", ".join(message.event_type for message in run))
+
+    def send_event(self, event_type: str, payload: str, coalesce_key: Hashable | None = None) -> None:
         """Queue an event for sending via WebSocket (non-blocking).
 
         Args:
             event_type: Type of event (e.g., "execution_event", "success_result")
             payload: JSON string payload to send
+            coalesce_key: If given, a still-unsent event queued with the same key is superseded
+                by this one and never sent (e.g. an older value of the same parameter)
         """
         if self._ws_task is None or self._ws_task.done():
             logger.debug("WebSocket sender not active, event not sent: %s", event_type)
@@ -89,11 +114,14 @@ class SubprocessWebSocketSenderMixin(SubprocessWebSocketBaseMixin):
         topic = f"sessions/{self._session_id}/response"
         message = WebSocketMessage(event_type, payload, topic)
 
-        try:
-            self._ws_send_queue.put_nowait(message)
-            logger.debug("QUEUED: %s event via websocket", event_type)
-        except asyncio.QueueFull:
-            logger.error("WebSocket queue full, event dropped: %s", event_type)
+        self._ws_send_queue.put(message, coalesce_key)
+        logger.debug("QUEUED: %s event via websocket", event_type)
+
+    async def _wait_for_websocket_send_capacity(self) -> None:
+        """Wait while the send buffer is full, so producers slow down instead of growing it without limit."""
+        if self._ws_task is None or self._ws_task.done():
+            return
+        await self._ws_send_queue.wait_for_capacity()
 
     async def _stop_websocket_connection(self) -> None:
         """Stop the sender task and close client."""
@@ -0,0 +1,167 @@
+"""Coalescing buffer for WebSocket messages sent from subprocess executions.
+
+Fast flows emit a ParameterValueUpdateEvent per output parameter per node, and most of these
+are superseded almost immediately by a newer value for the same (node, parameter). The buffer holds messages for a short window, keeps only the latest
+message for each coalescing key, and hands the survivors to the sender as one batch.
+
+The buffer is bounded: producers await wait_for_capacity() before queueing more work, so a slow
+connection slows the producer down instead of growing memory without limit. Coalescable
+messages never need more capacity than one slot per key.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from griptape_nodes.bootstrap.utils.subprocess_websocket_base import WebSocketMessage
+
+logger = logging.getLogger(__name__)
+
+COALESCE_WINDOW_ENV_VAR = "GRIPTAPE_NODES_EVENT_COALESCE_WINDOW_MS"
+DEFAULT_COALESCE_WINDOW_MS = 50.0
+DEFAULT_MAX_PENDING_MESSAGES = 1000
+
+# Message type of the envelope that carries a batch of messages; see encode_batch_payload().
+EVENT_BATCH_TYPE = "event_batch"
+
+
+def get_default_coalesce_window() -> float:
+    """Get the coalescing window in seconds, from GRIPTAPE_NODES_EVENT_COALESCE_WINDOW_MS.
+
+    Returns:
+        The window in seconds; 0 disables coalescing and sends every message on its own.
+    """
+    configured = os.getenv(COALESCE_WINDOW_ENV_VAR)
+    if configured is None:
+        return DEFAULT_COALESCE_WINDOW_MS / 1000
+    try:
+        return max(float(configured), 0.0) / 1000
+    except ValueError:
+        logger.warning(
+            "Invalid %s value '%s', using %sms", COALESCE_WINDOW_ENV_VAR, configured, DEFAULT_COALESCE_WINDOW_MS
+        )
+        return DEFAULT_COALESCE_WINDOW_MS / 1000
+
+
+def encode_batch_payload(messages: list[WebSocketMessage]) -> str:
+    """Encode the JSON payload of an EVENT_BATCH_TYPE envelope around already-serialized payloads.
+
+    The payload is {"events": [{"type": ..., "payload": ...}, ...]}, in send order.
+    """
+    events = ", ".join(
+        f'{{"type": {json.dumps(message.event_type)}, "payload": {message.payload}}}' for message in messages
+    )
+    return f'{{"events": [{events}]}}'
+
+
+def unpack_batch(message: dict) -> list[dict]:
+    """Expand a received EVENT_BATCH_TYPE envelope into the messages it carries.
+
+    Any other message is returned on its own, so callers can always iterate the result.
+    """
+    if message.get("type") != EVENT_BATCH_TYPE:
+        return [message]
+    topic = message.get("topic")
+    return [
+        {"type": event.get("type"), "payload": event.get("payload", {}), "topic": topic}
+        for event in message.get("payload", {}).get("events", [])
+    ]
+
+
+class WebSocketEventCoalescer:
+    """Bounded buffer that merges superseded messages and releases them in batches.
+
+    Messages queued with the same coalesce key replace each other: the newer message takes
+    the place of the older one at the end of the buffer, so it is still sent after everything
+    that was queued before it. Messages without a key are never merged or dropped.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float | None = None,
+        max_pending: int = DEFAULT_MAX_PENDING_MESSAGES,
+    ) -> None:
+        """Initialize the buffer.
+
+        Args:
+            window_seconds: How long to gather messages after the first one arrives before
+                releasing a batch (defaults to GRIPTAPE_NODES_EVENT_COALESCE_WINDOW_MS).
+            max_pending: Number of buffered messages at which wait_for_capacity() blocks.
+        """
+        self._window_seconds = get_default_coalesce_window() if window_seconds is None else window_seconds
+        self._max_pending = max_pending
+        self._pending: list[WebSocketMessage | None] = []
+        self._pending_count = 0
+        self._index_by_key: dict[Hashable, int] = {}
+        self._batches_in_flight = 0
+        self._not_empty = asyncio.Event()
+        self._has_capacity = asyncio.Event()
+        self._has_capacity.set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self.superseded_count = 0
+
+    @property
+    def pending_count(self) -> int:
+        """Number of messages waiting to be sent."""
+        return self._pending_count
+
+    def put(self, message: WebSocketMessage, coalesce_key: Hashable | None = None) -> None:
+        """Queue a message, replacing any still-pending message with the same coalesce key.
+
+        Args:
+            message: The message to send.
+            coalesce_key: Identifies messages that supersede each other, e.g. the event type,
+                node name, and parameter name of a value update. None never coalesces.
+        """
+        if coalesce_key is not None:
+            previous_index = self._index_by_key.get(coalesce_key)
+            if previous_index is not None:
+                self._pending[previous_index] = None
+                self._pending_count -= 1
+                self.superseded_count += 1
+            self._index_by_key[coalesce_key] = len(self._pending)
+        self._pending.append(message)
+        self._pending_count += 1
+        self._not_empty.set()
+        self._idle.clear()
+        if self._pending_count >= self._max_pending:
+            self._has_capacity.clear()
+
+    async def wait_for_capacity(self) -> None:
+        """Wait until fewer than max_pending messages are buffered."""
+        await self._has_capacity.wait()
+
+    async def get_batch(self) -> list[WebSocketMessage]:
+        """Wait for messages, gather for one window, and take everything buffered.
+
+        Every batch returned must be acknowledged with batch_done() once it has been sent.
+        """
+        await self._not_empty.wait()
+        if self._window_seconds > 0 and self._pending_count < self._max_pending:
+            await asyncio.sleep(self._window_seconds)
+        batch = [message for message in self._pending if message is not None]
+        self._pending = []
+        self._pending_count = 0
+        self._index_by_key.clear()
+        self._not_empty.clear()
+        self._has_capacity.set()
+        self._batches_in_flight += 1
+        return batch
+
+    def batch_done(self) -> None:
+        """Acknowledge that a batch returned by get_batch() has been sent (or dropped)."""
+        self._batches_in_flight -= 1
+        if self._batches_in_flight == 0 and self._pending_count == 0:
+            self._idle.set()
+
+    async def join(self) -> None:
+        """Wait until every queued message has been taken and its batch acknowledged."""
+        await self._idle.wait()
@@ -10,6 +10,7 @@ from griptape_nodes.bootstrap.workflow_executors.local_workflow_executor import
     LocalWorkflowExecutor,
 )
 from griptape_nodes.drivers.storage import StorageBackend
+from griptape_nodes.exe_types.node_types import BaseNode
 from griptape_nodes.retained_mode.events.app_events import AppInitializationComplete
 from griptape_nodes.retained_mode.events.base_events import (
     EventRequest,
@@ -23,22 +24,37 @@ from griptape_nodes.retained_mode.events.base_events import (
 from griptape_nodes.retained_mode.events.execution_events import (
     ControlFlowCancelledEvent,
     GriptapeEvent,
+    ParameterValueUpdateEvent,
     StartFlowRequest,
     StartFlowResultFailure,
 )
 from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
+from griptape_nodes.utils.node_thread_pool import shutdown_node_thread_pool
+from griptape_nodes.utils.preview_process_pool import shutdown_preview_process_pool
 
 if TYPE_CHECKING:
     from argparse import ArgumentParser, Namespace
-    from collections.abc import Callable
+    from collections.abc import Callable, Hashable
     from pathlib import Path
     from types import TracebackType
 
 logger = logging.getLogger(__name__)
 
 
+def _coalesce_key(payload: Any) -> Hashable | None:
+    """Key under which a newer execution event supersedes an unsent older one, or None if it never does.
+
+    A parameter value update only matters as the latest value for its (node, parameter), so only
+    the newest one queued within a coalescing window is sent. GriptapeEvents are not coalesced:
+    they carry deltas, such as streamed text, that the receiver appends to what it already has.
+    """
+    if isinstance(payload, ParameterValueUpdateEvent):
+        return (type(payload).__name__, payload.node_name, payload.parameter_name)
+    return None
+
+
 class LocalSessionWorkflowExecutor(LocalWorkflowExecutor, SubprocessWebSocketSenderMixin):
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         session_id: str,
         storage_backend: StorageBackend = StorageBackend.LOCAL,
@@ -46,18 +62,25 @@ class LocalSessionWorkflowExecutor(LocalWorkflowExecutor, SubprocessWebSocketSen
         save_on_failure_path: str | None = None,
         *,
         project_file_path: Path | None = None,
+        pickle_control_flow_result: bool = False,
     ):
         super().__init__(
             storage_backend=storage_backend,
             project_file_path=project_file_path,
             save_on_failure_path=save_on_failure_path,
+            pickle_control_flow_result=pickle_control_flow_result,
         )
         self._init_websocket_sender(session_id)
         self._on_start_flow_result = on_start_flow_result
+        # Each node's parameter values as aprepare_workflow_for_run left them, restored before every
+        # arun_prepared_flow so a warm worker's jobs don't see values set by earlier ones
+        self._prepared_parameter_values: dict[str, dict[str, Any]] = {}
 
     async def __aenter__(self) -> Self:
         """Async context manager entry: initialize queue and broadcast app initialization."""
         GriptapeNodes.EventManager().initialize_queue()
+        # Events relayed from this process may reference stored values after their workflow is cleared
+        GriptapeNodes.StaticFilesManager().retain_parameter_values = True
         await GriptapeNodes.EventManager().abroadcast_app_event(AppInitializationComplete())
 
         logger.info("Setting up session %s", self._session_id)
@@ -77,13 +100,15 @@ class LocalSessionWorkflowExecutor(LocalWorkflowExecutor, SubprocessWebSocketSen
         await self._stop_websocket_connection()
 
         GriptapeNodes.SessionManager().remove_session(self._session_id)
+        shutdown_node_thread_pool(wait=False)
+        shutdown_preview_process_pool(wait=False)
 
         # TODO: Broadcast shutdown https://github.com/griptape-ai/griptape-nodes/issues/2149
 
     async def _process_execution_event_async(self, event: ExecutionGriptapeNodeEvent) -> None:
         """Process execution events asynchronously for real-time websocket emission."""
         logger.debug("REAL-TIME: Processing execution event for session %s", self._session_id)
-        self.send_event("execution_event", event.wrapped_event.json())
+        self.send_event("execution_event", event.wrapped_event.json(), _coalesce_key(event.wrapped_event.payload))
 
     async def arun(
         self,
@@ -129,7 +154,7 @@ class LocalSessionWorkflowExecutor(LocalWorkflowExecutor, SubprocessWebSocketSen
         finally:
             await self._stop_websocket_connection()
 
-    async def _arun(  # noqa: C901, PLR0915
+    async def _arun(
         self,
         flow_input: Any,
         storage_backend: StorageBackend | None = None,
@@ -143,7 +168,62 @@ class LocalSessionWorkflowExecutor(LocalWorkflowExecutor, SubprocessWebSocketSen
             storage_backend=storage_backend,
             **kwargs,
         )
+        await self._arun_flow(flow_name, pickle_control_flow_result=pickle_control_flow_result)
+
+    async def arun_prepared_flow(
+        self,
+        flow_name: str,
+        flow_input: Any,
+        *,
+        pickle_control_flow_result: bool | None = None,
+    ) -> None:
+        """Runs an already loaded flow again with new input, leaving the websocket connection open.
+
+        Used by warm subprocess workers that load a workflow once and then run it for many inputs.
+        Unlike arun, failures are raised without emitting a ControlFlowCancelledEvent. Every node
+        starts from the parameter values it had when the flow was prepared, with the previous run's
+        outputs cleared, so a value set by one input does not carry over to the next.
+
+        Parameters:
+            flow_name: Name of the flow returned by aprepare_workflow_for_run.
+            flow_input: Input data for the flow's StartNodes, keyed by node name.
+            pickle_control_flow_result: Per-call override for the executor's save-time default.
+        """
+        GriptapeNodes.EventManager().initialize_queue()
+        self._restore_prepared_nodes()
+        await self._set_input_for_flow(flow_name=flow_name, flow_input=flow_input)
+        await self._arun_flow(flow_name, pickle_control_flow_result=pickle_control_flow_result)
 
+    async def aprepare_workflow_for_run(
+        self,
+        flow_input: Any,
+        storage_backend: StorageBackend | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """Prepares the workflow as LocalWorkflowExecutor does, and records the nodes' values for later runs."""
+        flow_name = await super().aprepare_workflow_for_run(flow_input, storage_backend, **kwargs)
+        # Shallow copies: running a flow replaces parameter values rather than mutating them
+        self._prepared_parameter_values = {
+            node_name: dict(node.parameter_values)
+            for node_name, node in GriptapeNodes.ObjectManager().get_filtered_subset(type=BaseNode).items()
+        }
+        return flow_name
+
+    def _restore_prepared_nodes(self) -> None:
+        """Put every node back to its prepared parameter values and clear what the last run produced."""
+        for node_name, node in GriptapeNodes.ObjectManager().get_filtered_subset(type=BaseNode).items():
+            prepared_values = self._prepared_parameter_values.get(node_name)
+            if prepared_values is not None:
+                node.parameter_values = dict(prepared_values)
+            node.clear_node()
+
+    async def _arun_flow(  # noqa: C901, PLR0915
+        self,
+        flow_name: str,
+        *,
+        pickle_control_flow_result: bool | None = None,
+    ) -> None:
+        """Start a prepared flow and pump the event queue until it resolves or is cancelled."""
         # Send the run command to actually execute it (fire and forget)
         effective_pickle = (
             pickle_control_flow_result if pickle_control_flow_result is not None else self._pickle_control_flow_result
@@ -214,7 +294,9 @@ class LocalSessionWorkflowExecutor(LocalWorkflowExecutor, SubprocessWebSocketSen
                     task.add_done_callback(_handle_task_done)
                 elif isinstance(event, ExecutionGriptapeNodeEvent):
                     # Emit execution event via WebSocket
-                    self.send_event("execution_event", event.wrapped_event.json())
+                    self.send_event(
+                        "execution_event", event.wrapped_event.json(), _coalesce_key(event.wrapped_event.payload)
+                    )
                     task = asyncio.create_task(self._process_execution_event_async(event))
                     background_tasks.add(task)
                     task.add_done_callback(_handle_task_done)
@@ -228,10 +310,13 @@ class LocalSessionWorkflowExecutor(LocalWorkflowExecutor, SubprocessWebSocketSen
                         value=event.value,
                     )
                     execution_event = ExecutionEvent(payload=payload)
-                    self.send_event("execution_event", execution_event.json())
+                    self.send_event("execution_event", execution_event.json(), _coalesce_key(payload))
 
                 event_queue.task_done()
 
+                # Stop draining the event queue while the websocket falls behind.
+                await self._wait_for_websocket_send_capacity()
+
             except Exception as e:
                 msg = f"Error handling queue event: {e}"
                 logger.exception(msg)
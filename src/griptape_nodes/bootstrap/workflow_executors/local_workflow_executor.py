@@ -41,6 +41,8 @@ from griptape_nodes.retained_mode.events.workflow_events import (
     SaveWorkflowFileFromSerializedFlowResultSuccess,
 )
 from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
+from griptape_nodes.utils.node_thread_pool import shutdown_node_thread_pool
+from griptape_nodes.utils.preview_process_pool import shutdown_preview_process_pool
 
 if TYPE_CHECKING:
     from argparse import ArgumentParser, Namespace
@@ -74,6 +76,8 @@ class LocalWorkflowExecutor(WorkflowExecutor):
     async def __aenter__(self) -> Self:
         """Async context manager entry: initialize queue and broadcast app initialization."""
         GriptapeNodes.EventManager().initialize_queue()
+        # Events relayed from this process may reference stored values after their workflow is cleared
+        GriptapeNodes.StaticFilesManager().retain_parameter_values = True
 
         # Activate the user-specified project BEFORE broadcasting AppInitializationComplete.
         # At this point ProjectManager._initialization_complete is still False, so the
@@ -99,6 +103,9 @@ class LocalWorkflowExecutor(WorkflowExecutor):
         # TODO: Broadcast shutdown https://github.com/griptape-ai/griptape-nodes/issues/2149
         if exc_val is not None and self._save_on_failure_path is not None:
             await self._save_failed_workflow(exc_val)
+        # Don't wait: a node body or preview render still running after a failure must not block the event loop
+        shutdown_node_thread_pool(wait=False)
+        shutdown_preview_process_pool(wait=False)
 
     def _get_workflow_name(self) -> str:
         try:
@@ -0,0 +1,330 @@
+"""Warm subprocess workers that load a workflow once and run it for many inputs.
+
+SubprocessWorkflowExecutor starts a fresh Python process per run, so every run pays for
+interpreter startup, library registration and workflow loading. A SubprocessWorkflowWorker
+pays that once: it runs utils/subprocess_worker_script.py, which loads the workflow and
+then takes one job per line on stdin. Flow events come back over the session WebSocket
+exactly as they do for SubprocessWorkflowExecutor, followed by a worker_result event per job.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import json
+import logging
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+from griptape_nodes.bootstrap.utils.python_subprocess_executor import PythonSubprocessExecutor, _create_subprocess_env
+from griptape_nodes.bootstrap.utils.subprocess_websocket_listener import SubprocessWebSocketListenerMixin
+from griptape_nodes.drivers.storage import StorageBackend
+from griptape_nodes.retained_mode.events.base_events import ExecutionEvent
+from griptape_nodes.retained_mode.events.execution_events import ControlFlowCancelledEvent, ControlFlowResolvedEvent
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import TracebackType
+
+logger = logging.getLogger(__name__)
+
+LOOP_SUBPROCESS_WORKERS_KEY = "loop_subprocess_workers"
+
+WORKER_READY_EVENT = "worker_ready"
+WORKER_RESULT_EVENT = "worker_result"
+
+_WORKER_SCRIPT_PATH = Path(__file__).parent / "utils" / "subprocess_worker_script.py"
+_STOP_TIMEOUT_S = 5.0
+_OUTPUT_TAIL_LINES = 50
+
+
+class SubprocessWorkflowWorkerError(Exception):
+    """Exception raised when a warm worker fails to start or to run a job."""
+
+
+@dataclass(frozen=True)
+class WorkerJobTiming:
+    """Where the wall time of one job run through a SubprocessWorkflowWorkerPool went.
+
+    startup_s is the time spent spawning the worker and loading the workflow before the
+    job could be sent; it is zero when the job ran on an already warm worker.
+    """
+
+    startup_s: float
+    run_s: float
+
+
+class SubprocessWorkflowWorker(PythonSubprocessExecutor, SubprocessWebSocketListenerMixin):
+    """One warm subprocess running a workflow for a job at a time."""
+
+    def __init__(
+        self,
+        workflow_path: str,
+        storage_backend: StorageBackend = StorageBackend.LOCAL,
+        on_event: Callable[[dict], None] | None = None,
+        session_id: str | None = None,
+    ) -> None:
+        PythonSubprocessExecutor.__init__(self)
+        self._init_websocket_listener(session_id=session_id, on_event=on_event)
+        self._workflow_path = workflow_path
+        self._storage_backend = storage_backend
+        self._job_ids = itertools.count()
+        self._ready: asyncio.Future[None] | None = None
+        self._pending_job_id: int | None = None
+        self._pending_job: asyncio.Future[dict[str, Any]] | None = None
+        self._job_output: dict[str, Any] | None = None
+        self._job_error: str | None = None
+        self._monitor_task: asyncio.Task[None] | None = None
+
+    @property
+    def is_idle(self) -> bool:
+        """True if the worker process is running and not busy with a job."""
+        return self.is_running() and self._pending_job is None
+
+    async def start(self) -> None:
+        """Spawn the worker and wait until it has loaded the workflow."""
+        loop = asyncio.get_running_loop()
+        self._ready = loop.create_future()
+        await self._start_websocket_listener()
+
+        args = [
+            "--session-id",
+            self._session_id,
+            "--storage-backend",
+            self._storage_backend.value,
+            "--workflow-path",
+            self._workflow_path,
+            "--pickle-control-flow-result",
+        ]
+        env = _create_subprocess_env({"GTN_CONFIG_ENABLE_WORKSPACE_FILE_WATCHING": "false"})
+        env["PYTHONUNBUFFERED"] = "1"
+        try:
+            self._process = await asyncio.create_subprocess_exec(
+                sys.executable,
+                str(_WORKER_SCRIPT_PATH),
+                *args,
+                cwd=Path(self._workflow_path).parent,
+                env=env,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except Exception as e:
+            await self._stop_websocket_listener()
+            msg = f"Failed to start worker subprocess for workflow '{self._workflow_path}': {e}"
+            raise SubprocessWorkflowWorkerError(msg) from e
+        self._is_running = True
+        logger.info("Started workflow worker subprocess with PID %s", self._process.pid)
+        self._monitor_task = asyncio.create_task(self._monitor_process(self._process))
+
+        try:
+            await self._ready
+        except BaseException:
+            await self.stop()
+            raise
+
+    async def run(self, flow_input: dict[str, Any]) -> dict[str, Any]:
+        """Run the workflow once with the given StartNode input and return the control flow output."""
+        if not self.is_idle or self._process is None or self._process.stdin is None:
+            msg = "Worker is not running or is already busy with a job"
+            raise SubprocessWorkflowWorkerError(msg)
+
+        job_id = next(self._job_ids)
+        job = asyncio.get_running_loop().create_future()
+        self._pending_job_id = job_id
+        self._pending_job = job
+        self._job_output = None
+        self._job_error = None
+        line = json.dumps({"job_id": job_id, "flow_input": flow_input}) + "\n"
+        self._process.stdin.write(line.encode())
+        await self._process.stdin.drain()
+        try:
+            return await job
+        finally:
+            # A job interrupted by cancellation is still running in the subprocess, so the worker stays busy.
+            if job.done() and not job.cancelled():
+                self._pending_job_id = None
+                self._pending_job = None
+
+    async def stop(self) -> None:
+        """Ask the worker to exit by closing its stdin, killing it if it doesn't within a few seconds."""
+        process = self._process
+        if process is not None and process.returncode is None:
+            if process.stdin is not None and not process.stdin.is_closing():
+                process.stdin.close()
+            try:
+                async with asyncio.timeout(_STOP_TIMEOUT_S):
+                    await process.wait()
+            except TimeoutError:
+                await self.terminate()
+        if self._monitor_task is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._monitor_task
+            self._monitor_task = None
+        await self._stop_websocket_listener()
+
+    async def _monitor_process(self, process: asyncio.subprocess.Process) -> None:
+        """Stream the worker's output until it exits, then fail whatever was waiting on it."""
+        # The worker lives for many jobs, so only keep the tail of its output for error reporting.
+        stdout_lines: deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
+        stderr_lines: deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
+        await asyncio.gather(
+            self._stream_output(process.stdout, "stdout", stdout_lines),
+            self._stream_output(process.stderr, "stderr", stderr_lines),
+        )
+        returncode = await process.wait()
+        self._is_running = False
+        logger.info("Workflow worker subprocess %s exited with return code %s", process.pid, returncode)
+
+        msg = f"Worker subprocess exited with return code {returncode}"
+        if returncode and stderr_lines:
+            msg = f"{msg}: {stderr_lines[-1]}"
+        error = SubprocessWorkflowWorkerError(msg)
+        for future in (self._ready, self._pending_job):
+            if future is not None and not future.done():
+                future.set_exception(error)
+
+    async def _handle_subprocess_event(self, event: dict) -> None:
+        event_type = event.get("type", "unknown")
+        payload = event.get("payload", {})
+        if event_type == "execution_event":
+            self._process_execution_event(payload)
+        elif event_type == WORKER_READY_EVENT:
+            self._process_ready_event(payload)
+        elif event_type == WORKER_RESULT_EVENT:
+            self._process_result_event(payload)
+
+    def _process_execution_event(self, payload: dict) -> None:
+        if payload.get("event_type") != "ExecutionEvent":
+            return
+        ex_event = ExecutionEvent.from_dict(data=payload)
+        if isinstance(ex_event.payload, ControlFlowResolvedEvent):
+            self._job_output = {
+                ex_event.payload.end_node_name: {
+                    "parameter_output_values": ex_event.payload.parameter_output_values,
+                    "unique_parameter_uuid_to_values": ex_event.payload.unique_parameter_uuid_to_values,
+                }
+            }
+        elif isinstance(ex_event.payload, ControlFlowCancelledEvent):
+            self._job_error = str(ex_event.payload.exception or ex_event.payload.result_details)
+
+    def _process_ready_event(self, payload: dict) -> None:
+        if self._ready is None or self._ready.done():
+            return
+        if payload.get("succeeded"):
+            self._ready.set_result(None)
+        else:
+            msg = f"Worker failed to load workflow '{self._workflow_path}': {payload.get('error')}"
+            self._ready.set_exception(SubprocessWorkflowWorkerError(msg))
+
+    def _process_result_event(self, payload: dict) -> None:
+        future = self._pending_job
+        if future is None or future.done() or payload.get("job_id") != self._pending_job_id:
+            logger.warning("Ignoring result for unknown worker job %s", payload.get("job_id"))
+            return
+        if payload.get("succeeded") and self._job_output is not None:
+            future.set_result(self._job_output)
+            return
+        details = payload.get("error") or self._job_error or "Workflow completed without output"
+        future.set_exception(SubprocessWorkflowWorkerError(f"Workflow execution failed: {details}"))
+
+
+class SubprocessWorkflowWorkerPool:
+    """Runs jobs for one workflow on at most max_workers warm SubprocessWorkflowWorkers.
+
+    Workers are started lazily, the first time a job finds no idle worker, and are reused
+    for later jobs until the pool closes. A worker that dies, or is interrupted mid-job by
+    cancellation, is discarded and replaced by the next job that needs one.
+    """
+
+    def __init__(
+        self,
+        workflow_path: str,
+        max_workers: int,
+        storage_backend: StorageBackend = StorageBackend.LOCAL,
+        on_event: Callable[[dict], None] | None = None,
+    ) -> None:
+        if max_workers < 1:
+            msg = f"max_workers must be at least 1, got {max_workers}"
+            raise ValueError(msg)
+        self._workflow_path = workflow_path
+        self._max_workers = max_workers
+        self._storage_backend = storage_backend
+        self._on_event = on_event
+        self._slots = asyncio.Semaphore(max_workers)
+        self._idle: list[SubprocessWorkflowWorker] = []
+        self._workers: set[SubprocessWorkflowWorker] = set()
+        self.workers_started = 0
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def arun(self, flow_input: dict[str, Any]) -> tuple[dict[str, Any], WorkerJobTiming]:
+        """Run one job, waiting for a free worker slot first.
+
+        Returns:
+            The control flow output and where the job's wall time went
+        """
+        async with self._slots:
+            worker, startup_s = await self._acquire_worker()
+            start = time.perf_counter()
+            try:
+                output = await worker.run(flow_input)
+            finally:
+                if worker.is_idle:
+                    self._idle.append(worker)
+                else:
+                    await self._discard(worker)
+            return output, WorkerJobTiming(startup_s=startup_s, run_s=time.perf_counter() - start)
+
+    async def close(self) -> None:
+        """Stop every worker."""
+        workers = list(self._workers)
+        self._workers.clear()
+        self._idle.clear()
+        results = await asyncio.gather(*(worker.stop() for worker in workers), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning("Error stopping workflow worker: %s", result)
+
+    async def _acquire_worker(self) -> tuple[SubprocessWorkflowWorker, float]:
+        while self._idle:
+            worker = self._idle.pop()
+            if worker.is_idle:
+                return worker, 0.0
+            await self._discard(worker)
+
+        start = time.perf_counter()
+        worker = SubprocessWorkflowWorker(
+            workflow_path=self._workflow_path,
+            storage_backend=self._storage_backend,
+            on_event=self._on_event,
+        )
+        self._workers.add(worker)
+        try:
+            await worker.start()
+        except BaseException:
+            self._workers.discard(worker)
+            raise
+        self.workers_started += 1
+        return worker, time.perf_counter() - start
+
+    async def _discard(self, worker: SubprocessWorkflowWorker) -> None:
+        self._workers.discard(worker)
+        try:
+            await worker.stop()
+        except Exception as e:
+            logger.warning("Error stopping workflow worker: %s", e)
@@ -0,0 +1,65 @@
+"""Warm worker script that runs a Griptape Nodes workflow once per input.
+
+This script is intended to be run as a subprocess by SubprocessWorkflowWorker. It loads
+the libraries and the workflow once, then reads one JSON job per line from stdin
+({"job_id": ..., "flow_input": {...}}) until stdin closes. Flow events go back over the
+session WebSocket as usual; each job is followed by a worker_result event carrying its
+job_id, so the parent can match results to jobs.
+"""
+
+import asyncio
+import json
+import sys
+from argparse import ArgumentParser
+
+from griptape_nodes.bootstrap.workflow_executors.local_session_workflow_executor import LocalSessionWorkflowExecutor
+from griptape_nodes.bootstrap.workflow_executors.subprocess_workflow_worker_pool import (
+    WORKER_READY_EVENT,
+    WORKER_RESULT_EVENT,
+)
+from griptape_nodes.utils import install_file_url_support
+
+# Install file:// URL support for httpx/requests in subprocess
+install_file_url_support()
+
+
+async def _serve(executor: LocalSessionWorkflowExecutor, workflow_path: str) -> None:
+    async with executor:
+        try:
+            flow_name = await executor.aprepare_workflow_for_run(flow_input={}, workflow_path=workflow_path)
+        except Exception as e:
+            executor.send_event(WORKER_READY_EVENT, json.dumps({"succeeded": False, "error": str(e)}))
+            await executor._wait_for_websocket_queue_flush()
+            raise
+        executor.send_event(WORKER_READY_EVENT, json.dumps({"succeeded": True}))
+
+        while line := await asyncio.to_thread(sys.stdin.readline):
+            job = json.loads(line)
+            error = None
+            try:
+                await executor.arun_prepared_flow(flow_name, job["flow_input"])
+            except Exception as e:
+                error = str(e)
+            executor.send_event(
+                WORKER_RESULT_EVENT,
+                json.dumps({"job_id": job["job_id"], "succeeded": error is None, "error": error}),
+            )
+            await executor._wait_for_websocket_queue_flush()
+
+
+def _main() -> None:
+    parser = ArgumentParser()
+    LocalSessionWorkflowExecutor.add_cli_arguments(parser)
+    parser.add_argument(
+        "--workflow-path",
+        required=True,
+        help="Path to the Griptape Nodes workflow file",
+    )
+    args = parser.parse_args()
+
+    local_session_workflow_executor = LocalSessionWorkflowExecutor.from_cli_args(args)
+    asyncio.run(_serve(local_session_workflow_executor, args.workflow_path))
+
+
+if __name__ == "__main__":
+    _main()
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 from rich.box import HEAVY_EDGE
 from rich.table import Table
 
+from griptape_nodes.cli.commands.doctor.startup_report import (
+    DEFAULT_STARTUP_TRACE_PATH,
+    StartupProfileError,
+    print_startup_report,
+    profile_startup,
+)
 from griptape_nodes.cli.commands.doctor.websocket_connection import WebSocketConnectionCheck
 
 if TYPE_CHECKING:
@@ -15,8 +22,38 @@ if TYPE_CHECKING:
 from griptape_nodes.cli.shared import console
 
 
-def doctor_command() -> None:
+def doctor_command(
+    startup: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--startup",
+            help=(
+                "Instead of the health checks, start the engine once and report where startup time goes. "
+                "No session is started, so no library workers are spawned unless --startup-session is given."
+            ),
+        ),
+    ] = False,
+    startup_session: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--startup-session",
+            help=(
+                "With --startup, also start a session so libraries that need a dedicated worker spawn one. "
+                "The spawns are traced; the workers' own startup is not."
+            ),
+        ),
+    ] = False,
+    trace_output: Annotated[
+        str,
+        typer.Option(help="Where --startup writes the full Chrome trace."),
+    ] = str(DEFAULT_STARTUP_TRACE_PATH),
+    top: Annotated[int, typer.Option(help="Number of phases and imports --startup lists.")] = 15,
+) -> None:
     """Run health checks on the Griptape Nodes engine."""
+    if startup:
+        _startup_report(Path(trace_output), top, start_session=startup_session)
+        return
+
     checks: list[HealthCheck] = [
         WebSocketConnectionCheck(),
     ]
@@ -41,3 +78,13 @@ def doctor_command() -> None:
 
     if not all_passed:
         raise typer.Exit(code=1)
+
+
+def _startup_report(trace_output: Path, top: int, *, start_session: bool) -> None:
+    console.print("[bold cyan]Starting the engine with startup tracing enabled...[/bold cyan]")
+    try:
+        spans, import_times = profile_startup(start_session=start_session)
+    except StartupProfileError as err:
+        console.print(f"[red]{err}[/red]")
+        raise typer.Exit(code=1) from err
+    print_startup_report(spans, import_times, top, trace_output)
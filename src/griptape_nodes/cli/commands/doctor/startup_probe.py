@@ -0,0 +1,82 @@
+"""Start the engine once with startup tracing enabled and write the spans to a Chrome trace.
+
+Run by `gtn doctor --startup` as `python -X importtime -m griptape_nodes.cli.commands.doctor.startup_probe
+<trace path> [--session]`, so the import times on stderr and the spans in the trace cover the same start.
+
+Without --session no session is started, so libraries that need a dedicated worker never spawn
+one. With it, a session is started after initialization and ended again once the worker spawns
+have run; the spawns are traced, but the workers themselves report back over the Nodes API
+connection, which the probe does not open.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+from griptape_nodes.common.startup_tracer import export_chrome_trace, get_startup_tracer
+
+# How long to let scheduled worker spawns run before ending the session
+WORKER_SPAWN_TIMEOUT_S = 30.0
+
+
+async def _start_engine(*, start_session: bool) -> None:
+    from griptape_nodes.retained_mode.events.app_events import AppInitializationComplete
+    from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
+
+    GriptapeNodes.EventManager().initialize_queue()
+    await GriptapeNodes.EventManager().abroadcast_app_event(AppInitializationComplete())
+    if start_session:
+        await _start_session()
+
+
+async def _start_session() -> None:
+    """Start a session as a client would, let the worker spawns it triggers run, then end it."""
+    from griptape_nodes.retained_mode.events.app_events import (
+        AppEndSessionRequest,
+        AppSessionStartedEvent,
+        AppStartSessionRequest,
+        AppStartSessionResultSuccess,
+    )
+    from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
+
+    result = await GriptapeNodes.ahandle_request(AppStartSessionRequest())
+    if not isinstance(result, AppStartSessionResultSuccess):
+        print(f"Failed to start a session: {result.result_details}", file=sys.stderr)  # noqa: T201
+        return
+
+    worker_manager = GriptapeNodes.WorkerManager()
+    try:
+        worker_manager.set_session_ready()
+        await GriptapeNodes.EventManager().abroadcast_app_event(AppSessionStartedEvent(session_id=result.session_id))
+        # Worker spawns are scheduled as tasks; wait for them rather than exiting under them
+        pending = asyncio.all_tasks() - {asyncio.current_task()}
+        if pending:
+            await asyncio.wait(pending, timeout=WORKER_SPAWN_TIMEOUT_S)
+    finally:
+        await worker_manager.reset_workers()
+        await GriptapeNodes.ahandle_request(AppEndSessionRequest())
+
+
+def main(argv: list[str]) -> int:
+    """Trace one engine start and write it to the given trace path."""
+    parser = argparse.ArgumentParser(prog="startup_probe")
+    parser.add_argument("trace_path", type=Path)
+    parser.add_argument("--session", action="store_true", help="Also start a session, so workers are spawned")
+    args = parser.parse_args(argv)
+
+    tracer = get_startup_tracer()
+    tracer.enabled = True
+    start = time.perf_counter()
+    asyncio.run(_start_engine(start_session=args.session))
+    tracer.record("engine startup", "startup", start, time.perf_counter())
+
+    export_chrome_trace(args.trace_path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,102 @@
+"""Startup report for `gtn doctor --startup`."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from rich.box import HEAVY_EDGE
+from rich.table import Table
+
+from griptape_nodes.cli.shared import console
+from griptape_nodes.common.startup_tracer import (
+    STARTUP_TRACE_ENV_VAR,
+    export_chrome_trace,
+    parse_importtime,
+    spans_from_chrome_trace,
+)
+
+if TYPE_CHECKING:
+    from griptape_nodes.common.startup_tracer import ModuleImportTime, StartupSpan
+
+PROBE_MODULE = "griptape_nodes.cli.commands.doctor.startup_probe"
+DEFAULT_STARTUP_TRACE_PATH = Path("gtn_startup_trace.json")
+
+
+class StartupProfileError(Exception):
+    """Raised when the traced engine start fails."""
+
+
+def profile_startup(*, start_session: bool = False) -> tuple[list[StartupSpan], list[ModuleImportTime]]:
+    """Start the engine in a subprocess under `python -X importtime` and return what it recorded.
+
+    A subprocess is used so that modules this CLI process has already imported are measured
+    from a cold start.
+
+    Args:
+        start_session: Also start a session after initialization, so worker spawns are traced
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        trace_path = Path(temp_dir) / "startup_trace.json"
+        env = {**os.environ, STARTUP_TRACE_ENV_VAR: "1"}
+        probe_args = [str(trace_path), *(["--session"] if start_session else [])]
+        completed = subprocess.run(  # noqa: S603
+            [sys.executable, "-X", "importtime", "-m", PROBE_MODULE, *probe_args],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if completed.returncode != 0 or not trace_path.exists():
+            details = "\n".join(line for line in completed.stderr.splitlines() if not line.startswith("import time:"))
+            msg = f"Traced engine start exited with code {completed.returncode}:\n{details[-4000:]}"
+            raise StartupProfileError(msg)
+        spans = spans_from_chrome_trace(json.loads(trace_path.read_text(encoding="utf-8")))
+    return spans, parse_importtime(completed.stderr)
+
+
+def slowest_spans(spans: list[StartupSpan], top: int) -> list[StartupSpan]:
+    """Return the top longest spans, longest first."""
+    return sorted(spans, key=lambda span: span.duration_s, reverse=True)[:top]
+
+
+def slowest_imports(import_times: list[ModuleImportTime], top: int) -> list[ModuleImportTime]:
+    """Return the top top-level imports by cumulative time, longest first.
+
+    Nested imports are left out because their time is already included in a top-level entry.
+    """
+    top_level = [timing for timing in import_times if timing.depth == 0]
+    return sorted(top_level, key=lambda timing: timing.cumulative_us, reverse=True)[:top]
+
+
+def print_startup_report(
+    spans: list[StartupSpan], import_times: list[ModuleImportTime], top: int, trace_output: Path
+) -> None:
+    """Print the slowest startup phases and imports, and write the full trace to trace_output."""
+    total = next((span for span in spans if span.name == "engine startup"), None)
+    if total is not None:
+        console.print(f"[bold]Engine startup took {total.duration_s * 1000:.0f} ms[/bold]")
+
+    phases = Table(title="Slowest startup phases", show_header=True, box=HEAVY_EDGE, expand=True)
+    phases.add_column("Phase", style="bold")
+    phases.add_column("Category")
+    phases.add_column("Duration (ms)", justify="right")
+    for span in slowest_spans(spans, top):
+        phases.add_row(span.name, span.category, f"{span.duration_s * 1000:.1f}")
+    console.print(phases)
+
+    imports = Table(title="Slowest imports", show_header=True, box=HEAVY_EDGE, expand=True)
+    imports.add_column("Module", style="bold")
+    imports.add_column("Cumulative (ms)", justify="right")
+    imports.add_column("Self (ms)", justify="right")
+    for timing in slowest_imports(import_times, top):
+        imports.add_row(timing.module, f"{timing.cumulative_us / 1000:.1f}", f"{timing.self_us / 1000:.1f}")
+    console.print(imports)
+
+    export_chrome_trace(trace_output, spans, import_times)
+    console.print(f"Full trace written to {trace_output} (open in chrome://tracing or https://ui.perfetto.dev)")
@@ -1,71 +1,148 @@
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from collections.abc import Set as AbstractSet
 
 logger = logging.getLogger("griptape_nodes")
 
 
 class DirectedGraph:
-    """Directed graph implementation using Python's graphlib for DAG operations."""
+    """Directed graph implementation using Python's graphlib for DAG operations.
+
+    Alongside the predecessor sets, the graph keeps a successor index and the sets of
+    nodes with no incoming edges (leaf nodes) and no outgoing edges (sink nodes) up to
+    date on every mutation. Degree queries are O(1), removing a node only touches its
+    direct neighbours, and leaf/sink nodes can be read without scanning the whole graph.
+
+    Methods returning ``AbstractSet`` hand back live, read-only views of internal state;
+    copy them before mutating the graph while iterating.
+    """
 
     def __init__(self) -> None:
         self._nodes: set[str] = set()
         self._predecessors: dict[str, set[str]] = {}
+        self._successors: dict[str, set[str]] = {}
+        self._leaf_nodes: set[str] = set()
+        self._sink_nodes: set[str] = set()
 
     def __len__(self) -> int:
         """Return the number of nodes in the graph."""
         return len(self._nodes)
 
+    def __contains__(self, node: object) -> bool:
+        """Return True if the node is in the graph, without copying the node set."""
+        return node in self._nodes
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the nodes in the graph without copying the node set."""
+        return iter(self._nodes)
+
     def add_node(self, node_for_adding: str) -> None:
         """Add a node to the graph."""
+        if node_for_adding in self._nodes:
+            return
         self._nodes.add(node_for_adding)
-        if node_for_adding not in self._predecessors:
-            self._predecessors[node_for_adding] = set()
+        self._predecessors[node_for_adding] = set()
+        self._successors[node_for_adding] = set()
+        self._leaf_nodes.add(node_for_adding)
+        self._sink_nodes.add(node_for_adding)
 
     def add_edge(self, from_node: str, to_node: str) -> None:
         """Add a directed edge from from_node to to_node."""
         self.add_node(from_node)
         self.add_node(to_node)
         self._predecessors[to_node].add(from_node)
+        self._successors[from_node].add(to_node)
+        self._leaf_nodes.discard(to_node)
+        self._sink_nodes.discard(from_node)
 
     def nodes(self) -> set[str]:
-        """Return all nodes in the graph."""
+        """Return a copy of all nodes in the graph.
+
+        Prefer ``node in graph``, ``len(graph)`` or iterating the graph directly when a
+        copy isn't needed.
+        """
         return self._nodes.copy()
 
+    def leaf_nodes(self) -> AbstractSet[str]:
+        """Return a read-only view of the nodes with no incoming edges (in-degree 0)."""
+        return self._leaf_nodes
+
+    def sink_nodes(self) -> AbstractSet[str]:
+        """Return a read-only view of the nodes with no outgoing edges (out-degree 0)."""
+        return self._sink_nodes
+
+    def predecessors(self, node: str) -> AbstractSet[str]:
+        """Return a read-only view of the nodes with an edge into the given node."""
+        if node not in self._nodes:
+            msg = f"Node {node} not found in graph"
+            raise KeyError(msg)
+        return self._predecessors[node]
+
+    def successors(self, node: str) -> AbstractSet[str]:
+        """Return a read-only view of the nodes the given node has an edge to."""
+        if node not in self._nodes:
+            msg = f"Node {node} not found in graph"
+            raise KeyError(msg)
+        return self._successors[node]
+
     def in_degree(self, node: str) -> int:
         """Return the in-degree of a node (number of incoming edges)."""
         if node not in self._nodes:
             msg = f"Node {node} not found in graph"
             raise KeyError(msg)
-        return len(self._predecessors.get(node, set()))
+        return len(self._predecessors[node])
 
     def out_degree(self, node: str) -> int:
         """Return the out-degree of a node (number of outgoing edges)."""
         if node not in self._nodes:
             msg = f"Node {node} not found in graph"
             raise KeyError(msg)
-        count = 0
-        for predecessors in self._predecessors.values():
-            if node in predecessors:
-                count += 1
-        return count
-
-    def remove_node(self, node: str) -> None:
-        """Remove a node and all its edges from the graph."""
+        return len(self._successors[node])
+
+    def remove_node(self, node: str) -> set[str]:
+        """Remove a node and all its edges from the graph.
+
+        Only the node's direct neighbours are visited.
+
+        Returns:
+            The successors of the removed node that became leaf nodes as a result.
+        """
         if node not in self._nodes:
-            return
+            return set()
 
         self._nodes.remove(node)
-
-        # Remove this node from all predecessor lists
-        for predecessors in self._predecessors.values():
+        self._leaf_nodes.discard(node)
+        self._sink_nodes.discard(node)
+        node_predecessors = self._predecessors.pop(node)
+        node_successors = self._successors.pop(node)
+
+        # Detach from predecessors' successor sets
+        for predecessor in node_predecessors - {node}:
+            successors = self._successors[predecessor]
+            successors.discard(node)
+            if not successors:
+                self._sink_nodes.add(predecessor)
+
+        # Detach from successors' predecessor sets, collecting any that are now ready
+        newly_ready = set()
+        for successor in node_successors - {node}:
+            predecessors = self._predecessors[successor]
             predecessors.discard(node)
+            if not predecessors:
+                self._leaf_nodes.add(successor)
+                newly_ready.add(successor)
 
-        # Remove this node's predecessor entry
-        if node in self._predecessors:
-            del self._predecessors[node]
+        return newly_ready
 
     def clear(self) -> None:
         """Clear all nodes and edges from the graph."""
         self._nodes.clear()
         self._predecessors.clear()
+        self._successors.clear()
+        self._leaf_nodes.clear()
+        self._sink_nodes.clear()
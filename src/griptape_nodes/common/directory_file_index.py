@@ -0,0 +1,296 @@
+"""Sorted, incrementally maintained index of the files under a directory.
+
+A DirectoryFileIndex maps the root-relative POSIX path of every file under its root to an entry,
+whose contents each subclass decides, and keeps those paths in one sorted list. A directory, or
+any path prefix, is then a contiguous slice found by binary search instead of a walk of the tree.
+
+The index is built by a single walk on first use, unless a subclass can load a persisted copy.
+After that, writes and deletes made through the engine update it as they happen, via
+record_write() and forget(). Files added or removed behind the engine's back are picked up by the
+next walk, which runs once the last one is older than rescan_interval_seconds, or when a caller
+asks for it. The default of five minutes keeps walks of large trees rare while bounding how long
+such a change goes unnoticed.
+
+A walk never holds the index lock. Changes recorded while it runs are replayed onto its result
+when it is swapped in.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import cast
+
+logger = logging.getLogger("griptape_nodes")
+
+DEFAULT_RESCAN_INTERVAL_SECONDS = 300.0
+# Suffix of the files the static server streams uploads into before renaming them into place
+PARTIAL_UPLOAD_SUFFIX = ".upload"
+
+# Change recorded for a path that was removed, since None can be an entry
+_REMOVED = object()
+
+
+class DirectoryFileIndex[T](ABC):
+    """The files under a directory, each mapped to an entry, in relative POSIX path order.
+
+    Subclasses decide what an entry holds by implementing _scanned_entry(), and can follow changes
+    to the entries through the other underscore hooks, which are called with self._lock held.
+    """
+
+    # Whether symlinks to files are indexed; symlinked directories are never entered
+    follow_file_symlinks = True
+
+    def __init__(self, root: Path, *, rescan_interval_seconds: float = DEFAULT_RESCAN_INTERVAL_SECONDS) -> None:
+        self.root = Path(root).absolute()
+        self.rescan_interval_seconds = rescan_interval_seconds
+        self._entries: dict[str, T] | None = None
+        self._sorted_keys: list[str] = []
+        self._scanned_at = 0.0
+        # (key, entry) changes recorded while a rescan is walking the tree, replayed onto its result.
+        # An entry of _REMOVED is a removal.
+        self._changes_during_rescan: list[tuple[str, T | object]] | None = None
+        # Guards the entries; held only briefly, never across a walk
+        self._lock = threading.RLock()
+        # Serializes the first load, so concurrent first uses walk the tree once
+        self._load_lock = threading.Lock()
+        # Serializes rescans
+        self._rescan_lock = threading.Lock()
+
+    @property
+    def file_count(self) -> int:
+        self._ensure_loaded()
+        with self._lock:
+            return len(self._sorted_keys)
+
+    def contains(self, path: Path) -> bool:
+        """Whether path lies inside the indexed directory."""
+        return Path(path).absolute().is_relative_to(self.root)
+
+    def ensure_current(self, *, refresh: bool = False) -> None:
+        """Load the index on first use, and walk the directory again if the last walk is stale or refresh is set."""
+        self._ensure_loaded()
+        with self._lock:
+            stale = refresh or time.time() - self._scanned_at > self.rescan_interval_seconds
+        if stale:
+            self.rescan()
+
+    def rescan(self) -> None:
+        """Rebuild the index from one walk of the directory."""
+        with self._rescan_lock:
+            with self._lock:
+                self._changes_during_rescan = []
+            try:
+                scanned = dict(self._walk(self.root)) if self.root.is_dir() else {}
+            except BaseException:
+                with self._lock:
+                    self._changes_during_rescan = None
+                raise
+            with self._lock:
+                previous_entries = self._entries or {}
+                for key, entry in scanned.items():
+                    if key in previous_entries:
+                        scanned[key] = self._rescanned_entry(entry, previous_entries[key])
+                changes = self._changes_during_rescan or []
+                self._changes_during_rescan = None
+                self._replace_entries(scanned, scanned_at=time.time())
+                for key, change in changes:
+                    self._apply_change(key, change)
+                self._rescanned()
+
+    def record_write(self, path: Path) -> None:
+        """Index a file, or every file beneath a directory, just written; forget the path if it is gone."""
+        path = Path(path)
+        written: list[tuple[str, T]] = []
+        try:
+            if path.is_dir():
+                directory_key = self._key(path)
+                directory_prefix = f"{directory_key}/" if directory_key else ""
+                written = [(f"{directory_prefix}{relative}", entry) for relative, entry in self._walk(path)]
+            elif path.is_file():
+                written = [(self._key(path), self._scanned_entry(path))]
+        except OSError as err:
+            logger.debug("Failed to index written path %s: %s", path, err)
+        if not written and not path.exists():
+            self.forget(path)
+            return
+        self._ensure_loaded()
+        with self._lock:
+            entries = self._loaded_entries()
+            for key, entry in written:
+                self._record_change(key, self._written_entry(entry, entries.get(key)))
+
+    def forget(self, path: Path) -> None:
+        """Drop a deleted file, or every file beneath a deleted directory, from the index."""
+        key = self._key(path)
+        self._ensure_loaded()
+        with self._lock:
+            self._forget_key(key)
+
+    def list_page(
+        self, prefix: str = "", cursor: str | None = None, limit: int | None = None
+    ) -> tuple[list[str], str | None]:
+        """Return up to limit indexed paths starting with prefix, in order, after cursor.
+
+        Args:
+            prefix: Only paths starting with this string are returned
+            cursor: The last path of the previous page, or None for the first page
+            limit: Maximum number of paths to return, or None for all of them
+
+        Returns:
+            The page of paths, and the cursor for the next page, or None if this is the last one
+        """
+        self.ensure_current()
+        with self._lock:
+            keys = self._sorted_keys
+            if cursor is not None and cursor >= prefix:
+                start = bisect.bisect_right(keys, cursor)
+            else:
+                start = bisect.bisect_left(keys, prefix)
+            page: list[str] = []
+            index = start
+            while index < len(keys) and (limit is None or len(page) < limit):
+                key = keys[index]
+                if not key.startswith(prefix):
+                    return page, None
+                page.append(key)
+                index += 1
+            has_more = index < len(keys) and keys[index].startswith(prefix)
+        return page, (page[-1] if has_more and page else None)
+
+    @abstractmethod
+    def _scanned_entry(self, file: os.DirEntry[str] | Path) -> T:
+        """Build the entry of a file found by a walk or just written. May raise OSError."""
+
+    def _written_entry(self, entry: T, previous: T | None) -> T:  # noqa: ARG002
+        """Adjust the entry of a file written through the engine, given its previous entry if it had one."""
+        return entry
+
+    def _rescanned_entry(self, entry: T, previous: T) -> T:  # noqa: ARG002
+        """Choose the entry a rescan keeps for a file that was already indexed."""
+        return entry
+
+    def _entry_changed(self, previous: T | None, current: T | None) -> None:  # noqa: B027
+        """Called after one file's entry is added, replaced or removed."""
+
+    def _entries_replaced(self) -> None:  # noqa: B027
+        """Called after every entry is replaced at once, by a load or a rescan."""
+
+    def _rescanned(self) -> None:  # noqa: B027
+        """Called at the end of a rescan, once changes made during the walk are replayed."""
+
+    def _load_persisted(self) -> tuple[dict[str, T], float] | None:
+        """Return persisted entries and the time of the walk that produced them, or None to walk now."""
+        return None
+
+    def _ensure_loaded(self) -> None:
+        """Load a persisted index, or walk the tree if there is none, on first use.
+
+        Callers must not hold self._lock: the read and the walk happen outside it.
+        """
+        if self._entries is not None:
+            return
+        with self._load_lock:
+            if self._entries is not None:
+                return
+            persisted = self._load_persisted()
+            if persisted is None:
+                self.rescan()
+                return
+            entries, scanned_at = persisted
+            with self._lock:
+                self._replace_entries(entries, scanned_at=scanned_at)
+
+    def _loaded_entries(self) -> dict[str, T]:
+        # Callers hold self._lock, after _ensure_loaded()
+        entries = self._entries
+        if entries is None:
+            msg = f"Index of directory {self.root} used before it was loaded."
+            raise RuntimeError(msg)
+        return entries
+
+    def _replace_entries(self, entries: dict[str, T], *, scanned_at: float) -> None:
+        # Callers hold self._lock
+        self._entries = entries
+        self._sorted_keys = sorted(entries)
+        self._scanned_at = scanned_at
+        self._entries_replaced()
+
+    def _record_change(self, key: str, entry: T | object) -> None:
+        # Callers hold self._lock. An entry of _REMOVED removes key.
+        if self._changes_during_rescan is not None:
+            self._changes_during_rescan.append((key, entry))
+        self._apply_change(key, entry)
+
+    def _forget_key(self, key: str) -> None:
+        # Callers hold self._lock
+        self._record_change(key, _REMOVED)
+
+    def _apply_change(self, key: str, entry: T | object) -> None:
+        # Callers hold self._lock
+        if entry is _REMOVED:
+            self._drop(key)
+        else:
+            self._store(key, cast("T", entry))
+
+    def _store(self, key: str, entry: T) -> None:
+        # Callers hold self._lock
+        entries = self._loaded_entries()
+        previous = entries.get(key)
+        if key not in entries:
+            bisect.insort(self._sorted_keys, key)
+        entries[key] = entry
+        self._entry_changed(previous, entry)
+
+    def _drop(self, key: str) -> None:
+        # Callers hold self._lock. Removes key and, if it is a directory, everything beneath it;
+        # the empty key is the root itself.
+        entries = self._loaded_entries()
+        keys = self._sorted_keys
+        if key in entries:
+            del keys[bisect.bisect_left(keys, key)]
+            self._entry_changed(entries.pop(key), None)
+        # Keys sharing a prefix are contiguous in sorted order
+        prefix = f"{key}/" if key else ""
+        start = bisect.bisect_left(keys, prefix)
+        end = start
+        while end < len(keys) and keys[end].startswith(prefix):
+            self._entry_changed(entries.pop(keys[end]), None)
+            end += 1
+        del keys[start:end]
+
+    def _key(self, path: Path) -> str:
+        absolute = Path(path).absolute()
+        if absolute == self.root:
+            return ""
+        try:
+            return absolute.relative_to(self.root).as_posix()
+        except ValueError:
+            return absolute.as_posix()
+
+    def _walk(self, directory: Path) -> list[tuple[str, T]]:
+        """Return (relative POSIX path, entry) for every file under directory, skipping partial uploads."""
+        files: list[tuple[str, T]] = []
+        pending = [(directory, "")]
+        while pending:
+            current, prefix = pending.pop()
+            try:
+                with os.scandir(current) as scanner:
+                    for entry in scanner:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append((Path(entry.path), f"{prefix}{entry.name}/"))
+                            elif entry.is_file(follow_symlinks=self.follow_file_symlinks) and not entry.name.endswith(
+                                PARTIAL_UPLOAD_SUFFIX
+                            ):
+                                files.append((f"{prefix}{entry.name}", self._scanned_entry(entry)))
+                        except OSError as err:
+                            logger.debug("Skipping inaccessible entry %s: %s", entry.path, err)
+            except OSError as err:
+                logger.debug("Skipping inaccessible directory %s: %s", current, err)
+        return files
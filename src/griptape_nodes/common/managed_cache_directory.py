@@ -0,0 +1,316 @@
+"""Size-bounded cache directories with an incrementally maintained size index.
+
+A ManagedCacheDirectory keeps the size, modification time, last access time and access count
+of every file under a directory, so its total size is known without walking the tree. Writes
+and reads made through the engine update the index as they happen, and the index is persisted
+under the user cache directory so that access history survives restarts.
+
+Eviction sorts the indexed files once by the configured policy (least recently used, or least
+frequently used) and deletes from the front until the directory is at the target size, instead
+of re-measuring the directory after every deletion.
+
+The index itself is a DirectoryFileIndex, so files added or removed behind the engine's back
+are picked up the same way as in the workspace listing: by a rescan, which runs when there is no
+persisted index and again before an eviction once the last walk is stale.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+
+from xdg_base_dirs import xdg_cache_home
+
+from griptape_nodes.common.directory_file_index import DEFAULT_RESCAN_INTERVAL_SECONDS, DirectoryFileIndex
+
+logger = logging.getLogger("griptape_nodes")
+
+CACHE_DIRECTORY_INDEX_DIR = xdg_cache_home() / "griptape_nodes" / "cache_directory_index"
+
+# Persist index changes from writes and reads at most this often
+_FLUSH_INTERVAL_SECONDS = 30.0
+_INDEX_VERSION = 1
+
+# Index entry fields, stored as a list per file to keep the persisted index small
+_SIZE, _MTIME_NS, _LAST_ACCESS, _ACCESS_COUNT = range(4)
+
+_directories: dict[str, ManagedCacheDirectory] = {}
+_directories_lock = threading.Lock()
+
+
+class CacheEvictionPolicy(StrEnum):
+    """Which files a ManagedCacheDirectory deletes first."""
+
+    LRU = "lru"  # Least recently written or read
+    LFU = "lfu"  # Fewest reads and writes, least recently used first among equals
+
+
+@dataclass(frozen=True)
+class CacheEvictionResult:
+    """Outcome of one eviction pass.
+
+    Attributes:
+        removed_count: Number of files deleted
+        freed_bytes: Total size of the deleted files
+        size_bytes: Directory size after the pass
+    """
+
+    removed_count: int
+    freed_bytes: int
+    size_bytes: int
+
+
+class ManagedCacheDirectory(DirectoryFileIndex[list[Any]]):
+    """A directory whose total size is tracked incrementally and bounded by eviction."""
+
+    # Eviction deletes what it indexes, so a symlink is never mistaken for the file it points to
+    follow_file_symlinks = False
+
+    def __init__(  # noqa: PLR0913
+        self,
+        directory: Path,
+        *,
+        max_size_bytes: int | None = None,
+        eviction_policy: CacheEvictionPolicy = CacheEvictionPolicy.LRU,
+        evict_in_background: bool = False,
+        rescan_interval_seconds: float = DEFAULT_RESCAN_INTERVAL_SECONDS,
+        index_path: Path | None = None,
+    ) -> None:
+        super().__init__(directory, rescan_interval_seconds=rescan_interval_seconds)
+        self.max_size_bytes = max_size_bytes
+        self.eviction_policy = eviction_policy
+        self.evict_in_background = evict_in_background
+        self._index_path = index_path if index_path is not None else self._default_index_path(self.root)
+        self._size_bytes = 0
+        self._flushed_at = 0.0
+        self._dirty = False
+        # Serializes eviction passes
+        self._evict_lock = threading.Lock()
+        self._background_eviction: threading.Thread | None = None
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the indexed files."""
+        self._ensure_loaded()
+        with self._lock:
+            return self._size_bytes
+
+    def record_access(self, path: Path) -> None:
+        """Note a read of an indexed file, for LRU and LFU ordering."""
+        key = self._key(path)
+        self._ensure_loaded()
+        with self._lock:
+            entry = self._loaded_entries().get(key)
+            if entry is None:
+                return
+            entry[_LAST_ACCESS] = time.time()
+            entry[_ACCESS_COUNT] += 1
+            self._mark_dirty()
+
+    def evict_to(self, target_bytes: int) -> CacheEvictionResult:
+        """Delete files in eviction-policy order until the directory is at most target_bytes.
+
+        Files are ranked once; the running total is updated per deletion rather than by
+        re-measuring the directory.
+        """
+        self._ensure_loaded()
+        with self._evict_lock:
+            with self._lock:
+                if self._size_bytes <= target_bytes:
+                    return CacheEvictionResult(removed_count=0, freed_bytes=0, size_bytes=self._size_bytes)
+                candidates = sorted(self._loaded_entries().items(), key=self._eviction_sort_key)
+
+            removed_count = 0
+            freed_bytes = 0
+            for key, candidate in candidates:
+                with self._lock:
+                    if self._size_bytes <= target_bytes:
+                        break
+                    # Skip files rewritten, forgotten or rescanned since they were ranked
+                    current = self._loaded_entries().get(key)
+                    if current is not candidate:
+                        continue
+                    try:
+                        (self.root / key).unlink()
+                    except FileNotFoundError:
+                        pass
+                    except OSError as err:
+                        logger.error(
+                            "While evicting from cache directory %s, could not delete %s; skipping. Error: %s",
+                            self.root,
+                            key,
+                            err,
+                        )
+                        continue
+                    else:
+                        removed_count += 1
+                        freed_bytes += current[_SIZE]
+                    self._forget_key(key)
+
+            with self._lock:
+                size_bytes = self._size_bytes
+        self.flush(force=True)
+
+        if removed_count > 0:
+            logger.info(
+                "Evicted %d files (%.1f MB) from %s. Directory size reduced to %.1f GB",
+                removed_count,
+                freed_bytes / (1024 * 1024),
+                self.root,
+                size_bytes / (1024 * 1024 * 1024),
+            )
+        return CacheEvictionResult(removed_count=removed_count, freed_bytes=freed_bytes, size_bytes=size_bytes)
+
+    def evict_if_needed(self) -> CacheEvictionResult | None:
+        """Evict down to max_size_bytes when the directory exceeds it.
+
+        Rescans the directory first when the last walk is older than rescan_interval_seconds.
+
+        Returns:
+            The eviction result, or None if no limit is set or the directory is within it
+        """
+        if self.max_size_bytes is None:
+            return None
+        self.ensure_current()
+        if self.size_bytes <= self.max_size_bytes:
+            return None
+        return self.evict_to(self.max_size_bytes)
+
+    def evict_if_needed_in_background(self) -> None:
+        """Start evict_if_needed() on a background thread, unless one is already running."""
+        if self.max_size_bytes is None or self.size_bytes <= self.max_size_bytes:
+            return
+        with self._lock:
+            if self._background_eviction is not None and self._background_eviction.is_alive():
+                return
+            self._background_eviction = threading.Thread(
+                target=self.evict_if_needed, daemon=True, name="cache-directory-eviction"
+            )
+            self._background_eviction.start()
+
+    def flush(self, *, force: bool = False) -> None:
+        """Persist the index if it changed. Failures are logged, since the index is only a cache."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            if not force and time.time() - self._flushed_at < _FLUSH_INTERVAL_SECONDS:
+                return
+            payload = json.dumps(
+                {
+                    "version": _INDEX_VERSION,
+                    "directory": str(self.root),
+                    "reconciled_at": self._scanned_at,
+                    "entries": self._entries,
+                }
+            )
+            self._dirty = False
+            self._flushed_at = time.time()
+        try:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file and rename it into place so readers never see a partial index.
+            fd, temp_path = tempfile.mkstemp(dir=self._index_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+                    temp_file.write(payload)
+                Path(temp_path).replace(self._index_path)
+            except BaseException:
+                Path(temp_path).unlink(missing_ok=True)
+                raise
+        except OSError as err:
+            logger.debug("Failed to write cache directory index '%s': %s", self._index_path, err)
+
+    def _scanned_entry(self, file: os.DirEntry[str] | Path) -> list[Any]:
+        file_stat = file.stat(follow_symlinks=False)
+        return [file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_mtime, 0]
+
+    def _written_entry(self, entry: list[Any], previous: list[Any] | None) -> list[Any]:
+        entry[_LAST_ACCESS] = time.time()
+        entry[_ACCESS_COUNT] = previous[_ACCESS_COUNT] + 1 if previous is not None else 1
+        return entry
+
+    def _rescanned_entry(self, entry: list[Any], previous: list[Any]) -> list[Any]:
+        # Keep the access history of files that did not change since they were indexed
+        if previous[_MTIME_NS] == entry[_MTIME_NS]:
+            entry[_LAST_ACCESS] = previous[_LAST_ACCESS]
+            entry[_ACCESS_COUNT] = previous[_ACCESS_COUNT]
+        return entry
+
+    def _entry_changed(self, previous: list[Any] | None, current: list[Any] | None) -> None:
+        if previous is not None:
+            self._size_bytes -= previous[_SIZE]
+        if current is not None:
+            self._size_bytes += current[_SIZE]
+        self._mark_dirty()
+
+    def _entries_replaced(self) -> None:
+        self._size_bytes = sum(entry[_SIZE] for entry in self._loaded_entries().values())
+
+    def _rescanned(self) -> None:
+        self._mark_dirty()
+
+    def _mark_dirty(self) -> None:
+        # Callers hold self._lock
+        self._dirty = True
+        if time.time() - self._flushed_at >= _FLUSH_INTERVAL_SECONDS:
+            self.flush()
+
+    def _load_persisted(self) -> tuple[dict[str, list[Any]], float] | None:
+        try:
+            data = json.loads(self._index_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as err:
+            logger.debug("Ignoring unreadable cache directory index '%s': %s", self._index_path, err)
+            return None
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != _INDEX_VERSION
+            or data.get("directory") != str(self.root)
+            or not isinstance(data.get("entries"), dict)
+        ):
+            return None
+        self._flushed_at = time.time()
+        return data["entries"], float(data.get("reconciled_at", 0.0))
+
+    def _eviction_sort_key(self, item: tuple[str, list[Any]]) -> tuple[float, ...]:
+        entry = item[1]
+        if self.eviction_policy == CacheEvictionPolicy.LFU:
+            return (entry[_ACCESS_COUNT], entry[_LAST_ACCESS])
+        return (entry[_LAST_ACCESS],)
+
+    @staticmethod
+    def _default_index_path(directory: Path) -> Path:
+        digest = hashlib.sha256(str(directory).encode("utf-8")).hexdigest()[:32]
+        return CACHE_DIRECTORY_INDEX_DIR / f"{digest}.json"
+
+
+def get_managed_cache_directory(directory: Path) -> ManagedCacheDirectory:
+    """Return the process-wide ManagedCacheDirectory for directory, creating it on first use."""
+    key = str(Path(directory).absolute())
+    with _directories_lock:
+        managed = _directories.get(key)
+        if managed is None:
+            managed = ManagedCacheDirectory(Path(key))
+            _directories[key] = managed
+        return managed
+
+
+def find_managed_cache_directory(path: Path) -> ManagedCacheDirectory | None:
+    """Return the managed directory with a size limit that contains path, if any."""
+    with _directories_lock:
+        if not _directories:
+            return None
+        managed_directories = list(_directories.values())
+    for managed in managed_directories:
+        if managed.max_size_bytes is not None and managed.contains(path):
+            return managed
+    return None
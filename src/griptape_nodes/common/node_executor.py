@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import pickle
+import time
 from contextvars import ContextVar
 from dataclasses import dataclass
 from enum import StrEnum
@@ -11,6 +13,11 @@ from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
 import anyio
 
+from griptape_nodes.bootstrap.workflow_executors.subprocess_workflow_worker_pool import (
+    LOOP_SUBPROCESS_WORKERS_KEY,
+    SubprocessWorkflowWorkerPool,
+    WorkerJobTiming,
+)
 from griptape_nodes.bootstrap.workflow_publishers.subprocess_workflow_publisher import SubprocessWorkflowPublisher
 from griptape_nodes.drivers.storage.storage_backend import StorageBackend
 from griptape_nodes.exe_types import node_types
@@ -89,6 +96,9 @@ from griptape_nodes.retained_mode.events.node_events import (
 )
 from griptape_nodes.retained_mode.events.parameter_events import (
     AlterElementEvent,
+    BatchSetParameterValuesRequest,
+    BatchSetParameterValuesResultFailure,
+    BatchSetParameterValuesResultSuccess,
     RemoveElementEvent,
     SetParameterValueRequest,
     SetParameterValueResultFailure,
@@ -116,6 +126,7 @@ from griptape_nodes.retained_mode.managers.event_manager import (
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from griptape_nodes.exe_types.flow import ControlFlow
     from griptape_nodes.retained_mode.events.node_events import SerializedNodeCommands
     from griptape_nodes.retained_mode.managers.library_manager import LibraryManager
 
@@ -134,7 +145,54 @@ class IterationControlAction(StrEnum):
     BREAK = "break"  # Break out of loop immediately
 
 
+MAX_LIVE_LOOP_ITERATIONS_KEY = "max_live_loop_iterations"
+
+# How often a parallel loop republishes its partial results to the End node
+_STREAMED_RESULTS_INTERVAL_S = 1.0
+
+
+class _LoopResultsStream:
+    """Streams a parallel loop's results into its End node in iteration order as iterations finish.
+
+    The End node's results list holds the results of the longest run of finished iterations
+    starting from the first, so it is always a prefix of the final results. The results
+    parameter is republished at most once per interval, since doing so copies the whole list.
+    """
+
+    def __init__(
+        self,
+        end_loop_node: BaseIterativeEndNode | BaseIterativeNodeGroup,
+        interval_s: float = _STREAMED_RESULTS_INTERVAL_S,
+    ) -> None:
+        self._end_loop_node = end_loop_node
+        self._interval_s = interval_s
+        # End nodes keep a None placeholder for iterations without a result; groups drop them
+        self._keep_missing = isinstance(end_loop_node, BaseIterativeEndNode)
+        self._finished_ahead: set[int] = set()
+        self._next_index = 0
+        self._published_at = time.perf_counter()
+        end_loop_node._results_list = []
+
+    def add(self, iteration_index: int, iteration_results: dict[int, Any]) -> None:
+        """Record a finished iteration, extending the End node's results if it closes a gap."""
+        self._finished_ahead.add(iteration_index)
+        while self._next_index in self._finished_ahead:
+            self._finished_ahead.remove(self._next_index)
+            if self._next_index in iteration_results or self._keep_missing:
+                self._end_loop_node._results_list.append(iteration_results.get(self._next_index))
+            self._next_index += 1
+
+    def publish(self) -> None:
+        """Republish the End node's results if the interval has passed since the last time."""
+        now = time.perf_counter()
+        if now - self._published_at >= self._interval_s:
+            self._end_loop_node._output_results_list()
+            self._published_at = now
+
+
 LOOP_EVENTS_TO_SUPPRESS = {
+    BatchSetParameterValuesResultSuccess,
+    BatchSetParameterValuesResultFailure,
     CreateFlowResultSuccess,
     CreateFlowResultFailure,
     ImportWorkflowAsReferencedSubFlowResultSuccess,
@@ -2778,57 +2836,76 @@ class NodeExecutor:
         Returns:
             Dict mapping iteration_index -> value for that iteration
         """
-        # Step 1: Get incoming connections TO the end_loop_node
+        endflow_param_name = self._find_endflow_param_for_iteration_results(end_loop_node, package_flow_result_success)
+        if endflow_param_name is None:
+            return {}
+
+        # Extract values from each iteration's EndFlow node
+        packaged_end_node_name = self.get_node_parameter_mappings(package_flow_result_success, "end").node_name
+        iteration_results = {}
+        for deserialized_flow in deserialized_flows:
+            iteration_index, flow_name, node_name_mappings = deserialized_flow
+            if node_name_mappings.get(packaged_end_node_name) is None:
+                logger.warning(
+                    "Could not find deserialized End node for iteration %d in flow '%s'",
+                    iteration_index,
+                    flow_name,
+                )
+                continue
+            iteration_results.update(
+                self._extract_iteration_result(deserialized_flow, packaged_end_node_name, endflow_param_name)
+            )
+        return iteration_results
+
+    def _find_endflow_param_for_iteration_results(
+        self,
+        end_loop_node: BaseIterativeEndNode | BaseIterativeNodeGroup,
+        package_flow_result_success: PackageNodesAsSerializedFlowResultSuccess,
+    ) -> str | None:
+        """Return the EndFlow parameter that carries each iteration's result, or None if nothing feeds the results."""
+        # Get incoming connections TO the end_loop_node
         list_connections_request = ListConnectionsForNodeRequest(node_name=end_loop_node.name)
         list_connections_result = GriptapeNodes.handle_request(list_connections_request)
         if not isinstance(list_connections_result, ListConnectionsForNodeResultSuccess):
             msg = f"Failed to list connections for node {end_loop_node.name}: {list_connections_result.result_details}"
             raise RuntimeError(msg)  # noqa: TRY004
 
-        incoming_connections = list_connections_result.incoming_connections
-
-        # Step 2: Get End node's parameter mappings (index 1 = EndFlow node)
-
-        end_node_mapping = self.get_node_parameter_mappings(package_flow_result_success, "end")
-        end_node_param_mappings = end_node_mapping.parameter_mappings
-
-        # Step 3: Find the EndFlow parameter that corresponds to new_item_to_add
-        endflow_param_name = self._find_endflow_param_for_end_loop_node(incoming_connections, end_node_param_mappings)
-
+        # Find the EndFlow parameter that corresponds to new_item_to_add
+        end_node_param_mappings = self.get_node_parameter_mappings(
+            package_flow_result_success, "end"
+        ).parameter_mappings
+        endflow_param_name = self._find_endflow_param_for_end_loop_node(
+            list_connections_result.incoming_connections, end_node_param_mappings
+        )
         if endflow_param_name is None:
             logger.warning(
                 "No connections found to BaseIterativeEndNode '%s' new_item_to_add parameter. No results will be collected.",
                 end_loop_node.name,
             )
-            return {}
-
-        # Step 4: Extract values from each iteration's EndFlow node
-        packaged_end_node_name = end_node_mapping.node_name
-        iteration_results = {}
-        node_manager = GriptapeNodes.NodeManager()
+        return endflow_param_name
 
-        for iteration_index, flow_name, node_name_mappings in deserialized_flows:
-            deserialized_end_node_name = node_name_mappings.get(packaged_end_node_name)
-            if deserialized_end_node_name is None:
-                logger.warning(
-                    "Could not find deserialized End node for iteration %d in flow '%s'",
-                    iteration_index,
-                    flow_name,
-                )
-                continue
-
-            try:
-                deserialized_end_node = node_manager.get_node_by_name(deserialized_end_node_name)
-                if endflow_param_name in deserialized_end_node.parameter_output_values:
-                    extracted_value = deserialized_end_node.parameter_output_values[endflow_param_name]
-                    iteration_results[iteration_index] = extracted_value
-            except Exception as e:
-                logger.warning(
-                    "Failed to extract result from End node for iteration %d: %s",
-                    iteration_index,
-                    e,
-                )
-        return iteration_results
+    def _extract_iteration_result(
+        self,
+        deserialized_flow: tuple[int, str, dict[str, str]],
+        packaged_end_node_name: str,
+        endflow_param_name: str,
+    ) -> dict[int, Any]:
+        """Return {iteration_index: result} from one iteration's EndFlow node, or {} if it produced no result."""
+        iteration_index, _, node_name_mappings = deserialized_flow
+        deserialized_end_node_name = node_name_mappings.get(packaged_end_node_name)
+        if deserialized_end_node_name is None:
+            return {}
+        try:
+            deserialized_end_node = GriptapeNodes.NodeManager().get_node_by_name(deserialized_end_node_name)
+            if endflow_param_name in deserialized_end_node.parameter_output_values:
+                return {iteration_index: deserialized_end_node.parameter_output_values[endflow_param_name]}
+        except Exception as e:
+            logger.warning(
+                "Failed to extract result from End node for iteration %d: %s",
+                iteration_index,
+                e,
+            )
+        return {}
 
     def get_last_iteration_values_for_packaged_nodes(
         self,
@@ -2921,6 +2998,11 @@ class NodeExecutor:
         can implement their own execution strategies (cloud, remote, etc.) by
         creating similar methods with the same signature.
 
+        Iterations stream through a window of at most max_live_loop_iterations live flows:
+        the next iteration's flow is deserialized as soon as an earlier one finishes, and
+        each finished flow has its results read and is deleted straight away. Results are
+        streamed into the End node in iteration order as they become available.
+
         Args:
             package_result: The packaged flow with parameter mappings
             total_iterations: Number of iterations to run
@@ -2933,181 +3015,209 @@ class NodeExecutor:
             - successful_iterations: List of iteration indices that succeeded
             - last_iteration_values: Dict mapping parameter names -> values from last iteration
         """
-        # Step 1: Deserialize N flow instances from the serialized flow
-        # Save the current context and restore it after each deserialization to prevent
-        # iteration flows from becoming children of each other
-        deserialized_flows = []
+        max_live = self._get_live_loop_iteration_limit(total_iterations)
         context_manager = GriptapeNodes.ContextManager()
         saved_context_flow = context_manager.get_current_flow() if context_manager.has_current_flow() else None
+        start_node_mapping = self.get_node_parameter_mappings(package_result, "start")
+        end_node_mapping = self.get_node_parameter_mappings(package_result, "end")
+        endflow_param_name = self._find_endflow_param_for_iteration_results(end_loop_node, package_result)
 
-        # Suppress events during deserialization to prevent sending them to websockets
-        event_manager = GriptapeNodes.EventManager()
-        with EventSuppressionContext(event_manager, LOOP_EVENTS_TO_SUPPRESS):
-            for iteration_index in range(total_iterations):
-                # Restore context before each deserialization to ensure all iteration flows
-                # are created at the same level (not as children of each other)
-                if saved_context_flow is not None:
-                    # Pop any flows that were pushed during previous iteration
-                    while (
-                        context_manager.has_current_flow() and context_manager.get_current_flow() != saved_context_flow
-                    ):
-                        context_manager.pop_flow()
+        live_iterations: dict[asyncio.Task[bool], tuple[int, str, dict[str, str]]] = {}
+        iteration_results: dict[int, Any] = {}
+        successful_iterations: list[int] = []
+        failed_iteration_errors: dict[int, str] = {}
+        last_iteration_values: dict[str, Any] = {}
+        results_stream = _LoopResultsStream(end_loop_node)
+        next_iteration_index = 0
+        setup_s = 0.0
 
-                deserialize_request = DeserializeFlowFromCommandsRequest(
-                    serialized_flow_commands=package_result.serialized_flow_commands
-                )
-                deserialize_result = GriptapeNodes.handle_request(deserialize_request)
-                if not isinstance(deserialize_result, DeserializeFlowFromCommandsResultSuccess):
-                    msg = f"Failed to deserialize flow for iteration {iteration_index}. Error: {deserialize_result.result_details}"
-                    raise TypeError(msg)
+        try:
+            while next_iteration_index < total_iterations or live_iterations:
+                # Step 1: Top the window up with new iteration flows
+                while next_iteration_index < total_iterations and len(live_iterations) < max_live:
+                    setup_start = time.perf_counter()
+                    iteration_flow = await self._create_loop_iteration_flow(
+                        package_result=package_result,
+                        iteration_index=next_iteration_index,
+                        parameter_values=parameter_values_per_iteration[next_iteration_index],
+                        start_node_mapping=start_node_mapping,
+                        saved_context_flow=saved_context_flow,
+                    )
+                    setup_s += time.perf_counter() - setup_start
+                    _, flow_name, node_name_mappings = iteration_flow
+                    task = asyncio.create_task(
+                        self._run_loop_iteration_flow(flow_name, node_name_mappings.get(start_node_mapping.node_name))
+                    )
+                    live_iterations[task] = iteration_flow
+                    next_iteration_index += 1
 
-                deserialized_flows.append(
-                    (iteration_index, deserialize_result.flow_name, deserialize_result.node_name_mappings)
-                )
+                # Step 2: Wait for any iteration to finish
+                done, _ = await asyncio.wait(live_iterations, return_when=asyncio.FIRST_COMPLETED)
 
-                # Pop the deserialized flow from the context stack to prevent it from staying there
-                # Deserialization pushes the flow onto the stack, but we don't want iteration flows
-                # to remain on the stack after deserialization
-                if (
-                    context_manager.has_current_flow()
-                    and context_manager.get_current_flow().name == deserialize_result.flow_name
-                ):
-                    context_manager.pop_flow()
-        logger.info("Successfully deserialized %d flow instances for parallel execution", total_iterations)
-        # Step 2: Set input values on start nodes for each iteration
-        for iteration_index, _, node_name_mappings in deserialized_flows:
-            parameter_values = parameter_values_per_iteration[iteration_index]
+                # Step 3: Collect each finished iteration's results, then tear its flow down
+                for task in sorted(done, key=lambda finished: live_iterations[finished][0]):
+                    iteration_flow = live_iterations.pop(task)
+                    iteration_index, flow_name, node_name_mappings = iteration_flow
+                    try:
+                        if task.cancelled():
+                            failed_iteration_errors[iteration_index] = "Iteration was cancelled"
+                        elif task.exception() is not None:
+                            failed_iteration_errors[iteration_index] = str(task.exception())
+                        elif task.result():
+                            successful_iterations.append(iteration_index)
+                        else:
+                            failed_iteration_errors[iteration_index] = "Iteration failed"
+
+                        # Failed iterations may still have produced partial output (e.g. nested loops)
+                        if endflow_param_name is not None:
+                            iteration_results.update(
+                                self._extract_iteration_result(
+                                    iteration_flow, end_node_mapping.node_name, endflow_param_name
+                                )
+                            )
+                        if iteration_index in failed_iteration_errors:
+                            iteration_results.setdefault(iteration_index, None)
+                        results_stream.add(iteration_index, iteration_results)
+                        if iteration_index == total_iterations - 1:
+                            last_iteration_values = self.get_last_iteration_values_for_packaged_nodes(
+                                deserialized_flows=[iteration_flow],
+                                package_result=package_result,
+                                total_iterations=total_iterations,
+                            )
+                    finally:
+                        await self._delete_loop_iteration_flow(iteration_index, flow_name)
+                results_stream.publish()
+        finally:
+            # Cancel whatever is still running (we only get here early on error or cancellation)
+            for task in live_iterations:
+                task.cancel()
+            await asyncio.gather(*live_iterations, return_exceptions=True)
+            for iteration_index, flow_name, _ in live_iterations.values():
+                await self._delete_loop_iteration_flow(iteration_index, flow_name)
 
-            # Get Start node mapping (index 0 in the list)
-            start_node_mapping = self.get_node_parameter_mappings(package_result, "start")
-            start_node_name = start_node_mapping.node_name
-            start_params = start_node_mapping.parameter_mappings
+        logger.info(
+            "Set up %d iterations in %.3fs (%.2fms per iteration), keeping at most %d live at once",
+            total_iterations,
+            setup_s,
+            setup_s * 1000 / max(total_iterations, 1),
+            max_live,
+        )
+        if failed_iteration_errors:
+            logger.warning(
+                "Loop execution: %d of %d parallel iterations failed. Results will contain None for failed iterations. Errors: %s",
+                len(failed_iteration_errors),
+                total_iterations,
+                failed_iteration_errors,
+            )
 
-            # Find the deserialized name for the Start node
-            deserialized_start_node_name = node_name_mappings.get(start_node_name)
-            if deserialized_start_node_name is None:
-                logger.warning(
-                    "Could not find deserialized Start node (original: '%s') for iteration %d",
-                    start_node_name,
-                    iteration_index,
-                )
-                continue
+        successful_iterations.sort()
+        return iteration_results, successful_iterations, last_iteration_values
 
-            # Set all parameter values on the deserialized Start node
-            for startflow_param_name in start_params:
-                if startflow_param_name not in parameter_values:
-                    continue
+    def _get_live_loop_iteration_limit(self, total_iterations: int) -> int:
+        """Return how many iteration flows a local parallel loop may keep live at once.
 
-                value_to_set = parameter_values[startflow_param_name]
+        Uses the max_live_loop_iterations setting, defaulting to every iteration at once,
+        and never more than the number of iterations.
+        """
+        configured = GriptapeNodes.ConfigManager().get_config_value(MAX_LIVE_LOOP_ITERATIONS_KEY, default=None)
+        limit = configured or total_iterations
+        return max(1, min(limit, total_iterations))
 
-                set_value_request = SetParameterValueRequest(
-                    node_name=deserialized_start_node_name,
-                    parameter_name=startflow_param_name,
-                    value=value_to_set,
-                )
-                set_value_result = await GriptapeNodes.ahandle_request(set_value_request)
-                if not isinstance(set_value_result, SetParameterValueResultSuccess):
-                    logger.warning(
-                        "Failed to set parameter '%s' on Start node '%s' for iteration %d: %s",
-                        startflow_param_name,
-                        deserialized_start_node_name,
-                        iteration_index,
-                        set_value_result.result_details,
-                    )
+    async def _create_loop_iteration_flow(
+        self,
+        *,
+        package_result: PackageNodesAsSerializedFlowResultSuccess,
+        iteration_index: int,
+        parameter_values: dict[str, Any],
+        start_node_mapping: PackagedNodeParameterMapping,
+        saved_context_flow: ControlFlow | None,
+    ) -> tuple[int, str, dict[str, str]]:
+        """Deserialize one iteration's flow and set its Start node values.
 
-        logger.info("Successfully set input values for %d iterations", total_iterations)
+        Returns:
+            Tuple of (iteration_index, flow_name, node_name_mappings)
+        """
+        context_manager = GriptapeNodes.ContextManager()
+        event_manager = GriptapeNodes.EventManager()
+        # Suppress events during deserialization to prevent sending them to websockets
+        with EventSuppressionContext(event_manager, LOOP_EVENTS_TO_SUPPRESS):
+            # Restore context before each deserialization to ensure all iteration flows
+            # are created at the same level (not as children of each other)
+            if saved_context_flow is not None:
+                while context_manager.has_current_flow() and context_manager.get_current_flow() != saved_context_flow:
+                    context_manager.pop_flow()
 
-        # Step 3: Run all flows concurrently
-        packaged_start_node_name = self.get_node_parameter_mappings(package_result, "start").node_name
+            deserialize_request = DeserializeFlowFromCommandsRequest(
+                serialized_flow_commands=package_result.serialized_flow_commands
+            )
+            deserialize_result = GriptapeNodes.handle_request(deserialize_request)
+            if not isinstance(deserialize_result, DeserializeFlowFromCommandsResultSuccess):
+                msg = f"Failed to deserialize flow for iteration {iteration_index}. Error: {deserialize_result.result_details}"
+                raise TypeError(msg)
 
-        async def run_single_iteration(flow_name: str, iteration_index: int, start_node_name: str) -> tuple[int, bool]:
-            """Run a single iteration flow and return success status."""
-            # Suppress execution events during parallel iteration to prevent flooding websockets
-            with EventSuppressionContext(event_manager, EXECUTION_EVENTS_TO_SUPPRESS):
-                start_subflow_request = StartLocalSubflowRequest(
-                    flow_name=flow_name,
-                    start_node=start_node_name,
-                    pickle_control_flow_result=False,
-                )
-                start_subflow_result = await GriptapeNodes.ahandle_request(start_subflow_request)
-                success = isinstance(start_subflow_result, StartLocalSubflowResultSuccess)
-                return iteration_index, success
+            # Deserialization pushes the flow onto the context stack, but we don't want
+            # iteration flows to remain on the stack after deserialization
+            if (
+                context_manager.has_current_flow()
+                and context_manager.get_current_flow().name == deserialize_result.flow_name
+            ):
+                context_manager.pop_flow()
 
-        try:
-            # Run all iterations concurrently
-            iteration_tasks = [
-                run_single_iteration(
-                    flow_name,
-                    iteration_index,
-                    node_name_mappings.get(packaged_start_node_name),
-                )
-                for iteration_index, flow_name, node_name_mappings in deserialized_flows
-            ]
-            iteration_results = await asyncio.gather(*iteration_tasks, return_exceptions=True)
-
-            # Step 4: Collect successful and failed iterations
-            successful_iterations = []
-            failed_iteration_indices = []
-            failed_iteration_errors = {}  # Map iteration_index -> error
-
-            for idx, result in enumerate(iteration_results):
-                if isinstance(result, Exception):
-                    # Exception doesn't include iteration_index, use enumerate index
-                    failed_iteration_indices.append(idx)
-                    failed_iteration_errors[idx] = str(result)
-                    continue
-                if isinstance(result, tuple):
-                    iteration_index, success = result
-                    if success:
-                        successful_iterations.append(iteration_index)
-                    else:
-                        failed_iteration_indices.append(iteration_index)
-                        failed_iteration_errors[iteration_index] = "Iteration failed"
-
-            if failed_iteration_indices:
+        # Set this iteration's input values on the deserialized Start node in one batch
+        node_name_mappings = deserialize_result.node_name_mappings
+        deserialized_start_node_name = node_name_mappings.get(start_node_mapping.node_name)
+        values_to_set = {
+            startflow_param_name: parameter_values[startflow_param_name]
+            for startflow_param_name in start_node_mapping.parameter_mappings
+            if startflow_param_name in parameter_values
+        }
+        if deserialized_start_node_name is None:
+            logger.warning(
+                "Could not find deserialized Start node (original: '%s') for iteration %d",
+                start_node_mapping.node_name,
+                iteration_index,
+            )
+        elif values_to_set:
+            set_values_request = BatchSetParameterValuesRequest(
+                node_name=deserialized_start_node_name,
+                parameter_values=values_to_set,
+            )
+            set_values_result = await GriptapeNodes.ahandle_request(set_values_request)
+            if not isinstance(set_values_result, BatchSetParameterValuesResultSuccess):
                 logger.warning(
-                    "Loop execution: %d of %d parallel iterations failed. Results will contain None for failed iterations. Errors: %s",
-                    len(failed_iteration_indices),
-                    total_iterations,
-                    failed_iteration_errors,
+                    "Failed to set input values on Start node '%s' for iteration %d: %s",
+                    deserialized_start_node_name,
+                    iteration_index,
+                    set_values_result.result_details,
                 )
 
-            # Step 4: Extract parameter values from iterations BEFORE cleanup
-            iteration_results = self.get_parameter_values_from_iterations(
-                end_loop_node=end_loop_node,
-                deserialized_flows=deserialized_flows,
-                package_flow_result_success=package_result,
-            )
-
-            # Add None values for failed iterations that didn't produce any results
-            # (e.g., nested loops may fail but still produce partial output)
-            for failed_idx in failed_iteration_indices:
-                if failed_idx not in iteration_results:
-                    iteration_results[failed_idx] = None
+        return iteration_index, deserialize_result.flow_name, node_name_mappings
 
-            # Step 5: Extract last iteration values BEFORE cleanup (flows deleted in finally block)
-            last_iteration_values = self.get_last_iteration_values_for_packaged_nodes(
-                deserialized_flows=deserialized_flows,
-                package_result=package_result,
-                total_iterations=total_iterations,
+    async def _run_loop_iteration_flow(self, flow_name: str, start_node_name: str | None) -> bool:
+        """Run a single iteration flow and return whether it succeeded."""
+        # Suppress execution events during parallel iteration to prevent flooding websockets
+        with EventSuppressionContext(GriptapeNodes.EventManager(), EXECUTION_EVENTS_TO_SUPPRESS):
+            start_subflow_request = StartLocalSubflowRequest(
+                flow_name=flow_name,
+                start_node=start_node_name,
+                pickle_control_flow_result=False,
             )
-
-            return iteration_results, successful_iterations, last_iteration_values
-
-        finally:
-            # Step 5: Cleanup - delete all iteration flows
-            # Suppress events during deletion to prevent sending them to websockets
-            with EventSuppressionContext(event_manager, {DeleteFlowResultSuccess, DeleteFlowResultFailure}):
-                for iteration_index, flow_name, _ in deserialized_flows:
-                    delete_request = DeleteFlowRequest(flow_name=flow_name)
-                    delete_result = await GriptapeNodes.ahandle_request(delete_request)
-                    if not isinstance(delete_result, DeleteFlowResultSuccess):
-                        logger.warning(
-                            "Failed to delete iteration flow '%s' (iteration %d): %s",
-                            flow_name,
-                            iteration_index,
-                            delete_result.result_details,
-                        )
+            start_subflow_result = await GriptapeNodes.ahandle_request(start_subflow_request)
+            return isinstance(start_subflow_result, StartLocalSubflowResultSuccess)
+
+    async def _delete_loop_iteration_flow(self, iteration_index: int, flow_name: str) -> None:
+        """Delete an iteration flow once its results have been read."""
+        # Suppress events during deletion to prevent sending them to websockets
+        with EventSuppressionContext(GriptapeNodes.EventManager(), {DeleteFlowResultSuccess, DeleteFlowResultFailure}):
+            delete_request = DeleteFlowRequest(flow_name=flow_name)
+            delete_result = await GriptapeNodes.ahandle_request(delete_request)
+            if not isinstance(delete_result, DeleteFlowResultSuccess):
+                logger.warning(
+                    "Failed to delete iteration flow '%s' (iteration %d): %s",
+                    flow_name,
+                    iteration_index,
+                    delete_result.result_details,
+                )
 
     async def _execute_loop_iterations_via_subprocess(  # noqa: PLR0913
         self,
@@ -3154,7 +3264,9 @@ class NodeExecutor:
             node_metadata = library.get_node_metadata(start_node_type)
             start_node_name = node_metadata.display_name
 
-        mode_str = "sequentially" if run_sequentially else "concurrently"
+        # Sequential loops still go through the bounded runners below, with a single slot.
+        max_workers = 1 if run_sequentially else self._get_loop_subprocess_worker_limit(total_iterations)
+        mode_str = "sequentially" if run_sequentially else f"concurrently (up to {max_workers} at a time)"
         logger.info(
             "Executing %d iterations %s in %s for loop '%s'",
             total_iterations,
@@ -3163,86 +3275,186 @@ class NodeExecutor:
             end_loop_node.name,
         )
 
-        try:
-            if run_sequentially:
-                # Execute iterations one-at-a-time
-                iteration_outputs: list[tuple[int, bool, dict[str, Any] | None]] = []
-                for iteration_index in range(total_iterations):
-                    try:
-                        flow_input = {start_node_name: parameter_values_per_iteration[iteration_index]}
-                        logger.info(
-                            "Executing iteration %d/%d for loop '%s'",
-                            iteration_index + 1,
-                            total_iterations,
-                            end_loop_node.name,
-                        )
+        # Pass node for event updates if it's a SubflowNodeGroup (includes BaseIterativeNodeGroup)
+        subflow_node = end_loop_node if isinstance(end_loop_node, SubflowNodeGroup) else None
+        flow_inputs = {
+            iteration_index: {start_node_name: parameter_values_per_iteration[iteration_index]}
+            for iteration_index in range(total_iterations)
+        }
 
-                        # Pass node for event updates if it's a SubflowNodeGroup (includes BaseIterativeNodeGroup)
-                        subflow_node = end_loop_node if isinstance(end_loop_node, SubflowNodeGroup) else None
-                        subprocess_result = await self._execute_subprocess(
-                            published_workflow_filename=workflow_path,
-                            file_name=f"{file_name_prefix}_iteration_{iteration_index}",
-                            pickle_control_flow_result=True,
-                            flow_input=flow_input,
-                            node=subflow_node,
-                        )
-                        iteration_outputs.append((iteration_index, True, subprocess_result))
-                    except Exception:
-                        logger.exception("Iteration %d failed for loop '%s'", iteration_index, end_loop_node.name)
-                        iteration_outputs.append((iteration_index, False, None))
-            else:
-                # Execute all iterations concurrently
-                # Get subflow_node reference for event updates (scoped outside the closure)
-                subflow_node = end_loop_node if isinstance(end_loop_node, SubflowNodeGroup) else None
+        if execution_type == PRIVATE_EXECUTION:
+            iteration_outputs = await self._run_loop_iterations_on_worker_pool(
+                flow_inputs=flow_inputs,
+                workflow_path=workflow_path,
+                end_loop_node=end_loop_node,
+                subflow_node=subflow_node,
+                max_workers=max_workers,
+            )
+        else:
+            # Library publishers own their published workflow's entry point, so each iteration
+            # runs it through a fresh subprocess; only the concurrency is bounded.
+            iteration_outputs = await self._run_loop_iterations_in_fresh_subprocesses(
+                flow_inputs=flow_inputs,
+                workflow_path=workflow_path,
+                file_name_prefix=file_name_prefix,
+                end_loop_node=end_loop_node,
+                subflow_node=subflow_node,
+                max_concurrent=max_workers,
+            )
 
-                async def run_single_iteration(iteration_index: int) -> tuple[int, bool, dict[str, Any] | None]:
-                    try:
-                        flow_input = {start_node_name: parameter_values_per_iteration[iteration_index]}
-                        logger.info(
-                            "Executing iteration %d/%d for loop '%s'",
-                            iteration_index + 1,
-                            total_iterations,
-                            end_loop_node.name,
-                        )
+        # Extract results
+        iteration_results, successful_iterations, last_iteration_values = (
+            self._extract_iteration_results_from_subprocess(
+                iteration_outputs=iteration_outputs,
+                package_result=package_result,
+                end_loop_node=end_loop_node,
+            )
+        )
 
-                        subprocess_result = await self._execute_subprocess(
-                            published_workflow_filename=workflow_path,
-                            file_name=f"{file_name_prefix}_iteration_{iteration_index}",
-                            pickle_control_flow_result=True,
-                            flow_input=flow_input,
-                            node=subflow_node,
-                        )
-                    except Exception:
-                        logger.exception("Iteration %d failed for loop '%s'", iteration_index, end_loop_node.name)
-                        return iteration_index, False, None
-                    else:
-                        return iteration_index, True, subprocess_result
-
-                iteration_tasks = [run_single_iteration(i) for i in range(total_iterations)]
-                iteration_outputs = await asyncio.gather(*iteration_tasks)
-
-            # Extract results
-            iteration_results, successful_iterations, last_iteration_values = (
-                self._extract_iteration_results_from_subprocess(
-                    iteration_outputs=iteration_outputs,
-                    package_result=package_result,
-                    end_loop_node=end_loop_node,
-                )
+        logger.info(
+            "Successfully completed %d/%d iterations %s in %s for loop '%s'",
+            len(successful_iterations),
+            total_iterations,
+            mode_str,
+            execution_type,
+            end_loop_node.name,
+        )
+
+        return iteration_results, successful_iterations, last_iteration_values
+
+    def _get_loop_subprocess_worker_limit(self, total_iterations: int) -> int:
+        """Return how many loop iterations may run in subprocesses at once.
+
+        Uses the loop_subprocess_workers setting, defaulting to the CPU count, and never
+        more than the number of iterations.
+        """
+        configured = GriptapeNodes.ConfigManager().get_config_value(LOOP_SUBPROCESS_WORKERS_KEY, default=None)
+        limit = configured or os.cpu_count() or 1
+        return max(1, min(limit, total_iterations))
+
+    async def _run_loop_iterations_on_worker_pool(
+        self,
+        *,
+        flow_inputs: dict[int, dict[str, Any]],
+        workflow_path: Path,
+        end_loop_node: BaseIterativeEndNode | BaseIterativeNodeGroup,
+        subflow_node: SubflowNodeGroup | None,
+        max_workers: int,
+    ) -> list[tuple[int, bool, dict[str, Any] | None]]:
+        """Run loop iterations on a bounded pool of warm workers that load the workflow once.
+
+        Args:
+            flow_inputs: Dict mapping iteration_index -> flow input for the workflow's StartNode
+            workflow_path: Path to the saved workflow file
+            end_loop_node: The End Loop Node, for logging
+            subflow_node: Optional SubflowNodeGroup to receive real-time event updates
+            max_workers: Maximum number of worker subprocesses, and so of concurrent iterations
+
+        Returns:
+            List of (iteration_index, success, subprocess_result) tuples in iteration order
+        """
+        total_iterations = len(flow_inputs)
+        on_event = subflow_node.subflow_execution_component.handle_execution_event if subflow_node else None
+        timings: list[WorkerJobTiming] = []
+
+        async def run_single_iteration(
+            pool: SubprocessWorkflowWorkerPool, iteration_index: int
+        ) -> tuple[int, bool, dict[str, Any] | None]:
+            try:
+                subprocess_result, timing = await pool.arun(flow_inputs[iteration_index])
+            except Exception:
+                logger.exception("Iteration %d failed for loop '%s'", iteration_index, end_loop_node.name)
+                return iteration_index, False, None
+            timings.append(timing)
+            logger.debug(
+                "Iteration %d/%d for loop '%s' finished: startup %.3fs, run %.3fs",
+                iteration_index + 1,
+                total_iterations,
+                end_loop_node.name,
+                timing.startup_s,
+                timing.run_s,
             )
+            return iteration_index, True, subprocess_result
+
+        async with SubprocessWorkflowWorkerPool(
+            workflow_path=str(workflow_path),
+            max_workers=max_workers,
+            storage_backend=await self._get_storage_backend(),
+            on_event=on_event,
+        ) as pool:
+            iteration_outputs = await asyncio.gather(*(run_single_iteration(pool, i) for i in flow_inputs))
+            workers_started = pool.workers_started
 
+        if timings:
+            total_startup_s = sum(timing.startup_s for timing in timings)
             logger.info(
-                "Successfully completed %d/%d iterations %s in %s for loop '%s'",
-                len(successful_iterations),
-                total_iterations,
-                mode_str,
-                execution_type,
+                "Loop '%s' ran %d iterations on %d warm worker(s): startup %.2fs total (%.3fs per iteration), "
+                "run %.3fs per iteration",
                 end_loop_node.name,
+                len(timings),
+                workers_started,
+                total_startup_s,
+                total_startup_s / len(timings),
+                sum(timing.run_s for timing in timings) / len(timings),
             )
+        return list(iteration_outputs)
 
-            return iteration_results, successful_iterations, last_iteration_values
-        finally:
-            # Cleanup handled by wrapper methods
-            pass
+    async def _run_loop_iterations_in_fresh_subprocesses(  # noqa: PLR0913
+        self,
+        *,
+        flow_inputs: dict[int, dict[str, Any]],
+        workflow_path: Path,
+        file_name_prefix: str,
+        end_loop_node: BaseIterativeEndNode | BaseIterativeNodeGroup,
+        subflow_node: SubflowNodeGroup | None,
+        max_concurrent: int,
+    ) -> list[tuple[int, bool, dict[str, Any] | None]]:
+        """Run each loop iteration in its own subprocess, at most max_concurrent at a time.
+
+        Args:
+            flow_inputs: Dict mapping iteration_index -> flow input for the workflow's StartNode
+            workflow_path: Path to the published workflow file
+            file_name_prefix: Prefix for iteration-specific file names
+            end_loop_node: The End Loop Node, for logging
+            subflow_node: Optional SubflowNodeGroup to receive real-time event updates
+            max_concurrent: Maximum number of subprocesses running at once
+
+        Returns:
+            List of (iteration_index, success, subprocess_result) tuples in iteration order
+        """
+        total_iterations = len(flow_inputs)
+        slots = asyncio.Semaphore(max_concurrent)
+
+        async def run_single_iteration(iteration_index: int) -> tuple[int, bool, dict[str, Any] | None]:
+            async with slots:
+                logger.info(
+                    "Executing iteration %d/%d for loop '%s'",
+                    iteration_index + 1,
+                    total_iterations,
+                    end_loop_node.name,
+                )
+                start = time.perf_counter()
+                try:
+                    subprocess_result = await self._execute_subprocess(
+                        published_workflow_filename=workflow_path,
+                        file_name=f"{file_name_prefix}_iteration_{iteration_index}",
+                        pickle_control_flow_result=True,
+                        flow_input=flow_inputs[iteration_index],
+                        node=subflow_node,
+                    )
+                except Exception:
+                    logger.exception("Iteration %d failed for loop '%s'", iteration_index, end_loop_node.name)
+                    return iteration_index, False, None
+                logger.debug(
+                    "Iteration %d/%d for loop '%s' finished in %.3fs, including subprocess startup",
+                    iteration_index + 1,
+                    total_iterations,
+                    end_loop_node.name,
+                    time.perf_counter() - start,
+                )
+                return iteration_index, True, subprocess_result
+
+        return list(await asyncio.gather(*(run_single_iteration(i) for i in flow_inputs)))
 
     async def _execute_loop_iterations_sequentially_private(
         self,
@@ -3619,12 +3831,11 @@ class NodeExecutor:
         if dag_builder:
             for node_name in packaged_node_names:
                 # Remove from node_to_reference
-                if node_name in dag_builder.node_to_reference:
-                    dag_builder.node_to_reference.pop(node_name)
+                dag_builder.remove_node_reference(node_name)
 
                 # Remove from all networks and check if any become empty
                 for network in list(dag_builder.graphs.values()):
-                    if node_name in network.nodes():
+                    if node_name in network:
                         network.remove_node(node_name)
 
     def _deserialize_parameter_value(self, param_name: str, param_value: Any, unique_uuid_to_values: dict) -> Any:
@@ -0,0 +1,252 @@
+"""References to large parameter values in ParameterValueUpdateEvents.
+
+A ParameterValueUpdateEvent normally carries the whole unstructured value: an image artifact
+with its base64 bytes, a long list, a large dict. When parameter_value_reference_threshold_bytes
+is set, values whose JSON form reaches it are written once to a content-addressed directory
+served by the static server, and the event carries a small reference instead:
+
+    {"__parameter_value_ref__": {"url": ..., "digest": ..., "size_bytes": ..., "summary": {...}}}
+
+Clients render the summary and fetch the URL when they need the full value. Identical values
+share one file, named by the SHA-256 of their JSON bytes.
+
+Every engine process using a workspace stores into its own ParameterValueStore, a subdirectory
+of the shared parameter value directory, and only ever deletes its own values. A store lives as
+long as the workflow whose events referenced its values: it is emptied when the workflow is
+cleared. Stores of processes that have exited are removed by the next engine that starts.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import shutil
+import uuid
+from typing import TYPE_CHECKING, Any
+
+import portalocker
+
+from griptape_nodes.retained_mode.managers.settings import PARAMETER_VALUE_REFERENCE_THRESHOLD_KEY
+from griptape_nodes.utils.file_utils import atomic_write_bytes
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = logging.getLogger("griptape_nodes")
+
+PARAMETER_VALUE_DIR_NAME = "parameter_values"
+PARAMETER_VALUE_REFERENCE_KEY = "__parameter_value_ref__"
+
+_VALUE_SUFFIX = ".json"
+_STORE_LOCK_SUFFIX = ".lock"
+_SUMMARY_MAX_KEYS = 20
+_SUMMARY_MAX_TEXT = 200
+
+
+def write_parameter_value(directory: Path, value_json: bytes) -> str:
+    """Store value_json in directory unless an identical value is already there.
+
+    Args:
+        directory: The value directory, created if missing.
+        value_json: The JSON bytes of the value.
+
+    Returns:
+        The SHA-256 hex digest that names the stored file.
+    """
+    digest = hashlib.sha256(value_json).hexdigest()
+    value_path = directory / f"{digest}{_VALUE_SUFFIX}"
+    if value_path.exists():
+        return digest
+
+    directory.mkdir(parents=True, exist_ok=True)
+    atomic_write_bytes(value_path, value_json)
+    return digest
+
+
+def clear_parameter_values(directory: Path) -> int:
+    """Delete every value stored in directory.
+
+    Args:
+        directory: The value directory. A missing directory holds nothing to delete.
+
+    Returns:
+        The number of stored values deleted.
+    """
+    if not directory.is_dir():
+        return 0
+
+    removed = 0
+    for value_path in directory.glob(f"*{_VALUE_SUFFIX}"):
+        try:
+            value_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("Failed to delete stored parameter value %s: %s", value_path, e)
+            continue
+        removed += 1
+    return removed
+
+
+def get_parameter_value_file_name(digest: str) -> str:
+    """Return the file name of the value with this digest within its store."""
+    return f"{digest}{_VALUE_SUFFIX}"
+
+
+class ParameterValueStore:
+    """The values stored by one process, in its own subdirectory of a root shared by every engine.
+
+    The process holds an exclusive lock on "<root>/<store_id>.lock" for as long as it lives, which
+    is how remove_abandoned_parameter_value_stores() tells a live store from an abandoned one.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """Claim a new store under root.
+
+        Raises:
+            OSError: If the store cannot be created or its lock cannot be taken.
+        """
+        self.root = root
+        self.store_id = uuid.uuid4().hex
+        self.directory = root / self.store_id
+        root.mkdir(parents=True, exist_ok=True)
+        # Taken before the directory exists, so no sweep ever sees the directory without a held lock
+        self._lock = portalocker.Lock(
+            root / f"{self.store_id}{_STORE_LOCK_SUFFIX}",
+            mode="a",
+            flags=portalocker.LockFlags.EXCLUSIVE | portalocker.LockFlags.NON_BLOCKING,
+        )
+        try:
+            self._lock.acquire()
+        except portalocker.LockException as e:
+            msg = f"Failed to lock parameter value store {self.directory}: {e}"
+            raise OSError(msg) from e
+        self.directory.mkdir()
+
+    def write(self, value_json: bytes) -> str:
+        """Store value_json unless an identical value is already stored; return its digest."""
+        return write_parameter_value(self.directory, value_json)
+
+    def clear(self) -> int:
+        """Delete every stored value; return how many were deleted."""
+        return clear_parameter_values(self.directory)
+
+    def close(self) -> None:
+        """Delete the store and release its lock."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self._lock.release()
+        lock_path = self.root / f"{self.store_id}{_STORE_LOCK_SUFFIX}"
+        try:
+            lock_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug("Failed to delete parameter value store lock %s: %s", lock_path, e)
+
+
+def remove_abandoned_parameter_value_stores(root: Path) -> int:
+    """Delete the stores under root whose process has exited, leaving those of running engines alone.
+
+    Values that older engines stored directly in root are deleted too.
+
+    Args:
+        root: The directory holding every store. A missing directory holds nothing to delete.
+
+    Returns:
+        The number of stores and loose values deleted.
+    """
+    if not root.is_dir():
+        return 0
+
+    removed = 0
+    for entry in root.iterdir():
+        if entry.suffix == _VALUE_SUFFIX and entry.is_file():
+            entry.unlink(missing_ok=True)
+        elif entry.suffix == _STORE_LOCK_SUFFIX and entry.is_file():
+            try:
+                with portalocker.Lock(
+                    entry, mode="a", flags=portalocker.LockFlags.EXCLUSIVE | portalocker.LockFlags.NON_BLOCKING
+                ):
+                    shutil.rmtree(root / entry.stem, ignore_errors=True)
+            except portalocker.LockException:
+                # Its process is still running
+                continue
+            entry.unlink(missing_ok=True)
+        elif entry.is_dir() and not (root / f"{entry.name}{_STORE_LOCK_SUFFIX}").exists():
+            # A store whose lock file is gone cannot be owned: owners create the lock first
+            shutil.rmtree(entry, ignore_errors=True)
+        else:
+            continue
+        removed += 1
+    return removed
+
+
+def summarize_parameter_value(value: Any) -> dict[str, Any]:
+    """Build a small description of an unstructured value for clients to show without fetching it.
+
+    Artifacts keep their type and every field except "value"; dicts list their first keys;
+    lists report their length; strings keep a short prefix.
+    """
+    summary: dict[str, Any] = {"python_type": type(value).__name__}
+    if isinstance(value, dict):
+        summary["length"] = len(value)
+        artifact_type = value.get("type")
+        if isinstance(artifact_type, str) and artifact_type.endswith("Artifact"):
+            summary["artifact"] = {
+                key: field_value
+                for key, field_value in value.items()
+                if key != "value" and len(json.dumps(field_value, default=str)) <= _SUMMARY_MAX_TEXT
+            }
+        else:
+            summary["keys"] = [str(key) for key in list(value)[:_SUMMARY_MAX_KEYS]]
+    elif isinstance(value, (list, tuple)):
+        summary["length"] = len(value)
+    elif isinstance(value, str):
+        summary["length"] = len(value)
+        summary["preview"] = value[:_SUMMARY_MAX_TEXT]
+    return summary
+
+
+def is_parameter_value_reference(value: Any) -> bool:
+    """Whether value is a reference produced by reference_large_parameter_value()."""
+    return isinstance(value, dict) and len(value) == 1 and PARAMETER_VALUE_REFERENCE_KEY in value
+
+
+def reference_large_parameter_value(value: Any) -> Any:
+    """Replace a large unstructured value with a reference to a stored copy.
+
+    Values below parameter_value_reference_threshold_bytes, or any value when the threshold is
+    unset or the static server cannot serve stored values, are returned unchanged.
+
+    Args:
+        value: The unstructured (JSON-compatible) parameter value.
+
+    Returns:
+        The value itself, or a reference dict keyed by PARAMETER_VALUE_REFERENCE_KEY.
+    """
+    from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
+
+    threshold = GriptapeNodes.ConfigManager().get_config_value(PARAMETER_VALUE_REFERENCE_THRESHOLD_KEY, default=None)
+    if threshold is None or isinstance(value, (bool, int, float)) or value is None:
+        return value
+    if isinstance(value, str) and len(value) < threshold:
+        return value
+
+    value_json = json.dumps(value, default=str).encode("utf-8")
+    if len(value_json) < threshold:
+        return value
+
+    try:
+        stored = GriptapeNodes.StaticFilesManager().store_parameter_value(value_json)
+    except OSError as e:
+        logger.warning("Failed to store parameter value for reference, sending it inline: %s", e)
+        return value
+    if stored is None:
+        return value
+
+    digest, url = stored
+    return {
+        PARAMETER_VALUE_REFERENCE_KEY: {
+            "url": url,
+            "digest": digest,
+            "size_bytes": len(value_json),
+            "summary": summarize_parameter_value(value),
+        }
+    }
@@ -0,0 +1,279 @@
+"""Spans recording where engine start time goes.
+
+Tracing is off unless the GTN_STARTUP_TRACE environment variable is set to a true value (or
+get_startup_tracer().enabled is set), in which case the manager constructors in GriptapeNodes, each library
+lifecycle state, dependency installs, workflow registration and the other startup phases
+record a span. When disabled, the instrumentation costs one boolean check per span.
+
+Spans can be exported in the Chrome trace event format (open in chrome://tracing or
+https://ui.perfetto.dev), together with per-module import costs parsed from the output of
+`python -X importtime`. `gtn doctor --startup` runs a traced engine start in a subprocess and
+reports both.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from contextlib import AbstractContextManager
+    from pathlib import Path
+
+STARTUP_TRACE_ENV_VAR = "GTN_STARTUP_TRACE"
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s*(\d+)\s*\|\s*(\d+)\s*\| (\s*)(\S+)\s*$")
+
+
+@dataclass(frozen=True)
+class StartupSpan:
+    """A timed phase of engine startup. Times are seconds since the tracer's origin."""
+
+    name: str
+    category: str
+    start_s: float
+    duration_s: float
+    thread_id: int
+    args: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class ModuleImportTime:
+    """One line of `python -X importtime` output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    # 0 for modules imported by the program itself, 1 for their imports, and so on
+    depth: int
+
+
+class StartupTracer:
+    """Thread-safe collector of StartupSpans."""
+
+    def __init__(self, *, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._spans: list[StartupSpan] = []
+
+    def record(self, name: str, category: str, start: float, end: float, **args: Any) -> None:
+        """Record a span from two time.perf_counter() readings."""
+        if not self.enabled:
+            return
+        span = StartupSpan(
+            name=name,
+            category=category,
+            start_s=start - self._origin,
+            duration_s=end - start,
+            thread_id=threading.get_ident(),
+            args=args,
+        )
+        with self._lock:
+            self._spans.append(span)
+
+    @contextmanager
+    def span(self, name: str, category: str = "startup", **args: Any) -> Iterator[None]:
+        """Record the enclosed block as a span."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, category, start, time.perf_counter(), **args)
+
+    def spans(self) -> list[StartupSpan]:
+        """Return the recorded spans in the order they finished."""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+        self._origin = time.perf_counter()
+
+
+class SpanSequence:
+    """Consecutive spans where entering a step ends the previous one.
+
+    For loops that advance through states one iteration at a time, such as the library
+    lifecycle, where wrapping each step in its own block is impractical.
+    """
+
+    def __init__(self, tracer: StartupTracer, category: str, **args: Any) -> None:
+        self._tracer = tracer
+        self._category = category
+        self._args = args
+        self._current: tuple[str, float] | None = None
+
+    def enter(self, name: str) -> None:
+        """End the current step, if any, and start a new one."""
+        if not self._tracer.enabled:
+            return
+        now = time.perf_counter()
+        self._finish(now)
+        self._current = (name, now)
+
+    def close(self) -> None:
+        """End the current step."""
+        if not self._tracer.enabled:
+            return
+        self._finish(time.perf_counter())
+
+    def _finish(self, now: float) -> None:
+        if self._current is not None:
+            name, start = self._current
+            self._tracer.record(name, self._category, start, now, **self._args)
+            self._current = None
+
+
+def _env_flag_enabled() -> bool:
+    return os.getenv(STARTUP_TRACE_ENV_VAR, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+_tracer = StartupTracer(enabled=_env_flag_enabled())
+
+
+def get_startup_tracer() -> StartupTracer:
+    """Return the process-wide startup tracer."""
+    return _tracer
+
+
+def startup_span(name: str, category: str = "startup", **args: Any) -> AbstractContextManager[None]:
+    """Record the enclosed block as a span on the process-wide tracer."""
+    return _tracer.span(name, category, **args)
+
+
+@contextmanager
+def startup_span_sequence(category: str, **args: Any) -> Iterator[SpanSequence]:
+    """Yield a SpanSequence on the process-wide tracer, closing its last step on exit."""
+    sequence = SpanSequence(_tracer, category, **args)
+    try:
+        yield sequence
+    finally:
+        sequence.close()
+
+
+def traced_startup_phase(
+    name: str | None = None, category: str = "startup"
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorate a function or coroutine function so each call records a span.
+
+    The span is named after the function's qualified name unless name is given.
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                with _tracer.span(span_name, category):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with _tracer.span(span_name, category):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def parse_importtime(output: str) -> list[ModuleImportTime]:
+    """Parse the lines `python -X importtime` writes to stderr, ignoring any other output."""
+    timings = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue  # The header line, or unrelated stderr output
+        self_us, cumulative_us, indent, module = match.groups()
+        timings.append(
+            ModuleImportTime(
+                module=module,
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=len(indent) // 2,
+            )
+        )
+    return timings
+
+
+def spans_to_chrome_trace(
+    spans: list[StartupSpan], import_times: list[ModuleImportTime] | None = None
+) -> dict[str, Any]:
+    """Build a Chrome trace event format document from spans.
+
+    Import times carry no start timestamps, so they are included under otherData rather than as
+    events.
+    """
+    pid = os.getpid()
+    events: list[dict[str, Any]] = [
+        {
+            "name": span.name,
+            "cat": span.category,
+            "ph": "X",
+            "ts": round(span.start_s * 1_000_000),
+            "dur": round(span.duration_s * 1_000_000),
+            "pid": pid,
+            "tid": span.thread_id,
+            "args": span.args,
+        }
+        for span in sorted(spans, key=lambda span: span.start_s)
+    ]
+    document: dict[str, Any] = {"traceEvents": events, "displayTimeUnit": "ms"}
+    if import_times:
+        document["otherData"] = {
+            "module_import_times_us": [
+                {
+                    "module": timing.module,
+                    "self_us": timing.self_us,
+                    "cumulative_us": timing.cumulative_us,
+                    "depth": timing.depth,
+                }
+                for timing in import_times
+            ]
+        }
+    return document
+
+
+def spans_from_chrome_trace(document: dict[str, Any]) -> list[StartupSpan]:
+    """Read back the spans written by spans_to_chrome_trace."""
+    return [
+        StartupSpan(
+            name=event["name"],
+            category=event.get("cat", "startup"),
+            start_s=event["ts"] / 1_000_000,
+            duration_s=event["dur"] / 1_000_000,
+            thread_id=event.get("tid", 0),
+            args=event.get("args", {}),
+        )
+        for event in document.get("traceEvents", [])
+        if event.get("ph") == "X"
+    ]
+
+
+def export_chrome_trace(
+    path: Path, spans: list[StartupSpan] | None = None, import_times: list[ModuleImportTime] | None = None
+) -> None:
+    """Write spans (default: everything recorded so far) to path as a Chrome trace."""
+    document = spans_to_chrome_trace(_tracer.spans() if spans is None else spans, import_times)
+    path.write_text(json.dumps(document), encoding="utf-8")
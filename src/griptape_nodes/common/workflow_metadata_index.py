@@ -0,0 +1,156 @@
+"""Persistent index of the metadata blocks of workflow files.
+
+Registering workflows means finding the `# /// script` block of every .py file in the
+configured directories. Workflow files can be large (they embed pickled parameter values),
+and reading each one in full on every startup makes boot time grow with the size of the
+workspace rather than with what changed.
+
+The index remembers each file's metadata blocks keyed by absolute path, modification time
+and size, and persists them to disk. A file whose mtime and size are unchanged is served from
+the index without being opened. A changed file is read only up to the end of its leading
+comment header, where saved workflows put their metadata; the whole file is read only when
+that header holds no metadata block.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from xdg_base_dirs import xdg_cache_home
+
+logger = logging.getLogger("griptape_nodes")
+
+WORKFLOW_METADATA_INDEX_PATH = xdg_cache_home() / "griptape_nodes" / "workflow_metadata_index.json"
+
+WORKFLOW_METADATA_BLOCK_REGEX = re.compile(r"(?m)^# /// (?P<type>[a-zA-Z0-9-]+)$\s(?P<content>(^#(| .*)$\s)+)^# ///$")
+
+_INDEX_VERSION = 1
+
+
+def extract_metadata_blocks(content: str) -> str:
+    """Return every metadata block in content, joined so WORKFLOW_METADATA_BLOCK_REGEX still finds each one."""
+    return "\n".join(match.group(0) for match in WORKFLOW_METADATA_BLOCK_REGEX.finditer(content))
+
+
+def read_metadata_blocks(workflow_file_path: Path) -> str:
+    """Read the metadata blocks of a workflow file, reading as little of it as possible."""
+    header_lines = []
+    with workflow_file_path.open("r", encoding="utf-8") as file:
+        for line in file:
+            if line.startswith("#") or not line.strip():
+                header_lines.append(line)
+                continue
+            # First line of code: the leading comment header is complete.
+            blocks = extract_metadata_blocks("".join(header_lines))
+            if blocks:
+                return blocks
+            # Metadata placed after code; fall back to scanning the rest of the file.
+            return extract_metadata_blocks("".join(header_lines) + line + file.read())
+    return extract_metadata_blocks("".join(header_lines))
+
+
+class WorkflowMetadataIndex:
+    """On-disk cache of workflow metadata blocks keyed by path, mtime and size."""
+
+    def __init__(self, index_path: Path | None = None) -> None:
+        self._index_path = index_path if index_path is not None else WORKFLOW_METADATA_INDEX_PATH
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._dirty = False
+
+    def get_metadata_blocks(self, workflow_file_path: Path) -> str:
+        """Return the metadata blocks of workflow_file_path, reading the file only if it changed.
+
+        Raises:
+            OSError: If the file cannot be stat'ed or read.
+            UnicodeDecodeError: If the file is not valid UTF-8.
+        """
+        stat = workflow_file_path.stat()
+        key = self._key(workflow_file_path)
+        entries = self._get_entries()
+        entry = entries.get(key)
+        if entry is not None and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry["blocks"]
+
+        blocks = read_metadata_blocks(workflow_file_path)
+        entries[key] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "blocks": blocks}
+        self._dirty = True
+        return blocks
+
+    def record(self, workflow_file_path: Path, content: str) -> None:
+        """Record a workflow file that was just written with content, so it is not read back."""
+        try:
+            stat = workflow_file_path.stat()
+        except OSError:
+            self.forget(workflow_file_path)
+            return
+        self._get_entries()[self._key(workflow_file_path)] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "blocks": extract_metadata_blocks(content),
+        }
+        self._dirty = True
+        self.flush()
+
+    def move(self, old_file_path: Path, new_file_path: Path) -> None:
+        """Carry the entry of a workflow file over to its new path after a rename."""
+        entries = self._get_entries()
+        entry = entries.pop(self._key(old_file_path), None)
+        if entry is not None:
+            entries[self._key(new_file_path)] = entry
+            self._dirty = True
+        self.flush()
+
+    def forget(self, workflow_file_path: Path) -> None:
+        """Drop the entry of a workflow file, e.g. after it was deleted."""
+        if self._get_entries().pop(self._key(workflow_file_path), None) is not None:
+            self._dirty = True
+        self.flush()
+
+    def flush(self) -> None:
+        """Persist the index if it changed. Failures are logged, since the index is only a cache."""
+        if not self._dirty or self._entries is None:
+            return
+        payload = json.dumps({"version": _INDEX_VERSION, "entries": self._entries})
+        try:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file and rename it into place so readers never see a partial index.
+            fd, temp_path = tempfile.mkstemp(dir=self._index_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+                    temp_file.write(payload)
+                Path(temp_path).replace(self._index_path)
+            except BaseException:
+                Path(temp_path).unlink(missing_ok=True)
+                raise
+        except OSError as err:
+            logger.debug("Failed to write workflow metadata index '%s': %s", self._index_path, err)
+            return
+        self._dirty = False
+
+    def _get_entries(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            self._entries = self._read_entries()
+        return self._entries
+
+    def _read_entries(self) -> dict[str, dict[str, Any]]:
+        try:
+            data = json.loads(self._index_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as err:
+            logger.debug("Ignoring unreadable workflow metadata index '%s': %s", self._index_path, err)
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _INDEX_VERSION:
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    @staticmethod
+    def _key(workflow_file_path: Path) -> str:
+        return str(workflow_file_path.absolute())
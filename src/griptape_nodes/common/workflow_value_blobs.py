@@ -0,0 +1,158 @@
+"""Content-addressed storage for large parameter values of saved workflows.
+
+Saved workflows normally embed every unique parameter value as a pickle literal in the
+generated Python source. Large values (images, embeddings) can instead be written to a blob
+directory next to the workflow file, one file per value named by the SHA-256 of its pickled
+bytes, and the workflow references them by digest. Identical values are stored once and
+shared by every workflow saved in the same directory.
+
+A workflow saved this way needs its blob directory: move or copy them together. The engine
+copies the blobs a workflow references when it moves the workflow to another directory, and
+removes blobs no workflow in the directory references after a save, move or delete.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import mmap
+import os
+import pickle
+import re
+import shutil
+import tempfile
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger("griptape_nodes")
+
+WORKFLOW_VALUE_BLOB_DIR_NAME = ".workflow_blobs"
+_BLOB_SUFFIX = ".pickle"
+# How generated workflow files load a blob, capturing its digest
+_BLOB_REFERENCE_PATTERN = re.compile(r"load_workflow_value_blob\(\s*__file__\s*,\s*['\"]([0-9a-f]{64})['\"]")
+
+
+def get_workflow_value_blob_dir(workflow_file_path: str | Path) -> Path:
+    """Return the blob directory used by the workflow file at workflow_file_path."""
+    return Path(workflow_file_path).parent / WORKFLOW_VALUE_BLOB_DIR_NAME
+
+
+def write_workflow_value_blob(blob_dir: Path, pickled_value: bytes) -> str:
+    """Store pickled_value in blob_dir unless an identical blob is already there.
+
+    Args:
+        blob_dir: The blob directory, created if missing.
+        pickled_value: The pickled bytes to store.
+
+    Returns:
+        The SHA-256 hex digest that names the blob.
+    """
+    digest = hashlib.sha256(pickled_value).hexdigest()
+    blob_path = blob_dir / f"{digest}{_BLOB_SUFFIX}"
+    if blob_path.exists():
+        return digest
+
+    blob_dir.mkdir(parents=True, exist_ok=True)
+    _replace_atomically(blob_dir, blob_path, lambda temp_path: temp_path.write_bytes(pickled_value))
+    return digest
+
+
+def _replace_atomically(blob_dir: Path, blob_path: Path, write: Callable[[Path], None]) -> None:
+    """Write a blob through a temporary file renamed into place, so readers never see a partial blob."""
+    fd, temp_path = tempfile.mkstemp(dir=blob_dir, suffix=".tmp")
+    os.close(fd)
+    try:
+        write(Path(temp_path))
+        Path(temp_path).replace(blob_path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+def find_workflow_value_blob_digests(workflow_file_path: str | Path) -> set[str]:
+    """Return the digests of the blobs the workflow file at workflow_file_path loads.
+
+    Raises:
+        OSError: If the workflow file cannot be read.
+    """
+    source = Path(workflow_file_path).read_text(encoding="utf-8")
+    return set(_BLOB_REFERENCE_PATTERN.findall(source))
+
+
+def copy_workflow_value_blobs(source_workflow_file_path: str | Path, target_workflow_file_path: str | Path) -> None:
+    """Copy the blobs a workflow file references into the blob directory of its new location.
+
+    Blobs already present at the target, or missing at the source, are skipped.
+
+    Raises:
+        OSError: If the workflow file cannot be read or a blob cannot be copied.
+    """
+    source_dir = get_workflow_value_blob_dir(source_workflow_file_path)
+    target_dir = get_workflow_value_blob_dir(target_workflow_file_path)
+    if not source_dir.is_dir() or source_dir.absolute() == target_dir.absolute():
+        return
+    for digest in find_workflow_value_blob_digests(source_workflow_file_path):
+        source_blob = source_dir / f"{digest}{_BLOB_SUFFIX}"
+        target_blob = target_dir / f"{digest}{_BLOB_SUFFIX}"
+        if target_blob.is_file() or not source_blob.is_file():
+            continue
+        target_dir.mkdir(parents=True, exist_ok=True)
+        _replace_atomically(target_dir, target_blob, partial(shutil.copyfile, source_blob))
+
+
+def remove_unreferenced_workflow_value_blobs(workflow_dir: Path) -> None:
+    """Delete the blobs in workflow_dir's blob directory that no workflow file in workflow_dir loads.
+
+    Cleanup is best effort: if any workflow file cannot be read, nothing is deleted.
+    """
+    blob_dir = workflow_dir / WORKFLOW_VALUE_BLOB_DIR_NAME
+    if not blob_dir.is_dir():
+        return
+    try:
+        referenced: set[str] = set()
+        for workflow_file in workflow_dir.glob("*.py"):
+            referenced |= find_workflow_value_blob_digests(workflow_file)
+        unreferenced = [
+            blob_path
+            for blob_path in blob_dir.glob(f"*{_BLOB_SUFFIX}")
+            if blob_path.name.removesuffix(_BLOB_SUFFIX) not in referenced
+        ]
+    except (OSError, UnicodeDecodeError) as err:
+        logger.debug("Skipping cleanup of workflow value blobs in %s: %s", blob_dir, err)
+        return
+    for blob_path in unreferenced:
+        try:
+            blob_path.unlink(missing_ok=True)
+        except OSError as err:
+            logger.debug("Failed to remove unreferenced workflow value blob %s: %s", blob_path, err)
+
+
+def load_workflow_value_blob(workflow_file_path: str | Path, digest: str) -> Any:
+    """Load a value that a saved workflow stored as a blob.
+
+    Generated workflow files call this with their own __file__. The blob is memory-mapped
+    rather than read into an intermediate buffer before unpickling.
+
+    Args:
+        workflow_file_path: Path of the workflow file that references the blob.
+        digest: The blob's SHA-256 hex digest.
+
+    Returns:
+        The unpickled value.
+
+    Raises:
+        FileNotFoundError: If the blob is missing, e.g. the workflow was moved without its blob directory.
+    """
+    blob_path = get_workflow_value_blob_dir(workflow_file_path) / f"{digest}{_BLOB_SUFFIX}"
+    if not blob_path.exists():
+        msg = (
+            f"Workflow '{workflow_file_path}' references value blob '{digest}', but '{blob_path}' does not exist. "
+            f"Copy the workflow together with its '{WORKFLOW_VALUE_BLOB_DIR_NAME}' directory."
+        )
+        raise FileNotFoundError(msg)
+    with blob_path.open("rb") as blob_file, mmap.mmap(blob_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return pickle.loads(mapped)  # noqa: S301
@@ -0,0 +1,59 @@
+"""Sorted index of the files under the workspace, for paginated, prefix-filtered listings.
+
+A WorkspaceFileIndex is a DirectoryFileIndex that only needs the sorted paths: a listing is a
+binary search for the prefix (or the cursor) followed by a slice. Writes, copies, renames and
+deletes made through the engine (OSManager, WorkflowManager and the static server) reach every
+index containing the path via note_path_written() and note_path_removed().
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from griptape_nodes.common.directory_file_index import DirectoryFileIndex
+
+if TYPE_CHECKING:
+    import os
+
+_indexes: dict[str, WorkspaceFileIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+class WorkspaceFileIndex(DirectoryFileIndex[None]):
+    """The files under a directory, as a sorted list of relative POSIX paths."""
+
+    def _scanned_entry(self, file: os.DirEntry[str] | Path) -> None:  # noqa: ARG002
+        return None
+
+
+def get_workspace_file_index(root: Path) -> WorkspaceFileIndex:
+    """Return the process-wide WorkspaceFileIndex for root, creating it on first use."""
+    key = str(Path(root).absolute())
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = WorkspaceFileIndex(Path(key))
+            _indexes[key] = index
+        return index
+
+
+def _indexes_containing(path: Path) -> list[WorkspaceFileIndex]:
+    with _indexes_lock:
+        if not _indexes:
+            return []
+        indexes = list(_indexes.values())
+    return [index for index in indexes if index.contains(path)]
+
+
+def note_path_written(path: Path) -> None:
+    """Update every index containing path after a file or directory was written there."""
+    for index in _indexes_containing(path):
+        index.record_write(path)
+
+
+def note_path_removed(path: Path) -> None:
+    """Update every index containing path after the file or directory there was removed."""
+    for index in _indexes_containing(path):
+        index.forget(path)
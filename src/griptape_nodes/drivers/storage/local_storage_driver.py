@@ -190,19 +190,26 @@ class LocalStorageDriver(BaseStorageDriver):
         Returns:
             A list of file names in storage.
         """
-        # Use the static server's list endpoint
+        # Use the static server's list endpoint, following its cursor through every page
         list_url = urljoin(self.base_url, "/static-uploads/")
 
-        try:
-            response = httpx.get(list_url)
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            msg = f"Failed to list files: {e}"
-            logger.error(msg)
-            raise RuntimeError(msg) from e
-
-        response_data = response.json()
-        return response_data.get("files", [])
+        file_names: list[str] = []
+        cursor: str | None = None
+        while True:
+            params = {} if cursor is None else {"cursor": cursor}
+            try:
+                response = httpx.get(list_url, params=params)
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                msg = f"Failed to list files: {e}"
+                logger.error(msg)
+                raise RuntimeError(msg) from e
+
+            response_data = response.json()
+            file_names.extend(response_data.get("files", []))
+            cursor = response_data.get("next_cursor")
+            if cursor is None:
+                return file_names
 
     def get_asset_url(self, path: Path) -> str:
         """Get the permanent URL for a local asset.
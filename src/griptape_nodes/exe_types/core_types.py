@@ -278,6 +278,61 @@ class ParameterType:
         return ParameterType.KeyValueTypePair(key_type=key_type, value_type=value_type)
 
 
+class _ElementIndex:
+    """Name and type lookups over an element's descendants.
+
+    Built from the children's own indexes, so rebuilding an element only walks its direct
+    children. Lookups follow depth-first (pre-order) order like the tree walks they replace:
+    the first element with a name wins, and type lists are in tree order.
+    """
+
+    __slots__ = ("by_name", "by_type", "owner")
+
+    def __init__(self, owner: BaseNodeElement) -> None:
+        self.owner = owner
+        self.by_name: dict[str, BaseNodeElement] = {}
+        self.by_type: dict[type, list[BaseNodeElement]] = {}
+        # Walk children last to first so earlier elements overwrite later ones with the same name.
+        for child in reversed(owner._children):
+            if child._children:
+                self.by_name.update(child._get_element_index().by_name)
+            self.by_name[child.name] = child
+
+    def of_type(self, element_type: type[N]) -> list[N]:
+        found = self.by_type.get(element_type)
+        if found is None:
+            found = []
+            for child in self.owner._children:
+                if isinstance(child, element_type):
+                    found.append(child)
+                if child._children:
+                    found.extend(child._get_element_index().of_type(element_type))
+            self.by_type[element_type] = found
+        return found  # pyright: ignore[reportReturnType]
+
+    def add_last_child(self, child: BaseNodeElement, subtree_names: dict[str, BaseNodeElement]) -> None:
+        """Extend the index with a child just appended to the owner."""
+        for name, element in subtree_names.items():
+            self.by_name.setdefault(name, element)
+        for element_type, found in self.by_type.items():
+            if isinstance(child, element_type):
+                found.append(child)
+            if child._children:
+                found.extend(child._get_element_index().of_type(element_type))
+
+    def add_descendant_subtree(self, subtree_names: dict[str, BaseNodeElement]) -> bool:
+        """Extend the index with a subtree added deeper down. Returns False if it must be rebuilt instead.
+
+        The subtree may land in the middle of this element's tree order, so cached type lists
+        are dropped, and a name collision means the first-match order is unknown.
+        """
+        if not self.by_name.keys().isdisjoint(subtree_names):
+            return False
+        self.by_name.update(subtree_names)
+        self.by_type.clear()
+        return True
+
+
 @dataclass(kw_only=True)
 class BaseNodeElement:
     element_id: str = field(default_factory=lambda: str(uuid.uuid4().hex))
@@ -291,11 +346,19 @@ class BaseNodeElement:
     _parent: BaseNodeElement | None = field(default=None)
     _node_context: BaseNode | None = field(default=None)
     _badge: BadgeData | None = field(default=None)
+    # Name and type lookups over this element's descendants. Built lazily, extended by add_child,
+    # and dropped (here and on every ancestor) when a descendant is removed or renamed.
+    _element_index: _ElementIndex | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def children(self) -> list[BaseNodeElement]:
         return self._children
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "name" and self._parent is not None:
+            self._parent._invalidate_element_index()
+        super().__setattr__(name, value)
+
     def __post_init__(self) -> None:
         # If there's currently an active element, add this new element as a child
         current = BaseNodeElement.get_current()
@@ -486,6 +549,7 @@ class BaseNodeElement:
         # Propagate node context to children
         child._node_context = self._node_context
         self._children.append(child)
+        self._index_added_child(child)
 
         # Also propagate to any existing children of the child
         for grandchild in child.find_elements_by_type(BaseNodeElement, find_recursively=True):
@@ -518,6 +582,7 @@ class BaseNodeElement:
                     # We are the direct parent, so handle removal directly
                     child._parent = None
                     ui_element._children.remove(child)
+                    ui_element._invalidate_element_index()
                 break
             ui_elements.extend(ui_element._children)
         if self._node_context is not None and isinstance(child, BaseNodeElement):
@@ -537,21 +602,40 @@ class BaseNodeElement:
         # Modified so ParameterGroups also just have name as a field.
         if self.name == element_name:
             return self
-        for child in self._children:
-            found = child.find_element_by_name(element_name)
-            if found is not None:
-                return found
-        return None
+        return self._get_element_index().by_name.get(element_name)
 
     def find_elements_by_type(self, element_type: type[N], *, find_recursively: bool = True) -> list[N]:
         """Returns a list of child elements that are instances of type specified. Optionally do this recursively."""
-        elements: list[N] = []
-        for child in self._children:
-            if isinstance(child, element_type):
-                elements.append(child)
-            if find_recursively:
-                elements.extend(child.find_elements_by_type(element_type))
-        return elements
+        if find_recursively:
+            return list(self._get_element_index().of_type(element_type))
+        return [child for child in self._children if isinstance(child, element_type)]
+
+    def _get_element_index(self) -> _ElementIndex:
+        if self._element_index is None:
+            self._element_index = _ElementIndex(self)
+        return self._element_index
+
+    def _index_added_child(self, child: BaseNodeElement) -> None:
+        subtree_names = dict(child._get_element_index().by_name) if child._children else {}
+        subtree_names[child.name] = child
+        if self._element_index is not None:
+            self._element_index.add_last_child(child, subtree_names)
+        ancestor = self._parent
+        while ancestor is not None:
+            index = ancestor._element_index
+            if index is not None and not index.add_descendant_subtree(subtree_names):
+                ancestor._element_index = None
+            ancestor = ancestor._parent
+
+    def _invalidate_element_index(self) -> None:
+        """Drop the lookup index of this element and its ancestors after their descendants changed.
+
+        Call this after reordering _children directly; add_child, remove_child and renames do it already.
+        """
+        element: BaseNodeElement | None = self
+        while element is not None:
+            element._element_index = None
+            element = element._parent
 
     @classmethod
     def get_current(cls) -> BaseNodeElement | None:
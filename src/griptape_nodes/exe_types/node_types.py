@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import threading
 import warnings
+import weakref
 from abc import ABC
 from collections.abc import Callable, Generator, Iterable, Iterator
 from contextlib import contextmanager
@@ -28,6 +29,7 @@ from griptape_nodes.exe_types.core_types import (
     ParameterTypeBuiltin,
 )
 from griptape_nodes.exe_types.param_components.execution_status_component import ExecutionStatusComponent
+from griptape_nodes.node_library.library_declarations import ProcessOffload, resolve_process_offload
 from griptape_nodes.retained_mode.events.base_events import (
     ExecutionEvent,
     ExecutionGriptapeNodeEvent,
@@ -43,6 +45,7 @@ from griptape_nodes.retained_mode.events.parameter_events import (
 from griptape_nodes.traits.options import Options
 from griptape_nodes.traits.widget import Widget
 from griptape_nodes.utils import async_utils
+from griptape_nodes.utils.node_thread_pool import get_node_thread_pool
 
 if TYPE_CHECKING:
     from griptape_nodes.exe_types.core_types import NodeMessagePayload
@@ -254,6 +257,47 @@ def get_library_names_with_publish_handlers() -> list[str]:
     return library_names
 
 
+# Nodes whose elements have changes waiting for the next EventManager flush, keyed by id.
+# Weak so a deleted node isn't kept alive by changes nobody will send.
+_nodes_with_tracked_parameters: weakref.WeakValueDictionary[int, BaseNode] = weakref.WeakValueDictionary()
+_nodes_with_tracked_parameters_lock = threading.Lock()
+
+
+class TrackedParameterList(list):
+    """A node's elements with unsent changes.
+
+    Appending registers the owning node with the pending-changes registry, so the flush
+    after every request only visits nodes that have something to send instead of scanning
+    every object.
+    """
+
+    def __init__(self, owner: BaseNode) -> None:
+        super().__init__()
+        self._owner = owner
+
+    def append(self, element: BaseNodeElement) -> None:
+        super().append(element)
+        # Unpickling appends items before it restores the owner.
+        owner = getattr(self, "_owner", None)
+        if owner is not None:
+            with _nodes_with_tracked_parameters_lock:
+                _nodes_with_tracked_parameters[id(owner)] = owner
+
+
+def take_nodes_with_tracked_parameters() -> list[BaseNode]:
+    """Return the nodes registered as having unsent element changes, clearing the registry."""
+    with _nodes_with_tracked_parameters_lock:
+        nodes = list(_nodes_with_tracked_parameters.values())
+        _nodes_with_tracked_parameters.clear()
+    return nodes
+
+
+def retrack_node_parameters(node: BaseNode) -> None:
+    """Put a node back in the registry so its unsent changes are retried on the next flush."""
+    with _nodes_with_tracked_parameters_lock:
+        _nodes_with_tracked_parameters[id(node)] = node
+
+
 class BaseNode(ABC):
     # Owned by a flow
     name: str
@@ -266,12 +310,15 @@ class BaseNode(ABC):
     stop_flow: bool = False
     root_ui_element: BaseNodeElement
     _state: NodeResolutionState
-    _tracked_parameters: list[BaseNodeElement]
+    _tracked_parameters: TrackedParameterList
     _entry_control_parameter: Parameter | None = (
         None  # The control input parameter used to enter this node during execution
     )
     lock: bool = False  # When lock is true, the node is locked and can't be modified. When lock is false, the node is unlocked and can be modified.
     _cancellation_requested: threading.Event  # Event indicating if cancellation has been requested for this node
+    # Where the default aprocess() runs a synchronous process(). None defers to the library's
+    # process_offload declarations; set it on a subclass to choose for the node class in code.
+    process_offload: ProcessOffload | None = None
 
     @property
     def parameters(self) -> list[Parameter]:
@@ -298,7 +345,7 @@ class BaseNode(ABC):
         # Set the node context for the root element
         self.root_ui_element._node_context = self
         self.process_generator = None
-        self._tracked_parameters = []
+        self._tracked_parameters = TrackedParameterList(self)
         self._cancellation_requested = threading.Event()
         self._parent_group = None
         self.set_entry_control_parameter(None)
@@ -635,10 +682,7 @@ class BaseNode(ABC):
         )
 
     def does_name_exist(self, param_name: str) -> bool:
-        for parameter in self.parameters:
-            if parameter.name == param_name:
-                return True
-        return False
+        return self.get_parameter_by_name(param_name) is not None
 
     def add_parameter(self, param: Parameter) -> None:
         """Adds a Parameter to the Node. Control and Data Parameters are all treated equally."""
@@ -874,6 +918,12 @@ class BaseNode(ABC):
         return None
 
     def get_parameter_by_name(self, param_name: str) -> Parameter | None:
+        candidate = self.root_ui_element.find_element_by_name(param_name)
+        if isinstance(candidate, Parameter):
+            return candidate
+        if candidate is None:
+            return None
+        # Another element (e.g. a ParameterGroup) shares the name; fall back to a scan of the parameters.
         for parameter in self.parameters:
             if param_name == parameter.name:
                 return parameter
@@ -1064,13 +1114,40 @@ class BaseNode(ABC):
     def process(self) -> AsyncResult | None:
         raise NotImplementedError
 
+    def get_process_offload(self) -> ProcessOffload:
+        """Return where the default aprocess() runs this node's process().
+
+        The process_offload class attribute wins; otherwise the node's and then its library's
+        process_offload declarations apply, defaulting to the event loop.
+        """
+        if self.process_offload is not None:
+            return self.process_offload
+        from griptape_nodes.node_library.library_registry import LibraryRegistry
+
+        library_name = self.metadata.get("library")
+        node_type = self.metadata.get("node_type")
+        if library_name is None or node_type is None:
+            return ProcessOffload.EVENT_LOOP
+        try:
+            library = LibraryRegistry.get_library(library_name)
+            node_metadata = library.get_node_metadata(node_type)
+        except KeyError:
+            return ProcessOffload.EVENT_LOOP
+        return resolve_process_offload(node_metadata.declarations, library.get_metadata().declarations)
+
     async def aprocess(self) -> None:
         """Async version of process().
 
         Default implementation wraps the existing process() method to maintain backwards compatibility.
         Subclasses can override this method to provide direct async implementation.
+
+        With THREAD process offload, process() runs in the engine's node thread pool so it doesn't
+        block the event loop; outputs it writes are visible once the await returns.
         """
-        result = self.process()
+        if self.get_process_offload() is ProcessOffload.THREAD:
+            result = await async_utils.run_in_executor(get_node_thread_pool(), self.process)
+        else:
+            result = self.process()
 
         if result is None:
             # Simple synchronous node - nothing to do
@@ -1273,6 +1350,7 @@ class BaseNode(ABC):
         )
 
     def publish_update_to_parameter(self, parameter_name: str, value: Any) -> None:
+        from griptape_nodes.common.parameter_value_references import reference_large_parameter_value
         from griptape_nodes.retained_mode.events.execution_events import ParameterValueUpdateEvent
         from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 
@@ -1284,7 +1362,7 @@ class BaseNode(ABC):
                 node_name=self.name,
                 parameter_name=parameter_name,
                 data_type=data_type,
-                value=safe_unstructure(value),
+                value=reference_large_parameter_value(safe_unstructure(value)),
             )
 
             GriptapeNodes.EventManager().put_event(
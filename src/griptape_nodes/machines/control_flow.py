@@ -20,9 +20,11 @@ from griptape_nodes.retained_mode.events.execution_events import (
 )
 from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 from griptape_nodes.retained_mode.managers.node_manager import NodeManager
-from griptape_nodes.retained_mode.managers.settings import WorkflowExecutionMode
+from griptape_nodes.retained_mode.managers.settings import RESOURCE_CLASS_BUDGETS_KEY, WorkflowExecutionMode
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from griptape_nodes.exe_types.core_types import Parameter
     from griptape_nodes.exe_types.flow import ControlFlow
 
@@ -57,6 +59,7 @@ class ControlFlowContext:
         *,
         pickle_control_flow_result: bool = False,
         is_isolated: bool = False,
+        resource_class_budgets: Mapping[str, int | None] | None = None,
     ) -> None:
         self.flow_name = flow_name
 
@@ -70,7 +73,9 @@ class ControlFlowContext:
         else:
             dag_builder = GriptapeNodes.FlowManager().global_dag_builder
 
-        self.resolution_machine = ParallelResolutionMachine(flow_name, max_nodes_in_parallel, dag_builder=dag_builder)
+        self.resolution_machine = ParallelResolutionMachine(
+            flow_name, max_nodes_in_parallel, dag_builder=dag_builder, resource_class_budgets=resource_class_budgets
+        )
         self.current_nodes = []
         self.pickle_control_flow_result = pickle_control_flow_result
         self.is_isolated = is_isolated
@@ -176,16 +181,22 @@ class ControlFlowMachine(FSM[ControlFlowContext]):
             "workflow_execution_mode", default=WorkflowExecutionMode.SEQUENTIAL
         )
         max_nodes_in_parallel = GriptapeNodes.ConfigManager().get_config_value("max_nodes_in_parallel", default=5)
+        resource_class_budgets = GriptapeNodes.ConfigManager().get_config_value(
+            RESOURCE_CLASS_BUDGETS_KEY, default=None
+        )
 
-        # SEQUENTIAL mode uses ParallelResolutionMachine with max_nodes_in_parallel=1
+        # SEQUENTIAL mode uses ParallelResolutionMachine with max_nodes_in_parallel=1. Class budgets
+        # would let IO and memory nodes run beside it, so every class shares that single slot instead.
         if execution_type == WorkflowExecutionMode.SEQUENTIAL:
             max_nodes_in_parallel = 1
+            resource_class_budgets = None
 
         context = ControlFlowContext(
             flow_name,
             max_nodes_in_parallel,
             pickle_control_flow_result=pickle_control_flow_result,
             is_isolated=is_isolated,
+            resource_class_budgets=resource_class_budgets,
         )
         super().__init__(context)
 
@@ -253,7 +264,7 @@ class ControlFlowMachine(FSM[ControlFlowContext]):
         ):
             await self.update()
 
-    async def _process_nodes_for_dag(self, start_node: BaseNode) -> list[BaseNode]:  # noqa: C901, PLR0912
+    async def _process_nodes_for_dag(self, start_node: BaseNode) -> list[BaseNode]:  # noqa: C901
         """Process data_nodes from the global queue to build unified DAG.
 
         This method identifies data_nodes in the execution queue and processes
@@ -325,9 +336,7 @@ class ControlFlowMachine(FSM[ControlFlowContext]):
                         if boundary_nodes:
                             # Is the node connected to a graph?
                             disconnected = False
-                            if node.name not in dag_builder.start_node_candidates:
-                                dag_builder.start_node_candidates[node.name] = {}
-                            dag_builder.start_node_candidates[node.name][graph_start_node_name] = set(boundary_nodes)
+                            dag_builder.add_start_node_candidate(node.name, graph_start_node_name, set(boundary_nodes))
                     if disconnected:
                         # If the node is not connected to any graph, we can add it as it's own graph here.
                         # It will not cause any overlapping confusion with existing graphs.
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import copy
 import logging
 from dataclasses import dataclass, field
 from enum import StrEnum
@@ -11,6 +10,7 @@ from griptape_nodes.exe_types.base_iterative_nodes import BaseIterativeEndNode,
 from griptape_nodes.exe_types.connections import Direction
 from griptape_nodes.exe_types.core_types import ParameterTypeBuiltin
 from griptape_nodes.exe_types.node_types import NodeResolutionState
+from griptape_nodes.machines.node_positions import NodePositionCache
 
 if TYPE_CHECKING:
     import asyncio
@@ -48,12 +48,17 @@ class DagBuilder:
     node_to_reference: dict[str, DagNode]
     graph_to_nodes: dict[str, set[str]]  # Track which nodes belong to which graph
     start_node_candidates: dict[str, dict[str, set[str]]]  # {data_node: {graph: {boundary_nodes}}}
+    # Reverse index of start_node_candidates: {(graph, boundary_node): {data_nodes}}
+    boundary_node_to_candidates: dict[tuple[str, str], set[str]]
+    node_positions: NodePositionCache  # Canvas positions of node_to_reference, filled in on first scheduling use
 
     def __init__(self) -> None:
         self.graphs = {}
         self.node_to_reference: dict[str, DagNode] = {}
         self.graph_to_nodes = {}
         self.start_node_candidates = {}
+        self.boundary_node_to_candidates = {}
+        self.node_positions = NodePositionCache()
 
     def _get_nodes_to_exclude_for_iterative_end(self, node: BaseNode, connections: Connections) -> set[str]:
         """Get nodes to exclude when collecting dependencies for BaseIterativeEndNode.
@@ -151,7 +156,7 @@ class DagBuilder:
             # Add start_node and its dependencies
             _add_node_recursive(node.start_node, set(), graph)
             # Add edge from start_node to end_node
-            if node.start_node.name in graph.nodes() and node.name in graph.nodes():
+            if node.start_node.name in graph and node.name in graph:
                 graph.add_edge(node.start_node.name, node.name)
 
         return added_nodes
@@ -182,6 +187,13 @@ class DagBuilder:
         self.node_to_reference.clear()
         self.graph_to_nodes.clear()
         self.start_node_candidates.clear()
+        self.boundary_node_to_candidates.clear()
+        self.node_positions.clear()
+
+    def remove_node_reference(self, node_name: str) -> None:
+        """Stop tracking a node's DagNode reference. Does not touch the graphs."""
+        self.node_to_reference.pop(node_name, None)
+        self.node_positions.remove(node_name)
 
     def _has_active_control_path_to_node(self, node: DagNode, connections: Connections) -> bool:
         """Check if any active graph has a control path that can reach the target node.
@@ -195,12 +207,11 @@ class DagBuilder:
         """
         for graph in self.graphs.values():
             # If the length of the graph is 0, skip it. it's either reached it or it's a dead end.
-            if len(graph.nodes()) == 0:
+            if len(graph) == 0:
                 continue
 
             # If graph has nodes, the root node (not the leaf, the root), check forward path from that
-            root_nodes = [n for n in graph.nodes() if graph.out_degree(n) == 0]
-            for root_node_name in root_nodes:
+            for root_node_name in graph.sink_nodes():
                 if root_node_name in self.node_to_reference:
                     root_node = self.node_to_reference[root_node_name].node_reference
 
@@ -225,11 +236,9 @@ class DagBuilder:
         # Check if node has any DAG predecessors (dependencies) still in the graph
         node_name = node.node_reference.name
         for graph in self.graphs.values():
-            if node_name in graph.nodes():
-                # If any predecessors exist, they haven't completed yet (completed nodes are removed)
-                predecessors = graph._predecessors.get(node_name, set())
-                if predecessors:
-                    return False
+            # If any predecessors exist, they haven't completed yet (completed nodes are removed)
+            if node_name in graph and graph.in_degree(node_name) > 0:
+                return False
 
         if len(self.graphs) == 1:
             # If there's only one graph, we aren't looking for a control flow connection from elsewhere! We can queue. We've already looked at data dependencies.
@@ -418,12 +427,26 @@ class DagBuilder:
         """Remove nodes from node_to_reference when their graph becomes empty (only in single node resolution)."""
         if graph_name in self.graph_to_nodes:
             for node_name in self.graph_to_nodes[graph_name]:
-                self.node_to_reference.pop(node_name, None)
+                self.remove_node_reference(node_name)
             self.graph_to_nodes.pop(graph_name, None)
 
+    def add_start_node_candidate(self, data_node: str, graph_name: str, boundary_nodes: set[str]) -> None:
+        """Record that a data node must wait for the given boundary nodes of a graph to complete.
+
+        Args:
+            data_node: Name of the data node that is waiting
+            graph_name: Name of the graph the boundary nodes belong to
+            boundary_nodes: Names of the nodes in that graph the data node is waiting on
+        """
+        self.start_node_candidates.setdefault(data_node, {})[graph_name] = set(boundary_nodes)
+        for boundary_node in boundary_nodes:
+            self.boundary_node_to_candidates.setdefault((graph_name, boundary_node), set()).add(data_node)
+
     def remove_node_from_dependencies(self, completed_node: str, graph_name: str) -> list[str]:
         """Remove completed node from all dependencies, return nodes ready to execute.
 
+        Only the data nodes waiting on (graph_name, completed_node) are visited.
+
         Args:
             completed_node: Name of the node that just completed
             graph_name: Name of the graph the node completed in
@@ -433,18 +456,22 @@ class DagBuilder:
         """
         newly_available = []
 
-        for data_node, graph_deps in copy.deepcopy(list(self.start_node_candidates.items())):
-            if graph_name in graph_deps:
-                # Remove the completed node from this graph's boundary nodes
-                graph_deps[graph_name].discard(completed_node)
+        waiting_data_nodes = self.boundary_node_to_candidates.pop((graph_name, completed_node), set())
+        for data_node in waiting_data_nodes:
+            graph_deps = self.start_node_candidates.get(data_node)
+            if graph_deps is None or graph_name not in graph_deps:
+                continue
+
+            # Remove the completed node from this graph's boundary nodes
+            graph_deps[graph_name].discard(completed_node)
 
-                # If all boundary nodes from this graph have completed, remove the graph dependency
-                if len(graph_deps[graph_name]) == 0:
-                    del graph_deps[graph_name]
+            # If all boundary nodes from this graph have completed, remove the graph dependency
+            if len(graph_deps[graph_name]) == 0:
+                del graph_deps[graph_name]
 
-                # If all graph dependencies are satisfied, the data node is ready
-                if len(graph_deps) == 0:
-                    del self.start_node_candidates[data_node]
-                    newly_available.append(data_node)
+            # If all graph dependencies are satisfied, the data node is ready
+            if len(graph_deps) == 0:
+                del self.start_node_candidates[data_node]
+                newly_available.append(data_node)
 
         return newly_available
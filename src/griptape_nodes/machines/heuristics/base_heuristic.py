@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 if TYPE_CHECKING:
     from griptape_nodes.machines.dag_builder import DagNode
@@ -11,7 +11,17 @@ if TYPE_CHECKING:
 
 
 class NodeHeuristic(ABC):
-    """Base class for node priority heuristics."""
+    """Base class for node priority heuristics.
+
+    NodePriorityQueue caches each node's score and uses the two class flags below to decide
+    which scores to recompute after a node resolves. A score must only depend on the node
+    itself, the DAG, and the inputs flagged here, not on which other nodes are queued.
+    """
+
+    # Scores change for every node when the previously executed node changes.
+    uses_previous_executed_node: ClassVar[bool] = True
+    # Scores change for nodes entering or leaving the last resolved node's successor set.
+    uses_last_resolved_successors: ClassVar[bool] = True
 
     def __init__(self, context: ParallelResolutionContext, weight: float = 1, max_value: float = 100.0) -> None:
         self._context = context
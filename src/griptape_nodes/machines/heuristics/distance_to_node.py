@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
+
+import numpy as np
 
 from griptape_nodes.machines.heuristics.base_heuristic import NodeHeuristic
 
@@ -20,73 +22,43 @@ class DistanceToNode(NodeHeuristic):
     - Nodes closer to the previous node receive higher scores (approaching max_value)
     - Nodes farther away receive lower scores (approaching 1.0)
     - When no previous node exists, all nodes receive a neutral score (max_value/2)
-    - Distances are normalized across all available nodes to ensure consistent scoring
+    - Distances are normalized across all nodes in the DAG, so a node's score doesn't depend
+      on which other nodes happen to be queued alongside it
 
     This encourages execution flow that follows the visual layout of the workflow.
     """
 
-    def calculate_priority(self, dag_node: DagNode, **kwargs) -> float:
-        previous_executed_node = kwargs.get("previous_executed_node")
-        if previous_executed_node is None:
-            return self.max_value / 2
-
-        current_pos = dag_node.node_reference.metadata.get("position", {"x": 0, "y": 0})
-        prev_pos = previous_executed_node.node_reference.metadata.get("position", {"x": 0, "y": 0})
-
-        distance_squared = (current_pos["x"] - prev_pos["x"]) ** 2 + (current_pos["y"] - prev_pos["y"]) ** 2
+    uses_previous_executed_node: ClassVar[bool] = True
+    uses_last_resolved_successors: ClassVar[bool] = False
 
-        # Track min/max distances in a single pass
-        min_distance_squared = float("inf")
-        max_distance_squared = 0.0
-        node_count = 0
-        for node_ref in self._context.node_to_reference.values():
-            pos = node_ref.node_reference.metadata.get("position", {"x": 0, "y": 0})
-            d_squared = (pos["x"] - prev_pos["x"]) ** 2 + (pos["y"] - prev_pos["y"]) ** 2
-            min_distance_squared = min(min_distance_squared, d_squared)
-            max_distance_squared = max(max_distance_squared, d_squared)
-            node_count += 1
-
-        if node_count in {0, 1}:
-            return self.max_value / 2
-
-        if max_distance_squared == min_distance_squared:
-            return self.max_value / 2
-
-        normalized = (distance_squared - min_distance_squared) / (max_distance_squared - min_distance_squared)
-        return self.max_value - (normalized * 99.0)
+    def calculate_priority(self, dag_node: DagNode, **kwargs) -> float:
+        return self.calculate_priorities_batch([dag_node], **kwargs)[dag_node.node_reference.name]
 
     def calculate_priorities_batch(self, dag_nodes: list[DagNode], **kwargs) -> dict[str, float]:
         previous_executed_node = kwargs.get("previous_executed_node")
+        names = [node.node_reference.name for node in dag_nodes]
         if previous_executed_node is None:
-            return {node.node_reference.name: self.max_value / 2 for node in dag_nodes}
+            return dict.fromkeys(names, self.max_value / 2)
 
         if not dag_nodes:
             return {}
 
-        if len(dag_nodes) == 1:
-            return {dag_nodes[0].node_reference.name: self.max_value / 2}
+        # Positions are cached in an array when the DAG is built, so both the DAG-wide
+        # normalization and the batch scores are computed in single vectorized passes.
+        node_positions = self._context.node_positions
+        if node_positions.active_positions().shape[0] <= 1:
+            return dict.fromkeys(names, self.max_value / 2)
 
         prev_pos = previous_executed_node.node_reference.metadata.get("position", {"x": 0, "y": 0})
+        prev_xy = np.array((prev_pos["x"], prev_pos["y"]), dtype=np.float64)
+
+        all_distances_squared = np.square(node_positions.active_positions() - prev_xy).sum(axis=1)
+        min_distance_squared = all_distances_squared.min()
+        max_distance_squared = all_distances_squared.max()
+        if max_distance_squared == min_distance_squared:
+            return dict.fromkeys(names, self.max_value / 2)
 
-        # Track min/max while building the list to avoid additional passes
-        distances_squared = []
-        min_distance_squared = float("inf")
-        max_distance_squared = 0.0
-        for dag_node in dag_nodes:
-            pos = dag_node.node_reference.metadata.get("position", {"x": 0, "y": 0})
-            d_squared = (pos["x"] - prev_pos["x"]) ** 2 + (pos["y"] - prev_pos["y"]) ** 2
-            distances_squared.append((dag_node, d_squared))
-            min_distance_squared = min(min_distance_squared, d_squared)
-            max_distance_squared = max(max_distance_squared, d_squared)
-
-        results = {}
-        for dag_node, distance_squared in distances_squared:
-            if max_distance_squared == min_distance_squared:
-                score = self.max_value / 2
-            else:
-                normalized = (distance_squared - min_distance_squared) / (max_distance_squared - min_distance_squared)
-                score = self.max_value - (normalized * 99.0)
-
-            results[dag_node.node_reference.name] = score
-
-        return results
+        distances_squared = np.square(node_positions.positions(node_positions.indices(names)) - prev_xy).sum(axis=1)
+        normalized = (distances_squared - min_distance_squared) / (max_distance_squared - min_distance_squared)
+        scores = self.max_value - (normalized * 99.0)
+        return dict(zip(names, scores.tolist(), strict=True))
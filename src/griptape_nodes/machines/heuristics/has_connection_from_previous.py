@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from griptape_nodes.machines.heuristics.base_heuristic import NodeHeuristic
 
@@ -26,6 +26,9 @@ class HasConnectionFromPrevious(NodeHeuristic):
     maintain data locality and reduces context switching during parallel execution.
     """
 
+    uses_previous_executed_node: ClassVar[bool] = False
+    uses_last_resolved_successors: ClassVar[bool] = True
+
     def calculate_priority(self, dag_node: DagNode, **kwargs) -> float:
         previous_executed_node = kwargs.get("previous_executed_node")
         last_resolved_successors = kwargs.get("last_resolved_successors", set())
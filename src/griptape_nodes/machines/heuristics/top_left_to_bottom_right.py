@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from griptape_nodes.machines.heuristics.base_heuristic import NodeHeuristic
 
@@ -21,58 +21,31 @@ class TopLeftToBottomRight(NodeHeuristic):
     - Reading order is calculated as: y_position + x_position
     - Nodes with smaller reading order values (top-left) receive higher scores
     - Nodes with larger reading order values (bottom-right) receive lower scores
-    - Scores are normalized across all nodes to ensure consistent priority distribution
+    - Scores are normalized across all nodes in the DAG to ensure consistent priority distribution
 
     This creates a predictable execution pattern that follows visual layout conventions,
     making workflow execution more intuitive for users.
     """
 
-    def calculate_priority(self, dag_node: DagNode, **kwargs) -> float:  # noqa: ARG002
-        current_pos = dag_node.node_reference.metadata.get("position", {"x": 0, "y": 0})
-        current_reading_order = current_pos["y"] + current_pos["x"]
+    uses_previous_executed_node: ClassVar[bool] = False
+    uses_last_resolved_successors: ClassVar[bool] = False
 
-        all_reading_orders = []
-        for node_ref in self._context.node_to_reference.values():
-            pos = node_ref.node_reference.metadata.get("position", {"x": 0, "y": 0})
-            reading_order = pos["y"] + pos["x"]
-            all_reading_orders.append(reading_order)
-
-        if not all_reading_orders or len(all_reading_orders) == 1:
-            return self.max_value / 2
-
-        min_reading_order = min(all_reading_orders)
-        max_reading_order = max(all_reading_orders)
-
-        if max_reading_order == min_reading_order:
-            return self.max_value / 2
-
-        normalized = (current_reading_order - min_reading_order) / (max_reading_order - min_reading_order)
-        return self.max_value - (normalized * 99.0)
+    def calculate_priority(self, dag_node: DagNode, **kwargs) -> float:
+        return self.calculate_priorities_batch([dag_node], **kwargs)[dag_node.node_reference.name]
 
     def calculate_priorities_batch(self, dag_nodes: list[DagNode], **kwargs) -> dict[str, float]:  # noqa: ARG002
         if not dag_nodes:
             return {}
 
-        if len(dag_nodes) == 1:
-            return {dag_nodes[0].node_reference.name: self.max_value / 2}
-
-        reading_orders = []
-        for dag_node in dag_nodes:
-            pos = dag_node.node_reference.metadata.get("position", {"x": 0, "y": 0})
-            reading_order = pos["y"] + pos["x"]
-            reading_orders.append((dag_node, reading_order))
-
-        min_reading_order = min(ro for _, ro in reading_orders)
-        max_reading_order = max(ro for _, ro in reading_orders)
-
-        results = {}
-        for dag_node, reading_order in reading_orders:
-            if max_reading_order == min_reading_order:
-                score = self.max_value / 2
-            else:
-                normalized = (reading_order - min_reading_order) / (max_reading_order - min_reading_order)
-                score = self.max_value - (normalized * 99.0)
+        names = [node.node_reference.name for node in dag_nodes]
 
-            results[dag_node.node_reference.name] = score
+        # The DAG-wide bounds are cached alongside the positions until the node set changes
+        node_positions = self._context.node_positions
+        min_reading_order, max_reading_order = node_positions.reading_order_bounds()
+        if len(node_positions) <= 1 or max_reading_order == min_reading_order:
+            return dict.fromkeys(names, self.max_value / 2)
 
-        return results
+        reading_orders = node_positions.positions(node_positions.indices(names)).sum(axis=1)
+        normalized = (reading_orders - min_reading_order) / (max_reading_order - min_reading_order)
+        scores = self.max_value - (normalized * 99.0)
+        return dict(zip(names, scores.tolist(), strict=True))
@@ -0,0 +1,116 @@
+"""Packed canvas positions for the nodes in a DAG."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from griptape_nodes.exe_types.node_types import BaseNode
+    from griptape_nodes.machines.dag_builder import DagNode
+
+_INITIAL_CAPACITY = 64
+
+
+class NodePositionCache:
+    """Canvas positions of DAG nodes, stored in a NumPy array keyed by node index.
+
+    Positions are read from node metadata once per node, the first time the scheduler
+    needs them after the node joins the DAG (see sync), so the heuristics can score a whole
+    batch of nodes with array operations instead of re-reading metadata dicts in a Python
+    loop. Slots freed by removed nodes are reused.
+    """
+
+    def __init__(self) -> None:
+        self._index: dict[str, int] = {}
+        self._positions = np.zeros((_INITIAL_CAPACITY, 2), dtype=np.float64)
+        self._active = np.zeros(_INITIAL_CAPACITY, dtype=bool)
+        self._free_slots: list[int] = []
+        self._next_slot = 0
+        self._reading_order_bounds: tuple[float, float] | None = None
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, node_name: object) -> bool:
+        return node_name in self._index
+
+    def add(self, node: BaseNode) -> int:
+        """Record a node's canvas position, returning its index. Re-adding refreshes the position."""
+        position = node.metadata.get("position", {"x": 0, "y": 0})
+        slot = self._index.get(node.name)
+        if slot is None:
+            slot = self._allocate_slot()
+            self._index[node.name] = slot
+            self._active[slot] = True
+        self._positions[slot] = (position["x"], position["y"])
+        self._reading_order_bounds = None
+        return slot
+
+    def remove(self, node_name: str) -> None:
+        """Forget a node's position. Unknown names are ignored."""
+        slot = self._index.pop(node_name, None)
+        if slot is None:
+            return
+        self._active[slot] = False
+        self._free_slots.append(slot)
+        self._reading_order_bounds = None
+
+    def clear(self) -> None:
+        """Forget every node."""
+        self._index.clear()
+        self._active[:] = False
+        self._free_slots.clear()
+        self._next_slot = 0
+        self._reading_order_bounds = None
+
+    def sync(self, node_to_reference: Mapping[str, DagNode]) -> None:
+        """Add positions for new DAG nodes and drop ones no longer in the DAG.
+
+        Only the sizes are compared first, so this is O(1) when the DAG hasn't changed.
+        Removals made through DagBuilder.remove_node_reference keep the sizes aligned.
+        """
+        if len(self._index) == len(node_to_reference):
+            return
+        for name in [name for name in self._index if name not in node_to_reference]:
+            self.remove(name)
+        for name, dag_node in node_to_reference.items():
+            if name not in self._index:
+                self.add(dag_node.node_reference)
+
+    def indices(self, node_names: Iterable[str]) -> np.ndarray:
+        """Return the array indices for the given node names, in order."""
+        index = self._index
+        return np.fromiter((index[name] for name in node_names), dtype=np.intp)
+
+    def positions(self, indices: np.ndarray) -> np.ndarray:
+        """Return an (n, 2) array of x, y positions for the given indices."""
+        return self._positions[indices]
+
+    def active_positions(self) -> np.ndarray:
+        """Return an (n, 2) array of the positions of every node in the cache."""
+        return self._positions[: self._next_slot][self._active[: self._next_slot]]
+
+    def reading_order_bounds(self) -> tuple[float, float]:
+        """Return the (min, max) of x + y across every node, cached until the node set changes."""
+        if self._reading_order_bounds is None:
+            reading_orders = self.active_positions().sum(axis=1)
+            if reading_orders.size == 0:
+                self._reading_order_bounds = (0.0, 0.0)
+            else:
+                self._reading_order_bounds = (float(reading_orders.min()), float(reading_orders.max()))
+        return self._reading_order_bounds
+
+    def _allocate_slot(self) -> int:
+        if self._free_slots:
+            return self._free_slots.pop()
+        slot = self._next_slot
+        if slot == len(self._active):
+            capacity = len(self._active) * 2
+            self._positions = np.resize(self._positions, (capacity, 2))
+            self._active = np.concatenate([self._active, np.zeros(capacity - len(self._active), dtype=bool)])
+        self._next_slot += 1
+        return slot
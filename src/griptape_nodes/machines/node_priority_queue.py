@@ -2,21 +2,38 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import heapq
+import itertools
+from typing import TYPE_CHECKING, Any
 
 from griptape_nodes.machines.heuristics import DistanceToNode, HasConnectionFromPrevious, TopLeftToBottomRight
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from griptape_nodes.machines.dag_builder import DagNode
     from griptape_nodes.machines.heuristics import NodeHeuristic
     from griptape_nodes.machines.parallel_resolution import ParallelResolutionContext
 
+# Placeholder name for heap entries that were superseded or removed (lazy deletion).
+_REMOVED = object()
+
 
 class NodePriorityQueue:
     """Manages priority-based ordering of nodes ready for execution.
 
-    This is a simple framework that stores nodes and returns them in priority order.
-    The _calculate_priority() method is the extension point for future heuristics.
+    Queued nodes live in a binary heap keyed by their combined heuristic score, with a
+    name-to-entry map for O(1) membership and lazy removal. Scores are cached per node and
+    per heuristic; when the scheduling context changes (a node resolves), only the scores
+    the change can affect are recomputed:
+
+    - nodes added since the last scoring pass are scored by every heuristic
+    - heuristics that use the previous node rescore everything queued when it changes
+    - heuristics that use the last resolved successors rescore nodes entering or leaving that set
+
+    Nodes whose can_queue_for_execution() returns False are held in a blocked set and only
+    re-polled when their inputs change (they become a successor of a resolved node), or when
+    nothing else is queued.
     """
 
     def __init__(self, context: ParallelResolutionContext) -> None:
@@ -26,9 +43,14 @@ class NodePriorityQueue:
             context: The execution context containing node references and DAG state
         """
         self._context = context
-        self._queued_nodes: list[str] = []  # Node names, sorted by priority (highest first)
-        self._blocked_nodes: list[str] = []  # Node names blocked from queuing (not ready yet)
-        self._needs_reorder = False  # Lazy reorder flag
+        self._heap: list[list[Any]] = []  # [negated priority, sequence, push id, node name] entries
+        self._entries: dict[str, list[Any]] = {}  # Node name -> live heap entry
+        self._sequence = itertools.count()  # Tie-breaker preserving insertion order
+        # Unique per pushed entry, so heap comparisons never reach the node name (or _REMOVED)
+        self._push_ids = itertools.count()
+        self._blocked_nodes: set[str] = set()  # Node names blocked from queuing (not ready yet)
+        self._blocked_to_recheck: set[str] = set()  # Blocked nodes whose inputs changed since the last poll
+        self._needs_reorder = False  # Lazy rescoring flag
         self._last_resolved_successors: set[str] = set()  # Nodes connected to last resolved node
 
         # Initialize heuristics with fixed weights
@@ -38,6 +60,21 @@ class NodePriorityQueue:
             TopLeftToBottomRight(context, weight=1.0),
         ]
 
+        # Cached scoring state: one score map per heuristic plus the weighted total per node
+        self._scores: list[dict[str, float]] = [{} for _ in self._heuristics]
+        self._combined_priorities: dict[str, float] = {}
+        self._unscored_nodes: set[str] = set()
+        self._scored_previous_node: str | None = None
+        self._scored_successors: set[str] = set()
+
+    def __len__(self) -> int:
+        """Return the number of queued (not blocked) nodes."""
+        return len(self._entries)
+
+    def __contains__(self, node_name: object) -> bool:
+        """Return True if the node is queued or blocked."""
+        return node_name in self._entries or node_name in self._blocked_nodes
+
     def add_node(self, dag_node: DagNode) -> str:
         """Add a node to the priority queue or blocked list based on readiness.
 
@@ -52,30 +89,51 @@ class NodePriorityQueue:
         """
         node_name = dag_node.node_reference.name
 
-        if node_name in self._queued_nodes or node_name in self._blocked_nodes:
+        if node_name in self:
             return node_name
 
         if dag_node.node_reference.can_queue_for_execution():
-            self._queued_nodes.append(node_name)
-            self._needs_reorder = True
+            self._enqueue(node_name)
         else:
-            self._blocked_nodes.append(node_name)
+            self._blocked_nodes.add(node_name)
 
         return node_name
 
-    def get_next_node(self) -> str | None:
+    def get_next_node(self, can_start: Callable[[str], bool] | None = None) -> str | None:
         """Get and remove the highest priority node from the queue.
 
+        Args:
+            can_start: Optional filter; nodes it rejects are skipped and stay queued with their priority
+
         Returns:
-            The name of the highest priority node, or None if queue is empty
+            The name of the highest priority node, or None if queue is empty or every node was rejected
         """
+        if self._blocked_to_recheck:
+            self._recheck_blocked_nodes(self._blocked_to_recheck)
+        if not self._entries and self._blocked_nodes:
+            # Nothing else can run; poll every blocked node in case an external condition cleared.
+            self.check_blocked_nodes()
+
         if self._needs_reorder:
-            self._reorder()
+            self._rescore()
             self._needs_reorder = False
 
-        if self._queued_nodes:
-            return self._queued_nodes.pop(0)
-        return None
+        skipped = []
+        next_node = None
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            node_name = entry[-1]
+            if node_name is _REMOVED:
+                continue
+            if can_start is not None and not can_start(node_name):
+                skipped.append(entry)
+                continue
+            self._forget(node_name)
+            next_node = node_name
+            break
+        for entry in skipped:
+            heapq.heappush(self._heap, entry)
+        return next_node
 
     def remove_node(self, node_name: str) -> None:
         """Remove a node from the priority queue or blocked list.
@@ -83,10 +141,12 @@ class NodePriorityQueue:
         Args:
             node_name: Name of the node to remove
         """
-        if node_name in self._queued_nodes:
-            self._queued_nodes.remove(node_name)
-        if node_name in self._blocked_nodes:
-            self._blocked_nodes.remove(node_name)
+        entry = self._entries.get(node_name)
+        if entry is not None:
+            entry[-1] = _REMOVED
+            self._forget(node_name)
+        self._blocked_nodes.discard(node_name)
+        self._blocked_to_recheck.discard(node_name)
 
     def mark_priorities_stale(self) -> None:
         """Mark priorities as needing recalculation.
@@ -94,68 +154,135 @@ class NodePriorityQueue:
         Called when context.last_resolved_node changes and existing
         queued nodes need reprioritization based on the new context.
         """
-        if self._queued_nodes:
+        if self._entries:
             self._needs_reorder = True
 
-    def check_blocked_nodes(self) -> int:
-        """Check blocked nodes and promote any that are now ready to the queue.
-
-        Returns:
-            The number of nodes that were promoted from blocked to queued
-        """
-        if not self._blocked_nodes:
-            return 0
-
-        promoted_count = 0
-        nodes_still_blocked = []
-
-        for node_name in self._blocked_nodes:
-            if node_name in self._context.node_to_reference:
-                dag_node = self._context.node_to_reference[node_name]
-                if dag_node.node_reference.can_queue_for_execution():
-                    self._queued_nodes.append(node_name)
-                    self._needs_reorder = True
-                    promoted_count += 1
-                else:
-                    nodes_still_blocked.append(node_name)
-            else:
-                nodes_still_blocked.append(node_name)
+    def set_last_resolved_successors(self, successors: set[str]) -> None:
+        """Replace the set of nodes connected to the last resolved node.
 
-        self._blocked_nodes = nodes_still_blocked
-        return promoted_count
+        Blocked nodes in the set have new inputs, so they are re-polled on the next pop.
 
-    def _reorder(self) -> None:
-        """Reorder the queue based on current node priorities."""
-        # Check if any blocked nodes have become unblocked
-        if len(self._blocked_nodes) > 0:
-            self.check_blocked_nodes()
+        Args:
+            successors: Names of the nodes downstream of the last resolved node
+        """
+        self._last_resolved_successors = successors
+        self.mark_inputs_changed(successors)
 
-        if not self._queued_nodes:
-            return
+    def add_last_resolved_successor(self, node_name: str) -> None:
+        """Add a node to the set of nodes connected to the last resolved node.
 
-        if len(self._queued_nodes) == 1:
-            return
+        Args:
+            node_name: Name of the node downstream of the last resolved node
+        """
+        self._last_resolved_successors.add(node_name)
+        self.mark_inputs_changed((node_name,))
 
-        # Look up DagNodes from context only during reorder
-        dag_nodes = [self._context.node_to_reference[name] for name in self._queued_nodes]
+    def mark_inputs_changed(self, node_names: Iterable[str]) -> None:
+        """Flag blocked nodes whose inputs changed so they are re-polled on the next pop.
 
-        previous_executed_node = None
-        if self._context.last_resolved_node is not None:
-            node_name = self._context.last_resolved_node.name
-            if node_name in self._context.node_to_reference:
-                previous_executed_node = self._context.node_to_reference[node_name]
+        Args:
+            node_names: Names of nodes whose inputs changed; names that aren't blocked are ignored
+        """
+        self._blocked_to_recheck.update(name for name in node_names if name in self._blocked_nodes)
 
-        combined_priorities: dict[str, float] = {node.node_reference.name: 0.0 for node in dag_nodes}
+    def check_blocked_nodes(self) -> int:
+        """Check all blocked nodes and promote any that are now ready to the queue.
 
-        for heuristic in self._heuristics:
-            scores = heuristic.calculate_priorities_batch(
-                dag_nodes,
+        Returns:
+            The number of nodes that were promoted from blocked to queued
+        """
+        return self._recheck_blocked_nodes(self._blocked_nodes)
+
+    def _recheck_blocked_nodes(self, node_names: Iterable[str]) -> int:
+        promoted = []
+        for node_name in node_names:
+            dag_node = self._context.node_to_reference.get(node_name)
+            if dag_node is not None and dag_node.node_reference.can_queue_for_execution():
+                promoted.append(node_name)
+
+        for node_name in promoted:
+            self._blocked_nodes.discard(node_name)
+            self._enqueue(node_name)
+        self._blocked_to_recheck.clear()
+        return len(promoted)
+
+    def _enqueue(self, node_name: str) -> None:
+        self._unscored_nodes.add(node_name)
+        self._push(node_name, 0.0)
+        self._needs_reorder = True
+
+    def _push(self, node_name: str, priority: float) -> None:
+        # Superseded entries stay in the heap, flagged as removed, and are skipped on pop.
+        # Re-pushes keep the original sequence number so ties stay in insertion order; the
+        # fresh push id orders a re-push against its own superseded entry.
+        entry = self._entries.get(node_name)
+        if entry is not None:
+            entry[-1] = _REMOVED
+            sequence = entry[1]
+        else:
+            sequence = next(self._sequence)
+        entry = [-priority, sequence, next(self._push_ids), node_name]
+        self._entries[node_name] = entry
+        heapq.heappush(self._heap, entry)
+
+    def _forget(self, node_name: str) -> None:
+        del self._entries[node_name]
+        self._unscored_nodes.discard(node_name)
+        self._combined_priorities.pop(node_name, None)
+        for scores in self._scores:
+            scores.pop(node_name, None)
+
+    def _previous_executed_node(self) -> DagNode | None:
+        if self._context.last_resolved_node is None:
+            return None
+        return self._context.node_to_reference.get(self._context.last_resolved_node.name)
+
+    def _rescore(self) -> None:
+        """Recompute the scores invalidated since the last pass and update the heap."""
+        queued = self._entries.keys()
+        previous_executed_node = self._previous_executed_node()
+        previous_name = previous_executed_node.node_reference.name if previous_executed_node else None
+        previous_changed = previous_name != self._scored_previous_node
+        successor_changes = (self._last_resolved_successors ^ self._scored_successors) & queued
+        new_nodes = self._unscored_nodes & queued
+
+        node_to_reference = self._context.node_to_reference
+        changed: set[str] = set()
+        for heuristic, scores in zip(self._heuristics, self._scores, strict=True):
+            if heuristic.uses_previous_executed_node and previous_changed:
+                to_score = set(queued)
+            else:
+                to_score = set(new_nodes)
+                if heuristic.uses_last_resolved_successors:
+                    to_score |= successor_changes
+            if not to_score:
+                continue
+            new_scores = heuristic.calculate_priorities_batch(
+                [node_to_reference[name] for name in to_score],
                 previous_executed_node=previous_executed_node,
                 last_resolved_successors=self._last_resolved_successors,
             )
-
-            for node_name, score in scores.items():
-                combined_priorities[node_name] += score * heuristic.weight
-
-        # Sort the string names directly
-        self._queued_nodes.sort(key=lambda name: combined_priorities[name], reverse=True)
+            # Fold the change into the cached weighted total instead of re-summing every heuristic
+            weight = heuristic.weight
+            combined = self._combined_priorities
+            for node_name, score in new_scores.items():
+                combined[node_name] = combined.get(node_name, 0.0) + (score - scores.get(node_name, 0.0)) * weight
+            scores.update(new_scores)
+            changed |= to_score
+
+        self._unscored_nodes.clear()
+        self._scored_previous_node = previous_name
+        self._scored_successors = set(self._last_resolved_successors)
+
+        combined = self._combined_priorities
+        if len(changed) * 2 >= len(self._entries):
+            # Most entries moved; rebuilding the heap is cheaper than pushing replacements.
+            self._heap = []
+            for node_name, old_entry in self._entries.items():
+                entry = [-combined.get(node_name, 0.0), old_entry[1], next(self._push_ids), node_name]
+                self._entries[node_name] = entry
+                self._heap.append(entry)
+            heapq.heapify(self._heap)
+        else:
+            for node_name in changed:
+                self._push(node_name, combined.get(node_name, 0.0))
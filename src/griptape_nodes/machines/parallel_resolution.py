@@ -4,6 +4,7 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING, NamedTuple
 
+from griptape_nodes.common.parameter_value_references import reference_large_parameter_value
 from griptape_nodes.exe_types.base_iterative_nodes import BaseIterativeEndNode, BaseIterativeStartNode
 from griptape_nodes.exe_types.connections import Direction
 from griptape_nodes.exe_types.core_types import Parameter, ParameterTypeBuiltin
@@ -14,6 +15,7 @@ from griptape_nodes.exe_types.node_types import (
 from griptape_nodes.machines.dag_builder import NodeState
 from griptape_nodes.machines.fsm import FSM, State, WorkflowState
 from griptape_nodes.machines.node_priority_queue import NodePriorityQueue
+from griptape_nodes.machines.resource_budgets import ResourceBudgets
 from griptape_nodes.node_library.library_registry import LibraryRegistry
 from griptape_nodes.retained_mode.events.base_events import (
     ExecutionEvent,
@@ -35,8 +37,13 @@ from griptape_nodes.retained_mode.events.parameter_events import (
 from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from griptape_nodes.common.directed_graph import DirectedGraph
     from griptape_nodes.machines.dag_builder import DagBuilder, DagNode
+    from griptape_nodes.machines.node_positions import NodePositionCache
+    from griptape_nodes.machines.resource_budgets import ResourceClaim, ResourceClassMetrics
+    from griptape_nodes.node_library.library_declarations import ResourceClass
     from griptape_nodes.retained_mode.managers.flow_manager import FlowManager
 
 logger = logging.getLogger("griptape_nodes")
@@ -61,6 +68,8 @@ class ParallelResolutionContext:
     workflow_state: WorkflowState
     # Execution fields
     max_nodes_in_parallel: int
+    resource_class_budgets: Mapping[str, int | None] | None
+    resource_budgets: ResourceBudgets
     running_tasks_count: int
     task_to_node: dict[asyncio.Task, DagNode]
     node_priority_queue: NodePriorityQueue
@@ -68,7 +77,11 @@ class ParallelResolutionContext:
     last_resolved_node: BaseNode | None  # Track the last node that was resolved
 
     def __init__(
-        self, flow_name: str, max_nodes_in_parallel: int | None = None, dag_builder: DagBuilder | None = None
+        self,
+        flow_name: str,
+        max_nodes_in_parallel: int | None = None,
+        dag_builder: DagBuilder | None = None,
+        resource_class_budgets: Mapping[str, int | None] | None = None,
     ) -> None:
         self.flow_name = flow_name
         self.paused = False
@@ -80,6 +93,8 @@ class ParallelResolutionContext:
 
         # Initialize execution fields
         self.max_nodes_in_parallel = max_nodes_in_parallel if max_nodes_in_parallel is not None else 5
+        self.resource_class_budgets = resource_class_budgets
+        self.resource_budgets = ResourceBudgets.from_config(self.max_nodes_in_parallel, resource_class_budgets)
         self.running_tasks_count = 0
         self.task_to_node = {}
 
@@ -91,6 +106,20 @@ class ParallelResolutionContext:
             raise ValueError(msg)
         return self.dag_builder.node_to_reference
 
+    @property
+    def node_positions(self) -> NodePositionCache:
+        """Get the DAG's node position cache, synced with node_to_reference."""
+        if not self.dag_builder:
+            msg = "DagBuilder is not initialized"
+            raise ValueError(msg)
+        node_positions = self.dag_builder.node_positions
+        node_positions.sync(self.dag_builder.node_to_reference)
+        return node_positions
+
+    def can_start_node(self, node_name: str) -> bool:
+        """Return True if the node's resource class budget has room for it to start now."""
+        return self.resource_budgets.has_capacity(self.node_to_reference[node_name].node_reference)
+
     @property
     def networks(self) -> dict[str, DirectedGraph]:
         """Get node_to_reference from dag_builder if available."""
@@ -113,8 +142,10 @@ class ParallelResolutionContext:
             self.task_to_node.clear()
             self.last_resolved_node = None
 
-        # Reset task counter
+        # Reset task counter and resource class budgets. Claims held by tasks still winding down
+        # release into the old budgets, so they can't skew the new run's accounting.
         self.running_tasks_count = 0
+        self.resource_budgets = ResourceBudgets.from_config(self.max_nodes_in_parallel, self.resource_class_budgets)
 
         # Clear the priority queue when resetting
         # Create a new instance to ensure clean state
@@ -163,7 +194,7 @@ class ExecuteDagState(State):
 
             # Remove start node from ALL networks where it appears
             for network in list(context.networks.values()):
-                if current_node.name in network.nodes():
+                if current_node.name in network:
                     network.remove_node(current_node.name)
 
             return
@@ -198,7 +229,7 @@ class ExecuteDagState(State):
                             node_name=current_node.name,
                             parameter_name=parameter_name,
                             data_type=data_type,
-                            value=safe_unstructure(value),
+                            value=reference_large_parameter_value(safe_unstructure(value)),
                         )
                     ),
                 )
@@ -275,7 +306,7 @@ class ExecuteDagState(State):
             next_node, next_parameter = node_connection
 
             # Add this control successor to the last_resolved_successors set
-            context.node_priority_queue._last_resolved_successors.add(next_node.name)
+            context.node_priority_queue.add_last_resolved_successor(next_node.name)
 
             # Set entry control parameter
             logger.debug(
@@ -345,6 +376,7 @@ class ExecuteDagState(State):
             if can_queue:
                 dag_node.node_state = NodeState.QUEUED
                 context.node_priority_queue.add_node(dag_node)
+                context.resource_budgets.mark_queued(node_name)
 
     @staticmethod
     async def collect_values_from_upstream_nodes(node_reference: DagNode) -> None:
@@ -397,8 +429,7 @@ class ExecuteDagState(State):
             # Reinitialize leaf nodes since maybe we changed things up.
             # We removed nodes from the network. There may be new leaf nodes.
             # Add all leaf nodes from all networks (using set union to avoid duplicates)
-            network_leaf_nodes = [n for n in network.nodes() if network.in_degree(n) == 0]
-            leaf_nodes.update(network_leaf_nodes)
+            leaf_nodes.update(network.leaf_nodes())
         canceled_nodes = set()
         for node in leaf_nodes:
             node_reference = context.node_to_reference[node]
@@ -413,16 +444,22 @@ class ExecuteDagState(State):
 
     @staticmethod
     async def pop_done_states(context: ParallelResolutionContext) -> None:
+        """Remove finished leaf nodes from their networks and queue the nodes they unblock.
+
+        Each network tracks its own leaf nodes and successor index, so this only visits the
+        current leaf nodes and the direct successors of the nodes that finished, rather than
+        every node of every network.
+        """
         networks = context.networks
         handled_nodes = set()  # Track nodes we've already processed to avoid duplicates
 
         # Create a copy of items to avoid "dictionary changed size during iteration" error
         # This is necessary because handle_done_nodes can add new networks via the DAG builder
         for network_name, network in list(networks.items()):
-            # Check and see if there are leaf nodes that are cancelled.
-            # Reinitialize leaf nodes since maybe we changed things up.
-            # We removed nodes from the network. There may be new leaf nodes.
-            leaf_nodes = [n for n in network.nodes() if network.in_degree(n) == 0]
+            # Snapshot the leaf nodes: nodes that become leaves while we remove finished ones
+            # are collected from remove_node() and offered to the queue below.
+            leaf_nodes = set(network.leaf_nodes())
+            newly_ready: set[str] = set()
             for node in leaf_nodes:
                 node_reference = context.node_to_reference[node]
                 node_state = node_reference.node_state
@@ -431,15 +468,12 @@ class ExecuteDagState(State):
                     node_reference.node_state = NodeState.DONE
 
                     # Initialize successors set with data successors from this network
-                    successors = set()
-                    for other_node in network.nodes():
-                        if node in network._predecessors.get(other_node, set()):
-                            successors.add(other_node)
+                    successors = set(network.successors(node)) if node in network else set()
 
                     # Set initial data successors (control successors will be added in handle_done_nodes)
-                    context.node_priority_queue._last_resolved_successors = successors
+                    context.node_priority_queue.set_last_resolved_successors(successors)
 
-                    network.remove_node(node)
+                    newly_ready.update(network.remove_node(node))
 
                     # Only call handle_done_nodes once per node (first network that processes it)
                     if node not in handled_nodes:
@@ -447,12 +481,10 @@ class ExecuteDagState(State):
                         # handle_done_nodes will append control successors to the set
                         await ExecuteDagState.handle_done_nodes(context, context.node_to_reference[node], network_name)
 
-            # After processing completions in this network, check if any remaining leaf nodes can now be queued
-            remaining_leaf_nodes = [n for n in network.nodes() if network.in_degree(n) == 0]
-
-            for leaf_node in remaining_leaf_nodes:
-                if leaf_node in context.node_to_reference:
-                    node_state = context.node_to_reference[leaf_node].node_state
+            # After processing completions in this network, offer the queue the nodes they unblocked,
+            # plus the leaf nodes that were still waiting (e.g. on a control connection)
+            still_waiting = {leaf_node for leaf_node in leaf_nodes if leaf_node in network}
+            for leaf_node in newly_ready | still_waiting:
                 ExecuteDagState._try_queue_waiting_node(context, leaf_node)
 
     @staticmethod
@@ -496,12 +528,13 @@ class ExecuteDagState(State):
             # Set state to workflow complete.
             context.workflow_state = WorkflowState.CANCELED
             return DagCompleteState
-        # Create tasks only while we have capacity
-        while context.running_tasks_count < context.max_nodes_in_parallel:
-            # Get next highest priority node
-            node = context.node_priority_queue.get_next_node()
+        # Create tasks only while we have capacity. The resource budgets enforce both the class
+        # budgets and the max_nodes_in_parallel cap on CPU nodes and classes without a budget.
+        while True:
+            # Get next highest priority node whose resource class has room for it
+            node = context.node_priority_queue.get_next_node(can_start=context.can_start_node)
             if node is None:
-                break  # No more nodes to process
+                break  # No more nodes to process, or every queued node's resource class is full
 
             # Increment counter BEFORE any await points
             context.running_tasks_count += 1
@@ -513,11 +546,15 @@ class ExecuteDagState(State):
                 context.running_tasks_count -= 1  # Decrement since we're skipping
                 continue
 
+            resource_budgets = context.resource_budgets
+            claim = resource_budgets.acquire(node_reference.node_reference)
+
             # Collect parameter values from upstream nodes before executing
             try:
                 await ExecuteDagState.collect_values_from_upstream_nodes(node_reference)
             except Exception as e:
                 context.running_tasks_count -= 1  # Decrement on error
+                resource_budgets.release(claim, completed=False)
                 logger.exception("Error collecting parameter values for node '%s'", node_reference.node_reference.name)
                 error_node_name = node_reference.node_reference.name
                 await GriptapeNodes.EventManager().aput_event(
@@ -540,6 +577,7 @@ class ExecuteDagState(State):
             exceptions = node_reference.node_reference.validate_before_node_run()
             if exceptions:
                 context.running_tasks_count -= 1  # Decrement on error
+                resource_budgets.release(claim, completed=False)
                 validation_node_name = node_reference.node_reference.name
                 msg = f"Node '{validation_node_name}' encountered problems: {exceptions}"
                 logger.error("Canceling flow run. %s", msg)
@@ -566,6 +604,7 @@ class ExecuteDagState(State):
                 node_reference.node_state = NodeState.DONE
                 if end_loop_node is None:
                     context.running_tasks_count -= 1  # Decrement on error
+                    resource_budgets.release(claim, completed=False)
                     msg = (
                         f"Cannot have a Start Loop Node without an End Loop Node: {node_reference.node_reference.name}"
                     )
@@ -590,7 +629,11 @@ class ExecuteDagState(State):
                         context.node_priority_queue.add_node(end_node_reference)
                         node_reference = end_node_reference
 
-            def on_task_done(task: asyncio.Task) -> None:
+            def on_task_done(
+                task: asyncio.Task, resource_budgets: ResourceBudgets = resource_budgets, claim: ResourceClaim = claim
+            ) -> None:
+                # Return the budget as soon as the node finishes, before the resolver wakes up.
+                resource_budgets.release(claim, completed=not task.cancelled())
                 if task in context.task_to_node:
                     node = context.task_to_node[task]
                     node.node_state = NodeState.DONE
@@ -712,6 +755,18 @@ class ErrorState(State):
 class DagCompleteState(State):
     @staticmethod
     async def on_enter(context: ParallelResolutionContext) -> type[State] | None:
+        if logger.isEnabledFor(logging.DEBUG):
+            for resource_class, metrics in context.resource_budgets.metrics.items():
+                if metrics.started:
+                    logger.debug(
+                        "Resource class %s: %d started, %d completed, %.2f nodes/s, avg queue wait %.3fs (max %.3fs)",
+                        resource_class,
+                        metrics.started,
+                        metrics.completed,
+                        metrics.throughput_per_s,
+                        metrics.average_queue_wait_s,
+                        metrics.max_queue_wait_s,
+                    )
         # Clear the DAG builder so we don't have any leftover nodes in node_to_reference.
         if context.dag_builder is not None:
             context.dag_builder.clear()
@@ -726,10 +781,17 @@ class ParallelResolutionMachine(FSM[ParallelResolutionContext]):
     """State machine for building DAG structure without execution."""
 
     def __init__(
-        self, flow_name: str, max_nodes_in_parallel: int | None = None, dag_builder: DagBuilder | None = None
+        self,
+        flow_name: str,
+        max_nodes_in_parallel: int | None = None,
+        dag_builder: DagBuilder | None = None,
+        resource_class_budgets: Mapping[str, int | None] | None = None,
     ) -> None:
         resolution_context = ParallelResolutionContext(
-            flow_name, max_nodes_in_parallel=max_nodes_in_parallel, dag_builder=dag_builder
+            flow_name,
+            max_nodes_in_parallel=max_nodes_in_parallel,
+            dag_builder=dag_builder,
+            resource_class_budgets=resource_class_budgets,
         )
         super().__init__(resolution_context)
 
@@ -785,5 +847,9 @@ class ParallelResolutionMachine(FSM[ParallelResolutionContext]):
     def is_errored(self) -> bool:
         return self._context.workflow_state == WorkflowState.ERRORED
 
+    def get_resource_class_metrics(self) -> dict[ResourceClass, ResourceClassMetrics]:
+        """Get throughput and queue-wait metrics per resource class for the current run."""
+        return self._context.resource_budgets.metrics
+
     def get_error_message(self) -> str | None:
         return self._context.error_message
@@ -0,0 +1,201 @@
+"""Per resource class concurrency budgets and metrics for the parallel resolver."""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from griptape_nodes.node_library.library_declarations import ResourceClass
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from griptape_nodes.exe_types.node_types import BaseNode
+
+logger = logging.getLogger("griptape_nodes")
+
+
+class ResourceRequirement(NamedTuple):
+    """The resource class a node's executions count against, and how many slots each one takes."""
+
+    resource_class: ResourceClass
+    weight: int
+
+
+DEFAULT_RESOURCE_REQUIREMENT = ResourceRequirement(ResourceClass.CPU, 1)
+
+
+@dataclass
+class ResourceClaim:
+    """Budget held by one running node, returned to its class on release."""
+
+    node_name: str
+    resource_class: ResourceClass
+    weight: int
+    started_at: float
+    released: bool = False
+
+
+@dataclass
+class ResourceClassMetrics:
+    """Throughput and queue-wait counters for one resource class.
+
+    Queue wait is the time between a node being queued as ready and it starting, so it
+    includes time spent waiting on both its class budget and the overall parallelism cap.
+    """
+
+    started: int = 0
+    completed: int = 0
+    total_queue_wait_s: float = 0.0
+    max_queue_wait_s: float = 0.0
+    total_run_s: float = 0.0
+    first_started_at: float | None = None
+    last_completed_at: float | None = None
+
+    @property
+    def average_queue_wait_s(self) -> float:
+        return self.total_queue_wait_s / self.started if self.started else 0.0
+
+    @property
+    def average_run_s(self) -> float:
+        return self.total_run_s / self.completed if self.completed else 0.0
+
+    @property
+    def throughput_per_s(self) -> float:
+        """Completed nodes per second, from the first start to the last completion in this class."""
+        if self.first_started_at is None or self.last_completed_at is None:
+            return 0.0
+        elapsed = self.last_completed_at - self.first_started_at
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+
+@dataclass
+class ResourceBudgets:
+    """Tracks how much of each resource class budget is in use by running nodes.
+
+    Each class may run nodes until the total weight of its running nodes reaches its
+    budget. A node heavier than its whole budget may still start when nothing else of its
+    class is running, so an oversized declaration serializes the class instead of
+    deadlocking it.
+
+    max_nodes_in_parallel caps the number of running CPU nodes together with the nodes of
+    any class left without a budget of its own. An IO or memory class given an explicit
+    budget is governed by that budget alone, so it can run more nodes than the cap (many
+    network-bound calls alongside a few local ones) or fewer.
+    """
+
+    max_nodes_in_parallel: int
+    class_budgets: Mapping[ResourceClass, int | None] | None = None
+    clock: Callable[[], float] = time.monotonic
+    budgets: dict[ResourceClass, int] = field(init=False)
+    in_use: dict[ResourceClass, int] = field(init=False)
+    # Classes whose running nodes count against max_nodes_in_parallel, and how many are running
+    pooled_classes: frozenset[ResourceClass] = field(init=False)
+    pooled_running: int = field(init=False, default=0)
+    metrics: dict[ResourceClass, ResourceClassMetrics] = field(init=False)
+    _queued_at: dict[str, float] = field(init=False, default_factory=dict)
+    _requirements: dict[str, ResourceRequirement] = field(init=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        class_budgets = self.class_budgets or {}
+        self.budgets = {}
+        pooled_classes = {ResourceClass.CPU}
+        for resource_class in ResourceClass:
+            budget = class_budgets.get(resource_class)
+            if budget is None:
+                pooled_classes.add(resource_class)
+                self.budgets[resource_class] = self.max_nodes_in_parallel
+            elif resource_class == ResourceClass.CPU:
+                self.budgets[resource_class] = min(budget, self.max_nodes_in_parallel)
+            else:
+                self.budgets[resource_class] = budget
+        self.pooled_classes = frozenset(pooled_classes)
+        self.in_use = dict.fromkeys(ResourceClass, 0)
+        self.metrics = {resource_class: ResourceClassMetrics() for resource_class in ResourceClass}
+
+    @classmethod
+    def from_config(cls, max_nodes_in_parallel: int, config_value: Mapping[str, Any] | None) -> ResourceBudgets:
+        """Build budgets from the resource_class_budgets setting ({"cpu": 4, "io": 16, "memory": 2})."""
+        class_budgets: dict[ResourceClass, int | None] = {}
+        for key, budget in (config_value or {}).items():
+            try:
+                resource_class = ResourceClass(key.upper())
+            except ValueError:
+                logger.warning("Ignoring budget for unknown resource class '%s'", key)
+                continue
+            class_budgets[resource_class] = budget
+        return cls(max_nodes_in_parallel, class_budgets)
+
+    def requirement_for(self, node: BaseNode) -> ResourceRequirement:
+        """Return the resource class and weight declared in the node's library metadata."""
+        requirement = self._requirements.get(node.name)
+        if requirement is None:
+            requirement = self._read_requirement(node)
+            self._requirements[node.name] = requirement
+        return requirement
+
+    def mark_queued(self, node_name: str) -> None:
+        """Record when a node became ready, for queue-wait metrics. Re-marking keeps the first time."""
+        self._queued_at.setdefault(node_name, self.clock())
+
+    def has_capacity(self, node: BaseNode) -> bool:
+        """Return True if the node's resource class, and the shared cap if it applies, have room for it now."""
+        resource_class, weight = self.requirement_for(node)
+        if resource_class in self.pooled_classes and self.pooled_running >= self.max_nodes_in_parallel:
+            return False
+        in_use = self.in_use[resource_class]
+        return in_use == 0 or in_use + weight <= self.budgets[resource_class]
+
+    def acquire(self, node: BaseNode) -> ResourceClaim:
+        """Take the node's weight from its class budget and record its queue wait."""
+        resource_class, weight = self.requirement_for(node)
+        now = self.clock()
+        self.in_use[resource_class] += weight
+        if resource_class in self.pooled_classes:
+            self.pooled_running += 1
+
+        metrics = self.metrics[resource_class]
+        queue_wait = now - self._queued_at.pop(node.name, now)
+        metrics.started += 1
+        metrics.total_queue_wait_s += queue_wait
+        metrics.max_queue_wait_s = max(metrics.max_queue_wait_s, queue_wait)
+        if metrics.first_started_at is None:
+            metrics.first_started_at = now
+        return ResourceClaim(node.name, resource_class, weight, started_at=now)
+
+    def release(self, claim: ResourceClaim, *, completed: bool = True) -> None:
+        """Return a claim's weight to its class budget. Releasing a claim twice is a no-op.
+
+        Args:
+            claim: The claim returned by acquire
+            completed: Whether the node actually ran, so it counts towards throughput
+        """
+        if claim.released:
+            return
+        claim.released = True
+        self.in_use[claim.resource_class] -= claim.weight
+        if claim.resource_class in self.pooled_classes:
+            self.pooled_running -= 1
+        if completed:
+            now = self.clock()
+            metrics = self.metrics[claim.resource_class]
+            metrics.completed += 1
+            metrics.total_run_s += now - claim.started_at
+            metrics.last_completed_at = now
+
+    @staticmethod
+    def _read_requirement(node: BaseNode) -> ResourceRequirement:
+        # Library.create_node injects the node's NodeMetadata, dumped to JSON, into its metadata blob.
+        library_node_metadata = node.metadata.get("library_node_metadata") if isinstance(node.metadata, dict) else None
+        if not isinstance(library_node_metadata, dict):
+            return DEFAULT_RESOURCE_REQUIREMENT
+        resource_class, weight = DEFAULT_RESOURCE_REQUIREMENT
+        for declaration in library_node_metadata.get("declarations") or []:
+            declaration_type = declaration.get("type")
+            if declaration_type == "resource_class":
+                resource_class = ResourceClass(declaration["resource_class"])
+            elif declaration_type == "resource_weight":
+                weight = int(declaration["weight"])
+        return ResourceRequirement(resource_class, weight)
@@ -79,6 +79,34 @@ class WorkerMode(StrEnum):
     WORKER = "WORKER"
 
 
+class ProcessOffload(StrEnum):
+    """Where a node's synchronous ``process()`` body runs. Shared by library- and node-level properties.
+
+    Node-level semantics match ``LifecycleStage``: a node-level property overrides
+    the library's value, and absence everywhere is treated as ``EVENT_LOOP``.
+    """
+
+    # Run process() directly on the engine's event loop. Right for quick nodes.
+    EVENT_LOOP = "EVENT_LOOP"
+    # Run process() in the engine's node thread pool, so CPU-bound or blocking
+    # bodies don't stall event delivery or other nodes. The node's code must not
+    # assume it runs on the event loop thread.
+    THREAD = "THREAD"
+
+
+class ResourceClass(StrEnum):
+    """The machine resource a node mostly consumes while it runs.
+
+    The parallel resolver keeps a separate concurrency budget per class, so many
+    cheap network-bound nodes can run alongside a few heavy local ones. Absence of a
+    ``ResourceClassNodeProperty`` is treated as ``CPU``.
+    """
+
+    CPU = "CPU"
+    IO = "IO"
+    MEMORY = "MEMORY"
+
+
 # ---------- Library-level declarations ----------
 
 
@@ -122,6 +150,16 @@ class SuggestedWorkerMode(BaseModel):
     mode: WorkerMode
 
 
+class ProcessOffloadLibraryProperty(BaseModel):
+    """Where the synchronous ``process()`` of every node in the library runs.
+
+    Absence of this property is treated as ``ProcessOffload.EVENT_LOOP``.
+    """
+
+    type: Literal["process_offload"] = "process_offload"
+    offload: ProcessOffload
+
+
 # `Annotated[X | Y, Field(discriminator="type")]` is Pydantic v2's discriminated-union
 # idiom. Breakdown:
 #   - `X | Y` is the union of valid member classes.
@@ -133,7 +171,7 @@ class SuggestedWorkerMode(BaseModel):
 #     ValidationError (strict validation).
 # This is the canonical Pydantic v2 way to round-trip "one of several shapes" through JSON.
 LibraryDeclaration = Annotated[
-    LifecycleStageLibraryProperty | WorkerModeCompatibility | SuggestedWorkerMode,
+    LifecycleStageLibraryProperty | WorkerModeCompatibility | SuggestedWorkerMode | ProcessOffloadLibraryProperty,
     Field(discriminator="type"),
 ]
 
@@ -185,8 +223,58 @@ class KeySupportNodeProperty(BaseModel):
     support: KeySupport
 
 
+class ResourceClassNodeProperty(BaseModel):
+    """Declares which resource class this node's executions count against.
+
+    Absence of this property means ``ResourceClass.CPU``.
+    """
+
+    type: Literal["resource_class"] = "resource_class"
+    resource_class: ResourceClass
+
+
+class ResourceWeightNodeProperty(BaseModel):
+    """Declares how many slots of its resource class budget one execution of this node takes.
+
+    Absence of this property means a weight of 1. A node heavier than its whole budget
+    still runs, alone in its class.
+    """
+
+    type: Literal["resource_weight"] = "resource_weight"
+    weight: int = Field(ge=1)
+
+
+class ProcessOffloadNodeProperty(BaseModel):
+    """Where this node's synchronous ``process()`` runs, overriding the library's value."""
+
+    type: Literal["process_offload"] = "process_offload"
+    offload: ProcessOffload
+
+
 # See the comment above `LibraryDeclaration` for how `Annotated[... discriminator ...]` works.
 NodeDeclaration = Annotated[
-    LifecycleStageNodeProperty | KeySupportNodeProperty,
+    LifecycleStageNodeProperty
+    | KeySupportNodeProperty
+    | ResourceClassNodeProperty
+    | ResourceWeightNodeProperty
+    | ProcessOffloadNodeProperty,
     Field(discriminator="type"),
 ]
+
+
+def resolve_process_offload(
+    node_declarations: Sequence[NodeDeclaration], library_declarations: Sequence[LibraryDeclaration]
+) -> ProcessOffload:
+    """Resolve where a node's synchronous ``process()`` runs from its node- and library-level declarations.
+
+    The node-level property wins over the library-level one; with neither, the body
+    runs on the event loop.
+    """
+    for declarations in (node_declarations, library_declarations):
+        declared = next(
+            (d for d in declarations if isinstance(d, (ProcessOffloadNodeProperty, ProcessOffloadLibraryProperty))),
+            None,
+        )
+        if declared is not None:
+            return declared.offload
+    return ProcessOffload.EVENT_LOOP
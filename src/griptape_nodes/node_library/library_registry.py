@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 from contextlib import contextmanager
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple
@@ -27,7 +28,7 @@ from griptape_nodes.retained_mode.managers.resource_components.resource_instance
 from griptape_nodes.utils.metaclasses import SingletonMeta
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
 
     from griptape_nodes.exe_types.node_types import BaseNode
     from griptape_nodes.node_library.advanced_node_library import AdvancedNodeLibrary
@@ -454,9 +455,18 @@ class Library:
 
     _library_data: LibrarySchema
     _is_default_library: bool
-    # Maintain fast lookups for node class name to class and to its metadata.
-    _node_types: dict[str, type[BaseNode]]
+    # Every registered node type, in registration (library JSON) order, to its metadata.
+    # This is the list of node types; the class lookups below do not affect its order.
     _node_metadata: dict[str, NodeMetadata]
+    # Node types whose class has been imported
+    _node_types: dict[str, type[BaseNode]]
+    # Node types registered without importing their module, mapped to the callable that
+    # imports and returns the class. An entry moves to _node_types on first use.
+    _lazy_node_loaders: dict[str, Callable[[], type[BaseNode]]]
+    # One lock per lazily registered node type, so each class is imported once without
+    # making a request for one node type wait on the import of another
+    _lazy_node_locks: dict[str, threading.Lock]
+    _lazy_node_locks_guard: threading.Lock
     _advanced_library: AdvancedNodeLibrary | None
 
     def __init__(
@@ -474,8 +484,11 @@ class Library:
 
         self._is_default_library = self._library_data.is_default_library
 
-        self._node_types = {}
         self._node_metadata = {}
+        self._node_types = {}
+        self._lazy_node_loaders = {}
+        self._lazy_node_locks = {}
+        self._lazy_node_locks_guard = threading.Lock()
         self._advanced_library = advanced_library
 
     def register_new_node_type(self, node_class: type[BaseNode], metadata: NodeMetadata) -> LibraryProblem | None:
@@ -490,8 +503,54 @@ class Library:
 
         self._node_types[node_class_as_str] = node_class
         self._node_metadata[node_class_as_str] = metadata
+        self._lazy_node_loaders.pop(node_class_as_str, None)
         return library_problem
 
+    def register_lazy_node_type(
+        self, node_class_name: str, metadata: NodeMetadata, loader: Callable[[], type[BaseNode]]
+    ) -> LibraryProblem | None:
+        """Register a node type without importing its class. Returns a LibraryProblem if registration fails.
+
+        The node type is listed and described from its metadata like any other. `loader` is
+        called to import the class the first time it is needed (creating a node, reading its
+        class). If the loader raises, the node type is unregistered and the error propagates.
+        """
+        library_problem = LibraryRegistry.register_node_type_from_library(library=self, node_class_name=node_class_name)
+
+        self._node_types.pop(node_class_name, None)
+        self._lazy_node_loaders[node_class_name] = loader
+        self._node_metadata[node_class_name] = metadata
+        return library_problem
+
+    def get_lazy_node_types(self) -> list[str]:
+        """Return the node types whose class has not been imported yet."""
+        return list(self._lazy_node_loaders)
+
+    def _resolve_node_class(self, node_type: str) -> type[BaseNode] | None:
+        """Return the class for `node_type`, importing it if it was registered lazily."""
+        node_class = self._node_types.get(node_type)
+        if node_class is not None or node_type not in self._lazy_node_loaders:
+            return node_class
+
+        with self._lazy_node_locks_guard:
+            lock = self._lazy_node_locks.setdefault(node_type, threading.Lock())
+        with lock:
+            # Another thread may have imported (or failed to import) it while we waited
+            node_class = self._node_types.get(node_type)
+            loader = self._lazy_node_loaders.get(node_type)
+            if node_class is not None or loader is None:
+                return node_class
+            try:
+                node_class = loader()
+            except Exception:
+                # Same outcome as a failed import at registration: the node type is not available
+                del self._lazy_node_loaders[node_type]
+                self._node_metadata.pop(node_type, None)
+                raise
+            self._node_types[node_type] = node_class
+            del self._lazy_node_loaders[node_type]
+        return node_class
+
     def unregister_node_type(self, node_class_name: str) -> None:
         """Remove a single node type from this library.
 
@@ -500,13 +559,14 @@ class Library:
         class that are already living in a flow; callers are responsible for deleting and
         recreating them if they want the new class to take effect.
         """
-        if node_class_name not in self._node_types:
+        if node_class_name not in self._node_types and node_class_name not in self._lazy_node_loaders:
             msg = (
                 f"Node type '{node_class_name}' was requested to be unregistered from library "
                 f"'{self._library_data.name}', but it wasn't registered in the first place."
             )
             raise KeyError(msg)
-        del self._node_types[node_class_name]
+        self._node_types.pop(node_class_name, None)
+        self._lazy_node_loaders.pop(node_class_name, None)
         self._node_metadata.pop(node_class_name, None)
 
     def get_library_data(self) -> LibrarySchema:
@@ -519,7 +579,7 @@ class Library:
         metadata: dict[Any, Any] | None = None,
     ) -> BaseNode:
         """Create a new node instance of the specified type."""
-        node_class = self._node_types.get(node_type)
+        node_class = self._resolve_node_class(node_type)
         if not node_class:
             msg = f"Node type '{node_type}' not found in library '{self._library_data.name}'"
             raise KeyError(msg)
@@ -544,11 +604,11 @@ class Library:
         return node
 
     def get_registered_nodes(self) -> list[str]:
-        """Get a list of all registered node types."""
-        return list(self._node_types.keys())
+        """Get a list of all registered node types, including ones not imported yet."""
+        return list(self._node_metadata)
 
     def has_node_type(self, node_type: str) -> bool:
-        return node_type in self._node_types
+        return node_type in self._node_types or node_type in self._lazy_node_loaders
 
     def get_node_metadata(self, node_type: str) -> NodeMetadata:
         if node_type not in self._node_metadata:
@@ -560,11 +620,12 @@ class Library:
 
         For callers that need the class itself, e.g. classmethod checks like
         `allow_outgoing_connection_by_class`, rather than an instance produced
-        by `create_node`.
+        by `create_node`. Imports the class if it was registered lazily.
         """
-        if node_type not in self._node_types:
+        node_class = self._resolve_node_class(node_type)
+        if node_class is None:
             raise KeyError(self._library_data.name, node_type)
-        return self._node_types[node_type]
+        return node_class
 
     def get_categories(self) -> list[dict[str, CategoryDefinition]]:
         return self._library_data.categories
@@ -592,6 +653,19 @@ class Library:
         Returns:
             List of node type names that extend the base type
         """
+        # The base type is only known once the class is imported
+        for node_type in self.get_lazy_node_types():
+            try:
+                self._resolve_node_class(node_type)
+            except Exception as err:
+                logger.warning(
+                    "Skipped node type '%s' from library '%s' when matching base type '%s': %s",
+                    node_type,
+                    self._library_data.name,
+                    base_type.__name__,
+                    err,
+                )
+
         matching_nodes = []
         for node_type, node_class in self._node_types.items():
             if issubclass(node_class, base_type):
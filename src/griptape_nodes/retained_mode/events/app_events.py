@@ -147,6 +147,8 @@ class EngineInitializationProgress(AppPayload):
         current: Number of items completed so far
         total: Total number of items to load
         error: Error message if status is failed, None otherwise
+        phase_durations_s: Seconds spent in each loading step of the item, when measured
+            (for libraries: "metadata", "dependencies", "registration")
     """
 
     phase: InitializationPhase
@@ -156,6 +158,7 @@ class EngineInitializationProgress(AppPayload):
     total: int
     error: str | None = None
     is_worker: bool = False
+    phase_durations_s: dict[str, float] | None = None
 
 
 @dataclass
@@ -5,6 +5,7 @@ from enum import StrEnum
 from typing import Any
 
 from griptape_nodes.retained_mode.events.base_events import (
+    ExecutionPayload,
     RequestPayload,
     ResultPayloadFailure,
     ResultPayloadSuccess,
@@ -178,6 +179,68 @@ class GetPreviewForArtifactResultFailure(WorkflowNotAlteredMixin, ResultPayloadF
     """Failed to get preview for artifact."""
 
 
+@dataclass
+@PayloadRegistry.register
+class GeneratePreviewsRequest(RequestPayload):
+    """Get previews for every artifact in a directory that a registered provider supports.
+
+    Each file is handled like a GetPreviewForArtifactRequest, using the first provider that
+    supports its extension. Previews are rendered concurrently, and a GeneratePreviewsProgressEvent
+    is emitted as each file finishes. Files inside preview output directories are skipped.
+
+    Args:
+        directory: Directory containing the artifacts
+        recursive: Whether to include artifacts in subdirectories
+        preview_generation_policy: When to generate/regenerate each preview
+
+    Results: GeneratePreviewsResultSuccess | GeneratePreviewsResultFailure
+    """
+
+    directory: str
+    recursive: bool = False
+    preview_generation_policy: PreviewGenerationPolicy = PreviewGenerationPolicy.ONLY_IF_STALE
+
+
+@dataclass
+@PayloadRegistry.register
+class GeneratePreviewsResultSuccess(WorkflowNotAlteredMixin, ResultPayloadSuccess):
+    """Previews processed for a directory. Per-file failures do not fail the request.
+
+    Attributes:
+        paths_to_preview: Preview path(s) keyed by source file path, for each file that succeeded
+        failures: Failure details keyed by source file path, for each file that failed
+    """
+
+    paths_to_preview: dict[str, str | dict[str, str]]
+    failures: dict[str, str]
+
+
+@dataclass
+@PayloadRegistry.register
+class GeneratePreviewsResultFailure(WorkflowNotAlteredMixin, ResultPayloadFailure):
+    """Failed to process previews for a directory."""
+
+
+@dataclass
+@PayloadRegistry.register
+class GeneratePreviewsProgressEvent(ExecutionPayload):
+    """Emitted as each file of a GeneratePreviewsRequest finishes.
+
+    Args:
+        directory: The directory from the request
+        source_path: The file that finished
+        succeeded: Whether its preview was retrieved or generated
+        completed: Number of files finished so far
+        total: Number of files being processed
+    """
+
+    directory: str
+    source_path: str
+    succeeded: bool
+    completed: int
+    total: int
+
+
 @dataclass
 @PayloadRegistry.register
 class RegisterArtifactProviderRequest(RequestPayload):
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import json
 import logging
 from abc import ABC, abstractmethod
@@ -17,6 +18,24 @@ from griptape_nodes.retained_mode.events.event_converter import (
 if TYPE_CHECKING:
     import builtins
 
+logger = logging.getLogger(__name__)
+
+# Field values BaseEvent.dict() copies as-is; anything else goes through pydantic.
+_PLAIN_FIELD_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _json_default(obj: Any) -> str:
+    logger.debug(
+        "json.dumps fallback hit: type=%s, value=%r",
+        type(obj).__name__,
+        obj,
+    )
+    return str(obj)
+
+
+# Reused by every BaseEvent.json() call instead of building an encoder per event.
+_EVENT_JSON_ENCODER = json.JSONEncoder(default=_json_default)
+
 
 def _resolve_payload_type(event_data: dict[str, Any], type_key: str) -> type:
     """Resolve a payload type from a type-name field in the event data.
@@ -311,31 +330,40 @@ class BaseEvent(BaseModel, ABC):
 
     def dict(self, *args, **kwargs) -> dict[str, Any]:
         """Override dict to handle payload serialization and add event_type."""
-        result = super().dict(*args, **kwargs)
+        result = super().dict(*args, **kwargs) if args or kwargs else self._fields_dict()
 
         # Add event type based on class name
         result["event_type"] = self.__class__.__name__
 
         # Include payload type information in serialized output
         for field_name, field_value in self.__dict__.items():
-            if isinstance(field_value, Payload):
+            if _is_payload_type(type(field_value)):
                 result[f"{field_name}_type"] = field_value.__class__.__name__
 
         return result
 
     def json(self, **kwargs) -> str:
         """Serialize to JSON string."""
-        logger = logging.getLogger(__name__)
+        if kwargs:
+            return json.dumps(self.dict(), default=_json_default, **kwargs)
+        return _EVENT_JSON_ENCODER.encode(self.dict())
 
-        def _default(obj: Any) -> str:
-            logger.debug(
-                "json.dumps fallback hit: type=%s, value=%r",
-                type(obj).__name__,
-                obj,
-            )
-            return str(obj)
+    def _fields_dict(self) -> dict[str, Any]:
+        """Build the field dict for dict() without running pydantic's serializer over every field.
 
-        return json.dumps(self.dict(), default=_default, **kwargs)
+        Plain values are copied. Payload fields are copied untouched, since every event class that
+        has one replaces it with its cattrs form in its own dict(). Any other value (nested events,
+        lists) is serialized by pydantic, as before.
+        """
+        values = self.__dict__
+        result = {}
+        for field_name in _event_field_names(type(self)):
+            value = values[field_name]
+            if type(value) in _PLAIN_FIELD_TYPES or _is_payload_type(type(value)):
+                result[field_name] = value
+            else:
+                result[field_name] = self.model_dump(include={field_name})[field_name]
+        return result
 
     @abstractmethod
     def get_request(self) -> Payload:
@@ -573,6 +601,17 @@ class AppEvent[A: AppPayload](BaseEvent):
         return cls(payload=event_payload, **event_data)
 
 
+@functools.cache
+def _is_payload_type(cls: type) -> bool:
+    """Cached issubclass(cls, Payload); Payload is an ABC, so the uncached check is slow per event."""
+    return issubclass(cls, Payload)
+
+
+@functools.cache
+def _event_field_names(cls: type[BaseEvent]) -> tuple[str, ...]:
+    return tuple(cls.model_fields)
+
+
 class GriptapeNodeEvent(BaseEvent):
     wrapped_event: EventResult
 
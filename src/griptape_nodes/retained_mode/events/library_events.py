@@ -1134,15 +1134,19 @@ class InstallLibraryDependenciesRequest(RequestPayload):
     2. Gets library dependencies from metadata
     3. Initializes the library's virtual environment
     4. Installs pip dependencies specified in the library metadata
-    5. Always installs dependencies without version checks
+    5. Skips steps 3-4 when the venv records an install of the same dependencies, install
+       flags, Python version and venv path (see force_reinstall)
 
     Args:
         library_file_path: Path to the library JSON file
+        force_reinstall: Install even if the recorded dependency fingerprint matches. Also
+            forced for every library by the force_library_dependency_reinstall setting.
 
     Results: InstallLibraryDependenciesResultSuccess | InstallLibraryDependenciesResultFailure
     """
 
     library_file_path: str
+    force_reinstall: bool = False
 
 
 @dataclass
@@ -1153,10 +1157,14 @@ class InstallLibraryDependenciesResultSuccess(ResultPayloadSuccess):
     Args:
         library_name: Name of the library whose dependencies were installed
         dependencies_installed: Number of dependencies that were installed
+        install_skipped: True if the install was skipped because the dependencies were unchanged
+        seconds_saved: Duration of the last real install, when install_skipped is True
     """
 
     library_name: str
     dependencies_installed: int
+    install_skipped: bool = False
+    seconds_saved: float = 0.0
 
 
 @dataclass
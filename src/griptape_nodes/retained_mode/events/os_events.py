@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import StrEnum
 
+from griptape_nodes.common.managed_cache_directory import CacheEvictionPolicy
 from griptape_nodes.common.sequences.models import MissingItemPolicy, NoTokenBehavior, Sequence
 from griptape_nodes.retained_mode.events.base_events import (
     RequestPayload,
@@ -997,3 +998,59 @@ class MakeDirectoryResultFailure(WorkflowNotAlteredMixin, ResultPayloadFailure):
     """
 
     failure_reason: FileIOFailureReason
+
+
+@dataclass
+@PayloadRegistry.register
+class RegisterCacheDirectoryRequest(RequestPayload):
+    """Bound the size of a cache directory by evicting files written through the engine.
+
+    Use when: A node library or feature keeps generated files in a directory that should not
+    grow without limit (downloaded models, intermediate renders, output caches).
+
+    The engine indexes the size of every file in the directory once and then updates the index
+    as files are written, read, and deleted through WriteFileRequest, ReadFileRequest, and
+    DeleteFileRequest. Registering an already registered directory updates its settings.
+
+    Args:
+        directory: Absolute path to the cache directory
+        max_size_gb: Size above which files are evicted, in GB
+        eviction_policy: Which files to delete first: least recently used (default) or least frequently used
+        evict_in_background: If True (default), a WriteFileRequest that pushes the directory over
+            max_size_gb starts eviction on a background thread. If False, eviction only happens
+            when cleanup_directory_if_needed() is called or the directory is registered again.
+
+    Results: RegisterCacheDirectoryResultSuccess | RegisterCacheDirectoryResultFailure
+    """
+
+    directory: str
+    max_size_gb: float
+    eviction_policy: CacheEvictionPolicy = CacheEvictionPolicy.LRU
+    evict_in_background: bool = True
+
+
+@dataclass
+@PayloadRegistry.register
+class RegisterCacheDirectoryResultSuccess(WorkflowNotAlteredMixin, ResultPayloadSuccess):
+    """Cache directory registered.
+
+    Attributes:
+        size_bytes: Size of the directory after any eviction the registration triggered
+        file_count: Number of files in the directory
+    """
+
+    size_bytes: int
+    file_count: int
+
+
+@dataclass
+@PayloadRegistry.register
+class RegisterCacheDirectoryResultFailure(WorkflowNotAlteredMixin, ResultPayloadFailure):
+    """Cache directory registration failed.
+
+    Attributes:
+        failure_reason: Classification of why the registration failed
+        result_details: Human-readable error message (inherited from ResultPayloadFailure)
+    """
+
+    failure_reason: FileIOFailureReason
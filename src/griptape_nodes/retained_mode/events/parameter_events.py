@@ -282,6 +282,53 @@ class SetParameterValueResultFailure(ResultPayloadFailure):
     """
 
 
+@dataclass
+@PayloadRegistry.register
+class BatchSetParameterValuesRequest(RequestPayload):
+    """Set the values of several parameters on one node in a single request.
+
+    Use when: Seeding many inputs at once, e.g. the Start node of each loop iteration.
+    Each value is applied in order exactly as a SetParameterValueRequest would apply it;
+    a parameter that fails does not stop the remaining ones from being set.
+
+    Args:
+        parameter_values: Dictionary mapping parameter names to the values to set
+        node_name: Name of the node containing the parameters (None for current context)
+
+    Results: BatchSetParameterValuesResultSuccess | BatchSetParameterValuesResultFailure (node not found, some values rejected)
+    """
+
+    parameter_values: dict[str, Any]
+    # If node name is None, use the Current Context
+    node_name: str | None = None
+
+
+@dataclass
+@PayloadRegistry.register
+class BatchSetParameterValuesResultSuccess(WorkflowAlteredMixin, ResultPayloadSuccess):
+    """All parameter values in the batch were set successfully.
+
+    Args:
+        updated_parameters: Names of the parameters that were set, in request order
+    """
+
+    updated_parameters: list[str]
+
+
+@dataclass
+@PayloadRegistry.register
+class BatchSetParameterValuesResultFailure(ResultPayloadFailure):
+    """One or more parameter values in the batch could not be set.
+
+    Values that were accepted before or after a failure remain set.
+
+    Args:
+        failed_parameters: Dictionary mapping failed parameter names to error descriptions
+    """
+
+    failed_parameters: dict[str, str] = field(default_factory=dict)
+
+
 @dataclass
 @PayloadRegistry.register
 class GetParameterDetailsRequest(RequestPayload):
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import logging
 import os
+import time
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 import semver
 
+from griptape_nodes.common.startup_tracer import get_startup_tracer, startup_span
 from griptape_nodes.exe_types.flow import ControlFlow
 from griptape_nodes.node_library.workflow_registry import WorkflowRegistry
 from griptape_nodes.retained_mode.events.app_events import (
@@ -77,6 +79,12 @@ if TYPE_CHECKING:
 logger = logging.getLogger("griptape_nodes")
 
 
+def _construct_traced[T](manager_class: type[T], *args: Any, **kwargs: Any) -> T:
+    """Construct a manager, recording its constructor as a startup span."""
+    with startup_span(f"{manager_class.__name__}.__init__", category="managers"):
+        return manager_class(*args, **kwargs)
+
+
 class GriptapeNodes(metaclass=SingletonMeta):
     _event_manager: EventManager
     _os_manager: OSManager
@@ -106,6 +114,7 @@ class GriptapeNodes(metaclass=SingletonMeta):
     _worker_manager: WorkerManager
 
     def __init__(self) -> None:  # noqa: PLR0915
+        imports_start = time.perf_counter()
         from griptape_nodes.retained_mode.managers.agent_manager import AgentManager
         from griptape_nodes.retained_mode.managers.arbitrary_code_exec_manager import (
             ArbitraryCodeExecManager,
@@ -147,34 +156,43 @@ class GriptapeNodes(metaclass=SingletonMeta):
 
         # Initialize only if our managers haven't been created yet
         if not hasattr(self, "_event_manager"):
-            self._event_manager = EventManager()
-            self._resource_manager = ResourceManager(self._event_manager)
-            self._config_manager = ConfigManager(self._event_manager)
-            self._os_manager = OSManager(self._event_manager)
-            self._secrets_manager = SecretsManager(self._config_manager, self._event_manager)
-            self._object_manager = ObjectManager(self._event_manager)
-            self._node_manager = NodeManager(self._event_manager)
-            self._flow_manager = FlowManager(self._event_manager)
-            self._context_manager = ContextManager(self._event_manager)
-            self._worker_manager = WorkerManager(griptape_nodes=self, event_manager=self._event_manager)
-            self._library_manager = LibraryManager(self._event_manager, worker_manager=self._worker_manager)
-            self._model_manager = ModelManager(self._event_manager)
-            self._workflow_manager = WorkflowManager(self._event_manager)
-            self._workflow_variables_manager = VariablesManager(self._event_manager)
-            self._arbitrary_code_exec_manager = ArbitraryCodeExecManager(self._event_manager)
-            self._operation_depth_manager = OperationDepthManager(self._config_manager)
-            self._static_files_manager = StaticFilesManager(
-                self._config_manager, self._secrets_manager, self._event_manager
+            get_startup_tracer().record("import manager modules", "imports", imports_start, time.perf_counter())
+            self._event_manager = _construct_traced(EventManager)
+            self._resource_manager = _construct_traced(ResourceManager, self._event_manager)
+            self._config_manager = _construct_traced(ConfigManager, self._event_manager)
+            self._os_manager = _construct_traced(OSManager, self._event_manager)
+            self._secrets_manager = _construct_traced(SecretsManager, self._config_manager, self._event_manager)
+            self._object_manager = _construct_traced(ObjectManager, self._event_manager)
+            self._node_manager = _construct_traced(NodeManager, self._event_manager)
+            self._flow_manager = _construct_traced(FlowManager, self._event_manager)
+            self._context_manager = _construct_traced(ContextManager, self._event_manager)
+            self._worker_manager = _construct_traced(
+                WorkerManager, griptape_nodes=self, event_manager=self._event_manager
+            )
+            self._library_manager = _construct_traced(
+                LibraryManager, self._event_manager, worker_manager=self._worker_manager
+            )
+            self._model_manager = _construct_traced(ModelManager, self._event_manager)
+            self._workflow_manager = _construct_traced(WorkflowManager, self._event_manager)
+            self._workflow_variables_manager = _construct_traced(VariablesManager, self._event_manager)
+            self._arbitrary_code_exec_manager = _construct_traced(ArbitraryCodeExecManager, self._event_manager)
+            self._operation_depth_manager = _construct_traced(OperationDepthManager, self._config_manager)
+            self._static_files_manager = _construct_traced(
+                StaticFilesManager, self._config_manager, self._secrets_manager, self._event_manager
             )
-            self._agent_manager = AgentManager(self._static_files_manager, self._event_manager)
-            self._version_compatibility_manager = VersionCompatibilityManager(self._event_manager)
-            self._engine_identity_manager = EngineIdentityManager(self._event_manager)
-            self._session_manager = SessionManager(self._engine_identity_manager, self._event_manager)
-            self._mcp_manager = MCPManager(self._event_manager, self._config_manager)
-            self._sync_manager = SyncManager(self._event_manager, self._config_manager)
-            self._user_manager = UserManager(self._secrets_manager)
-            self._project_manager = ProjectManager(self._event_manager, self._config_manager, self._secrets_manager)
-            self._artifact_manager = ArtifactManager(self._event_manager)
+            self._agent_manager = _construct_traced(AgentManager, self._static_files_manager, self._event_manager)
+            self._version_compatibility_manager = _construct_traced(VersionCompatibilityManager, self._event_manager)
+            self._engine_identity_manager = _construct_traced(EngineIdentityManager, self._event_manager)
+            self._session_manager = _construct_traced(
+                SessionManager, self._engine_identity_manager, self._event_manager
+            )
+            self._mcp_manager = _construct_traced(MCPManager, self._event_manager, self._config_manager)
+            self._sync_manager = _construct_traced(SyncManager, self._event_manager, self._config_manager)
+            self._user_manager = _construct_traced(UserManager, self._secrets_manager)
+            self._project_manager = _construct_traced(
+                ProjectManager, self._event_manager, self._config_manager, self._secrets_manager
+            )
+            self._artifact_manager = _construct_traced(ArtifactManager, self._event_manager)
 
             # Assign handlers now that these are created.
             self._event_manager.assign_manager_to_request_type(
@@ -416,6 +434,10 @@ class GriptapeNodes(metaclass=SingletonMeta):
             context_manager.pop_flow()
         context_manager.pop_workflow()
 
+        # Parameter values stored for this workflow's events are only referenced by those events
+        if not context_manager.has_current_workflow():
+            GriptapeNodes.StaticFilesManager().clear_parameter_values()
+
     def handle_engine_version_request(self, request: GetEngineVersionRequest) -> ResultPayload:  # noqa: ARG002
         try:
             engine_ver = semver.VersionInfo.parse(engine_version)
@@ -1,5 +1,6 @@
 """Manager for artifact operations."""
 
+import asyncio
 import json
 import logging
 from copy import deepcopy
@@ -9,7 +10,7 @@ from typing import Any, ClassVar, NamedTuple
 import semver
 from pydantic import BaseModel, ValidationError
 
-from griptape_nodes.common.macro_parser import MacroVariables, ParsedMacro
+from griptape_nodes.common.macro_parser import MacroSyntaxError, MacroVariables, ParsedMacro
 from griptape_nodes.files.path_utils import decompose_source_path
 from griptape_nodes.retained_mode.events.app_events import AppInitializationComplete
 from griptape_nodes.retained_mode.events.artifact_events import (
@@ -19,6 +20,10 @@ from griptape_nodes.retained_mode.events.artifact_events import (
     GeneratePreviewRequest,
     GeneratePreviewResultFailure,
     GeneratePreviewResultSuccess,
+    GeneratePreviewsProgressEvent,
+    GeneratePreviewsRequest,
+    GeneratePreviewsResultFailure,
+    GeneratePreviewsResultSuccess,
     GetArtifactProviderDetailsRequest,
     GetArtifactProviderDetailsResultFailure,
     GetArtifactProviderDetailsResultSuccess,
@@ -45,6 +50,7 @@ from griptape_nodes.retained_mode.events.artifact_events import (
     RegisterPreviewGeneratorResultFailure,
     RegisterPreviewGeneratorResultSuccess,
 )
+from griptape_nodes.retained_mode.events.base_events import ExecutionEvent, ExecutionGriptapeNodeEvent
 from griptape_nodes.retained_mode.events.config_events import (
     GetConfigCategoryRequest,
     GetConfigCategoryResultSuccess,
@@ -71,6 +77,7 @@ from griptape_nodes.retained_mode.events.project_events import (
     GetPathForMacroResultSuccess,
     GetSituationRequest,
     GetSituationResultSuccess,
+    MacroPath,
 )
 from griptape_nodes.retained_mode.file_metadata.sidecar_metadata import (
     SidecarContent,
@@ -97,11 +104,17 @@ from griptape_nodes.retained_mode.managers.artifact_providers.artifact_schema_mo
     PreviewGeneratorSchema,
     ProviderSchema,
 )
+from griptape_nodes.retained_mode.managers.artifact_providers.preview_metadata_cache import (
+    CachedPreviewMetadata,
+    PreviewMetadataCache,
+    PreviewMetadataCacheStats,
+)
 from griptape_nodes.retained_mode.managers.artifact_providers.utils import (
     normalize_friendly_name_to_key,
 )
 from griptape_nodes.retained_mode.managers.event_manager import EventManager
 from griptape_nodes.utils.async_utils import to_thread
+from griptape_nodes.utils.preview_process_pool import get_max_preview_processes
 
 logger = logging.getLogger("griptape_nodes")
 
@@ -174,6 +187,11 @@ class ArtifactManager:
         """
         # Provider registry for managing artifact providers
         self._registry = ProviderRegistry()
+        # Preview generations in progress, keyed by source and settings, so concurrent
+        # requests for the same preview share one job
+        self._previews_in_flight: dict[tuple[str, ...], asyncio.Task[str | dict[str, str]]] = {}
+        # Validated preview metadata, so repeat lookups skip reading the metadata JSON
+        self._preview_metadata_cache = PreviewMetadataCache()
 
         if event_manager is not None:
             event_manager.assign_manager_to_request_type(
@@ -185,6 +203,9 @@ class ArtifactManager:
             event_manager.assign_manager_to_request_type(
                 GetPreviewForArtifactRequest, self.on_handle_get_preview_for_artifact_request
             )
+            event_manager.assign_manager_to_request_type(
+                GeneratePreviewsRequest, self.on_handle_generate_previews_request
+            )
             event_manager.assign_manager_to_request_type(
                 RegisterArtifactProviderRequest, self.on_handle_register_artifact_provider_request
             )
@@ -387,7 +408,8 @@ class ArtifactManager:
 
         # FAILURE CASE: Call provider and get returned filenames
         try:
-            preview_file_names = await provider_instance.attempt_generate_preview(
+            preview_file_names = await self._attempt_generate_preview_once(
+                provider_instance,
                 preview_generator_friendly_name=generator_name,
                 source_file_location=source_path,
                 preview_format=preview_format,
@@ -587,6 +609,18 @@ class ArtifactManager:
                 f"Failed due to: provider '{request.artifact_provider_name}' does not generate previews"
             )
 
+        source_size = file_info_result.file_entry.size
+        source_mtime = file_info_result.file_entry.modified_time
+
+        # EARLY CASE: Metadata already validated for this exact source file state. The generation
+        # is taken first so metadata read below is not cached if a write invalidates it meanwhile.
+        cache_generation = self._preview_metadata_cache.generation
+        cached = self._preview_metadata_cache.get(source_path, source_mtime, source_size)
+        if cached is not None and self._is_cached_preview_usable(
+            cached.metadata, provider_class, request.artifact_provider_name, request.preview_generation_policy
+        ):
+            return self._build_preview_result(source_path, cached.destination_dir, cached.metadata)
+
         # FAILURE CASE: Calculate metadata path using same logic as preview path (metadata uses .json extension)
         try:
             resolved_path = self._resolve_preview_path(source_path, "json")
@@ -709,12 +743,18 @@ class ArtifactManager:
                     break
 
         # Check source staleness
-        source_size = file_info_result.file_entry.size
-        source_mtime = file_info_result.file_entry.modified_time
         source_is_stale = self._is_preview_source_stale(metadata, source_size, source_mtime)
 
         # Determine if there's any validity issue
         has_validity_issue = metadata_version_outdated or preview_files_missing or source_is_stale
+        if not has_validity_issue:
+            self._preview_metadata_cache.put(
+                source_path,
+                source_mtime,
+                source_size,
+                CachedPreviewMetadata(metadata=metadata, destination_dir=destination_dir, metadata_path=metadata_path),
+                generation=cache_generation,
+            )
 
         # Match on policy to determine if regeneration is needed
         should_regenerate_preview = False
@@ -791,7 +831,43 @@ class ArtifactManager:
                 result_details=f"Attempted to regenerate preview for '{source_path}'. Failed due to: {generate_result.result_details}"
             )
 
-        # Construct preview path(s) from metadata
+        # SUCCESS PATH: Return path(s) to preview
+        return self._build_preview_result(source_path, destination_dir, metadata)
+
+    @property
+    def preview_metadata_cache_stats(self) -> PreviewMetadataCacheStats:
+        """Hit, miss, and invalidation counts of the preview metadata cache."""
+        return self._preview_metadata_cache.stats()
+
+    def _is_cached_preview_usable(
+        self,
+        metadata: PreviewMetadata,
+        provider_class: type[BaseArtifactProvider],
+        artifact_provider_name: str,
+        policy: PreviewGenerationPolicy,
+    ) -> bool:
+        """Whether a cached, already validated preview satisfies the policy without reading from disk.
+
+        Returns False whenever the full check might regenerate or fail, so that path still decides.
+        """
+        match policy:
+            case PreviewGenerationPolicy.DO_NOT_GENERATE | PreviewGenerationPolicy.ONLY_IF_STALE:
+                return True
+            case PreviewGenerationPolicy.IF_DOES_NOT_MATCH_USER_PREVIEW_SETTINGS:
+                try:
+                    preview_settings = self._get_preview_settings_from_config(provider_class, artifact_provider_name)
+                except RuntimeError:
+                    return False
+                return self._does_preview_match_current_settings(
+                    metadata, preview_settings.generator_name, preview_settings.generator_params
+                )
+            case _:
+                return False
+
+    def _build_preview_result(
+        self, source_path: str, destination_dir: Path, metadata: PreviewMetadata
+    ) -> GetPreviewForArtifactResultSuccess:
+        """Construct the success result with the preview path(s) recorded in metadata."""
         if isinstance(metadata.preview_file_names, str):
             paths_to_preview = str(destination_dir / metadata.preview_file_names)
         else:
@@ -800,13 +876,24 @@ class ArtifactManager:
                 preview_file_paths[key] = str(destination_dir / filename)
             paths_to_preview = preview_file_paths
 
-        # SUCCESS PATH: Return path(s) to preview
         return GetPreviewForArtifactResultSuccess(
             result_details=f"Preview retrieved for '{source_path}'",
             paths_to_preview=paths_to_preview,
             artifact_metadata=metadata.artifact_metadata,
         )
 
+    def invalidate_preview_metadata(self, path: Path) -> None:
+        """Drop cached preview metadata for path, or for everything beneath it when it is a directory.
+
+        Call after the file changes on disk, not before: a preview request that read the old
+        metadata in between would otherwise cache it again.
+        """
+        self._preview_metadata_cache.invalidate_path(str(path))
+
+    def clear_preview_metadata(self) -> None:
+        """Drop all cached preview metadata, after a project switch may have moved every preview directory."""
+        self._preview_metadata_cache.clear()
+
     def on_handle_list_artifact_providers_request(
         self, _request: ListArtifactProvidersRequest
     ) -> ListArtifactProvidersResultSuccess | ListArtifactProvidersResultFailure:
@@ -1445,6 +1532,177 @@ class ArtifactManager:
         # Compare the normalized Pydantic models
         return metadata_params_model == current_generator_params
 
+    async def _attempt_generate_preview_once(  # noqa: PLR0913
+        self,
+        provider_instance: BaseArtifactProvider,
+        *,
+        preview_generator_friendly_name: str,
+        source_file_location: str,
+        preview_format: str,
+        destination_preview_directory: str,
+        destination_preview_file_name: str,
+        params: dict[str, Any],
+    ) -> str | dict[str, str]:
+        """Run provider_instance.attempt_generate_preview, sharing the job with identical concurrent calls.
+
+        A gallery can request the same preview several times before the first render finishes.
+        Calls with the same source, generator, format, destination and parameters await a single
+        generation instead of each rendering and writing the preview again.
+        """
+        key = (
+            type(provider_instance).__name__,
+            preview_generator_friendly_name,
+            source_file_location,
+            preview_format,
+            destination_preview_directory,
+            destination_preview_file_name,
+            json.dumps(params, sort_keys=True, default=str),
+        )
+        task = self._previews_in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                provider_instance.attempt_generate_preview(
+                    preview_generator_friendly_name=preview_generator_friendly_name,
+                    source_file_location=source_file_location,
+                    preview_format=preview_format,
+                    destination_preview_directory=destination_preview_directory,
+                    destination_preview_file_name=destination_preview_file_name,
+                    params=params,
+                )
+            )
+            self._previews_in_flight[key] = task
+
+            def _forget(done: asyncio.Task[str | dict[str, str]]) -> None:
+                if self._previews_in_flight.get(key) is done:
+                    del self._previews_in_flight[key]
+
+            task.add_done_callback(_forget)
+        # Shielded so one caller being cancelled does not cancel the job for the others.
+        return await asyncio.shield(task)
+
+    async def on_handle_generate_previews_request(
+        self, request: GeneratePreviewsRequest
+    ) -> GeneratePreviewsResultSuccess | GeneratePreviewsResultFailure:
+        """Handle a batch preview request for a directory of artifacts.
+
+        Args:
+            request: Contains directory, recursive, and preview_generation_policy
+
+        Returns:
+            Success with per-file preview paths and failures, or failure if the directory cannot be listed
+        """
+        directory = Path(request.directory)
+
+        # FAILURE CASE: Directory must exist
+        if not await to_thread(directory.is_dir):
+            return GeneratePreviewsResultFailure(
+                result_details=f"Attempted to generate previews for '{directory}'. Failed due to: not a directory"
+            )
+
+        try:
+            source_files = await to_thread(self._list_previewable_files, directory, recursive=request.recursive)
+        except OSError as e:
+            return GeneratePreviewsResultFailure(
+                result_details=f"Attempted to generate previews for '{directory}'. Failed due to: {e}"
+            )
+
+        paths_to_preview: dict[str, str | dict[str, str]] = {}
+        failures: dict[str, str] = {}
+        # Keep a few more files in flight than there are preview processes, so reading and writing
+        # files overlaps with rendering without queueing every file of a large directory at once.
+        limiter = asyncio.Semaphore(2 * get_max_preview_processes())
+
+        async def _preview(source_file: Path, provider_name: str) -> None:
+            try:
+                # A file name containing macro syntax such as "{" cannot be parsed as a macro path
+                parsed_macro = ParsedMacro(str(source_file))
+            except MacroSyntaxError as e:
+                result: GetPreviewForArtifactResultSuccess | GetPreviewForArtifactResultFailure = (
+                    GetPreviewForArtifactResultFailure(
+                        result_details=f"Attempted to generate a preview for '{source_file}'. Failed due to: {e}"
+                    )
+                )
+            else:
+                async with limiter:
+                    result = await self.on_handle_get_preview_for_artifact_request(
+                        GetPreviewForArtifactRequest(
+                            macro_path=MacroPath(parsed_macro, {}),
+                            artifact_provider_name=provider_name,
+                            preview_generation_policy=request.preview_generation_policy,
+                        )
+                    )
+            if isinstance(result, GetPreviewForArtifactResultSuccess):
+                paths_to_preview[str(source_file)] = result.paths_to_preview
+            else:
+                failures[str(source_file)] = str(result.result_details)
+            GriptapeNodes.EventManager().put_event(
+                ExecutionGriptapeNodeEvent(
+                    wrapped_event=ExecutionEvent(
+                        payload=GeneratePreviewsProgressEvent(
+                            directory=str(directory),
+                            source_path=str(source_file),
+                            succeeded=isinstance(result, GetPreviewForArtifactResultSuccess),
+                            completed=len(paths_to_preview) + len(failures),
+                            total=len(source_files),
+                        )
+                    )
+                )
+            )
+
+        await asyncio.gather(*(_preview(source_file, provider) for source_file, provider in source_files))
+
+        cache_stats = self._preview_metadata_cache.stats()
+        logger.debug(
+            "Preview metadata cache after batch for '%s': %d hits, %d misses (%.0f%% hit rate), %d entries",
+            directory,
+            cache_stats.hits,
+            cache_stats.misses,
+            cache_stats.hit_rate * 100,
+            cache_stats.entries,
+        )
+
+        return GeneratePreviewsResultSuccess(
+            result_details=f"Processed previews for {len(source_files)} file(s) in '{directory}': "
+            f"{len(paths_to_preview)} succeeded, {len(failures)} failed",
+            paths_to_preview=paths_to_preview,
+            failures=failures,
+        )
+
+    def _list_previewable_files(self, directory: Path, *, recursive: bool) -> list[tuple[Path, str]]:
+        """List the files in directory that a preview-generating provider supports, with that provider's name.
+
+        Files inside the preview output directory of another listed file are skipped, so previews
+        are not generated for previews (unless previews are saved next to their sources).
+        """
+        candidates = directory.rglob("*") if recursive else directory.iterdir()
+        source_files: list[tuple[Path, str]] = []
+        for path in sorted(candidates):
+            extension = path.suffix[1:].lower()
+            if not extension or not path.is_file():
+                continue
+            provider_classes = [
+                provider_class
+                for provider_class in self._registry.get_provider_classes_by_format(extension)
+                if provider_class.get_preview_formats()
+            ]
+            if provider_classes:
+                source_files.append((path, provider_classes[0].get_friendly_name()))
+
+        preview_dirs: set[Path] = set()
+        for path, _ in source_files:
+            try:
+                preview_dir = Path(self._resolve_preview_path(str(path), "json").destination_dir).resolve()
+            except Exception:  # noqa: S112 - a file without a preview location just isn't filtered against
+                continue
+            # Previews saved next to their sources can't be told apart by location.
+            if preview_dir != path.parent.resolve():
+                preview_dirs.add(preview_dir)
+        return [
+            (path, provider)
+            for path, provider in source_files
+            if not any(path.resolve().is_relative_to(preview_dir) for preview_dir in preview_dirs)
+        ]
+
     def _resolve_preview_path(
         self,
         source_path: str,
@@ -0,0 +1,192 @@
+"""In-memory LRU of validated preview metadata for ArtifactManager.
+
+Entries are keyed by source path, modification time, and size, so a source file that changes
+on disk simply stops matching its entry. Changes to the metadata JSON or preview files made
+through the engine's own file requests are dropped with invalidate_path().
+
+A reader takes the cache's generation before it reads metadata from disk and passes it to
+put(). Every invalidation advances the generation, so metadata read before a concurrent write
+is dropped instead of being cached after that write's invalidation has already run.
+"""
+
+from __future__ import annotations
+
+import bisect
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from griptape_nodes.retained_mode.managers.artifact_manager import PreviewMetadata
+
+DEFAULT_MAX_PREVIEW_METADATA_ENTRIES = 4096
+
+
+@dataclass(frozen=True)
+class PreviewMetadataCacheStats:
+    """Counters for a PreviewMetadataCache since it was created or last reset."""
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+    entries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(frozen=True)
+class CachedPreviewMetadata:
+    """Preview metadata that was read from disk and found valid, with the paths it was read from.
+
+    Attributes:
+        metadata: The parsed metadata
+        destination_dir: Directory holding the metadata JSON and preview file(s)
+        metadata_path: Path of the metadata JSON
+    """
+
+    metadata: PreviewMetadata
+    destination_dir: Path
+    metadata_path: str
+
+    def dependent_paths(self, source_path: str) -> list[str]:
+        """Return the normalized paths whose modification invalidates this entry."""
+        preview_file_names = self.metadata.preview_file_names
+        if isinstance(preview_file_names, str):
+            preview_file_names = {"": preview_file_names}
+        paths = [source_path, self.metadata_path]
+        paths.extend(str(self.destination_dir / file_name) for file_name in preview_file_names.values())
+        return [os.path.normpath(path) for path in paths]
+
+
+class PreviewMetadataCache:
+    """Thread-safe LRU mapping (source path, mtime, size) to CachedPreviewMetadata."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_PREVIEW_METADATA_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, float, int], tuple[CachedPreviewMetadata, list[str]]] = OrderedDict()
+        # Entry keys by dependent path, and those paths in sorted order so a directory's
+        # descendants are one contiguous range
+        self._keys_by_path: dict[str, set[tuple[str, float, int]]] = {}
+        self._sorted_paths: list[str] = []
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._stats = PreviewMetadataCacheStats()
+
+    @property
+    def generation(self) -> int:
+        """The number of invalidations so far; pass it to put() for metadata read after this point."""
+        with self._lock:
+            return self._generation
+
+    def get(self, source_path: str, modified_time: float, size: int) -> CachedPreviewMetadata | None:
+        """Return the entry for this exact source state, or None, counting the hit or miss."""
+        key = (os.path.normpath(source_path), modified_time, size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats = self._replace_stats(misses=self._stats.misses + 1)
+                return None
+            self._entries.move_to_end(key)
+            self._stats = self._replace_stats(hits=self._stats.hits + 1)
+            return entry[0]
+
+    def put(
+        self, source_path: str, modified_time: float, size: int, cached: CachedPreviewMetadata, *, generation: int
+    ) -> bool:
+        """Store an entry, evicting the least recently used ones beyond max_entries.
+
+        Args:
+            source_path: Path of the source file
+            modified_time: The source's modification time when the metadata was validated
+            size: The source's size when the metadata was validated
+            cached: The validated metadata
+            generation: The generation taken before the metadata was read from disk
+
+        Returns:
+            False if an invalidation happened since generation, so the entry was not stored
+        """
+        normalized_source = os.path.normpath(source_path)
+        key = (normalized_source, modified_time, size)
+        with self._lock:
+            if generation != self._generation:
+                return False
+            if key in self._entries:
+                self._drop(key)
+            dependent_paths = cached.dependent_paths(normalized_source)
+            self._entries[key] = (cached, dependent_paths)
+            for dependent in dependent_paths:
+                keys = self._keys_by_path.get(dependent)
+                if keys is None:
+                    keys = self._keys_by_path[dependent] = set()
+                    bisect.insort(self._sorted_paths, dependent)
+                keys.add(key)
+            evicted = 0
+            while len(self._entries) > self._max_entries:
+                self._drop(next(iter(self._entries)))
+                evicted += 1
+            self._stats = self._replace_stats(evictions=self._stats.evictions + evicted)
+            return True
+
+    def invalidate_path(self, path: str) -> int:
+        """Drop entries that depend on path, or on anything beneath it when path is a directory.
+
+        Returns:
+            The number of entries dropped
+        """
+        normalized = os.path.normpath(path)
+        prefix = normalized.rstrip(os.sep) + os.sep
+        with self._lock:
+            self._generation += 1
+            stale_keys = set(self._keys_by_path.get(normalized, ()))
+            start = bisect.bisect_left(self._sorted_paths, prefix)
+            for dependent in self._sorted_paths[start:]:
+                if not dependent.startswith(prefix):
+                    break
+                stale_keys.update(self._keys_by_path[dependent])
+            for key in stale_keys:
+                self._drop(key)
+            if stale_keys:
+                self._stats = self._replace_stats(invalidations=self._stats.invalidations + len(stale_keys))
+            return len(stale_keys)
+
+    def clear(self) -> None:
+        """Drop every entry, counting them as invalidations."""
+        with self._lock:
+            self._generation += 1
+            dropped = len(self._entries)
+            self._entries.clear()
+            self._keys_by_path.clear()
+            self._sorted_paths.clear()
+            self._stats = self._replace_stats(invalidations=self._stats.invalidations + dropped)
+
+    def stats(self) -> PreviewMetadataCacheStats:
+        with self._lock:
+            return self._replace_stats()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats = PreviewMetadataCacheStats()
+
+    def _drop(self, key: tuple[str, float, int]) -> None:
+        # Callers hold self._lock
+        _, dependent_paths = self._entries.pop(key)
+        for dependent in dependent_paths:
+            keys = self._keys_by_path.get(dependent)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_path[dependent]
+                del self._sorted_paths[bisect.bisect_left(self._sorted_paths, dependent)]
+
+    def _replace_stats(self, **changes: int) -> PreviewMetadataCacheStats:
+        # Callers hold self._lock
+        return replace(self._stats, entries=len(self._entries), **changes)
@@ -4,18 +4,18 @@ import asyncio
 import inspect
 import logging
 import threading
+import weakref
 from collections import defaultdict
 from contextlib import contextmanager
 from contextvars import ContextVar
 from dataclasses import fields
 from typing import TYPE_CHECKING, Any, cast
 
-from asyncio_thread_runner import ThreadRunner
 from typing_extensions import TypedDict, TypeVar
 
 from griptape_nodes.common.strict_mode import STRICT_MODE
 from griptape_nodes.common.strict_mode_checks import RULES
-from griptape_nodes.exe_types.node_types import BaseNode
+from griptape_nodes.exe_types.node_types import retrack_node_parameters, take_nodes_with_tracked_parameters
 from griptape_nodes.node_library.library_registry import LibraryRegistry
 from griptape_nodes.retained_mode.events.base_events import (
     AppPayload,
@@ -33,12 +33,14 @@ from griptape_nodes.retained_mode.events.event_converter import converter
 from griptape_nodes.retained_mode.events.generic_events import GenericResultFailure
 from griptape_nodes.retained_mode.events.payload_registry import PayloadRegistry
 from griptape_nodes.utils.async_utils import call_function
+from griptape_nodes.utils.sync_bridge import SyncBridge
 
 if TYPE_CHECKING:
     import types
     from collections.abc import Awaitable, Callable, Iterator
 
     from griptape_nodes.api_client.request_client import RequestClient
+    from griptape_nodes.utils.sync_bridge import SyncBridgeStats
 
 
 RP = TypeVar("RP", bound=RequestPayload, default=RequestPayload)
@@ -123,6 +125,10 @@ class EventManager:
         # chain is skipped so the hook can't keep re-triggering itself into
         # unbounded recursion.
         self._hook_evaluation = threading.local()
+        # Long-lived side loops that sync handle_request / broadcast_app_event use to
+        # drive async handlers, instead of a fresh event loop (and thread) per call.
+        self._sync_bridge = SyncBridge()
+        weakref.finalize(self, self._sync_bridge.close)
 
     @property
     def event_queue(self) -> asyncio.Queue:
@@ -140,6 +146,10 @@ class EventManager:
         """
         return self._event_loop
 
+    def sync_bridge_stats(self) -> SyncBridgeStats:
+        """Latency metrics for async handlers and listeners driven from sync handle_request / broadcast_app_event."""
+        return self._sync_bridge.stats()
+
     def should_suppress_event(self, event: BaseEvent | ProgressEvent) -> bool:
         """Check if events should be suppressed from being sent to websockets.
 
@@ -637,7 +647,7 @@ class EventManager:
         finally:
             _active_request_type.reset(token)
 
-    def handle_request(  # noqa: PLR0912
+    def handle_request(
         self,
         request: RP,
         *,
@@ -701,20 +711,16 @@ class EventManager:
                     result_payload: ResultPayload = future.result()
                 else:
                     result_payload: ResultPayload = asyncio.run(callback(request))
-            # Support async callbacks invoked from sync code. If no loop is running
-            # (bootstrap, worker threads) asyncio.run drives the coroutine directly.
-            # If a loop IS running (pre-#4449 workflow files exec'd from inside the
-            # engine loop), dispatch onto a side loop via ThreadRunner. The #4469
-            # deadlock shape is specific to callbacks whose coroutines share
-            # primitives with the caller's loop; RemoteHandler is the only such case
-            # and is handled above via run_coroutine_threadsafe onto the WS loop.
-            # For all other async handlers the side-loop path is safe.
+            # Support async callbacks invoked from sync code, whether or not a loop is
+            # running (bootstrap and worker threads have none; pre-#4449 workflow files
+            # exec'd from inside the engine loop do), by dispatching onto one of the
+            # sync bridge's long-lived side loops. The #4469 deadlock shape is specific
+            # to callbacks whose coroutines share primitives with the caller's loop;
+            # RemoteHandler is the only such case and is handled above via
+            # run_coroutine_threadsafe onto the WS loop. For all other async handlers
+            # the side-loop path is safe.
             elif inspect.iscoroutinefunction(callback):
-                if _running_loop() is not None:
-                    with ThreadRunner() as runner:
-                        result_payload: ResultPayload = runner.run(callback(request))
-                else:
-                    result_payload = asyncio.run(callback(request))
+                result_payload: ResultPayload = self._sync_bridge.run(callback(request))
             else:
                 result_payload = callback(request)
 
@@ -758,7 +764,7 @@ class EventManager:
             listener_set = self._app_event_listeners[app_event_type]
 
             # Support async callbacks for sync method. See the matching comment
-            # in handle_request for the ThreadRunner rationale: listeners here
+            # in handle_request for the side-loop rationale: listeners here
             # are user-supplied callbacks that do not share primitives with the
             # caller's loop, so the side-loop path is safe.
             async def _broadcast_async() -> None:
@@ -766,11 +772,7 @@ class EventManager:
                     for listener_callback in listener_set:
                         tg.create_task(call_function(listener_callback, app_event))
 
-            if _running_loop() is not None:
-                with ThreadRunner() as runner:
-                    runner.run(_broadcast_async())
-            else:
-                asyncio.run(_broadcast_async())
+            self._sync_bridge.run(_broadcast_async())
 
     async def abroadcast_app_event(self, app_event: AP) -> None:
         """Broadcast an app event to all registered listeners (async version).
@@ -790,12 +792,15 @@ class EventManager:
         from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 
         obj_manager = GriptapeNodes.ObjectManager()
-        # Get all flows and their nodes
-        nodes = obj_manager.get_filtered_subset(type=BaseNode)
-        for node in nodes.values():
-            # Only flush if there are actually tracked parameters
-            if node._tracked_parameters:
+        # Only nodes that tracked a change since the last flush can have anything to send.
+        for node in take_nodes_with_tracked_parameters():
+            if not node._tracked_parameters:
+                continue
+            if obj_manager.attempt_get_object_by_name(node.name) is node:
                 node.emit_parameter_changes()
+            else:
+                # Not registered (yet); keep its changes for a flush after it is.
+                retrack_node_parameters(node)
 
 
 class EventSuppressionContext:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import hashlib
 import importlib.util
 import json
@@ -11,6 +12,8 @@ import shutil
 import subprocess
 import sys
 import sysconfig
+import threading
+import time
 from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import StrEnum
@@ -30,6 +33,7 @@ from rich.text import Text
 from semver import Version
 from xdg_base_dirs import xdg_data_home
 
+from griptape_nodes.common.startup_tracer import startup_span_sequence, traced_startup_phase
 from griptape_nodes.common.strict_mode import (
     STRICT_MODE,
     StrictModeScopeKind,
@@ -204,8 +208,12 @@ from griptape_nodes.retained_mode.managers.fitness_problems.libraries import (
 )
 from griptape_nodes.retained_mode.managers.os_manager import OSManager
 from griptape_nodes.retained_mode.managers.settings import (
+    FORCE_LIBRARY_DEPENDENCY_REINSTALL_KEY,
+    LAZY_NODE_IMPORT_KEY,
+    LAZY_NODE_IMPORT_WARMUP_KEY,
     LIBRARIES_TO_DOWNLOAD_KEY,
     LIBRARIES_TO_REGISTER_KEY,
+    MAX_CONCURRENT_LIBRARY_INSTALLS_KEY,
     WORKER_HEARTBEAT_STARTUP_GRACE_KEY,
     LibraryRegistration,
 )
@@ -238,13 +246,23 @@ from griptape_nodes.utils.library_utils import (
     is_monorepo,
     normalize_library_registrations,
 )
-from griptape_nodes.utils.uv_utils import find_uv_bin, is_venv_functional, venv_python_path
+from griptape_nodes.utils.uv_utils import (
+    DependencyFingerprint,
+    clear_dependency_fingerprint,
+    compute_dependency_fingerprint,
+    find_uv_bin,
+    is_venv_functional,
+    read_dependency_fingerprint,
+    venv_python_path,
+    write_dependency_fingerprint,
+)
 from griptape_nodes.utils.version_utils import get_complete_version_string
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
     from types import ModuleType
 
+    from griptape_nodes.common.startup_tracer import SpanSequence
     from griptape_nodes.node_library.advanced_node_library import AdvancedNodeLibrary
     from griptape_nodes.retained_mode.events.base_events import Payload, RequestPayload, ResultPayload
     from griptape_nodes.retained_mode.managers.event_manager import EventManager
@@ -285,6 +303,16 @@ class LibraryUpdateResult(NamedTuple):
     result: ResultPayload
 
 
+class LibraryPreparation(NamedTuple):
+    """Outcome of the steps of loading a library that run before its nodes are imported."""
+
+    failure: RegisterLibraryFromFileResultFailure | None
+    phase_durations_s: dict[str, float]
+
+
+DEFAULT_MAX_CONCURRENT_LIBRARY_INSTALLS = 4
+
+
 class LibraryManager:
     SANDBOX_LIBRARY_NAME = "Sandbox Library"
     LIBRARY_CONFIG_FILENAME = "griptape_nodes_library.json"
@@ -438,6 +466,14 @@ class LibraryManager:
         self._is_worker: bool = False
         # The libraries this process is restricted to loading (set on workers).
         self._target_library_names: list[str] | None = None
+        # Dependency installs skipped because the venv fingerprint matched, since the last
+        # load_all_libraries_from_config, and the install time that saved.
+        self._dependency_installs_skipped = 0
+        self._dependency_install_seconds_saved = 0.0
+        # One lock per node module file imported by lazy_node_import. Loading a file replaces
+        # its module in sys.modules, so two node types from one file must not load it at once.
+        self._lazy_module_locks: dict[Path, threading.Lock] = {}
+        self._lazy_module_locks_guard = threading.Lock()
 
         event_manager.assign_manager_to_request_type(
             ListRegisteredLibrariesRequest, self.on_list_registered_libraries_request
@@ -1594,7 +1630,12 @@ class LibraryManager:
         # In that case we still return a success payload with the library-level metadata and a
         # WARNING entry in result_details, so callers can present the node at all instead of
         # getting an opaque failure for every such node type.
-        node_class = library.get_node_class(request.node_type)
+        # With lazy_node_import this is where the node's module is first imported
+        try:
+            node_class = library.get_node_class(request.node_type)
+        except Exception as err:
+            details = f"Attempted to describe node type '{request.node_type}' in Library '{library_name}'. Failed when importing its class because: {err}"
+            return DescribeNodeTypeResultFailure(result_details=details)
         probe_name = f"__describe_node_type_probe__{request.node_type}"
         try:
             # Wrap in ``LibraryRegistry.constructing_node()`` so the
@@ -1840,11 +1881,12 @@ class LibraryManager:
         # Prerequisites established - ready for lifecycle progression
         return LibraryManager.RegisterLibraryPrerequisites(library_info=library_info, file_path=file_path)
 
-    async def _progress_library_through_lifecycle(  # noqa: C901, PLR0911, PLR0912, PLR0915 (lifecycle state machine needs branches/statements/returns)
+    async def _progress_library_through_lifecycle(
         self,
         library_info: LibraryManager.LibraryInfo,
         file_path: str,
         request: RegisterLibraryFromFileRequest,
+        stop_at: frozenset[LibraryManager.LibraryLifecycleState] | None = None,
     ) -> None | RegisterLibraryFromFileResultFailure:
         """Progress library through lifecycle states until LOADED.
 
@@ -1854,12 +1896,37 @@ class LibraryManager:
 
         Modifies library_info in place as it progresses through states.
 
+        Args:
+            library_info: The library to progress
+            file_path: Path to the library JSON file
+            request: The originating registration request
+            stop_at: States at which to pause instead of progressing further. A later call
+                without stop_at resumes from there.
+
         Returns:
-            None: Successfully progressed to LOADED state
+            None: Successfully progressed to LOADED state (or to a state in stop_at)
             RegisterLibraryFromFileResultFailure: Failed during progression
         """
+        # Each state's handling is recorded as a startup span when startup tracing is on
+        with startup_span_sequence(
+            "library_lifecycle", library=library_info.library_name or library_info.library_path
+        ) as state_spans:
+            return await self._advance_library_lifecycle(library_info, file_path, request, stop_at, state_spans)
+
+    async def _advance_library_lifecycle(  # noqa: C901, PLR0911, PLR0912, PLR0915 (lifecycle state machine needs branches/statements/returns)
+        self,
+        library_info: LibraryManager.LibraryInfo,
+        file_path: str,
+        request: RegisterLibraryFromFileRequest,
+        stop_at: frozenset[LibraryManager.LibraryLifecycleState] | None,
+        state_spans: SpanSequence,
+    ) -> RegisterLibraryFromFileResultFailure | None:
+        """State machine behind _progress_library_through_lifecycle, entering a span per state handled."""
         while True:
             current_state = library_info.lifecycle_state
+            if stop_at is not None and current_state in stop_at:
+                return None
+            state_spans.enter(f"library lifecycle: {current_state}")
 
             match current_state:
                 case LibraryManager.LibraryLifecycleState.LOADED:
@@ -2237,6 +2304,7 @@ class LibraryManager:
             result_details=f"Successfully registered library from requirement specifier: {request.requirement_specifier}",
         )
 
+    @traced_startup_phase(category="dependencies")
     async def _init_library_venv(self, library_venv_path: Path) -> Path:
         """Initialize a virtual environment for the library.
 
@@ -2940,14 +3008,30 @@ class LibraryManager:
 
         return node_class
 
-    async def _load_and_track_library(self, lib_path: str, index: int, total: int) -> None:
-        """Load a single library and emit the corresponding progress event."""
-        load_result = await self.register_library_from_file_request(
-            RegisterLibraryFromFileRequest(
-                file_path=lib_path,
-                load_as_default_library=False,
+    async def _load_and_track_library(
+        self, lib_path: str, index: int, total: int, preparation: LibraryPreparation | None = None
+    ) -> None:
+        """Load a single library and emit the corresponding progress event.
+
+        Args:
+            lib_path: Path to the library JSON file
+            index: Position of the library in the load order, for progress
+            total: Number of libraries being loaded, for progress
+            preparation: Outcome of _prepare_library_for_registration, if it already ran. A failed
+                preparation is reported without attempting registration.
+        """
+        phase_durations_s = dict(preparation.phase_durations_s) if preparation is not None else {}
+        if preparation is not None and preparation.failure is not None:
+            load_result: ResultPayload = preparation.failure
+        else:
+            registration_start = time.perf_counter()
+            load_result = await self.register_library_from_file_request(
+                RegisterLibraryFromFileRequest(
+                    file_path=lib_path,
+                    load_as_default_library=False,
+                )
             )
-        )
+            phase_durations_s["registration"] = time.perf_counter() - registration_start
 
         if isinstance(load_result, RegisterLibraryFromFileResultFailure):
             logger.warning("Failed to load library at '%s': %s", lib_path, load_result.result_details)
@@ -2966,6 +3050,7 @@ class LibraryManager:
                         total=total,
                         error=error_message,
                         is_worker=self._is_worker,
+                        phase_durations_s=phase_durations_s,
                     )
                 )
             )
@@ -2979,15 +3064,67 @@ class LibraryManager:
                         current=index,
                         total=total,
                         is_worker=self._is_worker,
+                        phase_durations_s=phase_durations_s,
                     )
                 )
             )
 
+    async def _prepare_library_for_registration(self, lib_path: str) -> LibraryPreparation:
+        """Run the steps of loading a library that do not import its code.
+
+        Loads and evaluates the library's metadata, then creates its venv and installs its
+        dependencies, stopping before node modules are imported. Registration resumes from
+        there via register_library_from_file_request.
+        """
+        request = RegisterLibraryFromFileRequest(file_path=lib_path, load_as_default_library=False)
+        phase_durations_s: dict[str, float] = {}
+
+        metadata_start = time.perf_counter()
+        prereq_result = await self._establish_register_library_prerequisites(request)
+        if isinstance(prereq_result, RegisterLibraryFromFileResultFailure):
+            return LibraryPreparation(failure=prereq_result, phase_durations_s=phase_durations_s)
+        if isinstance(prereq_result, RegisterLibraryFromFileResultSuccess):
+            # Already loaded; registration reports it
+            return LibraryPreparation(failure=None, phase_durations_s=phase_durations_s)
+
+        library_info = prereq_result.library_info
+        failure = await self._progress_library_through_lifecycle(
+            library_info=library_info,
+            file_path=prereq_result.file_path,
+            request=request,
+            stop_at=frozenset({LibraryManager.LibraryLifecycleState.EVALUATED}),
+        )
+        phase_durations_s["metadata"] = time.perf_counter() - metadata_start
+        if failure is not None:
+            return LibraryPreparation(failure=failure, phase_durations_s=phase_durations_s)
+
+        dependencies_start = time.perf_counter()
+        failure = await self._progress_library_through_lifecycle(
+            library_info=library_info,
+            file_path=prereq_result.file_path,
+            request=request,
+            stop_at=frozenset(
+                {
+                    LibraryManager.LibraryLifecycleState.DEPENDENCIES_INSTALLED,
+                    LibraryManager.LibraryLifecycleState.WORKER_DELEGATED,
+                }
+            ),
+        )
+        phase_durations_s["dependencies"] = time.perf_counter() - dependencies_start
+        return LibraryPreparation(failure=failure, phase_durations_s=phase_durations_s)
+
+    @traced_startup_phase(category="libraries")
     async def load_all_libraries_from_config(self, target_library_names: list[str] | None = None) -> None:
         # Recreate the event bound to the current event loop. Calling .clear() on an event
         # created by a previous asyncio.run() call raises RuntimeError when awaited from
         # the new loop (asyncio.Event objects are bound to the loop they were created on).
         self._libraries_loading_complete = asyncio.Event()
+        self._dependency_installs_skipped = 0
+        self._dependency_install_seconds_saved = 0.0
+        # One lock per node module file imported by lazy_node_import. Loading a file replaces
+        # its module in sys.modules, so two node types from one file must not load it at once.
+        self._lazy_module_locks: dict[Path, threading.Lock] = {}
+        self._lazy_module_locks_guard = threading.Lock()
 
         # Discover all available libraries (config + sandbox)
         discover_result = self.discover_libraries_request(DiscoverLibrariesRequest())
@@ -3013,6 +3150,7 @@ class LibraryManager:
         # Calculate total libraries for progress tracking
         total_libraries = len(libraries_to_load)
 
+        selected_libraries: list[tuple[int, str]] = []
         for current_library_index, lib_path in enumerate(libraries_to_load, start=1):
             # When running as a dedicated library worker, skip libraries that don't match the target.
             # library_name is already populated in _library_file_path_to_info from the discovery phase.
@@ -3021,15 +3159,49 @@ class LibraryManager:
                 lib_info is None or lib_info.library_name not in target_library_names
             ):
                 continue
+            selected_libraries.append((current_library_index, lib_path))
+
+        # Venv creation and dependency installs run concurrently, bounded by
+        # max_concurrent_library_installs. Libraries sharing a directory share a venv, so they
+        # take turns. Imports and registration stay serial and in configured order, since
+        # libraries can depend on modules and settings registered by earlier ones.
+        install_limiter = asyncio.Semaphore(self._get_max_concurrent_library_installs())
+        venv_locks: defaultdict[Path, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+        async def prepare(lib_path: str) -> LibraryPreparation:
+            async with venv_locks[Path(lib_path).parent.absolute()], install_limiter:
+                return await self._prepare_library_for_registration(lib_path)
 
-            await self._load_and_track_library(lib_path, current_library_index, total_libraries)
+        async with asyncio.TaskGroup() as tg:
+            preparations = [tg.create_task(prepare(lib_path)) for _, lib_path in selected_libraries]
+            for (current_library_index, lib_path), preparation in zip(selected_libraries, preparations, strict=True):
+                await self._load_and_track_library(
+                    lib_path, current_library_index, total_libraries, preparation=await preparation
+                )
+
+        if self._dependency_installs_skipped:
+            logger.info(
+                "Skipped dependency installs for %d libraries with unchanged dependencies, saving ~%.1fs",
+                self._dependency_installs_skipped,
+                self._dependency_install_seconds_saved,
+            )
 
         # Remove any missing libraries AFTER we've loaded them for the user.
         user_libraries_section = LIBRARIES_TO_REGISTER_KEY
         self._remove_missing_libraries_from_config(config_category=user_libraries_section)
 
         self._libraries_loading_complete.set()
+        self._start_lazy_node_warmup()
 
+    @staticmethod
+    def _get_max_concurrent_library_installs() -> int:
+        """Return max_concurrent_library_installs, or min(4, cpu count) when unset."""
+        max_installs = GriptapeNodes.ConfigManager().get_config_value(MAX_CONCURRENT_LIBRARY_INSTALLS_KEY, default=None)
+        if max_installs is None:
+            return min(DEFAULT_MAX_CONCURRENT_LIBRARY_INSTALLS, os.cpu_count() or 1)
+        return max_installs
+
+    @traced_startup_phase(category="libraries")
     async def _ensure_libraries_from_config(self) -> None:
         """Ensure libraries from git URLs specified in config are downloaded.
 
@@ -3252,6 +3424,7 @@ class LibraryManager:
             return
         await self._start_workers()
 
+    @traced_startup_phase(category="workers")
     async def _maybe_start_workers_for_existing_session(self) -> None:
         """Start workers if the orchestrator restarted into an already-active session.
 
@@ -3267,6 +3440,7 @@ class LibraryManager:
             worker_manager.set_session_ready()
             await self._start_workers()
 
+    @traced_startup_phase(category="workers")
     async def _await_pending_workers(self, wait_seconds: float | None = None) -> None:
         """Wait for all WORKER_PENDING libraries to report back via LibraryLoadedNotification.
 
@@ -3504,6 +3678,7 @@ class LibraryManager:
 
         return advanced_library_instance
 
+    @traced_startup_phase(category="imports")
     def _attempt_load_nodes_from_library(  # noqa: PLR0912, PLR0915, C901
         self,
         library_data: LibrarySchema,
@@ -3554,44 +3729,50 @@ class LibraryManager:
                 )
                 logger.error(details)
 
+        # Workers always import eagerly: they serialize node schemas for the orchestrator
+        lazy_import = not self._is_worker and GriptapeNodes.ConfigManager().get_config_value(
+            LAZY_NODE_IMPORT_KEY, default=False, cast_type=bool
+        )
+
         # Process each node in the metadata
         for node_definition in library_data.nodes:
             # Resolve relative path to absolute path
             node_file_path = resolve_workspace_path(Path(node_definition.file_path), base_dir)
 
-            try:
-                # Dynamically load the module containing the node class
-                node_class = self._load_class_from_file(node_file_path, node_definition.class_name, library_data.name)
-            except ImportError as err:
-                root_cause = self._get_root_cause_from_exception(err)
-                library_info.problems.append(
-                    NodeModuleImportProblem(
-                        class_name=node_definition.class_name,
-                        file_path=str(node_file_path),
-                        error_message=str(err),
-                        root_cause=str(root_cause),
+            if lazy_import:
+                if not node_file_path.is_file():
+                    self._record_node_load_failure(
+                        ImportError(f"Node file '{node_file_path}' does not exist"),
+                        node_definition.class_name,
+                        node_file_path,
+                        library_info,
                     )
+                    continue  # SKIP IT
+
+                # Register from the JSON metadata; the module is imported on first use
+                library_problem = library.register_lazy_node_type(
+                    node_definition.class_name,
+                    metadata=node_definition.metadata,
+                    loader=functools.partial(
+                        self._import_lazy_node_class,
+                        node_file_path,
+                        node_definition.class_name,
+                        library_data.name,
+                        library_info,
+                    ),
                 )
-                details = f"Attempted to load node '{node_definition.class_name}' from '{node_file_path}'. Failed because module could not be imported: {err}"
-                logger.error(details)
-                continue  # SKIP IT
-            except AttributeError:
-                library_info.problems.append(
-                    NodeClassNotFoundProblem(class_name=node_definition.class_name, file_path=str(node_file_path))
-                )
-                details = f"Attempted to load node '{node_definition.class_name}' from '{node_file_path}'. Failed because class not found in module"
-                logger.error(details)
-                continue  # SKIP IT
-            except TypeError:
-                library_info.problems.append(
-                    NodeClassNotBaseNodeProblem(class_name=node_definition.class_name, file_path=str(node_file_path))
-                )
-                details = f"Attempted to load node '{node_definition.class_name}' from '{node_file_path}'. Failed because class doesn't inherit from BaseNode"
-                logger.error(details)
-                continue  # SKIP IT
+            else:
+                try:
+                    # Dynamically load the module containing the node class
+                    node_class = self._load_class_from_file(
+                        node_file_path, node_definition.class_name, library_data.name
+                    )
+                except (ImportError, AttributeError, TypeError) as err:
+                    self._record_node_load_failure(err, node_definition.class_name, node_file_path, library_info)
+                    continue  # SKIP IT
 
-            # Register the node type with the library
-            library_problem = library.register_new_node_type(node_class, metadata=node_definition.metadata)
+                # Register the node type with the library
+                library_problem = library.register_new_node_type(node_class, metadata=node_definition.metadata)
             if library_problem is not None:
                 library_info.problems.append(library_problem)
 
@@ -3631,6 +3812,97 @@ class LibraryManager:
         # Update lifecycle state to LOADED
         library_info.lifecycle_state = LibraryManager.LibraryLifecycleState.LOADED
 
+    def _record_node_load_failure(
+        self,
+        err: ImportError | AttributeError | TypeError,
+        class_name: str,
+        node_file_path: Path,
+        library_info: LibraryInfo,
+    ) -> None:
+        """Add the problem for a node class that failed to load to library_info and log it."""
+        problem: LibraryProblem
+        match err:
+            case ImportError():
+                root_cause = self._get_root_cause_from_exception(err)
+                problem = NodeModuleImportProblem(
+                    class_name=class_name,
+                    file_path=str(node_file_path),
+                    error_message=str(err),
+                    root_cause=str(root_cause),
+                )
+                reason = f"module could not be imported: {err}"
+            case AttributeError():
+                problem = NodeClassNotFoundProblem(class_name=class_name, file_path=str(node_file_path))
+                reason = "class not found in module"
+            case _:
+                problem = NodeClassNotBaseNodeProblem(class_name=class_name, file_path=str(node_file_path))
+                reason = "class doesn't inherit from BaseNode"
+        library_info.problems.append(problem)
+        details = f"Attempted to load node '{class_name}' from '{node_file_path}'. Failed because {reason}"
+        logger.error(details)
+
+    def _import_lazy_node_class(
+        self, node_file_path: Path, class_name: str, library_name: str, library_info: LibraryInfo
+    ) -> type[BaseNode]:
+        """Import a node class registered with lazy_node_import. Called by Library on first use.
+
+        A failure is recorded on library_info like a failure at registration would have been,
+        then re-raised so the request that needed the class fails.
+        """
+        with self._lazy_module_locks_guard:
+            module_lock = self._lazy_module_locks.setdefault(node_file_path, threading.Lock())
+        import_start = time.perf_counter()
+        try:
+            with module_lock:
+                node_class = self._load_class_from_file(node_file_path, class_name, library_name)
+        except (ImportError, AttributeError, TypeError) as err:
+            self._record_node_load_failure(err, class_name, node_file_path, library_info)
+            if library_info.fitness == LibraryManager.LibraryFitness.GOOD:
+                library_info.fitness = LibraryManager.LibraryFitness.FLAWED
+            raise
+        logger.debug(
+            "Imported deferred node '%s' from library '%s' in %.3fs",
+            class_name,
+            library_name,
+            time.perf_counter() - import_start,
+        )
+        return node_class
+
+    def _start_lazy_node_warmup(self) -> None:
+        """Import the node classes deferred by lazy_node_import in a background thread, if enabled."""
+        config_manager = GriptapeNodes.ConfigManager()
+        if self._is_worker or not config_manager.get_config_value(LAZY_NODE_IMPORT_KEY, default=False, cast_type=bool):
+            return
+        if not config_manager.get_config_value(LAZY_NODE_IMPORT_WARMUP_KEY, default=True, cast_type=bool):
+            return
+        threading.Thread(target=self._warm_up_lazy_nodes, name="lazy-node-warmup", daemon=True).start()
+
+    def _warm_up_lazy_nodes(self) -> None:
+        """Import every deferred node class, one at a time.
+
+        Requests that need a class before the warm-up reaches it import it themselves; the
+        Library locks each node type so each class is imported once, and a request only waits
+        on the warm-up when both need the same node type or module file.
+        """
+        warmup_start = time.perf_counter()
+        imported_count = 0
+        for library_name in LibraryRegistry.list_libraries():
+            try:
+                library = LibraryRegistry.get_library(library_name)
+            except KeyError:
+                continue  # Unloaded since we listed it
+            for node_type in library.get_lazy_node_types():
+                try:
+                    library.get_node_class(node_type)
+                except Exception:  # noqa: S112 (the failure is already recorded as a library problem)
+                    continue
+                imported_count += 1
+        logger.info(
+            "Imported %d deferred node classes in the background in %.1fs",
+            imported_count,
+            time.perf_counter() - warmup_start,
+        )
+
     # Per-node timeout for the schema probe. Node __init__ methods that make
     # synchronous handle_request calls can deadlock against async handlers that
     # await init-time events (e.g. WorkflowManager._workflows_loading_complete),
@@ -4220,6 +4492,7 @@ class LibraryManager:
             requires_worker=requires_worker,
         )
 
+    @traced_startup_phase(category="libraries")
     def discover_libraries_request(
         self,
         request: DiscoverLibrariesRequest,
@@ -5023,6 +5296,7 @@ class LibraryManager:
             result_details=details,
         )
 
+    @traced_startup_phase(category="dependencies")
     async def install_library_dependencies_request(self, request: InstallLibraryDependenciesRequest) -> ResultPayload:  # noqa: PLR0911
         """Install dependencies for a library."""
         library_file_path = request.library_file_path
@@ -5048,6 +5322,28 @@ class LibraryManager:
         # Always initialize the venv, even if there are no dependencies to install.
         # Advanced library hooks (before_library_nodes_loaded) expect the venv to exist.
         venv_path = self._get_library_venv_path(library_name, library_file_path)
+        config_manager = GriptapeNodes.ConfigManager()
+
+        # Skip venv checks and the install subprocess when the venv records an install of exactly
+        # these dependencies. The fingerprint lives inside the venv, so a recreated venv loses it.
+        fingerprint = compute_dependency_fingerprint(pip_dependencies, pip_install_flags, venv_path)
+        force_reinstall = request.force_reinstall or config_manager.get_config_value(
+            FORCE_LIBRARY_DEPENDENCY_REINSTALL_KEY, default=False
+        )
+        if pip_dependencies and not force_reinstall and is_venv_functional(venv_path):
+            recorded = read_dependency_fingerprint(venv_path, library_name)
+            if recorded is not None and recorded.fingerprint == fingerprint:
+                self._dependency_installs_skipped += 1
+                self._dependency_install_seconds_saved += recorded.install_duration_s
+                details = f"Dependencies for library '{library_name}' are unchanged since the last install; skipped installing them (saved ~{recorded.install_duration_s:.1f}s)"
+                logger.info(details)
+                return InstallLibraryDependenciesResultSuccess(
+                    library_name=library_name,
+                    dependencies_installed=0,
+                    install_skipped=True,
+                    seconds_saved=recorded.install_duration_s,
+                    result_details=details,
+                )
 
         try:
             library_venv_python_path = await self._init_library_venv(venv_path)
@@ -5061,7 +5357,6 @@ class LibraryManager:
             return InstallLibraryDependenciesResultFailure(result_details=details)
 
         # Check disk space
-        config_manager = GriptapeNodes.ConfigManager()
         min_space_gb = config_manager.get_config_value("minimum_disk_space_gb_libraries")
         if not OSManager.check_available_disk_space(Path(venv_path), min_space_gb):
             error_msg = OSManager.format_disk_space_error(Path(venv_path))
@@ -5079,6 +5374,9 @@ class LibraryManager:
         logger.info("Installing %d dependencies for library '%s'", len(pip_dependencies), library_name)
         is_debug = config_manager.get_config_value("log_level").upper() == "DEBUG"
 
+        # A failed or interrupted install may leave the venv half updated; don't trust it next time
+        clear_dependency_fingerprint(venv_path, library_name)
+        install_start = time.perf_counter()
         try:
             await subprocess_run(
                 [
@@ -5099,6 +5397,11 @@ class LibraryManager:
         except subprocess.CalledProcessError as e:
             details = f"Failed to install dependencies for library '{library_name}': return code={e.returncode}, stderr={e.stderr}"
             return InstallLibraryDependenciesResultFailure(result_details=details)
+        write_dependency_fingerprint(
+            venv_path,
+            library_name,
+            DependencyFingerprint(fingerprint=fingerprint, install_duration_s=time.perf_counter() - install_start),
+        )
 
         details = f"Installed {len(pip_dependencies)} dependencies for library '{library_name}'"
         logger.info(details)
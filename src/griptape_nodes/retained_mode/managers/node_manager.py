@@ -174,6 +174,9 @@ from griptape_nodes.retained_mode.events.parameter_events import (
     AlterParameterGroupDetailsRequest,
     AlterParameterGroupDetailsResultFailure,
     AlterParameterGroupDetailsResultSuccess,
+    BatchSetParameterValuesRequest,
+    BatchSetParameterValuesResultFailure,
+    BatchSetParameterValuesResultSuccess,
     GetCompatibleParametersRequest,
     GetCompatibleParametersResultFailure,
     GetCompatibleParametersResultSuccess,
@@ -332,6 +335,9 @@ class NodeManager:
         )
         event_manager.assign_manager_to_request_type(GetParameterValueRequest, self.on_get_parameter_value_request)
         event_manager.assign_manager_to_request_type(SetParameterValueRequest, self.on_set_parameter_value_request)
+        event_manager.assign_manager_to_request_type(
+            BatchSetParameterValuesRequest, self.on_batch_set_parameter_values_request
+        )
         event_manager.assign_manager_to_request_type(RenameParameterRequest, self.on_rename_parameter_request)
         event_manager.assign_manager_to_request_type(
             ReorderParameterListItemRequest, self.on_reorder_parameter_list_item_request
@@ -2412,6 +2418,43 @@ class NodeManager:
         )
         return result
 
+    def on_batch_set_parameter_values_request(self, request: BatchSetParameterValuesRequest) -> ResultPayload:
+        node_name = request.node_name
+        if node_name is None:
+            if not GriptapeNodes.ContextManager().has_current_node():
+                details = "Attempted to set parameter values. Failed because no Node was found in the Current Context."
+                return BatchSetParameterValuesResultFailure(result_details=details)
+            node_name = GriptapeNodes.ContextManager().get_current_node().name
+        elif GriptapeNodes.ObjectManager().attempt_get_object_by_name_as_type(node_name, BaseNode) is None:
+            details = (
+                f"Attempted to set parameter values on node '{node_name}'. Failed because no such Node could be found."
+            )
+            return BatchSetParameterValuesResultFailure(result_details=details)
+
+        # Apply each value through the single-value handler directly, so the batch pays for
+        # one request dispatch instead of one per parameter.
+        updated_parameters = []
+        failed_parameters = {}
+        for parameter_name, value in request.parameter_values.items():
+            result = self.on_set_parameter_value_request(
+                SetParameterValueRequest(parameter_name=parameter_name, value=value, node_name=node_name)
+            )
+            if isinstance(result, SetParameterValueResultSuccess):
+                updated_parameters.append(parameter_name)
+            else:
+                failed_parameters[parameter_name] = str(result.result_details)
+
+        if failed_parameters:
+            details = (
+                f"Attempted to set parameter values on node '{node_name}'. Failed for parameters: {failed_parameters}"
+            )
+            return BatchSetParameterValuesResultFailure(result_details=details, failed_parameters=failed_parameters)
+
+        return BatchSetParameterValuesResultSuccess(
+            updated_parameters=updated_parameters,
+            result_details=f"Successfully set {len(updated_parameters)} parameter values on node '{node_name}'.",
+        )
+
     def _set_and_pass_through_values(self, request: SetParameterValueRequest, node: BaseNode) -> ModifiedReturnValue:
         """Set the parameter value on the node according to the specifications."""
         modified = False
@@ -5074,6 +5117,7 @@ class NodeManager:
         item_to_move = children[request.from_index]
         parameter_list._children.remove(item_to_move)
         parameter_list._children.insert(request.to_index, item_to_move)
+        parameter_list._invalidate_element_index()
 
         # Mark the node as unresolved since parameter structure changed
         node.state = NodeResolutionState.UNRESOLVED
@@ -35,9 +35,13 @@ logger = logging.getLogger("griptape_nodes")
 
 class ObjectManager:
     _name_to_objects: dict[str, object]
+    # Prefix -> lowest index generate_name_for_object could still find free for that prefix.
+    # Every index below it is known to be taken, so the incremental walk can start there.
+    _free_index_hints: dict[str, int]
 
     def __init__(self, _event_manager: EventManager) -> None:
         self._name_to_objects = {}
+        self._free_index_hints = {}
         _event_manager.assign_manager_to_request_type(
             request_type=RenameObjectRequest, callback=self.on_rename_object_request
         )
@@ -91,7 +95,7 @@ class ObjectManager:
 
         # Update the object table.
         self._name_to_objects[final_name] = source_obj
-        del self._name_to_objects[request.object_name]
+        self._remove_name(request.object_name)
 
         details = f"Successfully renamed object '{request.object_name}' to '{final_name}`."
         log_level = logging.DEBUG
@@ -187,7 +191,6 @@ class ObjectManager:
         #    a. If name ends in a number, find the FIRST prefix + integer value that isn't a collision.
         #    b. If name does NOT end in a number, use the name + first free integer.
 
-        # We are going in with eyes open that the collision testing is inefficient.
         name_to_return = None
         incremental_prefix = ""
 
@@ -210,8 +213,8 @@ class ObjectManager:
                 incremental_prefix = f"{requested_name}_"
 
         if name_to_return is None:
-            # Do the incremental walk.
-            curr_idx = 1
+            # Do the incremental walk, starting past the indices already known to be taken.
+            curr_idx = self._free_index_hints.get(incremental_prefix, 1)
             done = False
             while not done:
                 test_name = f"{incremental_prefix}{curr_idx}"
@@ -222,6 +225,7 @@ class ObjectManager:
                 else:
                     # Keep going.
                     curr_idx += 1
+            self._free_index_hints[incremental_prefix] = curr_idx
 
         if name_to_return is None:
             msg = "Failed to generate a unique name for the object."
@@ -264,4 +268,14 @@ class ObjectManager:
                 if isinstance(child, Parameter) and isinstance(obj, BaseNode):
                     GriptapeNodes.handle_request(RemoveParameterFromNodeRequest(child.name, obj.name))
                     return
+        self._remove_name(name)
+
+    def _remove_name(self, name: str) -> None:
         del self._name_to_objects[name]
+        # A freed "<prefix><index>" name reopens that index for generate_name_for_object.
+        pattern_match = re.search(r"\d+$", name)
+        if pattern_match is not None:
+            prefix = name[: pattern_match.start()]
+            hint = self._free_index_hints.get(prefix)
+            if hint is not None:
+                self._free_index_hints[prefix] = min(hint, int(pattern_match.group()))
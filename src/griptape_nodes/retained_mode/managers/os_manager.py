@@ -30,12 +30,17 @@ from griptape_nodes.common.macro_parser.exceptions import MacroResolutionFailure
 from griptape_nodes.common.macro_parser.formats import NumericPaddingFormat
 from griptape_nodes.common.macro_parser.resolution import partial_resolve
 from griptape_nodes.common.macro_parser.segments import ParsedStaticValue, ParsedVariable
+from griptape_nodes.common.managed_cache_directory import (
+    find_managed_cache_directory,
+    get_managed_cache_directory,
+)
 from griptape_nodes.common.sequences import (
     InvalidSubsetBoundsError,
     InvalidTemplateError,
     MissingItemError,
 )
 from griptape_nodes.common.sequences.scan import DirectoryListingError, PathMapping, scan_sequences
+from griptape_nodes.common.workspace_file_index import note_path_removed, note_path_written
 from griptape_nodes.files.drivers.base64_file_driver import Base64FileDriver
 from griptape_nodes.files.drivers.data_uri_file_driver import DataUriFileDriver
 from griptape_nodes.files.drivers.griptape_cloud_file_driver import GriptapeCloudFileDriver
@@ -92,6 +97,9 @@ from griptape_nodes.retained_mode.events.os_events import (
     ReadFileRequest,
     ReadFileResultFailure,
     ReadFileResultSuccess,
+    RegisterCacheDirectoryRequest,
+    RegisterCacheDirectoryResultFailure,
+    RegisterCacheDirectoryResultSuccess,
     RenameFileRequest,
     RenameFileResultFailure,
     RenameFileResultSuccess,
@@ -365,6 +373,10 @@ class OSManager:
                 request_type=MakeDirectoryRequest, callback=self.on_make_directory_request
             )
 
+            event_manager.assign_manager_to_request_type(
+                request_type=RegisterCacheDirectoryRequest, callback=self.on_register_cache_directory_request
+            )
+
             # Store event_manager for direct access during resource registration
             self._event_manager = event_manager
 
@@ -1709,6 +1721,7 @@ class OSManager:
 
             # Driver validates and reads
             content = await driver.read(location, timeout=120.0)
+            self._record_cache_directory_access(location)
 
             # Add basic metadata
             file_size = len(content)
@@ -2216,12 +2229,16 @@ class OSManager:
         coercion_result = self._apply_extension_coercion(request, final_file_path)
         if isinstance(coercion_result, WriteFileResultFailure):
             return coercion_result
+        if Path(coercion_result) != Path(final_file_path):
+            self._record_path_removed(Path(final_file_path))
         final_file_path = coercion_result
 
         # Write sidecar metadata file if caller opted in by providing file_metadata
         if request.file_metadata is not None:
             write_sidecar(final_file_path, request.file_metadata)
 
+        self._record_path_written(Path(final_file_path))
+
         if used_indexed_fallback:
             msg = f"File written to indexed path: {final_file_path} (original path '{path_display}' already existed)"
             result_details = ResultDetails(message=msg, level=logging.DEBUG)
@@ -2234,7 +2251,7 @@ class OSManager:
             result_details=result_details,
         )
 
-    def _apply_extension_coercion(  # noqa: PLR0911
+    def _apply_extension_coercion(  # noqa: PLR0911, C901
         self,
         request: WriteFileRequest,
         final_file_path: Path,
@@ -2281,6 +2298,8 @@ class OSManager:
                     final_file_path,
                     e,
                 )
+            else:
+                self._record_path_removed(final_file_path)
             msg = (
                 f"Refusing to write {sniffed.upper()} bytes to '{final_file_path}' "
                 f"(extension '.{suffix}'). The file extension must match the byte content; "
@@ -2606,6 +2625,10 @@ class OSManager:
     def cleanup_directory_if_needed(full_directory_path: Path, max_size_gb: float) -> bool:
         """Check directory size and cleanup old files if needed.
 
+        The directory becomes a managed cache directory limited to max_size_gb. Each call
+        rescans it with one stat walk, so files written behind the engine's back are counted,
+        then ranks the files once and evicts in a single pass.
+
         Args:
             full_directory_path: Path to the directory to check and clean
             max_size_gb: Target size in GB
@@ -2619,123 +2642,99 @@ class OSManager:
             )
             max_size_gb = 0
 
-        # Calculate current directory size
-        current_size_gb = OSManager._get_directory_size_gb(full_directory_path)
-
-        if current_size_gb <= max_size_gb:
+        if not full_directory_path.exists():
+            logger.error("Directory %s does not exist. Skipping cleanup.", full_directory_path)
             return False
 
-        logger.info(
-            "Directory %s size (%.1f GB) exceeds limit (%s GB). Starting cleanup...",
-            full_directory_path,
-            current_size_gb,
-            max_size_gb,
-        )
+        managed = get_managed_cache_directory(full_directory_path)
+        managed.max_size_bytes = OSManager._gb_to_bytes(max_size_gb)
+        managed.rescan()
 
-        # Perform cleanup
-        return OSManager._cleanup_old_files(full_directory_path, max_size_gb)
+        eviction = managed.evict_if_needed()
+        if eviction is None:
+            return False
+        if eviction.removed_count == 0:
+            logger.error("Attempted to clean up old files from %s, but no files could be deleted.", full_directory_path)
+        return eviction.removed_count > 0
+
+    def on_register_cache_directory_request(
+        self, request: RegisterCacheDirectoryRequest
+    ) -> RegisterCacheDirectoryResultSuccess | RegisterCacheDirectoryResultFailure:
+        """Handle a request to bound the size of a cache directory."""
+        # FAILURE CASE: Negative limit
+        if request.max_size_gb < 0:
+            msg = f"Attempted to register cache directory '{request.directory}'. Failed due to negative max_size_gb: {request.max_size_gb}"
+            return RegisterCacheDirectoryResultFailure(failure_reason=FileIOFailureReason.UNKNOWN, result_details=msg)
+
+        # FAILURE CASE: Path must be an existing directory
+        try:
+            directory = self._resolve_file_path(request.directory)
+        except (ValueError, RuntimeError) as e:
+            msg = f"Attempted to register cache directory '{request.directory}'. Failed due to invalid path: {e}"
+            return RegisterCacheDirectoryResultFailure(
+                failure_reason=FileIOFailureReason.INVALID_PATH, result_details=msg
+            )
+        if not directory.is_dir():
+            msg = f"Attempted to register cache directory '{request.directory}'. Failed because it is not a directory"
+            return RegisterCacheDirectoryResultFailure(
+                failure_reason=FileIOFailureReason.INVALID_PATH, result_details=msg
+            )
+
+        managed = get_managed_cache_directory(directory)
+        managed.max_size_bytes = self._gb_to_bytes(request.max_size_gb)
+        managed.eviction_policy = request.eviction_policy
+        managed.evict_in_background = request.evict_in_background
+        managed.evict_if_needed()
+
+        return RegisterCacheDirectoryResultSuccess(
+            size_bytes=managed.size_bytes,
+            file_count=managed.file_count,
+            result_details=f"Registered cache directory '{directory}' with a limit of {request.max_size_gb} GB",
+        )
 
     @staticmethod
-    def _get_directory_size_gb(path: Path) -> float:
-        """Get total size of directory in GB.
-
-        Args:
-            path: Path to the directory
-
-        Returns:
-            Total size in GB
-        """
-        total_size = 0.0
-
-        if not path.exists():
-            logger.error("Directory %s does not exist. Skipping cleanup.", path)
-            return 0.0
-
-        for _, _, files in os.walk(path):
-            for f in files:
-                fp = path / f
-                if not fp.is_symlink():
-                    total_size += fp.stat().st_size
-        return total_size / (1024 * 1024 * 1024)  # Convert to GB
+    def _gb_to_bytes(size_gb: float) -> int:
+        return int(size_gb * 1024 * 1024 * 1024)
 
     @staticmethod
-    def _cleanup_old_files(directory_path: Path, target_size_gb: float) -> bool:
-        """Remove oldest files until directory is under target size.
-
-        Args:
-            directory_path: Path to the directory to clean
-            target_size_gb: Target size in GB
-
-        Returns:
-            True if files were removed, False otherwise
-        """
-        if not directory_path.exists():
-            logger.error("Directory %s does not exist. Skipping cleanup.", directory_path)
-            return False
-
-        # Get all files with their modification times
-        files_with_times: list[tuple[Path, float]] = []
-
-        for file_path in directory_path.rglob("*"):
-            if file_path.is_file():
-                try:
-                    mtime = file_path.stat().st_mtime
-                    files_with_times.append((file_path, mtime))
-                except (OSError, FileNotFoundError) as err:
-                    # Skip files that can't be accessed
-                    logger.error(
-                        "While cleaning up old files, saw file %s. File could not be accessed; skipping. Error: %s",
-                        file_path,
-                        err,
-                    )
-                    continue
-
-        if not files_with_times:
-            logger.error(
-                "Attempted to clean up files to get below a target directory size, but no suitable files were found that could be deleted."
-            )
-            return False
+    def _record_path_written(path: Path) -> None:
+        """Update the engine's file indexes and caches after a file or directory was written at path."""
+        OSManager._record_cache_directory_write(path)
+        note_path_written(path)
+        GriptapeNodes.ArtifactManager().invalidate_preview_metadata(path)
 
-        # Sort by modification time (oldest first)
-        files_with_times.sort(key=lambda x: x[1])
-
-        # Remove files until we're under the target size
-        removed_count = 0
+    @staticmethod
+    def _record_path_removed(path: Path) -> None:
+        """Update the engine's file indexes and caches after the file or directory at path was removed."""
+        OSManager._record_cache_directory_removal(path)
+        note_path_removed(path)
+        GriptapeNodes.ArtifactManager().invalidate_preview_metadata(path)
 
-        for file_path, _ in files_with_times:
-            try:
-                # Delete the file.
-                # TODO: Replace with DeleteFileRequest https://github.com/griptape-ai/griptape-nodes/issues/3765
-                file_path.unlink()
-                removed_count += 1
-
-                # Check if we're now under the target size
-                current_size_gb = OSManager._get_directory_size_gb(directory_path)
-                if current_size_gb <= target_size_gb:
-                    # We're done!
-                    break
-
-            except (OSError, FileNotFoundError) as err:
-                # Skip files that can't be deleted
-                logger.error(
-                    "While cleaning up old files, attempted to delete file %s. File could not be deleted; skipping. Deletion error: %s",
-                    file_path,
-                    err,
-                )
+    @staticmethod
+    def _record_cache_directory_write(path: Path) -> None:
+        """Index a file or directory written into a managed cache directory, evicting in the background if it is now too big."""
+        managed = find_managed_cache_directory(path)
+        if managed is None:
+            return
+        managed.record_write(path)
+        if managed.evict_in_background:
+            managed.evict_if_needed_in_background()
 
-        if removed_count > 0:
-            final_size_gb = OSManager._get_directory_size_gb(directory_path)
-            logger.info(
-                "Cleaned up %d old files from %s. Directory size reduced to %.1f GB",
-                removed_count,
-                directory_path,
-                final_size_gb,
-            )
-        else:
-            # None deleted.
-            logger.error("Attempted to clean up old files from %s, but no files could be deleted.")
+    @staticmethod
+    def _record_cache_directory_removal(path: Path) -> None:
+        """Drop a deleted or moved-away file, or a whole directory, from the managed cache directory holding it."""
+        managed = find_managed_cache_directory(path)
+        if managed is not None:
+            managed.forget(path)
 
-        return removed_count > 0
+    @staticmethod
+    def _record_cache_directory_access(location: str) -> None:
+        """Note a read from a managed cache directory, for its eviction order."""
+        if "://" in location or location.startswith("data:"):
+            return
+        managed = find_managed_cache_directory(Path(location))
+        if managed is not None:
+            managed.record_access(Path(location))
 
     def on_make_directory_request(self, request: MakeDirectoryRequest) -> ResultPayload:  # noqa: PLR0911
         """Handle a request to create a directory."""
@@ -2864,6 +2863,7 @@ class OSManager:
             return CreateFileResultFailure(failure_reason=FileIOFailureReason.UNKNOWN, result_details=msg)
 
         # SUCCESS PATH
+        self._record_path_written(file_path)
         return CreateFileResultSuccess(
             created_path=str(file_path),
             result_details=f"{'Directory' if request.is_directory else 'File'} created successfully at {file_path}",
@@ -2936,6 +2936,8 @@ class OSManager:
             return RenameFileResultFailure(failure_reason=FileIOFailureReason.UNKNOWN, result_details=msg)
 
         # SUCCESS PATH
+        self._record_path_removed(old_path)
+        self._record_path_written(new_path)
         details = f"Renamed: {old_path} -> {new_path}"
         return RenameFileResultSuccess(
             old_path=str(old_path),
@@ -3017,6 +3019,7 @@ class OSManager:
             return CopyFileResultFailure(failure_reason=FileIOFailureReason.UNKNOWN, result_details=msg)
 
         # SUCCESS PATH
+        self._record_path_written(destination_path)
         return CopyFileResultSuccess(
             source_path=str(source_path),
             destination_path=str(destination_path),
@@ -3158,6 +3161,8 @@ class OSManager:
                 msg = f"Unknown/unsupported deletion behavior: {request.deletion_behavior}"
                 raise ValueError(msg)
 
+        self._record_path_removed(resolved_path)
+
         # SUCCESS PATH AT END
         return DeleteFileResultSuccess(
             deleted_path=str(resolved_path),
@@ -3456,6 +3461,7 @@ class OSManager:
             return CopyTreeResultFailure(failure_reason=FileIOFailureReason.UNKNOWN, result_details=msg)
 
         # SUCCESS PATH
+        self._record_path_written(destination_path)
         return CopyTreeResultSuccess(
             source_path=str(source_path),
             destination_path=str(destination_path),
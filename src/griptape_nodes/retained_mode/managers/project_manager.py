@@ -442,6 +442,8 @@ class ProjectManager:
 
         # Store in new consolidated dict
         self._successfully_loaded_project_templates[project_id] = project_info
+        # Reloading the current project's template can move its preview directories
+        GriptapeNodes.ArtifactManager().clear_preview_metadata()
 
         # Track validation status for all load attempts (for UI display)
         self._registered_template_status[project_file_path] = validation
@@ -1077,6 +1079,8 @@ class ProjectManager:
 
         new_workspace = self._config_manager.workspace_path
         workspace_changed = old_workspace != new_workspace
+        # Preview directories resolve through the project and workspace that just changed
+        GriptapeNodes.ArtifactManager().clear_preview_metadata()
 
         if self._initialization_complete:
             # Persist the active project's file path so the next engine restart
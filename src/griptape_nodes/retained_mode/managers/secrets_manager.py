@@ -8,6 +8,7 @@ from dotenv import dotenv_values, get_key, set_key, unset_key
 from dotenv.main import DotEnv
 from xdg_base_dirs import xdg_config_home
 
+from griptape_nodes.common.startup_tracer import traced_startup_phase
 from griptape_nodes.retained_mode.events.app_events import SecretChanged
 from griptape_nodes.retained_mode.events.base_events import ResultPayload
 from griptape_nodes.retained_mode.events.secrets_events import (
@@ -125,6 +126,7 @@ class SecretsManager:
         value = self.config_manager.get_config_value(SECRETS_TO_REGISTER_KEY, default={})
         return normalize_secrets_to_register(value)
 
+    @traced_startup_phase(category="secrets")
     def register_all_secrets(self) -> None:
         """Register all secrets from config and library settings.
 
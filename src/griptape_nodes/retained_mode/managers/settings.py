@@ -19,6 +19,13 @@ EVENTS_TO_ECHO_KEY = "app_events.events_to_echo_as_retained_mode"
 WORKER_HEARTBEAT_INTERVAL_KEY = "worker.heartbeat_interval_s"
 WORKER_HEARTBEAT_TIMEOUT_KEY = "worker.heartbeat_timeout_s"
 WORKER_HEARTBEAT_STARTUP_GRACE_KEY = "worker.heartbeat_startup_grace_s"
+RESOURCE_CLASS_BUDGETS_KEY = "resource_class_budgets"
+WORKFLOW_VALUE_BLOB_THRESHOLD_KEY = "workflow_value_blob_threshold_bytes"
+PARAMETER_VALUE_REFERENCE_THRESHOLD_KEY = "parameter_value_reference_threshold_bytes"
+MAX_CONCURRENT_LIBRARY_INSTALLS_KEY = "max_concurrent_library_installs"
+FORCE_LIBRARY_DEPENDENCY_REINSTALL_KEY = "force_library_dependency_reinstall"
+LAZY_NODE_IMPORT_KEY = "lazy_node_import"
+LAZY_NODE_IMPORT_WARMUP_KEY = "lazy_node_import_warmup"
 
 
 class Category(BaseModel):
@@ -221,6 +228,32 @@ class WorkerSettings(BaseModel):
     )
 
 
+class ResourceClassBudgets(BaseModel):
+    """Per resource class concurrency budgets for parallel execution.
+
+    Nodes declare their class and weight with ResourceClassNodeProperty and
+    ResourceWeightNodeProperty. CPU nodes, and the nodes of any class whose budget
+    is None, share the max_nodes_in_parallel cap. An IO or memory budget replaces
+    that cap for its class, so it may be larger or smaller than max_nodes_in_parallel.
+    """
+
+    cpu: int | None = Field(
+        default=None,
+        ge=1,
+        description="Budget for CPU-bound nodes (the default class), within max_nodes_in_parallel. None means only max_nodes_in_parallel applies.",
+    )
+    io: int | None = Field(
+        default=None,
+        ge=1,
+        description="Budget for IO/network-bound nodes, replacing max_nodes_in_parallel for them. None means they share max_nodes_in_parallel.",
+    )
+    memory: int | None = Field(
+        default=2,
+        ge=1,
+        description="Budget for memory-heavy nodes, replacing max_nodes_in_parallel for them. None means they share max_nodes_in_parallel.",
+    )
+
+
 class Settings(BaseModel):
     model_config = ConfigDict(extra="allow")
 
@@ -291,6 +324,29 @@ class Settings(BaseModel):
         default=5,
         description="Maximum number of nodes executing at a time for parallel execution.",
     )
+    resource_class_budgets: ResourceClassBudgets = Field(
+        category=EXECUTION,
+        default_factory=ResourceClassBudgets,
+        description="Maximum total resource weight executing at a time per node resource class (CPU, IO, memory). IO and memory budgets replace max_nodes_in_parallel for their class; CPU and unset classes share it.",
+    )
+    max_node_threads: int | None = Field(
+        category=EXECUTION,
+        default=None,
+        ge=1,
+        description="Size of the thread pool that runs process() for nodes declared with THREAD process offload. Defaults to min(32, CPU count + 4).",
+    )
+    loop_subprocess_workers: int | None = Field(
+        category=EXECUTION,
+        default=None,
+        ge=1,
+        description="Maximum number of warm worker subprocesses running loop iterations concurrently in private or published execution. Defaults to the CPU count.",
+    )
+    max_live_loop_iterations: int | None = Field(
+        category=EXECUTION,
+        default=None,
+        ge=1,
+        description="Maximum number of iteration flows a parallel loop keeps live at once when running locally. Later iterations are created as earlier ones finish, and finished iterations are torn down immediately. Defaults to no limit.",
+    )
     worker: WorkerSettings = Field(
         category=EXECUTION,
         default_factory=WorkerSettings,
@@ -301,11 +357,38 @@ class Settings(BaseModel):
         default=True,
         description="Automatically inject workflow metadata into saved files with supported formats",
     )
+    workflow_value_blob_threshold_bytes: int | None = Field(
+        category=STORAGE,
+        default=None,
+        ge=1,
+        description="When set, saved workflows store parameter values whose pickled size is at least this many bytes in a content-addressed blob directory (.workflow_blobs) next to the workflow file instead of embedding them in the file. Identical values are stored once per directory. A workflow saved this way must be moved or copied together with its blob directory. Defaults to embedding every value.",
+    )
     minimum_disk_space_gb_libraries: float = Field(
         category=SYSTEM_REQUIREMENTS,
         default=10.0,
         description="Minimum disk space in GB required for library installation and virtual environment operations",
     )
+    max_concurrent_library_installs: int | None = Field(
+        category=SYSTEM_REQUIREMENTS,
+        default=None,
+        ge=1,
+        description="Number of libraries whose virtual environments and dependencies are set up at the same time during startup. Node imports and registration still run one library at a time, in configured order. Defaults to min(4, CPU count).",
+    )
+    force_library_dependency_reinstall: bool = Field(
+        category=SYSTEM_REQUIREMENTS,
+        default=False,
+        description="Run the dependency install for every library on startup, even when its dependencies, install flags and Python version match the last successful install",
+    )
+    lazy_node_import: bool = Field(
+        category=SYSTEM_REQUIREMENTS,
+        default=False,
+        description="Register library nodes from their library JSON without importing their Python modules on startup. A node's module is imported the first time that node is created or described. Not applied in library worker processes.",
+    )
+    lazy_node_import_warmup: bool = Field(
+        category=SYSTEM_REQUIREMENTS,
+        default=True,
+        description="When lazy_node_import is enabled, import the deferred node modules one at a time in a background thread once libraries finish loading",
+    )
     minimum_disk_space_gb_workflows: float = Field(
         category=SYSTEM_REQUIREMENTS,
         default=1.0,
@@ -351,11 +434,23 @@ class Settings(BaseModel):
         default=None,
         description="Base URL for the static server. Leave unset to derive it from the server's host/port (including the OS-assigned port when the configured port is unavailable). Set this only to override the derived URL, e.g. when fronting the server with a tunnel (ngrok, cloudflare) or reverse proxy.",
     )
+    parameter_value_reference_threshold_bytes: int | None = Field(
+        category=STATIC_SERVER,
+        default=None,
+        ge=1,
+        description="When set, parameter value updates whose JSON size is at least this many bytes are stored once in the static files directory and sent to clients as a reference (URL, size, and a short summary) instead of the full value. Clients fetch the full value from the static server on demand. Only applies with local storage. Defaults to sending every value inline.",
+    )
     artifacts: dict[str, Any] = Field(
         category=ARTIFACTS,
         default_factory=dict,
         description="Control how previews are generated for images and other media files",
     )
+    max_preview_processes: int | None = Field(
+        category=ARTIFACTS,
+        default=None,
+        ge=1,
+        description="Number of worker processes that decode and resize images for previews, off the engine's event loop. Defaults to min(4, CPU count).",
+    )
     project_file: str | None = Field(
         category=PROJECTS,
         default=None,
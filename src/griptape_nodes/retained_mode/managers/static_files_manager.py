@@ -8,6 +8,12 @@ from typing import NamedTuple
 from xdg_base_dirs import xdg_config_home
 
 from griptape_nodes.common.macro_parser import MacroSyntaxError, ParsedMacro
+from griptape_nodes.common.parameter_value_references import (
+    PARAMETER_VALUE_DIR_NAME,
+    ParameterValueStore,
+    get_parameter_value_file_name,
+    remove_abandoned_parameter_value_stores,
+)
 from griptape_nodes.common.project_templates.situation import SituationFilePolicy
 from griptape_nodes.drivers.storage import StorageBackend
 from griptape_nodes.drivers.storage.griptape_cloud_storage_driver import GriptapeCloudStorageDriver
@@ -93,6 +99,13 @@ class StaticFilesManager:
         self.config_manager = config_manager
         self.secrets_manager = secrets_manager
 
+        # This process's store for store_parameter_value, claimed on first use
+        self._parameter_value_store: ParameterValueStore | None = None
+        self._parameter_value_store_lock = threading.Lock()
+        # Set by workflow executors: the events they relay outlive the workflows they run, so
+        # their stored values are kept until the process exits rather than cleared with the workflow
+        self.retain_parameter_values = False
+
         self.storage_backend = config_manager.get_config_value("storage_backend", default=StorageBackend.LOCAL)
         workspace_directory = config_manager.workspace_path
 
@@ -403,6 +416,15 @@ class StaticFilesManager:
         )
 
     def on_app_initialization_complete(self, _payload: AppInitializationComplete) -> None:
+        # Values stored by engines that have exited belong to workflows that are no longer loaded
+        try:
+            removed = remove_abandoned_parameter_value_stores(self._parameter_value_root())
+        except OSError as e:
+            logger.debug("Failed to remove abandoned parameter value stores: %s", e)
+        else:
+            if removed:
+                logger.debug("Removed %d abandoned parameter value stores", removed)
+
         # Start static server in daemon thread if enabled
         if isinstance(self.storage_driver, LocalStorageDriver):
             # Pre-bind to port 0 (or the configured port) so the OS assigns a free port before
@@ -478,6 +500,54 @@ class StaticFilesManager:
             raise RuntimeError(msg) from e
         return self.storage_driver.create_signed_download_url(Path(saved_path))
 
+    def store_parameter_value(self, value_json: bytes) -> tuple[str, str] | None:
+        """Store a parameter value's JSON once in the static files directory for clients to fetch.
+
+        Args:
+            value_json: The JSON bytes of the value.
+
+        Returns:
+            The value's digest and its URL on the static server, or None if values cannot be
+            served (cloud storage, or the static server has not started yet).
+
+        Raises:
+            OSError: If the value cannot be written.
+        """
+        if not isinstance(self.storage_driver, LocalStorageDriver) or self._static_server_base_url is None:
+            return None
+
+        store = self._get_parameter_value_store()
+        digest = store.write(value_json)
+        file_name = get_parameter_value_file_name(digest)
+        return digest, f"{self._static_server_base_url}/static/{PARAMETER_VALUE_DIR_NAME}/{store.store_id}/{file_name}"
+
+    def clear_parameter_values(self) -> None:
+        """Delete the values this process stored with store_parameter_value; references to them stop resolving.
+
+        Does nothing when retain_parameter_values is set. Values stored by other engines are never touched.
+        """
+        if self.retain_parameter_values or self._parameter_value_store is None:
+            return
+        removed = self._parameter_value_store.clear()
+        if removed:
+            logger.debug("Deleted %d stored parameter values", removed)
+
+    def _get_parameter_value_store(self) -> ParameterValueStore:
+        root = self._parameter_value_root()
+        with self._parameter_value_store_lock:
+            store = self._parameter_value_store
+            if store is not None and store.root == root:
+                return store
+            # The workspace moved; values stored under the old one are no longer served
+            if store is not None:
+                store.close()
+            self._parameter_value_store = ParameterValueStore(root)
+            return self._parameter_value_store
+
+    def _parameter_value_root(self) -> Path:
+        static_files_directory = self.config_manager.get_config_value("static_files_directory", default="staticfiles")
+        return self.config_manager.workspace_path / static_files_directory / PARAMETER_VALUE_DIR_NAME
+
     def _resolve_static_file_path(
         self, file_name: str, situation_name: str = SAVE_STATIC_FILE_SITUATION
     ) -> ResolvedStaticFilePath | None:
@@ -13,6 +13,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from griptape_nodes.bootstrap.utils.subprocess_websocket_base import WebSocketMessage
+from griptape_nodes.common.startup_tracer import traced_startup_phase
 from griptape_nodes.retained_mode.events import worker_events
 from griptape_nodes.retained_mode.events.app_events import ConfigChanged, SecretChanged
 from griptape_nodes.retained_mode.events.base_events import EventRequest
@@ -299,6 +300,7 @@ class WorkerManager:
                 return wid, registration.request_topic
         return None
 
+    @traced_startup_phase(category="workers")
     async def spawn_worker(self, args: list[str], worker_key: str) -> None:
         """Spawn a worker subprocess using the given command args.
 
@@ -554,11 +556,11 @@ class WorkerManager:
 
         Listener is async and awaits the broadcast directly so the work
         is owned by the listener's own task. ``broadcast_app_event``
-        invokes listeners on a transient ``ThreadRunner`` side loop when
-        called from sync code (the production path); a fire-and-forget
+        invokes listeners on a sync bridge side loop when called from
+        sync code (the production path); a fire-and-forget
         ``asyncio.create_task`` from inside the listener would land on
-        that side loop and be killed when ``ThreadRunner.__exit__``
-        stops the loop, so the broadcast must be awaited inline.
+        that side loop and still be pending when ``broadcast_app_event``
+        returns, so the broadcast must be awaited inline.
 
         Lazy import breaks a cycle between this module and
         ``griptape_nodes.app.worker_routing``, which itself imports
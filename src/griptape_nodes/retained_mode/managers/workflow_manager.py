@@ -23,6 +23,16 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+from griptape_nodes.common.startup_tracer import traced_startup_phase
+from griptape_nodes.common.workflow_metadata_index import WORKFLOW_METADATA_BLOCK_REGEX, WorkflowMetadataIndex
+from griptape_nodes.common.workflow_value_blobs import (
+    WORKFLOW_VALUE_BLOB_DIR_NAME,
+    copy_workflow_value_blobs,
+    get_workflow_value_blob_dir,
+    remove_unreferenced_workflow_value_blobs,
+    write_workflow_value_blob,
+)
+from griptape_nodes.common.workspace_file_index import note_path_written
 from griptape_nodes.exe_types.core_types import ParameterTypeBuiltin
 from griptape_nodes.exe_types.flow import ControlFlow
 from griptape_nodes.exe_types.node_types import BaseNode, EndNode, StartNode
@@ -191,7 +201,7 @@ from griptape_nodes.retained_mode.managers.fitness_problems.workflows import (
     WorkflowNotFoundProblem,
 )
 from griptape_nodes.retained_mode.managers.os_manager import OSManager
-from griptape_nodes.retained_mode.managers.settings import WORKFLOWS_TO_REGISTER_KEY
+from griptape_nodes.retained_mode.managers.settings import WORKFLOW_VALUE_BLOB_THRESHOLD_KEY, WORKFLOWS_TO_REGISTER_KEY
 from griptape_nodes.utils.ast_utils import rewrite_string_comments
 from griptape_nodes.utils.string_utils import normalize_display_name
 
@@ -324,6 +334,8 @@ class WorkflowManager:
         # unwind. refresh_workflow_registry clears this while it mutates the registry.
         self._workflows_loading_complete = asyncio.Event()
         self._workflows_loading_complete.set()
+        # Metadata blocks of workflow files, persisted across runs so unchanged files aren't re-read.
+        self._metadata_index = WorkflowMetadataIndex()
 
         event_manager.assign_manager_to_request_type(
             RunWorkflowFromScratchRequest, self.on_run_workflow_from_scratch_request
@@ -495,6 +507,9 @@ class WorkflowManager:
     def get_workflow_metadata(self, workflow_file_path: Path, block_name: str) -> list[re.Match[str]]:
         """Get the workflow metadata for a given workflow file path.
 
+        The file's metadata blocks come from the persistent metadata index, which only reads
+        the file if it changed since it was last indexed.
+
         Args:
             workflow_file_path (Path): The path to the workflow file.
             block_name (str): The name of the metadata block to search for.
@@ -503,15 +518,13 @@ class WorkflowManager:
             list[re.Match[str]]: A list of regex matches for the specified metadata block.
 
         """
-        with workflow_file_path.open("r", encoding="utf-8") as file:
-            workflow_content = file.read()
+        metadata_blocks = self._metadata_index.get_metadata_blocks(workflow_file_path)
 
         # Find the metadata block.
-        regex = r"(?m)^# /// (?P<type>[a-zA-Z0-9-]+)$\s(?P<content>(^#(| .*)$\s)+)^# ///$"
         matches = list(
             filter(
                 lambda m: m.group("type") == block_name,
-                re.finditer(regex, workflow_content),
+                WORKFLOW_METADATA_BLOCK_REGEX.finditer(metadata_blocks),
             )
         )
 
@@ -1033,6 +1046,8 @@ class WorkflowManager:
         if isinstance(delete_result, DeleteFileResultFailure):
             details = f"Failed to delete workflow file with path '{workflow_file_path}'. {delete_result.result_details}"
             return DeleteWorkflowResultFailure(result_details=details)
+        self._metadata_index.forget(full_path)
+        remove_unreferenced_workflow_value_blobs(full_path.parent)
         return DeleteWorkflowResultSuccess(
             result_details=ResultDetails(message=f"Successfully deleted workflow: {request.name}", level=logging.INFO)
         )
@@ -1426,7 +1441,7 @@ class WorkflowManager:
             msg = f"Invalid workflow_metadata: {e!s}"
             raise ValueError(msg) from e
 
-    def on_move_workflow_request(self, request: MoveWorkflowRequest) -> ResultPayload:  # noqa: C901, PLR0911, PLR0915
+    def on_move_workflow_request(self, request: MoveWorkflowRequest) -> ResultPayload:  # noqa: C901, PLR0911, PLR0912, PLR0915
         try:
             # Validate source workflow exists
             workflow = WorkflowRegistry.get_workflow_by_name(request.workflow_name)
@@ -1479,12 +1494,20 @@ class WorkflowManager:
             )
             return MoveWorkflowResultFailure(result_details=details)
 
+        # Values saved as blobs are loaded from the blob directory next to the workflow file
+        try:
+            copy_workflow_value_blobs(current_file_path, new_absolute_path)
+        except OSError as e:
+            details = f"Failed to move workflow '{request.workflow_name}': could not copy its value blobs to '{target_dir_path}': {e!s}"
+            return MoveWorkflowResultFailure(result_details=details)
+
         old_registry_key = derive_registry_key(old_relative_path)
         new_registry_key = derive_registry_key(new_relative_path)
 
         try:
             # Move the file
             Path(current_file_path).rename(new_absolute_path)
+            self._metadata_index.move(Path(current_file_path), new_absolute_path)
 
             # Update workflow registry with new file path
             workflow.file_path = new_relative_path
@@ -1522,6 +1545,7 @@ class WorkflowManager:
             details = f"Failed to move workflow '{request.workflow_name}': {e!s}"
             return MoveWorkflowResultFailure(result_details=details)
         else:
+            remove_unreferenced_workflow_value_blobs(Path(current_file_path).parent)
             details = f"Successfully moved workflow '{request.workflow_name}' to '{new_relative_path}'"
             return MoveWorkflowResultSuccess(
                 moved_file_path=new_relative_path,
@@ -1810,6 +1834,7 @@ class WorkflowManager:
             metadata=workflow_metadata, result_details="Workflow metadata loaded successfully."
         )
 
+    @traced_startup_phase(category="workflows")
     async def register_workflows_from_config(self, config_section: str) -> None:
         workflows_to_register = GriptapeNodes.ConfigManager().get_config_value(config_section)
         if workflows_to_register:
@@ -1980,6 +2005,7 @@ class WorkflowManager:
             details = f"Attempted to save workflow '{file_name}'. {error_msg}"
             return self.WriteWorkflowFileResult(success=False, error_details=details)
 
+        self._metadata_index.record(file_path, content)
         return self.WriteWorkflowFileResult(success=True, error_details="")
 
     async def on_save_workflow_request(self, request: SaveWorkflowRequest) -> ResultPayload:  # noqa: C901, PLR0912, PLR0915
@@ -2330,11 +2356,16 @@ class WorkflowManager:
             execution_flow_name = request.file_name
 
         # Generate the workflow file content
+        value_blob_threshold_bytes = GriptapeNodes.ConfigManager().get_config_value(
+            WORKFLOW_VALUE_BLOB_THRESHOLD_KEY, default=None
+        )
         try:
             final_code_output = self._generate_workflow_file_content(
                 serialized_flow_commands=request.serialized_flow_commands,
                 workflow_metadata=workflow_metadata,
                 pickle_control_flow_result=request.pickle_control_flow_result,
+                value_blob_dir=get_workflow_value_blob_dir(file_path) if value_blob_threshold_bytes else None,
+                value_blob_threshold_bytes=value_blob_threshold_bytes,
             )
         except Exception as err:
             details = f"Attempted to save workflow file '{request.file_name}' from serialized flow commands. Failed during content generation: {err}"
@@ -2344,6 +2375,8 @@ class WorkflowManager:
         write_result = self._write_workflow_file(file_path, final_code_output, request.file_name)
         if not write_result.success:
             return SaveWorkflowFileFromSerializedFlowResultFailure(result_details=write_result.error_details)
+        # Values this save no longer stores as blobs may have been the last references to them
+        remove_unreferenced_workflow_value_blobs(file_path.parent)
 
         details = f"Successfully saved workflow file at: {file_path}"
         return SaveWorkflowFileFromSerializedFlowResultSuccess(
@@ -2499,8 +2532,15 @@ class WorkflowManager:
         workflow_metadata: WorkflowMetadata,
         *,
         pickle_control_flow_result: bool = False,
+        value_blob_dir: Path | None = None,
+        value_blob_threshold_bytes: int | None = None,
     ) -> str:
-        """Generate workflow file content from serialized commands and metadata."""
+        """Generate workflow file content from serialized commands and metadata.
+
+        When value_blob_dir and value_blob_threshold_bytes are given, unique parameter values whose
+        pickled size reaches the threshold are written to value_blob_dir and referenced by digest
+        instead of being embedded (see griptape_nodes.common.workflow_value_blobs).
+        """
         metadata_block = self._generate_workflow_metadata_header(workflow_metadata=workflow_metadata)
         if metadata_block is None:
             details = f"Failed to generate metadata block for workflow '{workflow_metadata.name}'."
@@ -2546,6 +2586,8 @@ class WorkflowManager:
             prefix="top_level",
             import_recorder=import_recorder,
             deferred_imports=deferred_imports,
+            value_blob_dir=value_blob_dir,
+            value_blob_threshold_bytes=value_blob_threshold_bytes,
         )
         # Emit deferred library imports inside build_workflow(), after sys.path is set up.
         main_body.extend(self._build_deferred_import_statements(deferred_imports))
@@ -3687,12 +3729,15 @@ class WorkflowManager:
         code_blocks.append(if_stmt)
         return code_blocks
 
-    def _generate_unique_values_code(
+    def _generate_unique_values_code(  # noqa: PLR0913
         self,
         unique_parameter_uuid_to_values: dict[SerializedNodeCommands.UniqueParameterValueUUID, Any],
         prefix: str,
         import_recorder: ImportRecorder,
         deferred_imports: dict[str, set[str]] | None = None,
+        *,
+        value_blob_dir: Path | None = None,
+        value_blob_threshold_bytes: int | None = None,
     ) -> ast.Module:
         if len(unique_parameter_uuid_to_values) == 0:
             return ast.Module(body=[], type_ignores=[])
@@ -3706,6 +3751,8 @@ class WorkflowManager:
         # IMPORTANT: We patch dynamic module names to stable namespaces before pickling
         # to ensure generated workflows can reliably import the required classes.
         unique_parameter_dict = {}
+        # Values stored as blobs instead, keyed to their blob digest.
+        unique_parameter_blob_digests = {}
 
         for uuid, unique_parameter_value in unique_parameter_uuid_to_values.items():
             # Dynamic Module Patching Strategy:
@@ -3726,9 +3773,16 @@ class WorkflowManager:
             # Apply recursive dynamic module patching, pickle, then restore
             unique_parameter_bytes = self._patch_and_pickle_object(unique_parameter_value)
 
-            # Encode the bytes as a string using latin1
-            unique_parameter_byte_str = unique_parameter_bytes.decode("latin1")
-            unique_parameter_dict[uuid] = unique_parameter_byte_str
+            if (
+                value_blob_dir is not None
+                and value_blob_threshold_bytes is not None
+                and len(unique_parameter_bytes) >= value_blob_threshold_bytes
+            ):
+                unique_parameter_blob_digests[uuid] = write_workflow_value_blob(value_blob_dir, unique_parameter_bytes)
+            else:
+                # Encode the bytes as a string using latin1
+                unique_parameter_byte_str = unique_parameter_bytes.decode("latin1")
+                unique_parameter_dict[uuid] = unique_parameter_byte_str
 
             # Collect import statements for all classes in the object tree
             self._collect_object_imports(unique_parameter_value, import_recorder, global_modules_set, deferred_imports)
@@ -3745,28 +3799,54 @@ class WorkflowManager:
             "#    them consistently save and load. It allows us to serialize complex objects like custom classes, which otherwise",
             "#    would be difficult to serialize.",
         ]
+        if unique_parameter_blob_digests:
+            import_recorder.add_from_import("griptape_nodes.common.workflow_value_blobs", "load_workflow_value_blob")
+            comment_lines.extend(
+                [
+                    f"# 4. Values of {value_blob_threshold_bytes} pickled bytes or more are stored in the {WORKFLOW_VALUE_BLOB_DIR_NAME} directory",
+                    "#    next to this file, named by content hash, and loaded from there. Keep that directory with this file.",
+                ]
+            )
 
         # Generate the dictionary of unique values
         unique_values_dict_name = f"{prefix}_unique_values_dict"
         unique_values_ast = ast.Assign(
             targets=[ast.Name(id=unique_values_dict_name, ctx=ast.Store(), lineno=1, col_offset=0)],
             value=ast.Dict(
-                keys=[ast.Constant(value=str(uuid), lineno=1, col_offset=0) for uuid in unique_parameter_dict],
+                keys=[
+                    ast.Constant(value=str(uuid), lineno=1, col_offset=0)
+                    for uuid in [*unique_parameter_dict, *unique_parameter_blob_digests]
+                ],
                 values=[
-                    ast.Call(
-                        func=ast.Attribute(
-                            value=ast.Name(id="pickle", ctx=ast.Load(), lineno=1, col_offset=0),
-                            attr="loads",
-                            ctx=ast.Load(),
+                    *(
+                        ast.Call(
+                            func=ast.Attribute(
+                                value=ast.Name(id="pickle", ctx=ast.Load(), lineno=1, col_offset=0),
+                                attr="loads",
+                                ctx=ast.Load(),
+                                lineno=1,
+                                col_offset=0,
+                            ),
+                            args=[ast.Constant(value=byte_str.encode("latin1"), lineno=1, col_offset=0)],
+                            keywords=[],
                             lineno=1,
                             col_offset=0,
-                        ),
-                        args=[ast.Constant(value=byte_str.encode("latin1"), lineno=1, col_offset=0)],
-                        keywords=[],
-                        lineno=1,
-                        col_offset=0,
-                    )
-                    for byte_str in unique_parameter_dict.values()
+                        )
+                        for byte_str in unique_parameter_dict.values()
+                    ),
+                    *(
+                        ast.Call(
+                            func=ast.Name(id="load_workflow_value_blob", ctx=ast.Load(), lineno=1, col_offset=0),
+                            args=[
+                                ast.Name(id="__file__", ctx=ast.Load(), lineno=1, col_offset=0),
+                                ast.Constant(value=digest, lineno=1, col_offset=0),
+                            ],
+                            keywords=[],
+                            lineno=1,
+                            col_offset=0,
+                        )
+                        for digest in unique_parameter_blob_digests.values()
+                    ),
                 ],
                 lineno=1,
                 col_offset=0,
@@ -5102,6 +5182,7 @@ class WorkflowManager:
             # Write branch workflow file to disk BEFORE registering in registry
             branch_full_path = WorkflowRegistry.get_complete_file_path(branch_file_path)
             Path(branch_full_path).write_text(branch_content, encoding="utf-8")
+            note_path_written(Path(branch_full_path))
 
             # Now create the branch workflow in registry (file must exist on disk first)
             WorkflowRegistry.generate_new_workflow(
@@ -5191,6 +5272,7 @@ class WorkflowManager:
 
         new_full_path = WorkflowRegistry.get_complete_file_path(relative_file_path)
         Path(new_full_path).write_text(new_content, encoding="utf-8")
+        note_path_written(Path(new_full_path))
         WorkflowRegistry.generate_new_workflow(
             registry_key=derive_registry_key(relative_file_path),
             metadata=new_metadata,
@@ -5270,6 +5352,7 @@ class WorkflowManager:
             # Write the updated content to the source workflow file
             source_file_path = WorkflowRegistry.get_complete_file_path(source_file_path_rel)
             Path(source_file_path).write_text(merged_content, encoding="utf-8")
+            note_path_written(Path(source_file_path))
 
             # Update the registry with new metadata for the source workflow
             source_workflow.metadata = merged_metadata
@@ -5365,6 +5448,7 @@ class WorkflowManager:
             # Write the updated content to the branch workflow file
             branch_content_file_path = WorkflowRegistry.get_complete_file_path(branch_file_path_rel)
             Path(branch_content_file_path).write_text(reset_content, encoding="utf-8")
+            note_path_written(Path(branch_content_file_path))
 
             # Update the registry with new metadata for the branch workflow
             branch_workflow.metadata = reset_metadata
@@ -5712,6 +5796,8 @@ class WorkflowManager:
         # Collect all workflow files first
         for workflow_to_register in workflows_to_register:
             collect_workflow_files(Path(workflow_to_register))
+        # Persist what this scan had to read so the next startup can skip unchanged files.
+        self._metadata_index.flush()
 
         # Track progress
         total_workflows = len(all_workflow_files)
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import asyncio
-import binascii
 import logging
 import os
+import uuid
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Annotated
 from urllib.parse import urljoin
 
 if TYPE_CHECKING:
@@ -13,12 +13,14 @@ if TYPE_CHECKING:
 
 import anyio
 import uvicorn
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 from rich.logging import RichHandler
 
+from griptape_nodes.common.directory_file_index import PARTIAL_UPLOAD_SUFFIX
+from griptape_nodes.common.workspace_file_index import get_workspace_file_index, note_path_removed, note_path_written
 from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 
 # Whether to enable the static server
@@ -31,6 +33,13 @@ STATIC_SERVER_PORT = int(os.getenv("STATIC_SERVER_PORT", "8124"))
 STATIC_SERVER_URL = os.getenv("STATIC_SERVER_URL", "/workspace")
 # Log level for the static server
 STATIC_SERVER_LOG_LEVEL = os.getenv("STATIC_SERVER_LOG_LEVEL", "ERROR").lower()
+# Largest accepted upload, in bytes
+STATIC_SERVER_MAX_UPLOAD_BYTES = int(os.getenv("STATIC_SERVER_MAX_UPLOAD_BYTES", str(10 * 1024**3)))
+
+# Uploads are written to disk once this much of the request body has been received
+UPLOAD_WRITE_CHUNK_BYTES = 1024 * 1024
+DEFAULT_LIST_PAGE_SIZE = 1000
+MAX_LIST_PAGE_SIZE = 10000
 
 logger = logging.getLogger("griptape_nodes_api")
 logging.getLogger("uvicorn").addHandler(RichHandler(show_time=True, show_path=False, markup=True, rich_tracebacks=True))
@@ -59,54 +68,104 @@ async def _create_static_file(request: Request, file_path: str) -> dict:
     workspace_directory = GriptapeNodes.ConfigManager().workspace_path
     full_file_path = workspace_directory / file_path
 
+    content_length = request.headers.get("content-length")
+    if content_length is not None and content_length.isdigit() and int(content_length) > STATIC_SERVER_MAX_UPLOAD_BYTES:
+        msg = f"File {file_path} is larger than the {STATIC_SERVER_MAX_UPLOAD_BYTES} byte upload limit."
+        raise HTTPException(status_code=413, detail=msg)
+
     # Create parent directories if they don't exist
     await anyio.Path(full_file_path.parent).mkdir(parents=True, exist_ok=True)
 
-    data = await request.body()
+    # Stream the body into a temporary file next to the target and rename it into place,
+    # so the upload is never held in memory and readers never see a partial file.
+    temp_path = anyio.Path(
+        full_file_path.with_name(f".{full_file_path.name}.{uuid.uuid4().hex}{PARTIAL_UPLOAD_SUFFIX}")
+    )
     try:
-        await anyio.Path(full_file_path).write_bytes(data)
-    except binascii.Error as e:
-        msg = f"Invalid base64 encoding for file {file_path}."
-        logger.error(msg)
-        raise HTTPException(status_code=400, detail=msg) from e
+        await _stream_request_body_to_file(request, temp_path, file_path)
+        await temp_path.replace(full_file_path)
     except (OSError, PermissionError) as e:
+        await _discard_partial_upload(temp_path)
         msg = f"Failed to write file {full_file_path}: {e}"
         logger.error(msg)
         raise HTTPException(status_code=500, detail=msg) from e
+    except BaseException:
+        await _discard_partial_upload(temp_path)
+        raise
+    note_path_removed(Path(temp_path))
+    note_path_written(full_file_path)
 
     base_url = GriptapeNodes.StaticFilesManager().static_server_base_url
     static_url = urljoin(f"{base_url}{STATIC_SERVER_URL}/", file_path)
     return {"url": static_url}
 
 
-async def _list_static_files(file_path_prefix: str = "") -> dict:
-    """List static files in the static server under the specified path prefix."""
+async def _stream_request_body_to_file(request: Request, destination: anyio.Path, file_path: str) -> None:
+    """Write the request body to destination in chunks, enforcing STATIC_SERVER_MAX_UPLOAD_BYTES."""
+    received = 0
+    pending = bytearray()
+    async with await anyio.open_file(destination, "wb") as destination_file:
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > STATIC_SERVER_MAX_UPLOAD_BYTES:
+                msg = f"File {file_path} is larger than the {STATIC_SERVER_MAX_UPLOAD_BYTES} byte upload limit."
+                raise HTTPException(status_code=413, detail=msg)
+            pending += chunk
+            if len(pending) >= UPLOAD_WRITE_CHUNK_BYTES:
+                await destination_file.write(bytes(pending))
+                pending.clear()
+        if pending:
+            await destination_file.write(bytes(pending))
+
+
+async def _discard_partial_upload(temp_path: anyio.Path) -> None:
+    try:
+        await temp_path.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning("Failed to remove partial upload %s: %s", temp_path, e)
+
+
+async def _list_static_files(
+    file_path_prefix: str = "",
+    cursor: str | None = None,
+    limit: Annotated[int | None, Query(ge=1, le=MAX_LIST_PAGE_SIZE)] = None,
+    refresh: bool = False,  # noqa: FBT001, FBT002
+) -> dict:
+    """List one page of static files in the static server under the specified path prefix.
+
+    Files are returned in path order from a cached index of the workspace. Without cursor or
+    limit every file is returned at once; otherwise pages hold limit files (DEFAULT_LIST_PAGE_SIZE
+    if unset). Pass the returned next_cursor as cursor to get the following page; it is None on the
+    last page. Set refresh to pick up files written outside the engine since the index was last rebuilt.
+    """
     if not STATIC_SERVER_ENABLED:
         msg = "Static server is not enabled. Please set STATIC_SERVER_ENABLED to True."
         raise HTTPException(status_code=500, detail=msg)
 
     workspace_directory = GriptapeNodes.ConfigManager().workspace_path
+    index = get_workspace_file_index(workspace_directory)
 
-    # Handle the prefix path
-    if file_path_prefix:
-        target_directory = workspace_directory / file_path_prefix
-    else:
-        target_directory = workspace_directory
+    # The prefix names a directory, so "out" must not match "outputs/..."
+    key_prefix = file_path_prefix.strip("/")
+    if key_prefix:
+        key_prefix = f"{key_prefix}/"
+
+    page_size = limit
+    if page_size is None and cursor is not None:
+        page_size = DEFAULT_LIST_PAGE_SIZE
+
+    def list_page() -> tuple[list[str], str | None]:
+        index.ensure_current(refresh=refresh)
+        return index.list_page(key_prefix, cursor, page_size)
 
     try:
-        anyio_target = anyio.Path(target_directory)
-        file_names = []
-        if await anyio_target.exists() and await anyio_target.is_dir():
-            async for file_path in anyio_target.rglob("*"):
-                if await file_path.is_file():
-                    relative_path = file_path.relative_to(workspace_directory)
-                    file_names.append(str(relative_path))
+        file_names, next_cursor = await asyncio.to_thread(list_page)
     except (OSError, PermissionError) as e:
         msg = f"Failed to list files in static directory: {e}"
         logger.error(msg)
         raise HTTPException(status_code=500, detail=msg) from e
     else:
-        return {"files": file_names}
+        return {"files": file_names, "next_cursor": next_cursor}
 
 
 async def _delete_static_file(file_path: str) -> dict:
@@ -139,6 +198,7 @@ async def _delete_static_file(file_path: str) -> dict:
         logger.error(msg)
         raise HTTPException(status_code=500, detail=msg) from e
     else:
+        note_path_removed(file_full_path)
         logger.info("Successfully deleted static file: %s", file_path)
         return {"message": f"File {file_path} deleted successfully"}
 
@@ -1,9 +1,19 @@
-"""Various utility functions."""
+"""Various utility functions.
 
-from griptape_nodes.files.path_utils import resolve_workspace_path
-from griptape_nodes.utils.async_utils import call_function
-from griptape_nodes.utils.http_file_patch import install_file_url_support
-from griptape_nodes.utils.url_utils import get_content_type_from_extension
+The re-exported helpers are imported on first access, so importing a single utils submodule
+(e.g. in a preview pool worker) does not pull in their HTTP and CLI dependencies.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from griptape_nodes.files.path_utils import resolve_workspace_path
+    from griptape_nodes.utils.async_utils import call_function
+    from griptape_nodes.utils.http_file_patch import install_file_url_support
+    from griptape_nodes.utils.url_utils import get_content_type_from_extension
 
 __all__ = [
     "call_function",
@@ -11,3 +21,20 @@ __all__ = [
     "install_file_url_support",
     "resolve_workspace_path",
 ]
+
+_LAZY_EXPORTS = {
+    "call_function": "griptape_nodes.utils.async_utils",
+    "get_content_type_from_extension": "griptape_nodes.utils.url_utils",
+    "install_file_url_support": "griptape_nodes.utils.http_file_patch",
+    "resolve_workspace_path": "griptape_nodes.files.path_utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import functools
 import inspect
 import logging
 import subprocess
@@ -10,6 +12,7 @@ from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Sequence
+    from concurrent.futures import Executor
 
 
 logger = logging.getLogger(__name__)
@@ -56,7 +59,31 @@ async def to_thread(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
     Raises:
         asyncio.CancelledError: After waiting for the thread to complete
     """
-    task = asyncio.create_task(asyncio.to_thread(func, *args, **kwargs))
+    return await run_in_executor(None, func, *args, **kwargs)
+
+
+async def run_in_executor(executor: Executor | None, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a synchronous function in the given executor, with the same cancellation semantics as `to_thread`.
+
+    The function runs in a copy of the caller's context, like `asyncio.to_thread`, so context
+    variables set by the caller are visible to it.
+
+    Args:
+        executor: The executor to run the function in, or None for the event loop's default executor
+        func: The synchronous function to run
+        *args: Positional arguments to pass to the function
+        **kwargs: Keyword arguments to pass to the function
+
+    Returns:
+        The result of the function call
+
+    Raises:
+        asyncio.CancelledError: After waiting for the function to complete
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    func_call = functools.partial(context.run, func, *args, **kwargs)
+    task = asyncio.ensure_future(loop.run_in_executor(executor, func_call))
     try:
         task_result = await asyncio.shield(task)
     except asyncio.CancelledError:
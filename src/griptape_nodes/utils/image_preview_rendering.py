@@ -0,0 +1,105 @@
+"""Pillow rendering for image previews, run in the preview process pool.
+
+These functions take and return bytes and import nothing from the engine, so pool workers
+only load Pillow.
+"""
+
+from __future__ import annotations
+
+from io import BytesIO
+
+from PIL import Image, ImageDraw, ImageOps
+
+
+def render_thumbnail(image_data: bytes, max_width: int, max_height: int, preview_format: str) -> bytes:
+    """Decode an image, apply its EXIF orientation, fit it within max_width x max_height, and encode it.
+
+    Args:
+        image_data: Encoded source image
+        max_width: Maximum width of the preview in pixels
+        max_height: Maximum height of the preview in pixels
+        preview_format: Output format (e.g. "webp", "png", "jpeg")
+
+    Returns:
+        The encoded preview
+    """
+    with Image.open(BytesIO(image_data)) as raw_img:
+        # Apply EXIF orientation so rotated images (e.g. phone photos) display correctly
+        img = ImageOps.exif_transpose(raw_img)
+        # Preserves aspect ratio, fits within max dimensions
+        img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+
+        output_buffer = BytesIO()
+        img.save(output_buffer, format=preview_format.upper())
+        return output_buffer.getvalue()
+
+
+def render_rounded_preview(
+    image_data: bytes, max_width: int, max_height: int, corner_radius_percent: float, preview_format: str
+) -> bytes:
+    """Render a thumbnail with rounded corners.
+
+    Corners are transparent for PNG/WEBP output, or composited onto a white background for JPEG.
+
+    Args:
+        image_data: Encoded source image
+        max_width: Maximum width of the preview in pixels
+        max_height: Maximum height of the preview in pixels
+        corner_radius_percent: Corner radius as a percentage of the smaller dimension
+        preview_format: Output format (e.g. "webp", "png", "jpg")
+
+    Returns:
+        The encoded preview
+    """
+    with Image.open(BytesIO(image_data)) as raw_img:
+        # Apply EXIF orientation so rotated images (e.g. phone photos) display correctly
+        img = ImageOps.exif_transpose(raw_img)
+        # Resize to fit max dimensions (preserves aspect ratio)
+        img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+
+        # Convert to RGBA for alpha channel support
+        rgba_img = img.convert("RGBA") if img.mode != "RGBA" else img
+        rounded_img = apply_rounded_corners(rgba_img, corner_radius_percent)
+
+        if preview_format.lower() in ("jpg", "jpeg"):
+            # JPEG doesn't support transparency - composite onto white background
+            final_img = Image.new("RGB", rounded_img.size, (255, 255, 255))
+            final_img.paste(rounded_img, (0, 0), rounded_img)
+        else:
+            # PNG/WEBP support transparency
+            final_img = rounded_img
+
+        output_buffer = BytesIO()
+        # Normalize format for PIL (JPG -> JPEG)
+        pil_format = "JPEG" if preview_format.lower() == "jpg" else preview_format.upper()
+        final_img.save(output_buffer, format=pil_format)
+        return output_buffer.getvalue()
+
+
+def apply_rounded_corners(img: Image.Image, corner_radius_percent: float) -> Image.Image:
+    """Apply rounded corners to an RGBA image using an alpha mask.
+
+    Args:
+        img: Source image (RGBA mode)
+        corner_radius_percent: Corner radius as a percentage of the smaller dimension
+
+    Returns:
+        RGBA image with transparent rounded corners
+    """
+    # Calculate pixel radius from percentage of smaller dimension
+    smaller_dimension = min(img.width, img.height)
+    radius_pixels = int((corner_radius_percent / 100.0) * smaller_dimension)
+
+    # Skip if no rounding requested (0% or rounds to 0 pixels)
+    if radius_pixels <= 0:
+        return img
+
+    # Clamp radius to prevent over-rounding
+    effective_radius = min(radius_pixels, smaller_dimension // 2)
+
+    mask = Image.new("L", img.size, 0)
+    draw = ImageDraw.Draw(mask)
+    draw.rounded_rectangle([(0, 0), (img.width - 1, img.height - 1)], radius=effective_radius, fill=255)
+
+    img.putalpha(mask)
+    return img
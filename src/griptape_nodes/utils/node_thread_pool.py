@@ -0,0 +1,42 @@
+"""Shared thread pool for node process() bodies offloaded from the event loop."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger("griptape_nodes")
+
+MAX_NODE_THREADS_KEY = "max_node_threads"
+
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def get_node_thread_pool() -> ThreadPoolExecutor:
+    """Return the engine's node thread pool, creating it on first use.
+
+    Sized by the max_node_threads setting; when unset, the ThreadPoolExecutor default
+    (min(32, cpu count + 4)) applies. Kept separate from the event loop's default executor
+    so long-running node bodies can't starve the short blocking calls the engine itself
+    sends through asyncio.to_thread.
+    """
+    global _pool  # noqa: PLW0603
+    with _pool_lock:
+        if _pool is None:
+            from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
+
+            max_workers = GriptapeNodes.ConfigManager().get_config_value(MAX_NODE_THREADS_KEY, default=None)
+            _pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="griptape-node")
+            logger.debug("Created node thread pool (max_workers=%s)", max_workers)
+        return _pool
+
+
+def shutdown_node_thread_pool(*, wait: bool = True) -> None:
+    """Shut down the node thread pool. The next get_node_thread_pool() call creates a fresh one."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait)
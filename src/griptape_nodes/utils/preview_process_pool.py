@@ -0,0 +1,83 @@
+"""Shared process pool for CPU-bound preview rendering (image decode, resize, re-encode)."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger("griptape_nodes")
+
+MAX_PREVIEW_PROCESSES_KEY = "max_preview_processes"
+DEFAULT_MAX_PREVIEW_PROCESSES = 4
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def get_max_preview_processes() -> int:
+    """Return the configured max_preview_processes, or min(4, cpu count) when unset."""
+    from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
+
+    max_workers = GriptapeNodes.ConfigManager().get_config_value(MAX_PREVIEW_PROCESSES_KEY, default=None)
+    if max_workers is None:
+        return min(DEFAULT_MAX_PREVIEW_PROCESSES, os.cpu_count() or 1)
+    return max_workers
+
+
+def get_preview_process_pool() -> ProcessPoolExecutor:
+    """Return the engine's preview process pool, creating it on first use.
+
+    Sized by get_max_preview_processes(). Workers are spawned rather than forked: the engine
+    runs several threads, and forking a threaded process can deadlock the child.
+    """
+    global _pool  # noqa: PLW0603
+    with _pool_lock:
+        if _pool is None:
+            max_workers = get_max_preview_processes()
+            _pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+            logger.debug("Created preview process pool (max_workers=%s)", max_workers)
+        return _pool
+
+
+def shutdown_preview_process_pool(*, wait: bool = True) -> None:
+    """Shut down the preview process pool. The next get_preview_process_pool() call creates a fresh one."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+
+async def run_in_preview_process(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a picklable module-level function in the preview process pool.
+
+    Like async_utils.run_in_executor, a cancelled caller still waits for the running call to
+    finish, but no context is carried over: contexts cannot cross a process boundary.
+
+    Args:
+        func: Module-level function to run; it and its arguments must be picklable
+        *args: Positional arguments to pass to the function
+
+    Returns:
+        The result of the function call
+
+    Raises:
+        asyncio.CancelledError: After waiting for the function to complete
+    """
+    loop = asyncio.get_running_loop()
+    task = asyncio.ensure_future(loop.run_in_executor(get_preview_process_pool(), func, *args))
+    try:
+        task_result = await asyncio.shield(task)
+    except asyncio.CancelledError:
+        task_result = await task
+        raise
+
+    return task_result
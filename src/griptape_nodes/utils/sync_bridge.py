@@ -0,0 +1,140 @@
+"""Long-lived side loops for running coroutines to completion from sync code."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from asyncio_thread_runner import ThreadRunner
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+logger = logging.getLogger("griptape_nodes")
+
+T = TypeVar("T")
+
+DEFAULT_MAX_IDLE_LOOPS = 4
+
+
+@dataclass(frozen=True)
+class SyncBridgeStats:
+    """Latency metrics for coroutines run through a SyncBridge.
+
+    dispatch_s measures the bridge itself: the time from submitting a coroutine
+    until it starts running on a side loop. total_s also includes the coroutine's
+    own run time.
+    """
+
+    calls: int = 0
+    loops_started: int = 0
+    dispatch_s: float = 0.0
+    max_dispatch_s: float = 0.0
+    total_s: float = 0.0
+    max_total_s: float = 0.0
+
+    @property
+    def mean_dispatch_s(self) -> float:
+        return self.dispatch_s / self.calls if self.calls else 0.0
+
+    @property
+    def mean_total_s(self) -> float:
+        return self.total_s / self.calls if self.calls else 0.0
+
+
+class SyncBridge:
+    """Runs coroutines from sync code on a pool of long-lived side loops.
+
+    Each call checks out an idle loop, starting a new one only when none is idle,
+    and hands it back when the coroutine finishes. A coroutine that re-enters the
+    bridge from its own side loop therefore gets a different loop instead of
+    blocking the one it is running on, and concurrent callers on different threads
+    don't serialize behind each other. Up to max_idle_loops loops are kept warm
+    between calls; extra loops are shut down as they are handed back.
+
+    Tasks a coroutine spawns without awaiting keep running on its side loop after
+    run() returns, until the bridge is closed.
+    """
+
+    def __init__(self, *, max_idle_loops: int = DEFAULT_MAX_IDLE_LOOPS) -> None:
+        self._max_idle_loops = max_idle_loops
+        self._idle_runners: list[ThreadRunner] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stats = SyncBridgeStats()
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on a side loop and block until it finishes.
+
+        Context variables of the calling thread are visible to the coroutine, as with asyncio.run.
+
+        Args:
+            coro: The coroutine to run.
+
+        Returns:
+            The coroutine's result. Exceptions it raises propagate to the caller.
+        """
+        submitted_at = time.perf_counter()
+        started_at = submitted_at
+
+        async def _timed() -> T:
+            nonlocal started_at
+            started_at = time.perf_counter()
+            return await coro
+
+        runner = self._acquire()
+        try:
+            return runner.run(_timed())
+        finally:
+            self._release(runner)
+            self._record(dispatch_s=started_at - submitted_at, total_s=time.perf_counter() - submitted_at)
+
+    def stats(self) -> SyncBridgeStats:
+        """Return a snapshot of the bridge's latency metrics."""
+        with self._lock:
+            return self._stats
+
+    def reset_stats(self) -> None:
+        """Zero the latency metrics."""
+        with self._lock:
+            self._stats = SyncBridgeStats()
+
+    def close(self) -> None:
+        """Shut down the idle side loops. Loops still in use shut down when their call finishes."""
+        with self._lock:
+            self._closed = True
+            runners, self._idle_runners = self._idle_runners, []
+        for runner in runners:
+            runner.close()
+
+    def _acquire(self) -> ThreadRunner:
+        with self._lock:
+            if self._idle_runners:
+                return self._idle_runners.pop()
+            self._stats = replace(self._stats, loops_started=self._stats.loops_started + 1)
+        logger.debug("Starting sync bridge side loop")
+        runner = ThreadRunner()
+        runner.__enter__()
+        return runner
+
+    def _release(self, runner: ThreadRunner) -> None:
+        with self._lock:
+            if not self._closed and len(self._idle_runners) < self._max_idle_loops:
+                self._idle_runners.append(runner)
+                return
+        runner.close()
+
+    def _record(self, *, dispatch_s: float, total_s: float) -> None:
+        with self._lock:
+            stats = self._stats
+            self._stats = replace(
+                stats,
+                calls=stats.calls + 1,
+                dispatch_s=stats.dispatch_s + dispatch_s,
+                max_dispatch_s=max(stats.max_dispatch_s, dispatch_s),
+                total_s=stats.total_s + total_s,
+                max_total_s=max(stats.max_total_s, total_s),
+            )
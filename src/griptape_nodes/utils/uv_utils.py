@@ -1,11 +1,27 @@
 """Utilities for working with the UV package manager."""
 
+import hashlib
+import json
+import logging
 import sys
+import tempfile
+import threading
 from pathlib import Path
+from typing import NamedTuple
 
 import uv
 from xdg_base_dirs import xdg_data_home
 
+logger = logging.getLogger("griptape_nodes")
+
+# Written inside a library venv after a successful dependency install
+DEPENDENCY_FINGERPRINT_FILE_NAME = "griptape_nodes_dependencies.json"
+_DEPENDENCY_FINGERPRINT_VERSION = 1
+# Layout of the fingerprint file: one record per library installed into the venv
+_DEPENDENCY_FINGERPRINT_FILE_VERSION = 2
+# Serializes read-modify-write of fingerprint files by libraries sharing a venv
+_dependency_fingerprint_lock = threading.Lock()
+
 
 def find_uv_bin() -> str:
     """Find the uv binary, checking dedicated Griptape installation first, then system uv.
@@ -43,3 +59,90 @@ def is_venv_functional(venv_path: Path) -> bool:
     if not (venv_path / "pyvenv.cfg").is_file():
         return False
     return venv_python_path(venv_path).exists()
+
+
+class DependencyFingerprint(NamedTuple):
+    """Record of the last successful dependency install into a venv."""
+
+    fingerprint: str
+    install_duration_s: float
+
+
+def compute_dependency_fingerprint(pip_dependencies: list[str], pip_install_flags: list[str], venv_path: Path) -> str:
+    """Hash everything that determines what `uv pip install` puts into a venv.
+
+    Covers the dependency specifiers and install flags in their declared order, the engine's
+    Python version (library venvs are created with it), and the venv location. Local path or
+    unpinned VCS dependencies can change without their specifier changing; those need a forced
+    reinstall to pick up.
+    """
+    payload = {
+        "version": _DEPENDENCY_FINGERPRINT_VERSION,
+        "pip_dependencies": pip_dependencies,
+        "pip_install_flags": pip_install_flags,
+        "python_version": sys.version,
+        "venv_path": str(venv_path.absolute()),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _read_dependency_fingerprints(venv_path: Path) -> dict[str, DependencyFingerprint]:
+    """Return the fingerprint of every library recorded in a venv, skipping unreadable records."""
+    fingerprint_path = venv_path / DEPENDENCY_FINGERPRINT_FILE_NAME
+    try:
+        data = json.loads(fingerprint_path.read_text(encoding="utf-8"))
+        if data.get("version") != _DEPENDENCY_FINGERPRINT_FILE_VERSION:
+            return {}
+        return {
+            str(library_name): DependencyFingerprint(
+                fingerprint=str(record["fingerprint"]), install_duration_s=float(record["install_duration_s"])
+            )
+            for library_name, record in data["libraries"].items()
+        }
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        logger.debug("Ignoring unreadable dependency fingerprints at %s: %s", fingerprint_path, e)
+        return {}
+
+
+def _write_dependency_fingerprints(venv_path: Path, fingerprints: dict[str, DependencyFingerprint]) -> None:
+    fingerprint_path = venv_path / DEPENDENCY_FINGERPRINT_FILE_NAME
+    data = {
+        "version": _DEPENDENCY_FINGERPRINT_FILE_VERSION,
+        "libraries": {library_name: record._asdict() for library_name, record in fingerprints.items()},
+    }
+    try:
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=venv_path, prefix=f".{DEPENDENCY_FINGERPRINT_FILE_NAME}.", delete=False
+        ) as f:
+            json.dump(data, f)
+        Path(f.name).replace(fingerprint_path)
+    except OSError as e:
+        logger.warning("Failed to record dependency fingerprints at %s: %s", fingerprint_path, e)
+
+
+def read_dependency_fingerprint(venv_path: Path, library_name: str) -> DependencyFingerprint | None:
+    """Return the fingerprint a library recorded in a venv, or None if it is missing or unreadable."""
+    return _read_dependency_fingerprints(venv_path).get(library_name)
+
+
+def write_dependency_fingerprint(venv_path: Path, library_name: str, fingerprint: DependencyFingerprint) -> None:
+    """Record a successful dependency install of a library inside the venv.
+
+    Libraries whose JSON files share a directory share a venv, so each keeps its own record and
+    writing one leaves the others in place. Failure to write is logged and otherwise ignored; the
+    next startup simply installs again.
+    """
+    with _dependency_fingerprint_lock:
+        fingerprints = _read_dependency_fingerprints(venv_path)
+        fingerprints[library_name] = fingerprint
+        _write_dependency_fingerprints(venv_path, fingerprints)
+
+
+def clear_dependency_fingerprint(venv_path: Path, library_name: str) -> None:
+    """Remove a library's recorded fingerprint so its next install runs unconditionally."""
+    with _dependency_fingerprint_lock:
+        fingerprints = _read_dependency_fingerprints(venv_path)
+        if fingerprints.pop(library_name, None) is not None:
+            _write_dependency_fingerprints(venv_path, fingerprints)
@@ -0,0 +1,41 @@
+"""Start and end nodes used by tests/e2e/test_warm_worker_execution.py.
+
+The start node exposes a `text` value that a warm worker's job input sets, and the end node
+reports it back, so the test can see whether a value set by one job leaks into the next.
+"""
+
+from __future__ import annotations
+
+from griptape_nodes.exe_types.core_types import Parameter, ParameterMode
+from griptape_nodes.exe_types.node_types import EndNode, StartNode
+
+
+class TextStartNode(StartNode):
+    def __init__(self, name: str, metadata: dict | None = None) -> None:
+        super().__init__(name, metadata=metadata)
+        self.add_parameter(
+            Parameter(
+                name="text",
+                tooltip="Text supplied by the job input",
+                type="str",
+                default_value="",
+                allowed_modes={ParameterMode.OUTPUT, ParameterMode.PROPERTY},
+            )
+        )
+
+    def process(self) -> None:
+        self.parameter_output_values["text"] = self.get_parameter_value("text")
+
+
+class TextEndNode(EndNode):
+    def __init__(self, name: str, metadata: dict | None = None) -> None:
+        super().__init__(name, metadata=metadata)
+        self.add_parameter(
+            Parameter(
+                name="text",
+                tooltip="Text reported back to the caller",
+                type="str",
+                default_value="",
+                allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
+            )
+        )
@@ -0,0 +1,201 @@
+"""End-to-end coverage for warm subprocess workflow workers.
+
+Generates a workflow whose start node's `text` value is wired to its end node, then runs
+it twice on one real SubprocessWorkflowWorker: the first job sets `text`, the second does
+not. A warm worker keeps the loaded flow between jobs, so unless it puts every node back
+the way the workflow file left it, the second job reports the first job's value.
+
+The worker talks to its parent over the session WebSocket, so the test stands up a tiny
+in-process broker that relays messages published on a topic to the clients subscribed to it.
+"""
+
+from __future__ import annotations
+
+import json
+import pickle
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import pytest_asyncio
+from websockets.asyncio.server import serve
+
+from griptape_nodes.bootstrap.workflow_executors.subprocess_workflow_worker_pool import SubprocessWorkflowWorker
+from griptape_nodes.node_library.workflow_registry import WorkflowMetadata
+from griptape_nodes.retained_mode.events.connection_events import (
+    CreateConnectionRequest,
+    CreateConnectionResultSuccess,
+)
+from griptape_nodes.retained_mode.events.flow_events import (
+    CreateFlowRequest,
+    CreateFlowResultSuccess,
+    SerializeFlowToCommandsRequest,
+    SerializeFlowToCommandsResultSuccess,
+)
+from griptape_nodes.retained_mode.events.library_events import (
+    RegisterLibraryFromFileRequest,
+    RegisterLibraryFromFileResultSuccess,
+)
+from griptape_nodes.retained_mode.events.node_events import CreateNodeRequest, CreateNodeResultSuccess
+from griptape_nodes.retained_mode.events.object_events import ClearAllObjectStateRequest
+from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from websockets.asyncio.server import ServerConnection
+
+FIXTURE_LIBRARY_DIR = Path(__file__).parent / "fixtures" / "worker_library"
+FIXTURE_LIBRARY_JSON_TEMPLATE = FIXTURE_LIBRARY_DIR / "griptape_nodes_library.json"
+FIXTURE_NODE_FILE = FIXTURE_LIBRARY_DIR / "worker_nodes.py"
+
+
+def _materialize_library(target_dir: Path) -> Path:
+    from griptape_nodes.utils.version_utils import engine_version
+
+    target_dir.mkdir(parents=True, exist_ok=True)
+    schema = json.loads(FIXTURE_LIBRARY_JSON_TEMPLATE.read_text())
+    schema["metadata"]["engine_version"] = engine_version
+    library_json = target_dir / "griptape_nodes_library.json"
+    library_json.write_text(json.dumps(schema, indent=2))
+    (target_dir / FIXTURE_NODE_FILE.name).write_text(FIXTURE_NODE_FILE.read_text())
+    return library_json
+
+
+def _write_isolated_config(config_root: Path, *, workspace: Path, library_path: Path) -> None:
+    config_dir = config_root / "griptape_nodes"
+    config_dir.mkdir(parents=True, exist_ok=True)
+    config_path = config_dir / "griptape_nodes_config.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "workspace_directory": str(workspace),
+                "log_level": "WARNING",
+                "app_events": {
+                    "on_app_initialization_complete": {
+                        "libraries_to_register": [str(library_path)],
+                    },
+                },
+            }
+        )
+    )
+
+
+def _generate_text_workflow_source(library_json: Path) -> str:
+    """Build a Start -> End flow that passes `text` along, and serialize it to a Python module."""
+    GriptapeNodes.handle_request(ClearAllObjectStateRequest(i_know_what_im_doing=True))
+
+    register_result = GriptapeNodes.handle_request(RegisterLibraryFromFileRequest(file_path=str(library_json)))
+    assert isinstance(register_result, RegisterLibraryFromFileResultSuccess), register_result
+
+    GriptapeNodes.ContextManager().push_workflow(workflow_name="worker_e2e_workflow")
+
+    flow_result = GriptapeNodes.handle_request(
+        CreateFlowRequest(parent_flow_name=None, flow_name="ControlFlow_1", set_as_new_context=False)
+    )
+    assert isinstance(flow_result, CreateFlowResultSuccess), flow_result
+
+    for node_type, node_name in (("TextStartNode", "Start"), ("TextEndNode", "End")):
+        node_result = GriptapeNodes.handle_request(
+            CreateNodeRequest(
+                node_type=node_type,
+                specific_library_name="Worker Library",
+                node_name=node_name,
+                override_parent_flow_name=flow_result.flow_name,
+            )
+        )
+        assert isinstance(node_result, CreateNodeResultSuccess), node_result
+
+    for source_parameter, target_parameter in (("exec_out", "exec_in"), ("text", "text")):
+        connection_result = GriptapeNodes.handle_request(
+            CreateConnectionRequest(
+                source_node_name="Start",
+                source_parameter_name=source_parameter,
+                target_node_name="End",
+                target_parameter_name=target_parameter,
+            )
+        )
+        assert isinstance(connection_result, CreateConnectionResultSuccess), connection_result
+
+    serialize_result = GriptapeNodes.handle_request(SerializeFlowToCommandsRequest(flow_name=flow_result.flow_name))
+    assert isinstance(serialize_result, SerializeFlowToCommandsResultSuccess), serialize_result
+
+    metadata = WorkflowMetadata(
+        name="worker_e2e_workflow",
+        schema_version=WorkflowMetadata.LATEST_SCHEMA_VERSION,
+        engine_version_created_with="0.0.0",
+        node_libraries_referenced=list(serialize_result.serialized_flow_commands.node_dependencies.libraries),
+        workflow_shape=None,
+    )
+    return GriptapeNodes.WorkflowManager()._generate_workflow_file_content(
+        serialized_flow_commands=serialize_result.serialized_flow_commands,
+        workflow_metadata=metadata,
+    )
+
+
+@pytest_asyncio.fixture
+async def broker_url() -> AsyncIterator[str]:
+    """Run a WebSocket broker that relays each published message to the topic's subscribers."""
+    subscribers: dict[str, set[ServerConnection]] = {}
+
+    async def handle(connection: ServerConnection) -> None:
+        try:
+            async for frame in connection:
+                message = json.loads(frame)
+                topic = message.get("topic")
+                if message.get("type") == "subscribe":
+                    subscribers.setdefault(topic, set()).add(connection)
+                elif message.get("type") == "unsubscribe":
+                    subscribers.get(topic, set()).discard(connection)
+                else:
+                    for subscriber in list(subscribers.get(topic, ())):
+                        await subscriber.send(frame)
+        finally:
+            for connections in subscribers.values():
+                connections.discard(connection)
+
+    async with serve(handle, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        yield f"http://127.0.0.1:{port}"
+
+
+def _end_text(output: dict[str, Any]) -> Any:
+    """Read the End node's `text` from a worker result; the worker pickles output values by reference."""
+    end_output = output["End"]
+    value_uuid = end_output["parameter_output_values"]["text"]
+    return pickle.loads(end_output["unique_parameter_uuid_to_values"][value_uuid])  # noqa: S301
+
+
+@pytest.mark.skipif(
+    not FIXTURE_LIBRARY_JSON_TEMPLATE.exists(),
+    reason=f"Worker Library fixture missing at {FIXTURE_LIBRARY_JSON_TEMPLATE}",
+)
+@pytest.mark.asyncio
+async def test_warm_worker_does_not_leak_values_between_jobs(
+    tmp_path: Path, broker_url: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A job that leaves a start node value unset must see the workflow's value, not the last job's."""
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    config_root = tmp_path / "xdg_config"
+    library_json = _materialize_library(tmp_path / "library")
+    _write_isolated_config(config_root, workspace=workspace, library_path=library_json)
+
+    workflow_path = tmp_path / "worker_workflow.py"
+    workflow_path.write_text(_generate_text_workflow_source(library_json))
+
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(config_root))
+    monkeypatch.setenv("GRIPTAPE_NODES_API_BASE_URL", broker_url)
+    # Engine bootstrap requires GT_CLOUD_API_KEY to be set; it only reaches the local broker.
+    monkeypatch.setenv("GT_CLOUD_API_KEY", "fake-test-key-for-bootstrap")
+
+    worker = SubprocessWorkflowWorker(str(workflow_path))
+    await worker.start()
+    try:
+        first = await worker.run({"Start": {"text": "first job"}})
+        second = await worker.run({})
+    finally:
+        await worker.stop()
+
+    assert _end_text(first) == "first job"
+    assert _end_text(second) == ""
@@ -51,3 +51,68 @@ class TestClientLargePayloadWarning:
         await client._send_message(message)
 
         client._websocket.send.assert_called_once_with(json.dumps(message))
+
+
+class TestClientWireEncoding:
+    @pytest.fixture
+    def client(self) -> Client:
+        """Client with a mocked WebSocket on a plain JSON connection."""
+        c = Client(api_key="test_key", url="ws://localhost", wire_encodings=[])
+        c._websocket = AsyncMock()
+        return c
+
+    @pytest.mark.asyncio
+    async def test_publish_json_sends_payload_without_reencoding(self, client: Client) -> None:
+        """The spliced frame is byte-identical to parsing the payload and encoding the whole message."""
+        payload_json = json.dumps({"event_type": "EventRequest", "request": {"value": "ü", "n": 1.5}})
+
+        await client.publish_json("EventRequest", payload_json, "topic/a")
+
+        expected = json.dumps({"type": "EventRequest", "payload": json.loads(payload_json), "topic": "topic/a"})
+        client._websocket.send.assert_called_once_with(expected)
+
+    @pytest.mark.asyncio
+    async def test_publish_event_encodes_event_once(self, client: Client) -> None:
+        from griptape_nodes.retained_mode.events.base_events import EventRequest
+        from griptape_nodes.retained_mode.events.os_events import ReadFileRequest
+
+        event = EventRequest(request=ReadFileRequest(file_path="a.txt"), request_id="r1")
+
+        await client.publish_event("EventRequest", event, "topic/a")
+
+        sent = json.loads(client._websocket.send.call_args.args[0])
+        assert sent == {"type": "EventRequest", "payload": json.loads(event.json()), "topic": "topic/a"}
+
+    def test_offers_only_available_compact_encodings(self) -> None:
+        from unittest.mock import patch
+
+        from griptape_nodes.api_client.wire_encoding import WireEncoding
+
+        with patch.object(WireEncoding, "is_available", return_value=False):
+            unavailable = Client(api_key="k", url="ws://localhost", wire_encodings=[WireEncoding.MSGPACK])
+        with patch.object(WireEncoding, "is_available", return_value=True):
+            available = Client(
+                api_key="k", url="ws://localhost", wire_encodings=[WireEncoding.MSGPACK, WireEncoding.JSON]
+            )
+
+        assert unavailable._offered_subprotocols == []
+        assert available._offered_subprotocols == ["griptape-nodes.msgpack"]
+
+    def test_encoding_follows_accepted_subprotocol(self) -> None:
+        from griptape_nodes.api_client.wire_encoding import WireEncoding, encoding_for_subprotocol
+
+        assert encoding_for_subprotocol(None) is WireEncoding.JSON
+        assert encoding_for_subprotocol("some-other-protocol") is WireEncoding.JSON
+        assert encoding_for_subprotocol("griptape-nodes.msgpack") is WireEncoding.MSGPACK
+
+    @pytest.mark.asyncio
+    async def test_msgpack_connection_sends_binary_frames(self, client: Client) -> None:
+        msgpack = pytest.importorskip("msgpack")
+        from griptape_nodes.api_client.wire_encoding import WireEncoding, decode_message
+
+        client._wire_encoding = WireEncoding.MSGPACK
+        await client.publish_json("EventRequest", '{"request": {"n": 1}}', "topic/a")
+
+        frame = client._websocket.send.call_args.args[0]
+        assert msgpack.unpackb(frame) == {"type": "EventRequest", "payload": {"request": {"n": 1}}, "topic": "topic/a"}
+        assert decode_message(frame, WireEncoding.MSGPACK)["topic"] == "topic/a"
@@ -944,17 +944,15 @@ class TestWorkerManagerDomainEventListeners:
 
         wm._tx.send_message.assert_not_called()  # type: ignore[union-attr]
 
-    def test_broadcast_completes_when_listener_is_dispatched_via_threadrunner(
+    def test_broadcast_completes_when_listener_is_dispatched_on_side_loop(
         self, worker_manager_with_real_events: WorkerManager
     ) -> None:
-        """Production path: sync request handler -> sync broadcast_app_event -> ThreadRunner side loop.
-
-        ``EventManager.broadcast_app_event`` detects a running loop and
-        runs the listener fan-out on a transient ``ThreadRunner`` side
-        loop. If the listener schedules its fan-out via
-        ``asyncio.create_task`` and returns, the side loop is torn down
-        before the orphan task ever runs and no broadcast actually goes
-        out. The listener now awaits the broadcast inline; this test
+        """Production path: sync request handler -> sync broadcast_app_event -> sync bridge side loop.
+
+        ``EventManager.broadcast_app_event`` runs the listener fan-out on
+        a sync bridge side loop. If the listener schedules its fan-out via
+        ``asyncio.create_task`` and returns, ``broadcast_app_event``
+        returns before the orphan task has sent anything. The listener now awaits the broadcast inline; this test
         confirms the broadcast lands by the time
         ``broadcast_app_event`` returns control to the caller, even
         when the underlying transport ``await`` does not resolve
@@ -968,8 +966,7 @@ class TestWorkerManagerDomainEventListeners:
 
         # Force send_message to yield repeatedly before recording the call.
         # An orphan ``asyncio.create_task`` scheduled inside the listener
-        # would lose its race with ``ThreadRunner.__exit__`` -> ``loop.stop()``
-        # under enough yield points, so the broadcast would silently drop.
+        # would still be pending when ``broadcast_app_event`` returns.
         # ``AsyncMock`` returns synchronously which would mask the bug;
         # the production transport awaits real I/O and yields many times.
         send_calls: list[tuple] = []
@@ -984,7 +981,7 @@ class TestWorkerManagerDomainEventListeners:
         async def driver() -> None:
             # Inside this coroutine there is a running loop on the main
             # thread. ``broadcast_app_event`` is sync; calling it from
-            # here triggers the ThreadRunner side-loop branch -- the same
+            # here runs the listeners on a sync bridge side loop -- the same
             # branch that runs in production when a sync request handler
             # (e.g. ``on_handle_set_config_value_request``) calls
             # ``set_config_value`` which calls ``broadcast_app_event``.
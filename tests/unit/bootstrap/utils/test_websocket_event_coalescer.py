@@ -0,0 +1,90 @@
+"""Tests for the coalescing WebSocket send buffer."""
+
+import asyncio
+import json
+
+import pytest
+
+from griptape_nodes.bootstrap.utils.subprocess_websocket_base import WebSocketMessage
+from griptape_nodes.bootstrap.utils.websocket_event_coalescer import (
+    EVENT_BATCH_TYPE,
+    WebSocketEventCoalescer,
+    encode_batch_payload,
+    unpack_batch,
+)
+
+
+def _message(value: int, event_type: str = "execution_event") -> WebSocketMessage:
+    return WebSocketMessage(event_type, json.dumps({"value": value}), "sessions/s/response")
+
+
+class TestWebSocketEventCoalescer:
+    @pytest.mark.asyncio
+    async def test_newer_message_supersedes_older_with_same_key(self) -> None:
+        coalescer = WebSocketEventCoalescer(window_seconds=0)
+
+        coalescer.put(_message(1), ("update", "node", "out"))
+        coalescer.put(_message(2))
+        coalescer.put(_message(3), ("update", "node", "out"))
+
+        batch = await coalescer.get_batch()
+
+        assert [json.loads(m.payload)["value"] for m in batch] == [2, 3]
+        assert coalescer.superseded_count == 1
+
+    @pytest.mark.asyncio
+    async def test_messages_without_key_are_never_merged(self) -> None:
+        coalescer = WebSocketEventCoalescer(window_seconds=0)
+
+        for value in range(3):
+            coalescer.put(_message(value))
+
+        batch = await coalescer.get_batch()
+
+        assert [json.loads(m.payload)["value"] for m in batch] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_full_buffer_blocks_producers_until_taken(self) -> None:
+        coalescer = WebSocketEventCoalescer(window_seconds=0, max_pending=2)
+        coalescer.put(_message(1))
+        coalescer.put(_message(2))
+
+        waiter = asyncio.create_task(coalescer.wait_for_capacity())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await coalescer.get_batch()
+        await asyncio.wait_for(waiter, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_join_waits_for_batch_done(self) -> None:
+        coalescer = WebSocketEventCoalescer(window_seconds=0)
+        coalescer.put(_message(1))
+
+        await coalescer.get_batch()
+        joiner = asyncio.create_task(coalescer.join())
+        await asyncio.sleep(0)
+        assert not joiner.done()
+
+        coalescer.batch_done()
+        await asyncio.wait_for(joiner, timeout=1)
+
+
+class TestBatchEnvelope:
+    def test_unpack_round_trips_encoded_batch(self) -> None:
+        messages = [_message(1), _message(2, "success_result")]
+        envelope = {
+            "type": EVENT_BATCH_TYPE,
+            "payload": json.loads(encode_batch_payload(messages)),
+            "topic": "sessions/s/response",
+        }
+
+        assert unpack_batch(envelope) == [
+            {"type": "execution_event", "payload": {"value": 1}, "topic": "sessions/s/response"},
+            {"type": "success_result", "payload": {"value": 2}, "topic": "sessions/s/response"},
+        ]
+
+    def test_unpack_passes_other_messages_through(self) -> None:
+        message = {"type": "execution_event", "payload": {}, "topic": "t"}
+
+        assert unpack_batch(message) == [message]
@@ -1,12 +1,55 @@
-"""Unit tests for LocalSessionWorkflowExecutor's CLI surface (issue #4599)."""
+"""Unit tests for LocalSessionWorkflowExecutor's CLI surface (issue #4599) and event coalescing."""
 
+import json
 from argparse import ArgumentParser
 from pathlib import Path
 
+import pytest
+
+from griptape_nodes.bootstrap.utils.subprocess_websocket_base import WebSocketMessage
+from griptape_nodes.bootstrap.utils.websocket_event_coalescer import WebSocketEventCoalescer
 from griptape_nodes.bootstrap.workflow_executors.local_session_workflow_executor import (
     LocalSessionWorkflowExecutor,
+    _coalesce_key,
 )
 from griptape_nodes.drivers.storage import StorageBackend
+from griptape_nodes.retained_mode.events.base_events import ExecutionEvent
+from griptape_nodes.retained_mode.events.execution_events import GriptapeEvent, ParameterValueUpdateEvent
+
+
+async def _send_in_one_window(payloads: list) -> list[dict]:
+    """Queue each payload the way the executor does and return the payloads of the batch that goes out."""
+    coalescer = WebSocketEventCoalescer(window_seconds=0)
+    for payload in payloads:
+        message = WebSocketMessage("execution_event", ExecutionEvent(payload=payload).json(), "sessions/s/response")
+        coalescer.put(message, _coalesce_key(payload))
+    batch = await coalescer.get_batch()
+    return [json.loads(message.payload)["payload"] for message in batch]
+
+
+class TestCoalesceKey:
+    @pytest.mark.asyncio
+    async def test_every_appended_delta_arrives(self) -> None:
+        deltas = ["Hel", "lo, ", "world"]
+        payloads = [
+            GriptapeEvent(node_name="agent", parameter_name="output", type="TextChunkEvent", value=delta)
+            for delta in deltas
+        ]
+
+        sent = await _send_in_one_window(payloads)
+
+        assert [payload["value"] for payload in sent] == deltas
+
+    @pytest.mark.asyncio
+    async def test_only_the_latest_parameter_value_arrives(self) -> None:
+        payloads = [
+            ParameterValueUpdateEvent(node_name="agent", parameter_name="output", data_type="str", value=value)
+            for value in ["draft", "final"]
+        ]
+
+        sent = await _send_in_one_window(payloads)
+
+        assert [payload["value"] for payload in sent] == ["final"]
 
 
 class TestLocalSessionWorkflowExecutorCli:
@@ -104,6 +104,30 @@ class TestLoadProject:
         assert mock_gn.ahandle_request.call_count == EXPECTED_REQUEST_COUNT
 
 
+class TestExit:
+    """Tests for LocalWorkflowExecutor.__aexit__."""
+
+    @pytest.mark.asyncio
+    async def test_exit_shuts_down_node_thread_pool(self) -> None:
+        executor = LocalWorkflowExecutor.__new__(LocalWorkflowExecutor)
+        executor._save_on_failure_path = None
+
+        with patch(f"{MODULE_PATH}.shutdown_node_thread_pool") as mock_shutdown:
+            await executor.__aexit__(None, None, None)
+
+        mock_shutdown.assert_called_once_with(wait=False)
+
+    @pytest.mark.asyncio
+    async def test_exit_shuts_down_preview_process_pool(self) -> None:
+        executor = LocalWorkflowExecutor.__new__(LocalWorkflowExecutor)
+        executor._save_on_failure_path = None
+
+        with patch(f"{MODULE_PATH}.shutdown_preview_process_pool") as mock_shutdown:
+            await executor.__aexit__(None, None, None)
+
+        mock_shutdown.assert_called_once_with(wait=False)
+
+
 class TestLocalWorkflowExecutorCli:
     """Tests for LocalWorkflowExecutor's CLI surface (issue #4599)."""
 
@@ -0,0 +1,168 @@
+"""Tests for the warm subprocess workflow worker pool."""
+
+# ruff: noqa: PLR2004
+
+import asyncio
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from griptape_nodes.bootstrap.workflow_executors.subprocess_workflow_worker_pool import (
+    WORKER_READY_EVENT,
+    WORKER_RESULT_EVENT,
+    SubprocessWorkflowWorker,
+    SubprocessWorkflowWorkerError,
+    SubprocessWorkflowWorkerPool,
+)
+
+_WORKER_PATH = "griptape_nodes.bootstrap.workflow_executors.subprocess_workflow_worker_pool.SubprocessWorkflowWorker"
+
+
+class FakeWorker:
+    """Stands in for SubprocessWorkflowWorker without spawning a process."""
+
+    instances: list["FakeWorker"] = []  # noqa: RUF012
+    running = 0
+    max_running = 0
+
+    def __init__(self, **_kwargs: Any) -> None:
+        self.started = False
+        self.stopped = False
+        self.alive = True
+        self.busy = False
+        self.jobs: list[dict] = []
+        FakeWorker.instances.append(self)
+
+    @property
+    def is_idle(self) -> bool:
+        return self.started and self.alive and not self.stopped and not self.busy
+
+    async def start(self) -> None:
+        await asyncio.sleep(0)
+        self.started = True
+
+    async def run(self, flow_input: dict[str, Any]) -> dict[str, Any]:
+        self.busy = True
+        FakeWorker.running += 1
+        FakeWorker.max_running = max(FakeWorker.max_running, FakeWorker.running)
+        try:
+            await asyncio.sleep(0.01)
+            if flow_input.get("crash"):
+                self.alive = False
+                msg = "worker died"
+                raise SubprocessWorkflowWorkerError(msg)
+            self.jobs.append(flow_input)
+            return {"End": {"parameter_output_values": flow_input}}
+        finally:
+            FakeWorker.running -= 1
+            self.busy = False
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+
+@pytest.fixture
+def fake_worker() -> Any:
+    """Patch the pool to create FakeWorkers and reset their shared counters."""
+    FakeWorker.instances = []
+    FakeWorker.running = 0
+    FakeWorker.max_running = 0
+    with patch(_WORKER_PATH, FakeWorker):
+        yield FakeWorker
+
+
+class TestSubprocessWorkflowWorkerPool:
+    """Tests for job scheduling on SubprocessWorkflowWorkerPool."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_warm_workers_and_bounds_concurrency(self, fake_worker: type[FakeWorker]) -> None:
+        async with SubprocessWorkflowWorkerPool("workflow.py", max_workers=2) as pool:
+            results = await asyncio.gather(*(pool.arun({"i": i}) for i in range(6)))
+
+        assert [output["End"]["parameter_output_values"]["i"] for output, _ in results] == list(range(6))
+        assert len(fake_worker.instances) == 2
+        assert pool.workers_started == 2
+        assert fake_worker.max_running == 2
+        assert all(worker.stopped for worker in fake_worker.instances)
+
+    @pytest.mark.asyncio
+    async def test_only_jobs_that_start_a_worker_report_startup(self, fake_worker: type[FakeWorker]) -> None:
+        async with SubprocessWorkflowWorkerPool("workflow.py", max_workers=1) as pool:
+            timings = [(await pool.arun({"i": i}))[1] for i in range(3)]
+
+        assert len(fake_worker.instances) == 1
+        assert timings[0].startup_s > 0
+        assert [timing.startup_s for timing in timings[1:]] == [0.0, 0.0]
+        assert all(timing.run_s > 0 for timing in timings)
+
+    @pytest.mark.asyncio
+    async def test_replaces_a_worker_that_died(self, fake_worker: type[FakeWorker]) -> None:
+        async with SubprocessWorkflowWorkerPool("workflow.py", max_workers=1) as pool:
+            with pytest.raises(SubprocessWorkflowWorkerError):
+                await pool.arun({"crash": True})
+            await pool.arun({"i": 1})
+
+        assert len(fake_worker.instances) == 2
+        assert fake_worker.instances[0].stopped
+        assert fake_worker.instances[1].jobs == [{"i": 1}]
+
+    def test_rejects_empty_pool(self) -> None:
+        with pytest.raises(ValueError, match="max_workers"):
+            SubprocessWorkflowWorkerPool("workflow.py", max_workers=0)
+
+
+class TestSubprocessWorkflowWorkerEvents:
+    """Tests for how SubprocessWorkflowWorker matches WebSocket events to jobs."""
+
+    @staticmethod
+    def _make_pending_worker(job_id: int = 3) -> tuple[SubprocessWorkflowWorker, asyncio.Future]:
+        worker = SubprocessWorkflowWorker("workflow.py", session_id="session")
+        job = asyncio.get_running_loop().create_future()
+        worker._pending_job_id = job_id
+        worker._pending_job = job
+        return worker, job
+
+    @pytest.mark.asyncio
+    async def test_result_event_resolves_job_with_control_flow_output(self) -> None:
+        worker, job = self._make_pending_worker()
+        worker._job_output = {"End": {"parameter_output_values": {"x": 1}}}
+
+        await worker._handle_subprocess_event(
+            {"type": WORKER_RESULT_EVENT, "payload": {"job_id": 3, "succeeded": True}}
+        )
+
+        assert job.result() == {"End": {"parameter_output_values": {"x": 1}}}
+
+    @pytest.mark.asyncio
+    async def test_failed_result_event_fails_job(self) -> None:
+        worker, job = self._make_pending_worker()
+
+        await worker._handle_subprocess_event(
+            {"type": WORKER_RESULT_EVENT, "payload": {"job_id": 3, "succeeded": False, "error": "boom"}}
+        )
+
+        with pytest.raises(SubprocessWorkflowWorkerError, match="boom"):
+            job.result()
+
+    @pytest.mark.asyncio
+    async def test_result_event_for_another_job_is_ignored(self) -> None:
+        worker, job = self._make_pending_worker()
+
+        await worker._handle_subprocess_event(
+            {"type": WORKER_RESULT_EVENT, "payload": {"job_id": 2, "succeeded": True}}
+        )
+
+        assert not job.done()
+
+    @pytest.mark.asyncio
+    async def test_failed_ready_event_fails_start(self) -> None:
+        worker = SubprocessWorkflowWorker("workflow.py", session_id="session")
+        worker._ready = asyncio.get_running_loop().create_future()
+
+        await worker._handle_subprocess_event(
+            {"type": WORKER_READY_EVENT, "payload": {"succeeded": False, "error": "missing library"}}
+        )
+
+        with pytest.raises(SubprocessWorkflowWorkerError, match="missing library"):
+            worker._ready.result()
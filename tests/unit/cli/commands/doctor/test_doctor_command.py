@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -9,6 +10,11 @@ import typer
 
 from griptape_nodes.cli.commands.doctor import doctor_command
 from griptape_nodes.cli.commands.doctor.base import CheckResult
+from griptape_nodes.cli.commands.doctor.startup_report import StartupProfileError
+from griptape_nodes.common.startup_tracer import StartupSpan
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 _MODULE = "griptape_nodes.cli.commands.doctor"
 
@@ -51,3 +57,41 @@ class TestDoctorCommand:
             doctor_command()
 
         mock_check.run.assert_called_once()
+
+    def test_startup_option_reports_instead_of_running_checks(self, tmp_path: Path) -> None:
+        """doctor_command(startup=True) profiles startup and skips the health checks."""
+        spans = [StartupSpan(name="engine startup", category="startup", start_s=0.0, duration_s=1.5, thread_id=1)]
+        trace_output = tmp_path / "trace.json"
+
+        with (
+            patch(f"{_MODULE}.WebSocketConnectionCheck") as check_class,
+            patch(f"{_MODULE}.profile_startup", return_value=(spans, [])),
+            patch(f"{_MODULE}.console"),
+            patch("griptape_nodes.cli.commands.doctor.startup_report.console"),
+        ):
+            doctor_command(startup=True, trace_output=str(trace_output), top=5)
+
+        check_class.assert_not_called()
+        assert trace_output.exists()
+
+    def test_startup_session_option_starts_a_session_in_the_probe(self, tmp_path: Path) -> None:
+        """doctor_command(startup_session=True) asks the traced start to start a session."""
+        with (
+            patch(f"{_MODULE}.profile_startup", return_value=([], [])) as profile,
+            patch(f"{_MODULE}.console"),
+            patch("griptape_nodes.cli.commands.doctor.startup_report.console"),
+        ):
+            doctor_command(startup=True, startup_session=True, trace_output=str(tmp_path / "trace.json"))
+
+        profile.assert_called_once_with(start_session=True)
+
+    def test_startup_option_exits_one_when_profiling_fails(self) -> None:
+        """doctor_command(startup=True) raises typer.Exit with code 1 when the traced start fails."""
+        with (
+            patch(f"{_MODULE}.profile_startup", side_effect=StartupProfileError("boom")),
+            patch(f"{_MODULE}.console"),
+            pytest.raises(typer.Exit) as exc_info,
+        ):
+            doctor_command(startup=True)
+
+        assert exc_info.value.exit_code == 1
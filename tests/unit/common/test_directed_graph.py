@@ -2,6 +2,8 @@
 
 # ruff: noqa: PLR2004
 
+import pytest
+
 from griptape_nodes.common.directed_graph import DirectedGraph
 
 
@@ -205,6 +207,64 @@ class TestDirectedGraph:
         leaf_nodes = [n for n in graph.nodes() if graph.in_degree(n) == 0]
 
         assert set(leaf_nodes) == {"root1", "root2", "isolated"}
+        assert graph.leaf_nodes() == {"root1", "root2", "isolated"}
+
+    def test_leaf_nodes_tracked_incrementally(self) -> None:
+        """Test that leaf_nodes() follows edge additions and node removals."""
+        graph = DirectedGraph()
+        graph.add_node("B")
+        assert graph.leaf_nodes() == {"B"}
+
+        # Gaining a predecessor means B is no longer a leaf
+        graph.add_edge("A", "B")
+        graph.add_edge("A", "C")
+        graph.add_edge("B", "C")
+        assert graph.leaf_nodes() == {"A"}
+
+        graph.remove_node("A")
+        assert graph.leaf_nodes() == {"B"}
+
+        graph.remove_node("B")
+        assert graph.leaf_nodes() == {"C"}
+
+        graph.clear()
+        assert graph.leaf_nodes() == set()
+
+    def test_leaf_and_sink_nodes_are_live_views(self) -> None:
+        """Test that leaf_nodes() and sink_nodes() both reflect later mutations without being re-read."""
+        graph = DirectedGraph()
+        graph.add_edge("A", "B")
+        leaf_nodes = graph.leaf_nodes()
+        sink_nodes = graph.sink_nodes()
+
+        graph.remove_node("A")
+
+        assert leaf_nodes == {"B"}
+        assert sink_nodes == {"B"}
+
+    def test_remove_node_returns_newly_ready_successors(self) -> None:
+        """Test that remove_node reports only the successors that became leaves."""
+        graph = DirectedGraph()
+        graph.add_edge("A", "B")
+        graph.add_edge("A", "C")
+        graph.add_edge("D", "C")
+
+        # C still waits on D, so only B becomes ready
+        assert graph.remove_node("A") == {"B"}
+        assert graph.remove_node("D") == {"C"}
+        assert graph.remove_node("nonexistent") == set()
+
+    def test_contains_does_not_require_nodes_copy(self) -> None:
+        """Test membership checks directly against the graph."""
+        graph = DirectedGraph()
+        graph.add_edge("A", "B")
+
+        assert "A" in graph
+        assert "B" in graph
+        assert "C" not in graph
+
+        graph.remove_node("A")
+        assert "A" not in graph
 
     def test_multiple_edges_same_direction(self) -> None:
         """Test that multiple edges in the same direction don't increase in_degree."""
@@ -224,11 +284,80 @@ class TestDirectedGraph:
         assert graph.nodes() == set()
 
         # in_degree should raise KeyError for nonexistent nodes
-        import pytest
-
         with pytest.raises(KeyError):
             graph.in_degree("any_node")
 
         # These operations should not raise errors
         graph.remove_node("nonexistent")
         graph.clear()
+
+    def test_successors_and_predecessors(self) -> None:
+        """Test the adjacency views in both directions."""
+        graph = DirectedGraph()
+        graph.add_edge("A", "B")
+        graph.add_edge("A", "C")
+        graph.add_edge("B", "C")
+
+        assert graph.successors("A") == {"B", "C"}
+        assert graph.successors("C") == set()
+        assert graph.predecessors("C") == {"A", "B"}
+        assert graph.predecessors("A") == set()
+
+        graph.remove_node("B")
+        assert graph.successors("A") == {"C"}
+        assert graph.predecessors("C") == {"A"}
+
+        with pytest.raises(KeyError):
+            graph.successors("B")
+        with pytest.raises(KeyError):
+            graph.predecessors("B")
+
+    def test_out_degree(self) -> None:
+        """Test out_degree follows edge additions and node removals."""
+        graph = DirectedGraph()
+        graph.add_edge("A", "B")
+        graph.add_edge("A", "C")
+        graph.add_edge("B", "C")
+
+        assert graph.out_degree("A") == 2
+        assert graph.out_degree("B") == 1
+        assert graph.out_degree("C") == 0
+
+        graph.remove_node("C")
+        assert graph.out_degree("A") == 1
+        assert graph.out_degree("B") == 0
+
+        with pytest.raises(KeyError):
+            graph.out_degree("C")
+
+    def test_sink_nodes_tracked_incrementally(self) -> None:
+        """Test that sink_nodes() reflects nodes with no outgoing edges."""
+        graph = DirectedGraph()
+        graph.add_edge("A", "B")
+        graph.add_edge("A", "C")
+        graph.add_node("isolated")
+
+        assert set(graph.sink_nodes()) == {"B", "C", "isolated"}
+
+        graph.remove_node("B")
+        graph.remove_node("C")
+        assert set(graph.sink_nodes()) == {"A", "isolated"}
+
+    def test_iterating_graph_yields_nodes(self) -> None:
+        """Test that the graph can be iterated without calling nodes()."""
+        graph = DirectedGraph()
+        graph.add_edge("A", "B")
+        graph.add_node("C")
+
+        assert set(graph) == {"A", "B", "C"}
+
+    def test_remove_node_with_self_loop(self) -> None:
+        """Test that a self-loop doesn't break removal bookkeeping."""
+        graph = DirectedGraph()
+        graph.add_edge("A", "A")
+        graph.add_edge("A", "B")
+
+        assert graph.remove_node("A") == {"B"}
+        assert graph.nodes() == {"B"}
+        assert graph.leaf_nodes() == {"B"}
+        assert set(graph.sink_nodes()) == {"B"}
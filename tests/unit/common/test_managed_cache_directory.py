@@ -0,0 +1,164 @@
+"""Tests for `griptape_nodes.common.managed_cache_directory`."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from griptape_nodes.common import managed_cache_directory
+from griptape_nodes.common.managed_cache_directory import CacheEvictionPolicy, ManagedCacheDirectory
+from griptape_nodes.retained_mode.events.os_events import (
+    CopyFileRequest,
+    CopyFileResultSuccess,
+    RenameFileRequest,
+    RenameFileResultSuccess,
+)
+from griptape_nodes.retained_mode.managers.os_manager import OSManager
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write(path: Path, size: int, mtime: float) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def _managed(tmp_path: Path, **kwargs: object) -> ManagedCacheDirectory:
+    return ManagedCacheDirectory(tmp_path / "cache", index_path=tmp_path / "index.json", **kwargs)  # type: ignore[arg-type]
+
+
+class TestManagedCacheDirectory:
+    def test_first_use_indexes_nested_files(self, tmp_path: Path) -> None:
+        _write(tmp_path / "cache" / "a.bin", 100, 1_000)
+        _write(tmp_path / "cache" / "nested" / "b.bin", 50, 2_000)
+
+        managed = _managed(tmp_path)
+
+        assert managed.size_bytes == 150  # noqa: PLR2004
+        assert managed.file_count == 2  # noqa: PLR2004
+
+    def test_record_write_and_forget_update_size_without_rescanning(self, tmp_path: Path) -> None:
+        (tmp_path / "cache").mkdir()
+        managed = _managed(tmp_path)
+        assert managed.size_bytes == 0
+
+        written = _write(tmp_path / "cache" / "a.bin", 100, 1_000)
+        managed.record_write(written)
+        assert managed.size_bytes == 100  # noqa: PLR2004
+
+        _write(written, 40, 1_001)
+        managed.record_write(written)
+        assert managed.size_bytes == 40  # noqa: PLR2004
+
+        written.unlink()
+        managed.forget(written)
+        assert managed.size_bytes == 0
+
+    def test_forgetting_the_directory_itself_forgets_every_file(self, tmp_path: Path) -> None:
+        _write(tmp_path / "cache" / "a.bin", 100, 1_000)
+        _write(tmp_path / "cache" / "nested" / "b.bin", 50, 2_000)
+        managed = _managed(tmp_path)
+        assert managed.file_count == 2  # noqa: PLR2004
+
+        managed.forget(tmp_path / "cache")
+
+        assert (managed.file_count, managed.size_bytes) == (0, 0)
+
+    def test_lru_evicts_oldest_until_under_target(self, tmp_path: Path) -> None:
+        for i in range(5):
+            _write(tmp_path / "cache" / f"{i}.bin", 100, 1_000 + i)
+        managed = _managed(tmp_path)
+
+        result = managed.evict_to(250)
+
+        assert result.removed_count == 3  # noqa: PLR2004
+        assert result.size_bytes == 200  # noqa: PLR2004
+        assert sorted(path.name for path in (tmp_path / "cache").iterdir()) == ["3.bin", "4.bin"]
+
+    def test_lfu_keeps_frequently_read_files(self, tmp_path: Path) -> None:
+        for i in range(3):
+            _write(tmp_path / "cache" / f"{i}.bin", 100, 1_000 + i)
+        managed = _managed(tmp_path, eviction_policy=CacheEvictionPolicy.LFU)
+        for _ in range(3):
+            managed.record_access(tmp_path / "cache" / "0.bin")
+
+        managed.evict_to(100)
+
+        assert [path.name for path in (tmp_path / "cache").iterdir()] == ["0.bin"]
+
+    def test_access_history_survives_restart(self, tmp_path: Path) -> None:
+        for i in range(2):
+            _write(tmp_path / "cache" / f"{i}.bin", 100, 1_000 + i)
+        managed = _managed(tmp_path, eviction_policy=CacheEvictionPolicy.LFU)
+        managed.record_access(tmp_path / "cache" / "0.bin")
+        managed.flush(force=True)
+
+        restarted = _managed(tmp_path, eviction_policy=CacheEvictionPolicy.LFU)
+        restarted.evict_to(100)
+
+        assert [path.name for path in (tmp_path / "cache").iterdir()] == ["0.bin"]
+
+    def test_evict_if_needed_rescans_stale_index(self, tmp_path: Path) -> None:
+        _write(tmp_path / "cache" / "a.bin", 100, 1_000)
+        managed = _managed(tmp_path, max_size_bytes=150, rescan_interval_seconds=0)
+        assert managed.evict_if_needed() is None
+
+        # Written behind the engine's back; only a rescan sees it
+        _write(tmp_path / "cache" / "b.bin", 100, 2_000)
+        result = managed.evict_if_needed()
+
+        assert result is not None
+        assert result.removed_count == 1
+        assert [path.name for path in (tmp_path / "cache").iterdir()] == ["b.bin"]
+
+
+class TestCleanupDirectoryIfNeeded:
+    def test_each_call_counts_files_written_behind_the_engine(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(managed_cache_directory, "CACHE_DIRECTORY_INDEX_DIR", tmp_path / "index")
+        monkeypatch.setattr(managed_cache_directory, "_directories", {})
+        cache = tmp_path / "cache"
+        _write(cache / "a.bin", 600_000, 1_000)
+        max_size_gb = 1_000_000 / (1024 * 1024 * 1024)
+        assert not OSManager.cleanup_directory_if_needed(cache, max_size_gb)
+
+        _write(cache / "b.bin", 600_000, 2_000)
+
+        assert OSManager.cleanup_directory_if_needed(cache, max_size_gb)
+        assert [path.name for path in cache.iterdir()] == ["b.bin"]
+
+
+class TestOSManagerCacheDirectoryUpdates:
+    @pytest.fixture
+    def managed(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ManagedCacheDirectory:
+        monkeypatch.setattr(managed_cache_directory, "CACHE_DIRECTORY_INDEX_DIR", tmp_path / "index")
+        monkeypatch.setattr(managed_cache_directory, "_directories", {})
+        (tmp_path / "cache").mkdir()
+        managed = managed_cache_directory.get_managed_cache_directory(tmp_path / "cache")
+        managed.max_size_bytes = 1_000_000
+        return managed
+
+    @pytest.mark.usefixtures("griptape_nodes")
+    def test_copy_and_rename_update_the_size_index(self, tmp_path: Path, managed: ManagedCacheDirectory) -> None:
+        source = _write(tmp_path / "source.bin", 100, 1_000)
+        os_manager = OSManager()
+
+        copy_result = os_manager.on_copy_file_request(
+            CopyFileRequest(source_path=str(source), destination_path=str(tmp_path / "cache" / "a.bin"))
+        )
+        assert isinstance(copy_result, CopyFileResultSuccess)
+        assert managed.size_bytes == 100  # noqa: PLR2004
+
+        rename_result = os_manager.on_rename_file_request(
+            RenameFileRequest(
+                old_path=str(tmp_path / "cache" / "a.bin"), new_path=str(tmp_path / "moved.bin"), workspace_only=False
+            )
+        )
+        assert isinstance(rename_result, RenameFileResultSuccess)
+        assert (managed.file_count, managed.size_bytes) == (0, 0)
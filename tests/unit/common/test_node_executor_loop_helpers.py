@@ -10,15 +10,27 @@ These tests cover small, near-pure helpers that decide loop control flow:
   pair has fired its control output.
 * ``_find_source_for_control_param`` - return the first source for a given
   control parameter name, or None.
+* ``_get_loop_subprocess_worker_limit`` - cap how many iterations run in
+  subprocesses at once.
+* ``_run_loop_iterations_in_fresh_subprocesses`` - run iterations in bounded
+  fresh subprocesses.
+* ``_LoopResultsStream`` - stream finished iterations' results into the End node
+  in iteration order.
+* ``_get_live_loop_iteration_limit`` - cap how many local iteration flows are
+  live at once.
+* ``_execute_loop_iterations_locally`` - run local iterations through a sliding
+  window of live flows.
 """
 
+import asyncio
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from griptape_nodes.common.node_executor import NodeExecutor
+from griptape_nodes.common.node_executor import NodeExecutor, _LoopResultsStream
 from griptape_nodes.exe_types.base_iterative_nodes import BaseIterativeEndNode
+from griptape_nodes.exe_types.node_groups import BaseIterativeNodeGroup
 
 _GRIPTAPE_NODES_PATH = "griptape_nodes.common.node_executor.GriptapeNodes"
 
@@ -253,3 +265,232 @@ class TestFindSourceForControlParam:
             result = executor._find_source_for_control_param([], "break_loop")
 
         assert result is None
+
+
+class TestGetLoopSubprocessWorkerLimit:
+    """_get_loop_subprocess_worker_limit caps subprocess concurrency by setting, CPU count and iterations."""
+
+    @staticmethod
+    def _limit(configured: int | None, total_iterations: int, cpu_count: int | None = 4) -> int:
+        with (
+            patch(_GRIPTAPE_NODES_PATH) as mock_gn,
+            patch("griptape_nodes.common.node_executor.os.cpu_count", return_value=cpu_count),
+        ):
+            mock_gn.ConfigManager.return_value.get_config_value.return_value = configured
+            return _make_executor()._get_loop_subprocess_worker_limit(total_iterations)
+
+    def test_uses_configured_value(self) -> None:
+        assert self._limit(configured=3, total_iterations=10) == 3  # noqa: PLR2004
+
+    def test_defaults_to_cpu_count(self) -> None:
+        assert self._limit(configured=None, total_iterations=10) == 4  # noqa: PLR2004
+
+    def test_never_exceeds_iterations(self) -> None:
+        assert self._limit(configured=8, total_iterations=2) == 2  # noqa: PLR2004
+
+    def test_is_at_least_one(self) -> None:
+        assert self._limit(configured=None, total_iterations=0, cpu_count=None) == 1
+
+
+class TestRunLoopIterationsInFreshSubprocesses:
+    """_run_loop_iterations_in_fresh_subprocesses bounds how many subprocesses run at once."""
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrency_and_keeps_iteration_order(self) -> None:
+        running = 0
+        max_running = 0
+
+        async def fake_execute_subprocess(**kwargs: Any) -> dict:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if kwargs["flow_input"]["Start"]["i"] == 2:  # noqa: PLR2004
+                msg = "iteration failed"
+                raise RuntimeError(msg)
+            return {"End": kwargs["flow_input"]["Start"]}
+
+        executor = _make_executor()
+        end_loop_node = MagicMock()
+        end_loop_node.name = "Loop"
+        with patch.object(executor, "_execute_subprocess", side_effect=fake_execute_subprocess):
+            outputs = await executor._run_loop_iterations_in_fresh_subprocesses(
+                flow_inputs={i: {"Start": {"i": i}} for i in range(5)},
+                workflow_path=MagicMock(),
+                file_name_prefix="loop",
+                end_loop_node=end_loop_node,
+                subflow_node=None,
+                max_concurrent=2,
+            )
+
+        assert max_running == 2  # noqa: PLR2004
+        assert [(index, success) for index, success, _ in outputs] == [
+            (0, True),
+            (1, True),
+            (2, False),
+            (3, True),
+            (4, True),
+        ]
+        assert outputs[4][2] == {"End": {"i": 4}}
+
+
+class TestLoopResultsStream:
+    """_LoopResultsStream keeps the End node's results a prefix of the final results."""
+
+    def test_extends_results_only_when_a_gap_closes(self) -> None:
+        end_node = MagicMock(spec=BaseIterativeEndNode)
+        stream = _LoopResultsStream(end_node)
+        results = {}
+
+        results[1] = "b"
+        stream.add(1, results)
+        assert end_node._results_list == []
+
+        results[0] = "a"
+        stream.add(0, results)
+        assert end_node._results_list == ["a", "b"]
+
+    def test_end_node_keeps_placeholders_for_missing_results(self) -> None:
+        end_node = MagicMock(spec=BaseIterativeEndNode)
+        stream = _LoopResultsStream(end_node)
+
+        stream.add(0, {})
+        stream.add(1, {1: "b"})
+
+        assert end_node._results_list == [None, "b"]
+
+    def test_group_drops_missing_results(self) -> None:
+        group = MagicMock(spec=BaseIterativeNodeGroup)
+        stream = _LoopResultsStream(group)
+
+        stream.add(0, {})
+        stream.add(1, {1: "b"})
+
+        assert group._results_list == ["b"]
+
+    def test_publish_is_rate_limited(self) -> None:
+        end_node = MagicMock(spec=BaseIterativeEndNode)
+        stream = _LoopResultsStream(end_node, interval_s=3600)
+        stream.publish()
+        end_node._output_results_list.assert_not_called()
+
+        stream = _LoopResultsStream(end_node, interval_s=0)
+        stream.publish()
+        end_node._output_results_list.assert_called_once()
+
+
+class TestGetLiveLoopIterationLimit:
+    """_get_live_loop_iteration_limit caps live iteration flows by setting and iteration count."""
+
+    @staticmethod
+    def _limit(configured: int | None, total_iterations: int) -> int:
+        with patch(_GRIPTAPE_NODES_PATH) as mock_gn:
+            mock_gn.ConfigManager.return_value.get_config_value.return_value = configured
+            return _make_executor()._get_live_loop_iteration_limit(total_iterations)
+
+    def test_uses_configured_value(self) -> None:
+        assert self._limit(configured=3, total_iterations=10) == 3  # noqa: PLR2004
+
+    def test_defaults_to_every_iteration(self) -> None:
+        assert self._limit(configured=None, total_iterations=10) == 10  # noqa: PLR2004
+
+    def test_never_exceeds_iterations(self) -> None:
+        assert self._limit(configured=8, total_iterations=2) == 2  # noqa: PLR2004
+
+
+class TestExecuteLoopIterationsLocally:
+    """_execute_loop_iterations_locally keeps a bounded window of live iteration flows."""
+
+    @pytest.mark.asyncio
+    async def test_bounds_live_flows_and_tears_each_down_once_finished(self) -> None:
+        live: set[str] = set()
+        max_live = 0
+        deleted: list[str] = []
+
+        async def fake_create(**kwargs: Any) -> tuple[int, str, dict[str, str]]:
+            nonlocal max_live
+            flow_name = f"flow_{kwargs['iteration_index']}"
+            live.add(flow_name)
+            max_live = max(max_live, len(live))
+            return kwargs["iteration_index"], flow_name, {"StartPkg": f"Start_{flow_name}"}
+
+        async def fake_run(flow_name: str, _start_node_name: str | None) -> bool:
+            # Later iterations finish first, so results arrive out of order
+            await asyncio.sleep(0.01 * (5 - int(flow_name.split("_")[1])))
+            if flow_name == "flow_2":
+                msg = "iteration failed"
+                raise RuntimeError(msg)
+            return True
+
+        async def fake_delete(_iteration_index: int, flow_name: str) -> None:
+            live.discard(flow_name)
+            deleted.append(flow_name)
+
+        def fake_extract(flow: tuple[int, str, dict[str, str]], *_args: Any) -> dict[int, Any]:
+            return {} if flow[0] == 2 else {flow[0]: flow[0] * 10}  # noqa: PLR2004
+
+        executor = _make_executor()
+        end_loop_node = MagicMock(spec=BaseIterativeEndNode)
+        with (
+            patch(_GRIPTAPE_NODES_PATH),
+            patch.object(executor, "_get_live_loop_iteration_limit", return_value=2),
+            patch.object(executor, "_find_endflow_param_for_iteration_results", return_value="result"),
+            patch.object(executor, "_create_loop_iteration_flow", side_effect=fake_create),
+            patch.object(executor, "_run_loop_iteration_flow", side_effect=fake_run),
+            patch.object(executor, "_delete_loop_iteration_flow", side_effect=fake_delete),
+            patch.object(executor, "_extract_iteration_result", side_effect=fake_extract),
+            patch.object(executor, "get_last_iteration_values_for_packaged_nodes", return_value={"out": 40}),
+        ):
+            results, successful, last_values = await executor._execute_loop_iterations_locally(
+                package_result=_make_package_result(),
+                total_iterations=5,
+                parameter_values_per_iteration={i: {} for i in range(5)},
+                end_loop_node=end_loop_node,
+            )
+
+        assert max_live == 2  # noqa: PLR2004
+        assert sorted(deleted) == [f"flow_{i}" for i in range(5)]
+        assert results == {0: 0, 1: 10, 2: None, 3: 30, 4: 40}
+        assert successful == [0, 1, 3, 4]
+        assert last_values == {"out": 40}
+        assert end_loop_node._results_list == [0, 10, None, 30, 40]
+
+    @pytest.mark.asyncio
+    async def test_cancels_and_tears_down_live_flows_on_failure(self) -> None:
+        deleted: list[str] = []
+        started = asyncio.Event()
+
+        async def fake_create(**kwargs: Any) -> tuple[int, str, dict[str, str]]:
+            if kwargs["iteration_index"] == 1:
+                await started.wait()
+                msg = "Failed to deserialize flow for iteration 1"
+                raise TypeError(msg)
+            return kwargs["iteration_index"], f"flow_{kwargs['iteration_index']}", {}
+
+        async def fake_run(_flow_name: str, _start_node_name: str | None) -> bool:
+            started.set()
+            await asyncio.sleep(10)
+            return True
+
+        async def fake_delete(_iteration_index: int, flow_name: str) -> None:
+            deleted.append(flow_name)
+
+        executor = _make_executor()
+        with (
+            patch(_GRIPTAPE_NODES_PATH),
+            patch.object(executor, "_get_live_loop_iteration_limit", return_value=2),
+            patch.object(executor, "_find_endflow_param_for_iteration_results", return_value=None),
+            patch.object(executor, "_create_loop_iteration_flow", side_effect=fake_create),
+            patch.object(executor, "_run_loop_iteration_flow", side_effect=fake_run),
+            patch.object(executor, "_delete_loop_iteration_flow", side_effect=fake_delete),
+            pytest.raises(TypeError, match="iteration 1"),
+        ):
+            await executor._execute_loop_iterations_locally(
+                package_result=_make_package_result(),
+                total_iterations=3,
+                parameter_values_per_iteration={i: {} for i in range(3)},
+                end_loop_node=MagicMock(spec=BaseIterativeEndNode),
+            )
+
+        assert deleted == ["flow_0"]
@@ -0,0 +1,153 @@
+"""Tests for `griptape_nodes.common.parameter_value_references`."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from griptape_nodes.common.parameter_value_references import (
+    PARAMETER_VALUE_REFERENCE_KEY,
+    ParameterValueStore,
+    clear_parameter_values,
+    is_parameter_value_reference,
+    reference_large_parameter_value,
+    remove_abandoned_parameter_value_stores,
+    summarize_parameter_value,
+    write_parameter_value,
+)
+from griptape_nodes.retained_mode.managers.settings import PARAMETER_VALUE_REFERENCE_THRESHOLD_KEY
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
+
+
+class TestWriteParameterValue:
+    def test_identical_values_share_one_file(self, tmp_path: Path) -> None:
+        value_json = json.dumps({"a": 1}).encode()
+
+        first = write_parameter_value(tmp_path / "values", value_json)
+        second = write_parameter_value(tmp_path / "values", value_json)
+
+        assert first == second
+        assert [path.name for path in (tmp_path / "values").iterdir()] == [f"{first}.json"]
+        assert json.loads((tmp_path / "values" / f"{first}.json").read_bytes()) == {"a": 1}
+
+
+class TestClearParameterValues:
+    def test_deletes_stored_values(self, tmp_path: Path) -> None:
+        write_parameter_value(tmp_path / "values", b"[1]")
+        write_parameter_value(tmp_path / "values", b"[2]")
+
+        assert clear_parameter_values(tmp_path / "values") == 2  # noqa: PLR2004
+        assert list((tmp_path / "values").iterdir()) == []
+
+    def test_missing_directory_holds_nothing(self, tmp_path: Path) -> None:
+        assert clear_parameter_values(tmp_path / "values") == 0
+
+    def _store_value_in_workflow(self, griptape_nodes: GriptapeNodes, tmp_path: Path) -> Path:
+        griptape_nodes.ConfigManager().set_config_value("workspace_directory", str(tmp_path))
+        static_files_manager = griptape_nodes.StaticFilesManager()
+        static_files_manager._static_server_base_url = "http://localhost:8124"
+        griptape_nodes.ContextManager().push_workflow(workflow_name="values_workflow")
+
+        stored = static_files_manager.store_parameter_value(b"[1, 2, 3]")
+        assert stored is not None
+        digest, url = stored
+        store_id = url.split("/")[-2]
+        value_path = tmp_path / "staticfiles" / "parameter_values" / store_id / f"{digest}.json"
+        assert value_path.is_file()
+        return value_path
+
+    def test_values_are_deleted_with_the_workflow(self, griptape_nodes: GriptapeNodes, tmp_path: Path) -> None:
+        value_path = self._store_value_in_workflow(griptape_nodes, tmp_path)
+
+        griptape_nodes.clear_current_workflow_data()
+
+        assert list(value_path.parent.iterdir()) == []
+
+    def test_workflow_executors_keep_values(self, griptape_nodes: GriptapeNodes, tmp_path: Path) -> None:
+        value_path = self._store_value_in_workflow(griptape_nodes, tmp_path)
+        griptape_nodes.StaticFilesManager().retain_parameter_values = True
+
+        griptape_nodes.clear_current_workflow_data()
+
+        assert value_path.is_file()
+
+
+class TestParameterValueStore:
+    def test_clearing_a_store_leaves_other_stores_alone(self, tmp_path: Path) -> None:
+        first = ParameterValueStore(tmp_path)
+        second = ParameterValueStore(tmp_path)
+        first.write(b"[1]")
+        digest = second.write(b"[2]")
+
+        assert first.clear() == 1
+        assert [path.name for path in second.directory.iterdir()] == [f"{digest}.json"]
+
+    def test_only_abandoned_stores_are_removed(self, tmp_path: Path) -> None:
+        live = ParameterValueStore(tmp_path)
+        live.write(b"[1]")
+        # A store whose process exited: its lock file is no longer held
+        (tmp_path / "exited").mkdir()
+        (tmp_path / "exited" / "value.json").write_bytes(b"[2]")
+        (tmp_path / "exited.lock").touch()
+        # A value stored directly in the root by an older engine
+        (tmp_path / "legacy.json").write_bytes(b"[3]")
+
+        assert remove_abandoned_parameter_value_stores(tmp_path) == 2  # noqa: PLR2004
+        assert sorted(path.name for path in tmp_path.iterdir()) == [live.store_id, f"{live.store_id}.lock"]
+        assert len(list(live.directory.iterdir())) == 1
+
+    def test_close_removes_the_store(self, tmp_path: Path) -> None:
+        store = ParameterValueStore(tmp_path)
+        store.write(b"[1]")
+
+        store.close()
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestSummarizeParameterValue:
+    def test_artifact_summary_drops_value(self) -> None:
+        artifact = {"type": "ImageArtifact", "value": "iVBOR" * 1000, "format": "png", "width": 64}
+
+        summary = summarize_parameter_value(artifact)
+
+        assert summary["artifact"] == {"type": "ImageArtifact", "format": "png", "width": 64}
+
+    def test_list_summary_reports_length(self) -> None:
+        assert summarize_parameter_value(list(range(500))) == {"python_type": "list", "length": 500}
+
+
+class TestReferenceLargeParameterValue:
+    @pytest.mark.usefixtures("griptape_nodes")
+    def test_values_are_inline_when_threshold_unset(self) -> None:
+        value = list(range(10_000))
+
+        assert reference_large_parameter_value(value) is value
+
+    def test_large_value_becomes_reference(self, griptape_nodes: GriptapeNodes) -> None:
+        griptape_nodes.ConfigManager().set_config_value(PARAMETER_VALUE_REFERENCE_THRESHOLD_KEY, 100)
+        stored = ("abc", "http://localhost:8124/static/parameter_values/store/abc.json")
+
+        with patch.object(griptape_nodes.StaticFilesManager(), "store_parameter_value", return_value=stored):
+            small = reference_large_parameter_value([1, 2, 3])
+            large_value = list(range(1000))
+            large = reference_large_parameter_value(large_value)
+
+        assert small == [1, 2, 3]
+        assert is_parameter_value_reference(large)
+        assert large[PARAMETER_VALUE_REFERENCE_KEY]["url"] == stored[1]
+        assert large[PARAMETER_VALUE_REFERENCE_KEY]["summary"]["length"] == len(large_value)
+
+    def test_value_is_inline_when_it_cannot_be_served(self, griptape_nodes: GriptapeNodes) -> None:
+        griptape_nodes.ConfigManager().set_config_value(PARAMETER_VALUE_REFERENCE_THRESHOLD_KEY, 100)
+        value = list(range(1000))
+
+        with patch.object(griptape_nodes.StaticFilesManager(), "store_parameter_value", return_value=None):
+            assert reference_large_parameter_value(value) is value
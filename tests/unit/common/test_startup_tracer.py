@@ -0,0 +1,126 @@
+"""Tests for `griptape_nodes.common.startup_tracer`."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from griptape_nodes.common import startup_tracer
+from griptape_nodes.common.startup_tracer import (
+    ModuleImportTime,
+    SpanSequence,
+    StartupSpan,
+    StartupTracer,
+    export_chrome_trace,
+    parse_importtime,
+    spans_from_chrome_trace,
+    traced_startup_phase,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        420 | io
+some unrelated warning
+import time:      1500 |       2000 |   yaml.reader
+import time:       900 |       2900 | yaml
+"""
+
+
+@pytest.fixture
+def tracer() -> Iterator[StartupTracer]:
+    """Enable the process-wide tracer for one test."""
+    tracer = startup_tracer.get_startup_tracer()
+    was_enabled = tracer.enabled
+    tracer.enabled = True
+    tracer.clear()
+    yield tracer
+    tracer.enabled = was_enabled
+    tracer.clear()
+
+
+class TestStartupTracer:
+    def test_disabled_tracer_records_nothing(self) -> None:
+        tracer = StartupTracer(enabled=False)
+
+        with tracer.span("phase"):
+            pass
+
+        assert tracer.spans() == []
+
+    def test_span_records_name_category_and_args(self) -> None:
+        tracer = StartupTracer(enabled=True)
+
+        with tracer.span("phase", "libraries", library="core"):
+            pass
+
+        [span] = tracer.spans()
+        assert (span.name, span.category, span.args) == ("phase", "libraries", {"library": "core"})
+        assert span.duration_s >= 0
+
+    def test_span_sequence_ends_each_step_when_the_next_begins(self) -> None:
+        tracer = StartupTracer(enabled=True)
+        sequence = SpanSequence(tracer, "library_lifecycle", library="core")
+
+        sequence.enter("discovered")
+        sequence.enter("evaluated")
+        sequence.close()
+
+        assert [span.name for span in tracer.spans()] == ["discovered", "evaluated"]
+        assert all(span.args == {"library": "core"} for span in tracer.spans())
+
+
+class TestTracedStartupPhase:
+    def test_sync_function(self, tracer: StartupTracer) -> None:
+        @traced_startup_phase(category="secrets")
+        def register() -> str:
+            return "done"
+
+        assert register() == "done"
+        [span] = tracer.spans()
+        assert span.name.endswith("register")
+        assert span.category == "secrets"
+
+    def test_async_function_stays_a_coroutine_function(self, tracer: StartupTracer) -> None:
+        @traced_startup_phase("load libraries", category="libraries")
+        async def load() -> int:
+            await asyncio.sleep(0)
+            return 3
+
+        assert asyncio.iscoroutinefunction(load)
+        assert asyncio.run(load()) == 3  # noqa: PLR2004
+        assert [span.name for span in tracer.spans()] == ["load libraries"]
+
+
+class TestImportTime:
+    def test_parse_importtime_reads_depth_and_skips_other_lines(self) -> None:
+        assert parse_importtime(IMPORTTIME_OUTPUT) == [
+            ModuleImportTime(module="_io", self_us=120, cumulative_us=120, depth=1),
+            ModuleImportTime(module="io", self_us=300, cumulative_us=420, depth=0),
+            ModuleImportTime(module="yaml.reader", self_us=1500, cumulative_us=2000, depth=1),
+            ModuleImportTime(module="yaml", self_us=900, cumulative_us=2900, depth=0),
+        ]
+
+
+class TestChromeTrace:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        spans = [
+            StartupSpan(name="b", category="workers", start_s=0.5, duration_s=0.25, thread_id=2),
+            StartupSpan(name="a", category="libraries", start_s=0.0, duration_s=1.0, thread_id=1, args={"n": 1}),
+        ]
+        import_times = parse_importtime(IMPORTTIME_OUTPUT)
+        trace_path = tmp_path / "trace.json"
+
+        export_chrome_trace(trace_path, spans, import_times)
+        document = json.loads(trace_path.read_text(encoding="utf-8"))
+
+        assert [event["ts"] for event in document["traceEvents"]] == [0, 500_000]
+        assert len(document["otherData"]["module_import_times_us"]) == len(import_times)
+        assert spans_from_chrome_trace(document) == sorted(spans, key=lambda span: span.start_s)
@@ -0,0 +1,109 @@
+"""Tests for `griptape_nodes.common.workflow_metadata_index`."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from griptape_nodes.common import workflow_metadata_index
+from griptape_nodes.common.workflow_metadata_index import WorkflowMetadataIndex, read_metadata_blocks
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+METADATA_BLOCK = '# /// script\n# [tool.griptape-nodes]\n# name = "demo"\n# ///\n'
+
+
+def _write_workflow(path: Path, name: str = "demo", body: str = "x = 1\n") -> Path:
+    path.write_text(METADATA_BLOCK.replace("demo", name) + "\n" + body, encoding="utf-8")
+    return path
+
+
+class TestReadMetadataBlocks:
+    def test_reads_block_from_leading_header(self, tmp_path: Path) -> None:
+        workflow_file = _write_workflow(tmp_path / "workflow.py")
+
+        assert read_metadata_blocks(workflow_file) == METADATA_BLOCK.rstrip("\n")
+
+    def test_finds_block_placed_after_code(self, tmp_path: Path) -> None:
+        workflow_file = tmp_path / "workflow.py"
+        workflow_file.write_text('"""Docstring."""\n\n' + METADATA_BLOCK, encoding="utf-8")
+
+        assert read_metadata_blocks(workflow_file) == METADATA_BLOCK.rstrip("\n")
+
+    def test_file_without_block_yields_empty_string(self, tmp_path: Path) -> None:
+        module_file = tmp_path / "helpers.py"
+        module_file.write_text("# helpers\nimport os\n", encoding="utf-8")
+
+        assert read_metadata_blocks(module_file) == ""
+
+
+class TestWorkflowMetadataIndex:
+    def test_unchanged_file_is_served_from_persisted_index(self, tmp_path: Path) -> None:
+        index_path = tmp_path / "index.json"
+        workflow_file = _write_workflow(tmp_path / "workflow.py")
+        first_index = WorkflowMetadataIndex(index_path)
+        first_index.get_metadata_blocks(workflow_file)
+        first_index.flush()
+
+        second_index = WorkflowMetadataIndex(index_path)
+        with patch.object(workflow_metadata_index, "read_metadata_blocks") as mock_read:
+            blocks = second_index.get_metadata_blocks(workflow_file)
+
+        mock_read.assert_not_called()
+        assert 'name = "demo"' in blocks
+
+    def test_changed_file_is_read_again(self, tmp_path: Path) -> None:
+        index = WorkflowMetadataIndex(tmp_path / "index.json")
+        workflow_file = _write_workflow(tmp_path / "workflow.py")
+        index.get_metadata_blocks(workflow_file)
+
+        _write_workflow(workflow_file, name="renamed_demo")
+        stat = workflow_file.stat()
+        os.utime(workflow_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert 'name = "renamed_demo"' in index.get_metadata_blocks(workflow_file)
+
+    def test_record_saves_written_content_without_reading_it_back(self, tmp_path: Path) -> None:
+        index_path = tmp_path / "index.json"
+        workflow_file = _write_workflow(tmp_path / "workflow.py")
+        WorkflowMetadataIndex(index_path).record(workflow_file, workflow_file.read_text(encoding="utf-8"))
+
+        with patch.object(workflow_metadata_index, "read_metadata_blocks") as mock_read:
+            blocks = WorkflowMetadataIndex(index_path).get_metadata_blocks(workflow_file)
+
+        mock_read.assert_not_called()
+        assert 'name = "demo"' in blocks
+
+    def test_move_carries_entry_to_new_path(self, tmp_path: Path) -> None:
+        index_path = tmp_path / "index.json"
+        old_path = _write_workflow(tmp_path / "workflow.py")
+        new_path = tmp_path / "moved.py"
+        index = WorkflowMetadataIndex(index_path)
+        index.get_metadata_blocks(old_path)
+
+        old_path.rename(new_path)
+        index.move(old_path, new_path)
+
+        with patch.object(workflow_metadata_index, "read_metadata_blocks") as mock_read:
+            WorkflowMetadataIndex(index_path).get_metadata_blocks(new_path)
+        mock_read.assert_not_called()
+
+    def test_forget_drops_entry(self, tmp_path: Path) -> None:
+        index_path = tmp_path / "index.json"
+        workflow_file = _write_workflow(tmp_path / "workflow.py")
+        index = WorkflowMetadataIndex(index_path)
+        index.get_metadata_blocks(workflow_file)
+        index.flush()
+
+        index.forget(workflow_file)
+
+        assert str(workflow_file) not in index_path.read_text(encoding="utf-8")
+
+    def test_corrupt_index_is_ignored(self, tmp_path: Path) -> None:
+        index_path = tmp_path / "index.json"
+        index_path.write_text("{not json", encoding="utf-8")
+        workflow_file = _write_workflow(tmp_path / "workflow.py")
+
+        assert 'name = "demo"' in WorkflowMetadataIndex(index_path).get_metadata_blocks(workflow_file)
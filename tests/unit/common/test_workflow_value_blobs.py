@@ -0,0 +1,83 @@
+"""Tests for `griptape_nodes.common.workflow_value_blobs`."""
+
+from __future__ import annotations
+
+import pickle
+from typing import TYPE_CHECKING
+
+import pytest
+
+from griptape_nodes.common.workflow_value_blobs import (
+    copy_workflow_value_blobs,
+    find_workflow_value_blob_digests,
+    get_workflow_value_blob_dir,
+    load_workflow_value_blob,
+    remove_unreferenced_workflow_value_blobs,
+    write_workflow_value_blob,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestWorkflowValueBlobs:
+    def test_write_then_load_round_trips(self, tmp_path: Path) -> None:
+        workflow_file = tmp_path / "workflow.py"
+        value = {"image": b"\x00\x01" * 1000, "label": "cat"}
+
+        digest = write_workflow_value_blob(get_workflow_value_blob_dir(workflow_file), pickle.dumps(value))
+
+        assert load_workflow_value_blob(workflow_file, digest) == value
+
+    def test_identical_values_share_one_blob(self, tmp_path: Path) -> None:
+        blob_dir = get_workflow_value_blob_dir(tmp_path / "workflow.py")
+        pickled = pickle.dumps(b"same")
+
+        first = write_workflow_value_blob(blob_dir, pickled)
+        second = write_workflow_value_blob(blob_dir, pickled)
+
+        assert first == second
+        assert [path.name for path in blob_dir.iterdir()] == [f"{first}.pickle"]
+
+    def test_missing_blob_names_the_blob_directory(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError, match=r"\.workflow_blobs"):
+            load_workflow_value_blob(tmp_path / "workflow.py", "0" * 64)
+
+    def _save_workflow(self, workflow_file: Path, *values: object) -> list[str]:
+        """Write a workflow file that loads each value from a blob, as generated workflows do."""
+        blob_dir = get_workflow_value_blob_dir(workflow_file)
+        digests = [write_workflow_value_blob(blob_dir, pickle.dumps(value)) for value in values]
+        workflow_file.parent.mkdir(parents=True, exist_ok=True)
+        workflow_file.write_text(
+            "".join(
+                f"value_{index} = load_workflow_value_blob(__file__, '{digest}')\n"
+                for index, digest in enumerate(digests)
+            )
+        )
+        return digests
+
+    def test_find_digests_reads_blob_references(self, tmp_path: Path) -> None:
+        digests = self._save_workflow(tmp_path / "workflow.py", "first", "second")
+
+        assert find_workflow_value_blob_digests(tmp_path / "workflow.py") == set(digests)
+
+    def test_copy_makes_moved_workflow_loadable(self, tmp_path: Path) -> None:
+        source = tmp_path / "workflow.py"
+        target = tmp_path / "moved" / "workflow.py"
+        (digest,) = self._save_workflow(source, {"image": b"\x00" * 1000})
+
+        copy_workflow_value_blobs(source, target)
+
+        assert load_workflow_value_blob(target, digest) == {"image": b"\x00" * 1000}
+
+    def test_remove_unreferenced_keeps_blobs_other_workflows_load(self, tmp_path: Path) -> None:
+        (shared,) = self._save_workflow(tmp_path / "first.py", "shared")
+        self._save_workflow(tmp_path / "second.py", "shared")
+        (orphan,) = self._save_workflow(tmp_path / "third.py", "orphan")
+        (tmp_path / "third.py").unlink()
+
+        remove_unreferenced_workflow_value_blobs(tmp_path)
+
+        blob_dir = get_workflow_value_blob_dir(tmp_path / "first.py")
+        assert [path.name for path in blob_dir.iterdir()] == [f"{shared}.pickle"]
+        assert orphan != shared
@@ -0,0 +1,103 @@
+"""Tests for `griptape_nodes.common.workspace_file_index`."""
+
+from __future__ import annotations
+
+import shutil
+from typing import TYPE_CHECKING
+
+import pytest
+
+from griptape_nodes.common.directory_file_index import DirectoryFileIndex
+from griptape_nodes.common.workspace_file_index import WorkspaceFileIndex
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write(path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x")
+    return path
+
+
+def _all_pages(index: WorkspaceFileIndex, prefix: str = "", limit: int = 2) -> list[list[str]]:
+    pages = []
+    cursor = None
+    while True:
+        page, cursor = index.list_page(prefix, cursor, limit)
+        pages.append(page)
+        if cursor is None:
+            return pages
+
+
+class TestWorkspaceFileIndex:
+    def test_pages_through_files_in_path_order(self, tmp_path: Path) -> None:
+        for name in ["b/2.png", "a/1.png", "top.txt", "a/0.png", "a-b/3.png"]:
+            _write(tmp_path / name)
+        index = WorkspaceFileIndex(tmp_path)
+
+        assert _all_pages(index) == [["a-b/3.png", "a/0.png"], ["a/1.png", "b/2.png"], ["top.txt"]]
+
+    def test_prefix_limits_listing_to_a_directory(self, tmp_path: Path) -> None:
+        for name in ["a/0.png", "a/1.png", "a-b/3.png", "b/2.png"]:
+            _write(tmp_path / name)
+        index = WorkspaceFileIndex(tmp_path)
+
+        assert _all_pages(index, prefix="a/", limit=1) == [["a/0.png"], ["a/1.png"]]
+        assert index.list_page("missing/") == ([], None)
+
+    def test_engine_writes_and_deletes_update_without_rescanning(self, tmp_path: Path) -> None:
+        _write(tmp_path / "a" / "0.png")
+        index = WorkspaceFileIndex(tmp_path, rescan_interval_seconds=3600)
+        assert index.file_count == 1
+
+        index.record_write(_write(tmp_path / "a" / "1.png"))
+        shutil.copytree(tmp_path / "a", tmp_path / "copy")
+        index.record_write(tmp_path / "copy")
+        assert index.list_page()[0] == ["a/0.png", "a/1.png", "copy/0.png", "copy/1.png"]
+
+        shutil.rmtree(tmp_path / "a")
+        index.forget(tmp_path / "a")
+        assert index.list_page()[0] == ["copy/0.png", "copy/1.png"]
+
+    def test_files_written_behind_the_engine_need_a_rescan(self, tmp_path: Path) -> None:
+        _write(tmp_path / "0.png")
+        index = WorkspaceFileIndex(tmp_path, rescan_interval_seconds=3600)
+        assert index.file_count == 1
+
+        _write(tmp_path / "1.png")
+        assert index.file_count == 1
+
+        index.ensure_current(refresh=True)
+        assert index.file_count == 2  # noqa: PLR2004
+
+    def test_writes_during_a_rescan_survive_it(self, tmp_path: Path) -> None:
+        _write(tmp_path / "0.png")
+        index = WorkspaceFileIndex(tmp_path)
+        assert index.file_count == 1
+        walk = index._walk
+
+        def walk_then_write(directory: Path) -> list[tuple[str, None]]:
+            files = walk(directory)
+            index.record_write(_write(tmp_path / "1.png"))
+            return files
+
+        index._walk = walk_then_write  # type: ignore[method-assign]
+        index.rescan()
+
+        assert index.list_page()[0] == ["0.png", "1.png"]
+
+    def test_partial_uploads_are_not_indexed(self, tmp_path: Path) -> None:
+        _write(tmp_path / "0.png")
+        _write(tmp_path / ".1.png.0123.upload")
+
+        assert WorkspaceFileIndex(tmp_path).list_page()[0] == ["0.png"]
+
+
+class TestDirectoryFileIndex:
+    def test_subclass_without_scanned_entry_cannot_be_constructed(self, tmp_path: Path) -> None:
+        class Incomplete(DirectoryFileIndex[None]):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete(tmp_path)  # type: ignore[abstract]
@@ -14,6 +14,7 @@ from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 @pytest.fixture(autouse=True)
 def isolate_user_config() -> Generator[Path, None, None]:
     """Isolate the user config file during tests to prevent pollution of the real config."""
+    import griptape_nodes.common.workflow_metadata_index as workflow_metadata_index_module
     import griptape_nodes.retained_mode.managers.config_manager as config_manager_module
     from griptape_nodes.utils.metaclasses import SingletonMeta
 
@@ -27,8 +28,16 @@ def isolate_user_config() -> Generator[Path, None, None]:
         # Initialize with an empty config
         temp_config_path.write_text(json.dumps({}, indent=2))
 
-        # Patch the USER_CONFIG_PATH constant to point to our temp file
-        with patch.object(config_manager_module, "USER_CONFIG_PATH", temp_config_path):
+        # Patch the USER_CONFIG_PATH constant to point to our temp file, and keep the
+        # workflow metadata index out of the real cache directory too.
+        with (
+            patch.object(config_manager_module, "USER_CONFIG_PATH", temp_config_path),
+            patch.object(
+                workflow_metadata_index_module,
+                "WORKFLOW_METADATA_INDEX_PATH",
+                Path(temp_dir) / "workflow_metadata_index.json",
+            ),
+        ):
             yield temp_config_path
 
             # Clear singleton instances after test to ensure clean state
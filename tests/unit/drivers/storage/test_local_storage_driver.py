@@ -197,3 +197,25 @@ class TestLocalStorageDriverCreateSignedDownloadUrl:
         assert "\\" not in url
         assert "C:/Users/foo/image.png" in url
         assert url == "http://localhost:8124/external/C:/Users/foo/image.png?t=1000"
+
+
+class TestLocalStorageDriverListFiles:
+    """Test LocalStorageDriver.list_files() pagination."""
+
+    def test_follows_cursor_through_every_page(self) -> None:
+        driver = LocalStorageDriver(Path("/workspace"))
+        pages = [
+            {"files": ["a.png", "b.png"], "next_cursor": "b.png"},
+            {"files": ["c.png"], "next_cursor": None},
+        ]
+        responses = []
+        for page in pages:
+            response = Mock()
+            response.json.return_value = page
+            responses.append(response)
+
+        with patch("griptape_nodes.drivers.storage.local_storage_driver.httpx.get", side_effect=responses) as mock_get:
+            assert driver.list_files() == ["a.png", "b.png", "c.png"]
+
+        assert mock_get.call_args_list[0].kwargs["params"] == {}
+        assert mock_get.call_args_list[1].kwargs["params"] == {"cursor": "b.png"}
@@ -330,6 +330,44 @@ class TestBaseNodeElement:
             ],
         }
 
+    def test_find_element_by_name_tracks_adds_removes_and_renames(self, ui_element: BaseNodeElement) -> None:
+        group = ui_element.find_element_by_name("group1")
+        assert isinstance(group, ParameterGroup)
+        parameter = ui_element.find_element_by_name("test")
+        assert parameter is not None
+
+        added = Parameter(name="added", type="str", tooltip="added")
+        group.add_child(added)
+        assert ui_element.find_element_by_name("added") is added
+
+        parameter.name = "renamed"
+        assert ui_element.find_element_by_name("test") is None
+        assert ui_element.find_element_by_name("renamed") is parameter
+
+        group.remove_child(added)
+        assert ui_element.find_element_by_name("added") is None
+
+    def test_find_element_by_name_returns_first_match_in_tree_order(self) -> None:
+        with BaseNodeElement() as root:
+            with ParameterGroup(name="outer"):
+                first = ParameterGroup(name="dup")
+            second = ParameterGroup(name="dup")
+        assert root.find_element_by_name("dup") is first
+
+        first.name = "not_dup"
+        assert root.find_element_by_name("dup") is second
+
+    def test_find_elements_by_type_keeps_tree_order_after_changes(self, ui_element: BaseNodeElement) -> None:
+        group = ui_element.find_element_by_name("group1")
+        assert group is not None
+        assert [p.name for p in ui_element.find_elements_by_type(Parameter)] == ["test"]
+
+        group.add_child(Parameter(name="in_group", type="str", tooltip="in_group"))
+        ui_element.add_child(Parameter(name="last", type="str", tooltip="last"))
+
+        assert [p.name for p in ui_element.find_elements_by_type(Parameter)] == ["in_group", "test", "last"]
+        assert [p.name for p in ui_element.find_elements_by_type(Parameter, find_recursively=False)] == ["last"]
+
     def test_get_current(self) -> None:
         with BaseNodeElement() as ui:
             assert ui
@@ -6,6 +6,8 @@ from unittest.mock import Mock, patch
 import pytest
 
 from griptape_nodes.exe_types.core_types import BaseNodeElement
+from griptape_nodes.exe_types.node_types import take_nodes_with_tracked_parameters
+from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 
 from .mocks import MockNode
 
@@ -245,3 +247,49 @@ class TestEmitsUpdateOnWrite:
             test_setter(minimal_element, "test")
         except Exception as e:
             pytest.fail(f"Decorator should handle missing attributes gracefully, but got: {e}")
+
+
+class TestTrackedParameterRegistry:
+    """Test that nodes with tracked changes are registered for the next EventManager flush."""
+
+    def setup_method(self) -> None:
+        """Start every test with an empty registry."""
+        take_nodes_with_tracked_parameters()
+        self.node = MockNode()
+        self.element = ElementWithDecorator()
+        self.element._node_context = self.node
+
+    def test_change_registers_node_once(self) -> None:
+        """A tracked change registers the node until the registry is next taken."""
+        self.element.test_value = "new_value"
+        self.element.test_dict = {"key": "new"}
+
+        assert take_nodes_with_tracked_parameters() == [self.node]
+        assert take_nodes_with_tracked_parameters() == []
+
+    def test_untouched_node_is_not_registered(self) -> None:
+        """Creating a node doesn't register it."""
+        MockNode(name="other_node")
+
+        assert take_nodes_with_tracked_parameters() == []
+
+    def test_flush_emits_registered_nodes(self, griptape_nodes: GriptapeNodes) -> None:
+        """The flush emits changes for nodes the ObjectManager knows about."""
+        griptape_nodes.ObjectManager().add_object_by_name(self.node.name, self.node)
+        self.element.test_value = "new_value"
+
+        with patch.object(self.node, "emit_parameter_changes") as emit:
+            griptape_nodes.EventManager()._flush_tracked_parameter_changes()
+
+        emit.assert_called_once()
+        assert take_nodes_with_tracked_parameters() == []
+
+    def test_flush_keeps_changes_of_unregistered_nodes(self, griptape_nodes: GriptapeNodes) -> None:
+        """A node that isn't in the ObjectManager yet keeps its changes for a later flush."""
+        self.element.test_value = "new_value"
+
+        with patch.object(self.node, "emit_parameter_changes") as emit:
+            griptape_nodes.EventManager()._flush_tracked_parameter_changes()
+
+        emit.assert_not_called()
+        assert take_nodes_with_tracked_parameters() == [self.node]
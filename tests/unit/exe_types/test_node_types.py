@@ -1,9 +1,11 @@
+import threading
 from unittest.mock import Mock
 
 import pytest
 
-from griptape_nodes.exe_types.core_types import Parameter
+from griptape_nodes.exe_types.core_types import Parameter, ParameterGroup
 from griptape_nodes.exe_types.node_types import AsyncResult
+from griptape_nodes.node_library.library_declarations import ProcessOffload
 
 from .mocks import MockNode
 
@@ -37,6 +39,38 @@ class TestNodeTypes:
         # Verify all yields were processed
         assert results == ["result1", "result2"]
 
+    @pytest.mark.asyncio
+    async def test_aprocess_runs_process_on_event_loop_by_default(self) -> None:
+        """Test that process() runs on the calling thread without an offload declaration."""
+        node = ThreadRecordingNode()
+
+        await node.aprocess()
+
+        assert node.get_process_offload() is ProcessOffload.EVENT_LOOP
+        assert node.process_thread is threading.current_thread()
+
+    @pytest.mark.asyncio
+    async def test_aprocess_offloads_process_to_thread_pool(self) -> None:
+        """Test that THREAD process offload runs process() off the event loop thread."""
+        node = ThreadRecordingNode()
+        node.process_offload = ProcessOffload.THREAD
+
+        await node.aprocess()
+
+        assert node.process_thread is not threading.current_thread()
+        assert node.process_thread.name.startswith("griptape-node")
+        assert node.parameter_output_values["thread"] == node.process_thread.name
+
+
+class ThreadRecordingNode(MockNode):
+    """Records which thread process() ran on."""
+
+    process_thread: threading.Thread | None = None
+
+    def process(self) -> None:
+        self.process_thread = threading.current_thread()
+        self.parameter_output_values["thread"] = self.process_thread.name
+
 
 class TestConnectionRemovedHooks:
     def _make_param(self, name: str) -> Parameter:
@@ -117,3 +151,32 @@ class TestConnectionRemovedHooks:
 
         # Should not raise when no callbacks are registered
         source_node.after_outgoing_connection_removed(source_param, target_node, target_param)
+
+
+class TestGetParameterByName:
+    """Test suite for parameter lookup by name."""
+
+    def test_finds_parameters_inside_groups_and_after_renames(self) -> None:
+        node = MockNode()
+        with ParameterGroup(name="settings") as group:
+            Parameter(name="nested", type="str", tooltip="nested")
+        node.add_node_element(group)
+        top = Parameter(name="top", type="str", tooltip="top")
+        node.add_parameter(top)
+
+        assert node.get_parameter_by_name("nested") is group.children[0]
+        assert node.get_parameter_by_name("top") is top
+        assert node.get_parameter_by_name("missing") is None
+
+        top.name = "renamed"
+        assert node.get_parameter_by_name("top") is None
+        assert node.get_parameter_by_name("renamed") is top
+        assert node.does_name_exist("renamed")
+
+    def test_skips_non_parameter_elements_with_the_same_name(self) -> None:
+        node = MockNode()
+        node.add_node_element(ParameterGroup(name="shared"))
+        parameter = Parameter(name="shared", type="str", tooltip="shared")
+        node.add_parameter(parameter)
+
+        assert node.get_parameter_by_name("shared") is parameter
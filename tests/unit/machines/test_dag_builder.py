@@ -326,3 +326,59 @@ class TestDagBuilder:
         retrieved_dag_node = dag_builder.node_to_reference["test_node"]
         assert retrieved_dag_node is dag_node
         assert retrieved_dag_node.node_state == NodeState.PROCESSING
+
+    def test_remove_node_from_dependencies_single_boundary_node(self) -> None:
+        """Test that a data node becomes available once its only boundary node completes."""
+        dag_builder = DagBuilder()
+        dag_builder.add_start_node_candidate("data_node", "graph_a", {"boundary"})
+
+        assert dag_builder.remove_node_from_dependencies("boundary", "graph_a") == ["data_node"]
+        assert dag_builder.start_node_candidates == {}
+        assert dag_builder.boundary_node_to_candidates == {}
+
+    def test_remove_node_from_dependencies_tracks_progress(self) -> None:
+        """Test that completions accumulate across boundary nodes and graphs."""
+        dag_builder = DagBuilder()
+        dag_builder.add_start_node_candidate("data_node", "graph_a", {"a1", "a2"})
+        dag_builder.add_start_node_candidate("data_node", "graph_b", {"b1"})
+
+        assert dag_builder.remove_node_from_dependencies("a1", "graph_a") == []
+        assert dag_builder.start_node_candidates["data_node"] == {"graph_a": {"a2"}, "graph_b": {"b1"}}
+
+        assert dag_builder.remove_node_from_dependencies("a2", "graph_a") == []
+        assert dag_builder.start_node_candidates["data_node"] == {"graph_b": {"b1"}}
+
+        assert dag_builder.remove_node_from_dependencies("b1", "graph_b") == ["data_node"]
+        assert "data_node" not in dag_builder.start_node_candidates
+
+    def test_remove_node_from_dependencies_ignores_unrelated_completions(self) -> None:
+        """Test that completions in other graphs or of other nodes leave candidates untouched."""
+        dag_builder = DagBuilder()
+        dag_builder.add_start_node_candidate("data_node", "graph_a", {"boundary"})
+
+        # Same node name, different graph
+        assert dag_builder.remove_node_from_dependencies("boundary", "graph_b") == []
+        # Same graph, different node
+        assert dag_builder.remove_node_from_dependencies("other", "graph_a") == []
+
+        assert dag_builder.start_node_candidates == {"data_node": {"graph_a": {"boundary"}}}
+
+    def test_remove_node_from_dependencies_releases_all_waiting_nodes(self) -> None:
+        """Test that every data node waiting on the same boundary node is released."""
+        dag_builder = DagBuilder()
+        dag_builder.add_start_node_candidate("data_1", "graph_a", {"boundary"})
+        dag_builder.add_start_node_candidate("data_2", "graph_a", {"boundary"})
+
+        newly_available = dag_builder.remove_node_from_dependencies("boundary", "graph_a")
+
+        assert sorted(newly_available) == ["data_1", "data_2"]
+
+    def test_clear_removes_start_node_candidates(self) -> None:
+        """Test that clear() resets the start node candidates and their reverse index."""
+        dag_builder = DagBuilder()
+        dag_builder.add_start_node_candidate("data_node", "graph_a", {"boundary"})
+
+        dag_builder.clear()
+
+        assert dag_builder.start_node_candidates == {}
+        assert dag_builder.boundary_node_to_candidates == {}
@@ -0,0 +1,158 @@
+"""Tests for NodePositionCache and the vectorized spatial heuristics."""
+
+# ruff: noqa: PLR2004
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from griptape_nodes.exe_types.node_types import BaseNode
+from griptape_nodes.machines.dag_builder import DagBuilder, DagNode
+from griptape_nodes.machines.heuristics import DistanceToNode, TopLeftToBottomRight
+from griptape_nodes.machines.node_positions import NodePositionCache
+from griptape_nodes.machines.parallel_resolution import ParallelResolutionContext
+
+
+def _mock_node(name: str, x: float = 0, y: float = 0) -> MagicMock:
+    node = MagicMock(spec=BaseNode)
+    node.name = name
+    node.metadata = {"position": {"x": x, "y": y}}
+    return node
+
+
+class TestNodePositionCache:
+    """Test cases for NodePositionCache."""
+
+    def test_add_and_lookup_positions(self) -> None:
+        """Test that positions come back in the order of the requested names."""
+        cache = NodePositionCache()
+        cache.add(_mock_node("a", 1, 2))
+        cache.add(_mock_node("b", 3, 4))
+
+        positions = cache.positions(cache.indices(["b", "a"]))
+
+        assert positions.tolist() == [[3.0, 4.0], [1.0, 2.0]]
+        assert len(cache) == 2
+        assert "a" in cache
+
+    def test_missing_position_defaults_to_origin(self) -> None:
+        """Test that nodes without a position in their metadata sit at the origin."""
+        cache = NodePositionCache()
+        node = _mock_node("a")
+        node.metadata = {}
+        cache.add(node)
+
+        assert cache.positions(cache.indices(["a"])).tolist() == [[0.0, 0.0]]
+
+    def test_remove_reuses_slot(self) -> None:
+        """Test that removed nodes drop out of the active set and free their slot."""
+        cache = NodePositionCache()
+        first_slot = cache.add(_mock_node("a", 1, 1))
+        cache.add(_mock_node("b", 2, 2))
+
+        cache.remove("a")
+        cache.remove("unknown")
+
+        assert "a" not in cache
+        assert cache.active_positions().tolist() == [[2.0, 2.0]]
+        assert cache.add(_mock_node("c", 5, 5)) == first_slot
+
+    def test_grows_past_initial_capacity(self) -> None:
+        """Test that the arrays grow as nodes are added."""
+        cache = NodePositionCache()
+        for i in range(500):
+            cache.add(_mock_node(f"n{i}", i, i))
+
+        assert cache.active_positions().shape == (500, 2)
+        assert cache.positions(cache.indices(["n499"])).tolist() == [[499.0, 499.0]]
+
+    def test_reading_order_bounds_follow_node_set(self) -> None:
+        """Test that the cached reading order bounds are invalidated on changes."""
+        cache = NodePositionCache()
+        assert cache.reading_order_bounds() == (0.0, 0.0)
+
+        cache.add(_mock_node("a", 10, 10))
+        cache.add(_mock_node("b", 100, 50))
+        assert cache.reading_order_bounds() == (20.0, 150.0)
+
+        cache.remove("b")
+        assert cache.reading_order_bounds() == (20.0, 20.0)
+
+    def test_sync_with_node_references(self) -> None:
+        """Test that sync adds new DAG nodes and drops removed ones."""
+        cache = NodePositionCache()
+        node_to_reference = {"a": DagNode(node_reference=_mock_node("a", 1, 1))}
+        cache.sync(node_to_reference)
+        assert "a" in cache
+
+        node_to_reference = {
+            "b": DagNode(node_reference=_mock_node("b", 2, 2)),
+            "c": DagNode(node_reference=_mock_node("c")),
+        }
+        cache.sync(node_to_reference)
+        assert "a" not in cache
+        assert "b" in cache
+        assert "c" in cache
+
+    def test_dag_builder_clear_and_remove_reference(self) -> None:
+        """Test that DagBuilder keeps its position cache in step with node_to_reference."""
+        dag_builder = DagBuilder()
+        dag_builder.add_node(_mock_node("a"))
+        dag_builder.add_node(_mock_node("b"))
+        dag_builder.node_positions.sync(dag_builder.node_to_reference)
+
+        dag_builder.remove_node_reference("a")
+        assert "a" not in dag_builder.node_to_reference
+        assert "a" not in dag_builder.node_positions
+
+        dag_builder.clear()
+        assert len(dag_builder.node_positions) == 0
+
+
+class TestVectorizedSpatialHeuristics:
+    """Test cases for the array-based DistanceToNode and TopLeftToBottomRight scoring."""
+
+    @pytest.fixture
+    def context(self) -> ParallelResolutionContext:
+        """Provide a context whose DAG holds nodes along the diagonal."""
+        context = ParallelResolutionContext("test_flow", dag_builder=DagBuilder())
+        for name, offset in (("origin", 0), ("near", 10), ("middle", 50), ("far", 100)):
+            context.node_to_reference[name] = DagNode(node_reference=_mock_node(name, offset, offset))
+        return context
+
+    def test_distance_scores_match_reference_formula(self, context: ParallelResolutionContext) -> None:
+        """Test the vectorized distance scores against the scalar formula."""
+        heuristic = DistanceToNode(context)
+        previous = context.node_to_reference["origin"]
+        dag_nodes = [context.node_to_reference[name] for name in ("near", "middle", "far")]
+
+        scores = heuristic.calculate_priorities_batch(dag_nodes, previous_executed_node=previous)
+
+        max_distance_squared = 2 * 100**2
+        for name, offset in (("near", 10), ("middle", 50), ("far", 100)):
+            expected = heuristic.max_value - (2 * offset**2 / max_distance_squared) * 99.0
+            assert scores[name] == pytest.approx(expected)
+        assert heuristic.calculate_priority(dag_nodes[0], previous_executed_node=previous) == pytest.approx(
+            scores["near"]
+        )
+
+    def test_distance_without_previous_node_is_neutral(self, context: ParallelResolutionContext) -> None:
+        """Test that every node scores max_value / 2 when nothing has resolved yet."""
+        heuristic = DistanceToNode(context)
+        dag_nodes = list(context.node_to_reference.values())
+
+        scores = heuristic.calculate_priorities_batch(dag_nodes, previous_executed_node=None)
+
+        assert set(scores.values()) == {heuristic.max_value / 2}
+
+    def test_reading_order_scores(self, context: ParallelResolutionContext) -> None:
+        """Test that top-left nodes score highest, normalized across the whole DAG."""
+        heuristic = TopLeftToBottomRight(context)
+        dag_nodes = [context.node_to_reference[name] for name in ("far", "near")]
+
+        scores = heuristic.calculate_priorities_batch(dag_nodes)
+
+        assert scores["far"] == pytest.approx(heuristic.max_value - 99.0)
+        assert scores["near"] == pytest.approx(heuristic.max_value - 0.1 * 99.0)
+        assert np.isclose(heuristic.calculate_priority(dag_nodes[1]), scores["near"])
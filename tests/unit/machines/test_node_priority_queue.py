@@ -0,0 +1,194 @@
+"""Tests for NodePriorityQueue."""
+
+# ruff: noqa: PLR2004
+
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from griptape_nodes.exe_types.node_types import BaseNode
+from griptape_nodes.machines.dag_builder import DagBuilder, DagNode
+from griptape_nodes.machines.node_priority_queue import NodePriorityQueue
+from griptape_nodes.machines.parallel_resolution import ParallelResolutionContext
+
+
+def _add_dag_node(context: ParallelResolutionContext, name: str, x: int = 0, y: int = 0) -> DagNode:
+    node = MagicMock(spec=BaseNode)
+    node.name = name
+    node.metadata = {"position": {"x": x, "y": y}}
+    node.can_queue_for_execution.return_value = True
+    dag_node = DagNode(node_reference=node)
+    context.node_to_reference[name] = dag_node
+    return dag_node
+
+
+def _drain(queue: NodePriorityQueue) -> list[str]:
+    names = []
+    while (name := queue.get_next_node()) is not None:
+        names.append(name)
+    return names
+
+
+@pytest.fixture
+def context() -> ParallelResolutionContext:
+    """Provide a resolution context backed by an empty DagBuilder."""
+    return ParallelResolutionContext("test_flow", dag_builder=DagBuilder())
+
+
+class TestNodePriorityQueue:
+    """Test cases for NodePriorityQueue functionality."""
+
+    def test_empty_queue_returns_none(self, context: ParallelResolutionContext) -> None:
+        """Test that an empty queue returns None."""
+        queue = NodePriorityQueue(context)
+
+        assert queue.get_next_node() is None
+        assert len(queue) == 0
+
+    def test_orders_by_reading_order_without_previous_node(self, context: ParallelResolutionContext) -> None:
+        """Test that nodes come out top-left first when nothing has resolved yet."""
+        queue = NodePriorityQueue(context)
+        for name, x, y in (("bottom_right", 500, 500), ("top_left", 0, 0), ("middle", 200, 200)):
+            queue.add_node(_add_dag_node(context, name, x, y))
+
+        assert _drain(queue) == ["top_left", "middle", "bottom_right"]
+
+    def test_successors_of_last_resolved_node_come_first(self, context: ParallelResolutionContext) -> None:
+        """Test that a successor of the last resolved node outranks closer nodes."""
+        queue = NodePriorityQueue(context)
+        previous = _add_dag_node(context, "previous", 0, 0)
+        for name, x, y in (("near", 10, 10), ("successor", 100, 100), ("far", 900, 900)):
+            queue.add_node(_add_dag_node(context, name, x, y))
+
+        context.last_resolved_node = previous.node_reference
+        queue.set_last_resolved_successors({"successor"})
+        queue.mark_priorities_stale()
+
+        assert _drain(queue) == ["successor", "near", "far"]
+
+    def test_add_node_is_idempotent(self, context: ParallelResolutionContext) -> None:
+        """Test that adding the same node twice queues it once."""
+        queue = NodePriorityQueue(context)
+        dag_node = _add_dag_node(context, "node")
+
+        queue.add_node(dag_node)
+        queue.add_node(dag_node)
+
+        assert len(queue) == 1
+        assert _drain(queue) == ["node"]
+
+    def test_remove_node(self, context: ParallelResolutionContext) -> None:
+        """Test removing queued and unknown nodes."""
+        queue = NodePriorityQueue(context)
+        queue.add_node(_add_dag_node(context, "keep", 0, 0))
+        queue.add_node(_add_dag_node(context, "drop", 10, 10))
+
+        queue.remove_node("drop")
+        queue.remove_node("not_queued")
+
+        assert "drop" not in queue
+        assert _drain(queue) == ["keep"]
+
+    def test_blocked_node_promoted_when_inputs_change(self, context: ParallelResolutionContext) -> None:
+        """Test that blocked nodes are only re-polled once their inputs change."""
+        queue = NodePriorityQueue(context)
+        blocked = _add_dag_node(context, "blocked")
+        blocked.node_reference.can_queue_for_execution.return_value = False
+        queue.add_node(blocked)
+        queue.add_node(_add_dag_node(context, "ready"))
+        assert "blocked" in queue
+
+        blocked.node_reference.can_queue_for_execution.return_value = True
+        poll_count = blocked.node_reference.can_queue_for_execution.call_count
+
+        # Inputs haven't changed and other work is queued, so the blocked node isn't re-polled
+        assert queue.get_next_node() == "ready"
+        assert blocked.node_reference.can_queue_for_execution.call_count == poll_count
+
+        queue.add_node(_add_dag_node(context, "another"))
+        queue.add_last_resolved_successor("blocked")
+        assert set(_drain(queue)) == {"blocked", "another"}
+
+    def test_blocked_nodes_polled_when_nothing_else_queued(self, context: ParallelResolutionContext) -> None:
+        """Test that blocked nodes are polled when the queue would otherwise be empty."""
+        queue = NodePriorityQueue(context)
+        blocked = _add_dag_node(context, "blocked")
+        blocked.node_reference.can_queue_for_execution.return_value = False
+        queue.add_node(blocked)
+
+        assert queue.get_next_node() is None
+
+        blocked.node_reference.can_queue_for_execution.return_value = True
+        assert queue.get_next_node() == "blocked"
+
+    def test_rescoring_only_touches_affected_nodes(self, context: ParallelResolutionContext) -> None:
+        """Test that a stale mark only rescores the nodes each heuristic depends on."""
+        queue = NodePriorityQueue(context)
+        scored: list[tuple[str, set[str]]] = []
+        for heuristic in queue._heuristics:
+            original = heuristic.calculate_priorities_batch
+
+            def spy(
+                dag_nodes: list[DagNode], _original: Any = original, _name: str = type(heuristic).__name__, **kwargs
+            ) -> dict[str, float]:
+                scored.append((_name, {node.node_reference.name for node in dag_nodes}))
+                return _original(dag_nodes, **kwargs)
+
+            heuristic.calculate_priorities_batch = spy  # type: ignore[method-assign]
+
+        previous = _add_dag_node(context, "previous")
+        for i in range(10):
+            queue.add_node(_add_dag_node(context, f"n{i}", i * 10, i * 10))
+        context.last_resolved_node = previous.node_reference
+        queue.get_next_node()
+        scored.clear()
+
+        # Same previous node, one new successor: only that node is rescored, and only by
+        # the heuristic that depends on successors.
+        queue.set_last_resolved_successors({"n5"})
+        queue.mark_priorities_stale()
+        assert queue.get_next_node() == "n5"
+        assert scored == [("HasConnectionFromPrevious", {"n5"})]
+
+        # A new node gets scored by every heuristic, and nothing else is rescored.
+        scored.clear()
+        queue.add_node(_add_dag_node(context, "new", 0, 0))
+        queue.get_next_node()
+        assert len(scored) == len(queue._heuristics)
+        assert all(names == {"new"} for _, names in scored)
+
+        # A different previous node rescores every queued node for the distance heuristic.
+        scored.clear()
+        context.last_resolved_node = context.node_to_reference["n9"].node_reference
+        queue.mark_priorities_stale()
+        queue.get_next_node()
+        distance_batches = [names for name, names in scored if name == "DistanceToNode"]
+        assert len(distance_batches) == 1
+        assert len(distance_batches[0]) == len(queue) + 1
+
+    def test_get_next_node_skips_rejected_nodes_without_dequeuing_them(
+        self, context: ParallelResolutionContext
+    ) -> None:
+        """Test that nodes rejected by can_start stay queued in priority order."""
+        queue = NodePriorityQueue(context)
+        for name, x, y in (("first", 0, 0), ("second", 100, 100), ("third", 200, 200)):
+            queue.add_node(_add_dag_node(context, name, x, y))
+
+        assert queue.get_next_node(can_start=lambda name: name == "third") == "third"
+        assert queue.get_next_node(can_start=lambda _name: False) is None
+        assert len(queue) == 2
+        assert _drain(queue) == ["first", "second"]
+
+    def test_tied_re_push_keeps_insertion_order(self, context: ParallelResolutionContext) -> None:
+        """Test that re-pushing a node at an unchanged score neither compares names nor reorders ties."""
+        queue = NodePriorityQueue(context)
+        for name in ("first", "second"):
+            _add_dag_node(context, name)
+            queue._push(name, 1.0)
+
+        # The superseded entry ties with its replacement on score and sequence
+        queue._push("first", 1.0)
+        queue._push("second", 1.0)
+
+        assert _drain(queue) == ["first", "second"]
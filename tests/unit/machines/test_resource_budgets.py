@@ -0,0 +1,198 @@
+"""Tests for per resource class budgets in the parallel resolver."""
+
+# ruff: noqa: PLR2004
+
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from griptape_nodes.exe_types.node_types import BaseNode
+from griptape_nodes.machines.dag_builder import DagBuilder, DagNode
+from griptape_nodes.machines.parallel_resolution import ParallelResolutionContext
+from griptape_nodes.machines.resource_budgets import ResourceBudgets, ResourceRequirement
+from griptape_nodes.node_library.library_declarations import (
+    ResourceClass,
+    ResourceClassNodeProperty,
+    ResourceWeightNodeProperty,
+)
+from griptape_nodes.node_library.library_registry import NodeMetadata
+
+
+def _make_node(name: str, *declarations: Any) -> BaseNode:
+    node = MagicMock(spec=BaseNode)
+    node.name = name
+    node_metadata = NodeMetadata(
+        category="Test", description="test", display_name=name, declarations=list(declarations)
+    )
+    node.metadata = {"library_node_metadata": node_metadata.model_dump(mode="json")}
+    return node
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestResourceBudgets:
+    """Test cases for ResourceBudgets."""
+
+    def test_requirement_defaults_to_cpu_weight_one(self) -> None:
+        """Test that nodes without declarations count as one CPU slot."""
+        budgets = ResourceBudgets(4)
+        bare_node = MagicMock(spec=BaseNode)
+        bare_node.name = "bare"
+        bare_node.metadata = {}
+
+        assert budgets.requirement_for(_make_node("plain")) == ResourceRequirement(ResourceClass.CPU, 1)
+        assert budgets.requirement_for(bare_node) == ResourceRequirement(ResourceClass.CPU, 1)
+
+    def test_requirement_read_from_node_declarations(self) -> None:
+        """Test that resource class and weight come from the library node metadata."""
+        budgets = ResourceBudgets(4)
+        node = _make_node(
+            "heavy",
+            ResourceClassNodeProperty(resource_class=ResourceClass.MEMORY),
+            ResourceWeightNodeProperty(weight=3),
+        )
+
+        assert budgets.requirement_for(node) == ResourceRequirement(ResourceClass.MEMORY, 3)
+
+    def test_class_budgets_are_independent(self) -> None:
+        """Test that a full class doesn't block nodes of another class."""
+        budgets = ResourceBudgets(8, {ResourceClass.MEMORY: 1})
+        heavy = _make_node("heavy", ResourceClassNodeProperty(resource_class=ResourceClass.MEMORY))
+        other_heavy = _make_node("other_heavy", ResourceClassNodeProperty(resource_class=ResourceClass.MEMORY))
+        fetch = _make_node("fetch", ResourceClassNodeProperty(resource_class=ResourceClass.IO))
+
+        claim = budgets.acquire(heavy)
+
+        assert not budgets.has_capacity(other_heavy)
+        assert budgets.has_capacity(fetch)
+
+        budgets.release(claim)
+        assert budgets.has_capacity(other_heavy)
+
+    def test_io_budget_replaces_max_nodes_in_parallel(self) -> None:
+        """Test that a budgeted IO class runs past the cap that still bounds CPU nodes."""
+        budgets = ResourceBudgets(1, {ResourceClass.IO: 3, ResourceClass.CPU: 4})
+        fetches = [
+            _make_node(f"fetch_{i}", ResourceClassNodeProperty(resource_class=ResourceClass.IO)) for i in range(4)
+        ]
+
+        assert budgets.budgets[ResourceClass.CPU] == 1
+        for fetch in fetches[:3]:
+            assert budgets.has_capacity(fetch)
+            budgets.acquire(fetch)
+        assert not budgets.has_capacity(fetches[3])
+
+        cpu_claim = budgets.acquire(_make_node("local"))
+        assert not budgets.has_capacity(_make_node("other_local"))
+        budgets.release(cpu_claim)
+        assert budgets.has_capacity(_make_node("other_local"))
+
+    def test_classes_without_budget_share_max_nodes_in_parallel(self) -> None:
+        """Test that CPU and unbudgeted classes draw from the same cap."""
+        budgets = ResourceBudgets(2, {ResourceClass.MEMORY: 1})
+        fetch = _make_node("fetch", ResourceClassNodeProperty(resource_class=ResourceClass.IO))
+        heavy = _make_node("heavy", ResourceClassNodeProperty(resource_class=ResourceClass.MEMORY))
+
+        budgets.acquire(fetch)
+        budgets.acquire(_make_node("local"))
+
+        assert not budgets.has_capacity(_make_node("other_local"))
+        assert budgets.has_capacity(heavy)
+
+    def test_weight_counts_against_budget(self) -> None:
+        """Test that weights are summed, and an oversized node still runs alone."""
+        budgets = ResourceBudgets(4)
+        light = _make_node("light")
+        heavy = _make_node("heavy", ResourceWeightNodeProperty(weight=3))
+        oversized = _make_node("oversized", ResourceWeightNodeProperty(weight=10))
+
+        light_claim = budgets.acquire(light)
+        assert budgets.has_capacity(heavy)
+        heavy_claim = budgets.acquire(heavy)
+        assert budgets.in_use[ResourceClass.CPU] == 4
+        assert not budgets.has_capacity(light)
+        assert not budgets.has_capacity(oversized)
+
+        budgets.release(light_claim)
+        budgets.release(heavy_claim)
+        assert budgets.has_capacity(oversized)
+
+    def test_release_is_idempotent(self) -> None:
+        """Test that releasing a claim twice only returns its weight once."""
+        budgets = ResourceBudgets(4)
+        claim = budgets.acquire(_make_node("node"))
+
+        budgets.release(claim)
+        budgets.release(claim)
+
+        assert budgets.in_use[ResourceClass.CPU] == 0
+        assert budgets.metrics[ResourceClass.CPU].completed == 1
+
+    def test_metrics_track_queue_wait_and_throughput(self) -> None:
+        """Test per class queue wait, run time and throughput."""
+        clock = FakeClock()
+        budgets = ResourceBudgets(4, clock=clock)
+        first = _make_node("first", ResourceClassNodeProperty(resource_class=ResourceClass.IO))
+        second = _make_node("second", ResourceClassNodeProperty(resource_class=ResourceClass.IO))
+
+        budgets.mark_queued("first")
+        budgets.mark_queued("second")
+        clock.now = 1.0
+        first_claim = budgets.acquire(first)
+        clock.now = 3.0
+        second_claim = budgets.acquire(second)
+        clock.now = 4.0
+        budgets.release(first_claim)
+        budgets.release(second_claim, completed=False)
+
+        metrics = budgets.metrics[ResourceClass.IO]
+        assert metrics.started == 2
+        assert metrics.completed == 1
+        assert metrics.average_queue_wait_s == pytest.approx(2.0)
+        assert metrics.max_queue_wait_s == pytest.approx(3.0)
+        assert metrics.average_run_s == pytest.approx(3.0)
+        assert metrics.throughput_per_s == pytest.approx(1 / 3)
+        assert budgets.metrics[ResourceClass.CPU].started == 0
+
+    def test_from_config_maps_setting_keys(self) -> None:
+        """Test building budgets from the resource_class_budgets setting."""
+        budgets = ResourceBudgets.from_config(8, {"cpu": None, "io": 6, "memory": 2, "gpu": 1})
+
+        assert budgets.budgets == {ResourceClass.CPU: 8, ResourceClass.IO: 6, ResourceClass.MEMORY: 2}
+
+
+class TestParallelResolutionContextBudgets:
+    """Test cases for resource budgets on the parallel resolution context."""
+
+    def test_can_start_node_uses_class_budget(self) -> None:
+        """Test that the context consults the node's resource class budget."""
+        context = ParallelResolutionContext(
+            "test_flow", max_nodes_in_parallel=4, dag_builder=DagBuilder(), resource_class_budgets={"memory": 1}
+        )
+        for name in ("heavy", "other_heavy"):
+            context.node_to_reference[name] = DagNode(
+                node_reference=_make_node(name, ResourceClassNodeProperty(resource_class=ResourceClass.MEMORY))
+            )
+
+        context.resource_budgets.acquire(context.node_to_reference["heavy"].node_reference)
+
+        assert not context.can_start_node("other_heavy")
+
+    def test_reset_starts_fresh_budgets(self) -> None:
+        """Test that reset drops in-use weight and metrics from the previous run."""
+        context = ParallelResolutionContext("test_flow", dag_builder=DagBuilder(), resource_class_budgets={"io": 2})
+        previous_budgets = context.resource_budgets
+        previous_budgets.acquire(_make_node("node"))
+
+        context.reset()
+
+        assert context.resource_budgets is not previous_budgets
+        assert context.resource_budgets.in_use[ResourceClass.CPU] == 0
+        assert context.resource_budgets.budgets[ResourceClass.IO] == 2
@@ -14,11 +14,18 @@ from griptape_nodes.node_library.library_declarations import (
     LifecycleStage,
     LifecycleStageLibraryProperty,
     LifecycleStageNodeProperty,
+    ProcessOffload,
+    ProcessOffloadLibraryProperty,
+    ProcessOffloadNodeProperty,
+    ResourceClass,
+    ResourceClassNodeProperty,
+    ResourceWeightNodeProperty,
     SuggestedWorkerMode,
     WorkerCompatibility,
     WorkerMode,
     WorkerModeCompatibility,
     requires_worker_process,
+    resolve_process_offload,
 )
 from griptape_nodes.node_library.library_registry import (
     CategoryDefinition,
@@ -84,6 +91,26 @@ class TestDeclarationDiscriminator:
         assert isinstance(decl, KeySupportNodeProperty)
         assert decl.support is KeySupport.REQUIRES_CUSTOMER_KEY
 
+    def test_node_resource_class_and_weight_round_trip(self) -> None:
+        metadata = _make_node_metadata(
+            declarations=[
+                ResourceClassNodeProperty(resource_class=ResourceClass.MEMORY),
+                ResourceWeightNodeProperty(weight=2),
+            ]
+        )
+
+        rebuilt = NodeMetadata.model_validate(metadata.model_dump(mode="json"))
+
+        resource_class, weight = rebuilt.declarations
+        assert isinstance(resource_class, ResourceClassNodeProperty)
+        assert resource_class.resource_class is ResourceClass.MEMORY
+        assert isinstance(weight, ResourceWeightNodeProperty)
+        assert weight.weight == 2  # noqa: PLR2004
+
+    def test_node_resource_weight_must_be_positive(self) -> None:
+        with pytest.raises(ValidationError):
+            ResourceWeightNodeProperty(weight=0)
+
     def test_library_lifecycle_stage_round_trips(self) -> None:
         metadata = _make_library_metadata(
             declarations=[LifecycleStageLibraryProperty(stage=LifecycleStage.STABLE)],
@@ -355,3 +382,29 @@ class TestRequiresWorkerProcess:
 class TestSchemaVersion:
     def test_latest_schema_version_is_090(self) -> None:
         assert LibrarySchema.LATEST_SCHEMA_VERSION == "0.9.0"
+
+
+# ---------- ProcessOffload resolution ----------
+
+
+class TestResolveProcessOffload:
+    def test_no_declarations_runs_on_event_loop(self) -> None:
+        assert resolve_process_offload([], []) is ProcessOffload.EVENT_LOOP
+
+    def test_library_declaration_applies_to_nodes(self) -> None:
+        library = [ProcessOffloadLibraryProperty(offload=ProcessOffload.THREAD)]
+
+        assert resolve_process_offload([], library) is ProcessOffload.THREAD
+
+    def test_node_declaration_overrides_library(self) -> None:
+        library = [ProcessOffloadLibraryProperty(offload=ProcessOffload.THREAD)]
+        node = [ProcessOffloadNodeProperty(offload=ProcessOffload.EVENT_LOOP)]
+
+        assert resolve_process_offload(node, library) is ProcessOffload.EVENT_LOOP
+
+    def test_round_trips_through_library_schema_json(self) -> None:
+        metadata = _make_library_metadata(declarations=[ProcessOffloadLibraryProperty(offload=ProcessOffload.THREAD)])
+
+        rebuilt = LibraryMetadata.model_validate(metadata.model_dump(mode="json"))
+
+        assert resolve_process_offload([], rebuilt.declarations) is ProcessOffload.THREAD
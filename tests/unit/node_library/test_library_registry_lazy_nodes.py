@@ -0,0 +1,116 @@
+"""Tests for node types registered on a Library without importing their class."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from griptape_nodes.exe_types.node_types import BaseNode, EndNode
+from griptape_nodes.node_library.library_registry import Library, LibraryMetadata, LibrarySchema, NodeMetadata
+
+NODE_METADATA = NodeMetadata(category="test", description="lazy probe", display_name="Lazy Probe")
+
+
+class _LazyProbe(BaseNode):
+    def process(self) -> None:
+        pass
+
+
+class _OtherLazyProbe(BaseNode):
+    def process(self) -> None:
+        pass
+
+
+def _library() -> Library:
+    schema = LibrarySchema(
+        name="lazy-test-library",
+        library_schema_version=LibrarySchema.LATEST_SCHEMA_VERSION,
+        metadata=LibraryMetadata(
+            author="test",
+            description="lazy library",
+            library_version="1.0.0",
+            engine_version="1.0.0",
+            tags=[],
+        ),
+        categories=[],
+        nodes=[],
+    )
+    return Library(library_data=schema)
+
+
+class TestLazyNodeTypes:
+    def test_listed_without_importing(self) -> None:
+        library = _library()
+        loader = Mock(return_value=_LazyProbe)
+
+        library.register_lazy_node_type("_LazyProbe", NODE_METADATA, loader)
+
+        assert library.has_node_type("_LazyProbe")
+        assert library.get_registered_nodes() == ["_LazyProbe"]
+        assert library.get_node_metadata("_LazyProbe") == NODE_METADATA
+        loader.assert_not_called()
+
+    def test_first_use_imports_once(self) -> None:
+        library = _library()
+        loader = Mock(return_value=_LazyProbe)
+        library.register_lazy_node_type("_LazyProbe", NODE_METADATA, loader)
+
+        node = library.create_node("_LazyProbe", name="probe-1")
+
+        assert isinstance(node, _LazyProbe)
+        assert library.get_node_class("_LazyProbe") is _LazyProbe
+        assert library.get_lazy_node_types() == []
+        loader.assert_called_once()
+
+    def test_failed_import_unregisters_node_type(self) -> None:
+        library = _library()
+        library.register_lazy_node_type("_LazyProbe", NODE_METADATA, Mock(side_effect=ImportError("no torch")))
+
+        with pytest.raises(ImportError, match="no torch"):
+            library.get_node_class("_LazyProbe")
+
+        assert not library.has_node_type("_LazyProbe")
+        with pytest.raises(KeyError):
+            library.get_node_class("_LazyProbe")
+
+    def test_matching_base_type_imports_deferred_classes(self) -> None:
+        library = _library()
+        library.register_lazy_node_type("_LazyProbe", NODE_METADATA, Mock(return_value=_LazyProbe))
+
+        assert library.get_nodes_by_base_type(BaseNode) == ["_LazyProbe"]
+        assert library.get_nodes_by_base_type(EndNode) == []
+
+    def test_listing_keeps_registration_order_as_classes_are_imported(self) -> None:
+        library = _library()
+        library.register_lazy_node_type("_LazyProbe", NODE_METADATA, Mock(return_value=_LazyProbe))
+        library.register_lazy_node_type("_OtherLazyProbe", NODE_METADATA, Mock(return_value=_OtherLazyProbe))
+
+        library.get_node_class("_OtherLazyProbe")
+
+        assert library.get_registered_nodes() == ["_LazyProbe", "_OtherLazyProbe"]
+
+    def test_import_of_one_node_type_does_not_block_another(self) -> None:
+        library = _library()
+        import_started = threading.Event()
+        release_import = threading.Event()
+
+        def slow_loader() -> type[BaseNode]:
+            import_started.set()
+            release_import.wait(timeout=5)
+            return _LazyProbe
+
+        library.register_lazy_node_type("_LazyProbe", NODE_METADATA, slow_loader)
+        library.register_lazy_node_type("_OtherLazyProbe", NODE_METADATA, Mock(return_value=_OtherLazyProbe))
+        slow_import = threading.Thread(target=library.get_node_class, args=("_LazyProbe",))
+        slow_import.start()
+        import_started.wait(timeout=5)
+
+        try:
+            assert library.get_node_class("_OtherLazyProbe") is _OtherLazyProbe
+            assert library.get_lazy_node_types() == ["_LazyProbe"]
+        finally:
+            release_import.set()
+            slow_import.join()
+        assert library.get_node_class("_LazyProbe") is _LazyProbe
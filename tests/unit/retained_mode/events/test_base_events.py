@@ -91,3 +91,50 @@ class TestResultDetailsRoundTrip:
         assert type(first) is ResultDetail
         assert isinstance(second, StrictModeViolationDetail)
         assert second.rule_id == "r2"
+
+
+class TestEventSerialization:
+    """BaseEvent.dict()/json() build the wire form without pydantic's generic serializer."""
+
+    def test_dict_matches_pydantic_serialization(self) -> None:
+        from griptape_nodes.retained_mode.events.base_events import (
+            EventResultSuccess,
+            ExecutionEvent,
+            ExecutionGriptapeNodeEvent,
+        )
+        from griptape_nodes.retained_mode.events.execution_events import ParameterValueUpdateEvent
+        from griptape_nodes.retained_mode.events.os_events import ReadFileResultSuccess
+
+        events = [
+            ExecutionGriptapeNodeEvent(
+                wrapped_event=ExecutionEvent(
+                    payload=ParameterValueUpdateEvent(node_name="n", parameter_name="p", data_type="str", value=[1, 2])
+                )
+            ),
+            EventResultSuccess(
+                request=ReadFileRequest(file_path="a.txt"),
+                result=ReadFileResultSuccess(
+                    content="hi", file_size=2, mime_type="text/plain", encoding="utf-8", result_details="ok"
+                ),
+                request_id="r1",
+                retained_mode="cmd",
+            ),
+        ]
+        for event in events:
+            # Passing any argument takes the original pydantic-based path.
+            assert event.dict() == event.dict(exclude=set())
+
+    def test_json_uses_str_fallback_for_unserializable_values(self) -> None:
+        from griptape_nodes.retained_mode.events.base_events import ExecutionEvent
+        from griptape_nodes.retained_mode.events.execution_events import ParameterValueUpdateEvent
+
+        class Opaque:
+            def __str__(self) -> str:
+                return "opaque"
+
+        event = ExecutionEvent(
+            payload=ParameterValueUpdateEvent(node_name="n", parameter_name="p", data_type="any", value=Opaque())
+        )
+
+        assert '"opaque"' in event.json()
+        assert event.json(indent=2).startswith("{\n")
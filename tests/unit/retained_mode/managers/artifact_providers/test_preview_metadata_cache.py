@@ -0,0 +1,88 @@
+"""Tests for PreviewMetadataCache."""
+
+from pathlib import Path
+
+from griptape_nodes.retained_mode.managers.artifact_manager import PreviewMetadata
+from griptape_nodes.retained_mode.managers.artifact_providers.preview_metadata_cache import (
+    CachedPreviewMetadata,
+    PreviewMetadataCache,
+)
+
+PREVIEW_DIR = Path("/workspace/.previews")
+
+
+def _cached(source_name: str) -> CachedPreviewMetadata:
+    metadata = PreviewMetadata(
+        version=PreviewMetadata.LATEST_SCHEMA_VERSION,
+        source_macro_path=f"/workspace/{source_name}",
+        source_file_size=100,
+        source_file_modified_time=1.0,
+        preview_file_names=f"{source_name}.webp",
+        preview_generator_name="Standard Thumbnail Generation",
+        preview_generator_parameters={},
+    )
+    return CachedPreviewMetadata(
+        metadata=metadata, destination_dir=PREVIEW_DIR, metadata_path=str(PREVIEW_DIR / f"{source_name}.json")
+    )
+
+
+class TestPreviewMetadataCache:
+    def test_hit_requires_matching_mtime_and_size(self) -> None:
+        cache = PreviewMetadataCache()
+        cache.put("/workspace/a.png", 1.0, 100, _cached("a.png"), generation=cache.generation)
+
+        assert cache.get("/workspace/a.png", 1.0, 100) is not None
+        assert cache.get("/workspace/a.png", 2.0, 100) is None
+        assert cache.get("/workspace/a.png", 1.0, 101) is None
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (1, 2)
+        assert stats.hit_rate == 1 / 3
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache = PreviewMetadataCache(max_entries=2)
+        cache.put("/workspace/a.png", 1.0, 100, _cached("a.png"), generation=cache.generation)
+        cache.put("/workspace/b.png", 1.0, 100, _cached("b.png"), generation=cache.generation)
+        cache.get("/workspace/a.png", 1.0, 100)
+        cache.put("/workspace/c.png", 1.0, 100, _cached("c.png"), generation=cache.generation)
+
+        assert cache.get("/workspace/b.png", 1.0, 100) is None
+        assert cache.get("/workspace/a.png", 1.0, 100) is not None
+        assert cache.stats().evictions == 1
+
+    def test_writing_metadata_or_preview_file_invalidates(self) -> None:
+        cache = PreviewMetadataCache()
+        cache.put("/workspace/a.png", 1.0, 100, _cached("a.png"), generation=cache.generation)
+        cache.put("/workspace/b.png", 1.0, 100, _cached("b.png"), generation=cache.generation)
+
+        assert cache.invalidate_path(str(PREVIEW_DIR / "a.png.json")) == 1
+        assert cache.invalidate_path(str(PREVIEW_DIR / "b.png.webp")) == 1
+        assert cache.stats().entries == 0
+
+    def test_deleting_preview_directory_invalidates_everything_under_it(self) -> None:
+        cache = PreviewMetadataCache()
+        cache.put("/workspace/a.png", 1.0, 100, _cached("a.png"), generation=cache.generation)
+        cache.put("/workspace/b.png", 1.0, 100, _cached("b.png"), generation=cache.generation)
+
+        assert cache.invalidate_path("/workspace/.previews-old") == 0
+        assert cache.invalidate_path(str(PREVIEW_DIR)) == 2  # noqa: PLR2004
+
+    def test_put_after_a_concurrent_invalidation_is_dropped(self) -> None:
+        cache = PreviewMetadataCache()
+        generation = cache.generation
+        # A write invalidates the metadata after the reader took the generation, before it stores the entry
+        cache.invalidate_path(str(PREVIEW_DIR / "a.png.json"))
+
+        assert not cache.put("/workspace/a.png", 1.0, 100, _cached("a.png"), generation=generation)
+        assert cache.get("/workspace/a.png", 1.0, 100) is None
+
+    def test_replaced_and_evicted_entries_leave_the_path_index(self) -> None:
+        cache = PreviewMetadataCache(max_entries=1)
+        cache.put("/workspace/a.png", 1.0, 100, _cached("a.png"), generation=cache.generation)
+        cache.put("/workspace/a.png", 1.0, 100, _cached("a.png"), generation=cache.generation)
+        cache.put("/workspace/b.png", 1.0, 100, _cached("b.png"), generation=cache.generation)
+
+        assert cache.invalidate_path(str(PREVIEW_DIR / "a.png.webp")) == 0
+        assert cache.invalidate_path(str(PREVIEW_DIR / "b.png.webp")) == 1
+        assert cache._keys_by_path == {}
+        assert cache._sorted_paths == []
@@ -1,9 +1,11 @@
+import asyncio
 import json
 import os
 import tempfile
 from collections.abc import Generator
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import anyio
 import pytest
@@ -15,6 +17,8 @@ from griptape_nodes.retained_mode.events.artifact_events import (
     GeneratePreviewRequest,
     GeneratePreviewResultFailure,
     GeneratePreviewResultSuccess,
+    GeneratePreviewsRequest,
+    GeneratePreviewsResultSuccess,
     GetArtifactProviderDetailsRequest,
     GetArtifactProviderDetailsResultFailure,
     GetArtifactProviderDetailsResultSuccess,
@@ -30,12 +34,16 @@ from griptape_nodes.retained_mode.events.artifact_events import (
 )
 from griptape_nodes.retained_mode.events.base_events import RequestPayload, ResultPayload
 from griptape_nodes.retained_mode.events.config_events import SetConfigValueResultSuccess
+from griptape_nodes.retained_mode.events.os_events import WriteFileRequest, WriteFileResultSuccess
 from griptape_nodes.retained_mode.events.project_events import MacroPath
+from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 from griptape_nodes.retained_mode.managers.artifact_manager import ArtifactManager, PreviewMetadata
 from griptape_nodes.retained_mode.managers.artifact_providers import (
     BaseArtifactProvider,
     ImageArtifactProvider,
 )
+from griptape_nodes.retained_mode.managers.artifact_providers.preview_metadata_cache import CachedPreviewMetadata
+from griptape_nodes.retained_mode.managers.os_manager import OSManager
 
 if TYPE_CHECKING:
     from griptape_nodes.retained_mode.managers.artifact_providers.image.preview_generators.pil_thumbnail_generator import (
@@ -1481,3 +1489,126 @@ class TestProviderRegistrationConfigLogLevels:
         assert error_records == [], (
             f"Provider registration produced ERROR-level logs: {[r.message for r in error_records]}"
         )
+
+
+class TestPreviewGenerationDedup:
+    """Concurrent requests for the same preview share one generation."""
+
+    class _CountingProvider:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        async def attempt_generate_preview(self, **_kwargs: object) -> str:
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            return "preview.webp"
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_requests_share_one_job(self) -> None:
+        manager = ArtifactManager()
+        provider = self._CountingProvider()
+        kwargs = {
+            "preview_generator_friendly_name": "Standard Thumbnail Generation",
+            "source_file_location": "/tmp/a.png",  # noqa: S108
+            "preview_format": "webp",
+            "destination_preview_directory": "/tmp/previews",  # noqa: S108
+            "destination_preview_file_name": "a.png.webp",
+            "params": {"max_width": 64, "max_height": 64},
+        }
+
+        results = await asyncio.gather(
+            *(
+                manager._attempt_generate_preview_once(cast("BaseArtifactProvider", provider), **kwargs)
+                for _ in range(5)
+            )
+        )
+
+        assert results == ["preview.webp"] * 5
+        assert provider.calls == 1
+        assert manager._previews_in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_different_parameters_generate_separately(self) -> None:
+        manager = ArtifactManager()
+        provider = self._CountingProvider()
+        base = {
+            "preview_generator_friendly_name": "Standard Thumbnail Generation",
+            "source_file_location": "/tmp/a.png",  # noqa: S108
+            "preview_format": "webp",
+            "destination_preview_directory": "/tmp/previews",  # noqa: S108
+            "destination_preview_file_name": "a.png.webp",
+        }
+
+        await asyncio.gather(
+            manager._attempt_generate_preview_once(
+                cast("BaseArtifactProvider", provider), params={"max_width": 64}, **base
+            ),
+            manager._attempt_generate_preview_once(
+                cast("BaseArtifactProvider", provider), params={"max_width": 128}, **base
+            ),
+        )
+
+        assert provider.calls == 2  # noqa: PLR2004
+
+
+class TestGeneratePreviews:
+    """Batch preview requests for a directory."""
+
+    @pytest.mark.asyncio
+    async def test_file_name_with_macro_syntax_fails_only_that_file(self, tmp_path: Path) -> None:
+        manager = ArtifactManager()
+        plain_file = tmp_path / "a.png"
+        brace_file = tmp_path / "b{.png"
+        preview_result = GetPreviewForArtifactResultSuccess(
+            paths_to_preview="a.png.webp", result_details="Preview retrieved"
+        )
+
+        with (
+            patch.object(
+                manager, "_list_previewable_files", return_value=[(plain_file, "Image"), (brace_file, "Image")]
+            ),
+            patch.object(manager, "on_handle_get_preview_for_artifact_request", AsyncMock(return_value=preview_result)),
+            patch("griptape_nodes.retained_mode.managers.artifact_manager.GriptapeNodes.EventManager", MagicMock()),
+        ):
+            result = await manager.on_handle_generate_previews_request(GeneratePreviewsRequest(directory=str(tmp_path)))
+
+        assert isinstance(result, GeneratePreviewsResultSuccess)
+        assert result.paths_to_preview == {str(plain_file): "a.png.webp"}
+        assert list(result.failures) == [str(brace_file)]
+
+
+class TestPreviewMetadataInvalidation:
+    """OSManager drops cached preview metadata once a file request has changed the file."""
+
+    def test_write_invalidates_after_the_file_changes(self, griptape_nodes: GriptapeNodes, tmp_path: Path) -> None:
+        target = tmp_path / "a.txt"
+        target.write_text("old")
+        cache = griptape_nodes.ArtifactManager()._preview_metadata_cache
+        metadata = PreviewMetadata(
+            version=PreviewMetadata.LATEST_SCHEMA_VERSION,
+            source_macro_path=str(target),
+            source_file_size=3,
+            source_file_modified_time=1.0,
+            preview_file_names="a.txt.webp",
+            preview_generator_name="Standard Thumbnail Generation",
+            preview_generator_parameters={},
+        )
+        cached = CachedPreviewMetadata(
+            metadata=metadata, destination_dir=tmp_path, metadata_path=str(tmp_path / "a.json")
+        )
+        cache.put(str(target), 1.0, 3, cached, generation=cache.generation)
+        # A preview request that reads metadata while the write is landing
+        generations_seen_after_write: list[int] = []
+
+        def observe_write(_path: Path) -> None:
+            assert target.read_text() == "new"
+            generations_seen_after_write.append(cache.generation)
+
+        with patch.object(OSManager, "_record_cache_directory_write", side_effect=observe_write):
+            result = griptape_nodes.OSManager().on_write_file_request(
+                WriteFileRequest(file_path=str(target), content="new")
+            )
+
+        assert isinstance(result, WriteFileResultSuccess)
+        assert cache.get(str(target), 1.0, 3) is None
+        assert not cache.put(str(target), 1.0, 3, cached, generation=generations_seen_after_write[0])
@@ -196,7 +196,7 @@ class _ProbeResult(ResultPayloadSuccess):
 
 
 class TestHandleRequestLoopSafety:
-    """`handle_request` drives async handlers via ThreadRunner from inside a running loop.
+    """`handle_request` drives async handlers on a sync bridge side loop from inside a running loop.
 
     The #4469 deadlock is specific to callbacks whose coroutines share
     primitives with the caller's loop; ``RemoteHandler`` is the only such
@@ -207,7 +207,7 @@ class TestHandleRequestLoopSafety:
     """
 
     @pytest.mark.asyncio
-    async def test_sync_dispatch_from_running_loop_drives_async_handler_via_thread_runner(self) -> None:
+    async def test_sync_dispatch_from_running_loop_drives_async_handler_on_side_loop(self) -> None:
         event_manager = EventManager()
 
         captured: dict[str, object] = {}
@@ -247,6 +247,26 @@ class TestHandleRequestLoopSafety:
         event = event_manager.handle_request(_ProbeRequest())
         assert event.result.succeeded()
 
+    @pytest.mark.asyncio
+    async def test_sync_dispatch_reuses_side_loop_and_records_latency(self) -> None:
+        event_manager = EventManager()
+
+        handler_loops: list[asyncio.AbstractEventLoop] = []
+
+        async def async_handler(_request: _ProbeRequest) -> _ProbeResult:
+            handler_loops.append(asyncio.get_running_loop())
+            return _ProbeResult(result_details="ok")
+
+        event_manager.assign_manager_to_request_type(_ProbeRequest, async_handler)
+
+        for _ in range(3):
+            event_manager.handle_request(_ProbeRequest())
+
+        stats = event_manager.sync_bridge_stats()
+        assert len(set(handler_loops)) == 1
+        assert stats.calls == 3  # noqa: PLR2004
+        assert stats.loops_started == 1
+
     @pytest.mark.asyncio
     async def test_ahandle_request_is_the_recommended_async_alternative(self) -> None:
         event_manager = EventManager()
@@ -329,7 +349,7 @@ class TestHandleRequestForwardingFromRunningLoop:
 
 
 class TestBroadcastAppEventLoopSafety:
-    """`broadcast_app_event` drives async listeners via ThreadRunner from inside a running loop."""
+    """`broadcast_app_event` drives async listeners on a sync bridge side loop from inside a running loop."""
 
     @pytest.mark.asyncio
     async def test_sync_broadcast_from_running_loop_drives_async_listener(self) -> None:
@@ -25,6 +25,8 @@ from griptape_nodes.retained_mode.events.library_events import (
     DescribeNodeTypeRequest,
     DescribeNodeTypeResultFailure,
     DescribeNodeTypeResultSuccess,
+    DiscoveredLibrary,
+    DiscoverLibrariesResultSuccess,
     GetAllInfoForAllLibrariesRequest,
     GetAllInfoForAllLibrariesResultFailure,
     GetAllInfoForAllLibrariesResultSuccess,
@@ -41,6 +43,7 @@ from griptape_nodes.retained_mode.events.library_events import (
 )
 from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 from griptape_nodes.retained_mode.managers.library_manager import LibraryManager as _LibraryManager
+from griptape_nodes.retained_mode.managers.library_manager import LibraryPreparation
 from griptape_nodes.retained_mode.managers.settings import LibraryRegistration
 
 
@@ -146,6 +149,83 @@ class TestLibraryManagerLoadLibraries:
             assert "failed" in result.result_details.result_details[0].message.lower()
 
 
+class TestLibraryManagerConcurrentLoading:
+    """load_all_libraries_from_config prepares libraries concurrently but registers them in order."""
+
+    @staticmethod
+    def _lib_info(path: str) -> _LibraryManager.LibraryInfo:
+        return _LibraryManager.LibraryInfo(
+            lifecycle_state=_LibraryManager.LibraryLifecycleState.DISCOVERED,
+            library_path=path,
+            is_sandbox=False,
+            library_name=Path(path).parent.name,
+            fitness=_LibraryManager.LibraryFitness.NOT_EVALUATED,
+            problems=[],
+        )
+
+    @pytest.mark.asyncio
+    async def test_preparation_overlaps_and_registration_follows_config_order(
+        self, griptape_nodes: GriptapeNodes
+    ) -> None:
+        library_manager = griptape_nodes.LibraryManager()
+        # lib_b shares a directory (and so a venv) with lib_a
+        paths = ["/libs/a/lib_a.json", "/libs/a/lib_b.json", "/libs/c/lib_c.json"]
+        # The first library is the slowest to prepare; it must still register first
+        prepare_delays = {paths[0]: 0.05, paths[1]: 0.0, paths[2]: 0.0}
+        events: list[tuple[str, str]] = []
+        in_flight_per_venv: dict[str, int] = {}
+
+        async def fake_prepare(lib_path: str) -> LibraryPreparation:
+            venv_dir = str(Path(lib_path).parent)
+            in_flight_per_venv[venv_dir] = in_flight_per_venv.get(venv_dir, 0) + 1
+            assert in_flight_per_venv[venv_dir] == 1
+            events.append(("prepare_start", lib_path))
+            await asyncio.sleep(prepare_delays[lib_path])
+            events.append(("prepare_end", lib_path))
+            in_flight_per_venv[venv_dir] -= 1
+            return LibraryPreparation(failure=None, phase_durations_s={"dependencies": prepare_delays[lib_path]})
+
+        async def fake_register(request: RegisterLibraryFromFileRequest) -> RegisterLibraryFromFileResultFailure:
+            events.append(("register", str(request.file_path)))
+            return RegisterLibraryFromFileResultFailure(result_details="not under test")
+
+        discover_result = DiscoverLibrariesResultSuccess(
+            result_details="discovered",
+            libraries_discovered=[DiscoveredLibrary(path=Path(path), is_sandbox=False) for path in paths],
+        )
+        with (
+            patch.object(library_manager, "_library_file_path_to_info", {path: self._lib_info(path) for path in paths}),
+            patch.object(library_manager, "discover_libraries_request", return_value=discover_result),
+            patch.object(library_manager, "_prepare_library_for_registration", side_effect=fake_prepare),
+            patch.object(library_manager, "register_library_from_file_request", side_effect=fake_register),
+            patch.object(library_manager, "_remove_missing_libraries_from_config"),
+            patch.object(library_manager, "_get_max_concurrent_library_installs", return_value=4),
+        ):
+            await library_manager.load_all_libraries_from_config()
+
+        assert [path for kind, path in events if kind == "register"] == paths
+        # lib_c finished preparing while lib_a was still installing
+        assert events.index(("prepare_end", paths[2])) < events.index(("prepare_end", paths[0]))
+        # lib_b waited for lib_a's venv
+        assert events.index(("prepare_start", paths[1])) > events.index(("prepare_end", paths[0]))
+
+    @pytest.mark.asyncio
+    async def test_failed_preparation_is_not_registered(self, griptape_nodes: GriptapeNodes) -> None:
+        library_manager = griptape_nodes.LibraryManager()
+        mock_register = AsyncMock()
+        failure = RegisterLibraryFromFileResultFailure(result_details="install failed")
+
+        with patch.object(library_manager, "register_library_from_file_request", mock_register):
+            await library_manager._load_and_track_library(
+                "/libs/a/lib_a.json",
+                1,
+                1,
+                preparation=LibraryPreparation(failure=failure, phase_durations_s={"dependencies": 1.0}),
+            )
+
+        mock_register.assert_not_called()
+
+
 class TestLibraryManagerDisabledEntries:
     """Behavior when libraries_to_register entries have enabled=False."""
 
@@ -865,6 +945,102 @@ class TestLibraryManagerInstallLibraryDependencies:
 
         assert isinstance(result, InstallLibraryDependenciesResultFailure)
 
+    def _schema_with_dependencies(self, library_name: str = "test_lib", dependency: str = "numpy==2.0") -> MagicMock:
+        schema = MagicMock()
+        schema.name = library_name
+        schema.metadata.library_version = "1.0.0"
+        schema.metadata.dependencies.pip_dependencies = [dependency]
+        schema.metadata.dependencies.pip_install_flags = []
+        return schema
+
+    async def _install(
+        self,
+        griptape_nodes: GriptapeNodes,
+        venv_path: Path,
+        *,
+        force_reinstall: bool = False,
+        schema: MagicMock | None = None,
+    ) -> tuple[Any, AsyncMock]:
+        mgr = griptape_nodes.LibraryManager()
+        mock_subprocess_run = AsyncMock()
+        with (
+            patch.object(
+                mgr,
+                "load_library_metadata_from_file_request",
+                return_value=self._metadata_result(schema or self._schema_with_dependencies()),
+            ),
+            patch.object(mgr, "_get_library_venv_path", return_value=venv_path),
+            patch.object(mgr, "_init_library_venv", new_callable=AsyncMock, return_value=venv_path / "bin" / "python"),
+            patch.object(mgr, "_can_write_to_venv_location", return_value=True),
+            patch(
+                "griptape_nodes.retained_mode.managers.library_manager.OSManager.check_available_disk_space",
+                return_value=True,
+            ),
+            patch(
+                "griptape_nodes.retained_mode.managers.library_manager.is_venv_functional",
+                side_effect=lambda path: path.is_dir(),
+            ),
+            patch("griptape_nodes.retained_mode.managers.library_manager.subprocess_run", mock_subprocess_run),
+            patch.object(griptape_nodes.ConfigManager(), "get_config_value", side_effect=_fake_config_value),
+        ):
+            result = await mgr.install_library_dependencies_request(
+                InstallLibraryDependenciesRequest(library_file_path="/mock.json", force_reinstall=force_reinstall)
+            )
+        return result, mock_subprocess_run
+
+    @pytest.mark.asyncio
+    async def test_skips_install_when_dependencies_are_unchanged(
+        self, griptape_nodes: GriptapeNodes, tmp_path: Path
+    ) -> None:
+        """A second install of the same dependencies into the same venv does not run uv."""
+        venv_path = tmp_path / ".venv"
+        venv_path.mkdir()
+
+        first, first_run = await self._install(griptape_nodes, venv_path)
+        second, second_run = await self._install(griptape_nodes, venv_path)
+
+        first_run.assert_called_once()
+        assert isinstance(first, InstallLibraryDependenciesResultSuccess)
+        assert not first.install_skipped
+        second_run.assert_not_called()
+        assert isinstance(second, InstallLibraryDependenciesResultSuccess)
+        assert second.install_skipped
+
+    @pytest.mark.asyncio
+    async def test_force_reinstall_ignores_fingerprint(self, griptape_nodes: GriptapeNodes, tmp_path: Path) -> None:
+        """force_reinstall runs uv even when the recorded fingerprint matches."""
+        venv_path = tmp_path / ".venv"
+        venv_path.mkdir()
+
+        await self._install(griptape_nodes, venv_path)
+        result, forced_run = await self._install(griptape_nodes, venv_path, force_reinstall=True)
+
+        forced_run.assert_called_once()
+        assert isinstance(result, InstallLibraryDependenciesResultSuccess)
+        assert not result.install_skipped
+
+    @pytest.mark.asyncio
+    async def test_libraries_sharing_a_venv_skip_independently(
+        self, griptape_nodes: GriptapeNodes, tmp_path: Path
+    ) -> None:
+        """Installing one library into a shared venv does not make the other reinstall."""
+        venv_path = tmp_path / ".venv"
+        venv_path.mkdir()
+        schema_a = self._schema_with_dependencies("lib_a", "numpy==2.0")
+        schema_b = self._schema_with_dependencies("lib_b", "pillow==11.0")
+
+        await self._install(griptape_nodes, venv_path, schema=schema_a)
+        await self._install(griptape_nodes, venv_path, schema=schema_b)
+        second_a, second_a_run = await self._install(griptape_nodes, venv_path, schema=schema_a)
+        second_b, second_b_run = await self._install(griptape_nodes, venv_path, schema=schema_b)
+
+        second_a_run.assert_not_called()
+        second_b_run.assert_not_called()
+        assert isinstance(second_a, InstallLibraryDependenciesResultSuccess)
+        assert second_a.install_skipped
+        assert isinstance(second_b, InstallLibraryDependenciesResultSuccess)
+        assert second_b.install_skipped
+
 
 def _fake_config_value(key: str, **_: object) -> object:
     """Return realistic values for config keys touched by venv initialization."""
@@ -1728,3 +1904,43 @@ class TestLibraryNodeMetadataInjection:
         injected = node.metadata["library_node_metadata"]
         assert injected["category"] == "test"
         assert injected["description"] == "probe"
+
+
+class TestLazyNodeImport:
+    """Node classes deferred by lazy_node_import are imported by _import_lazy_node_class."""
+
+    @staticmethod
+    def _lib_info() -> _LibraryManager.LibraryInfo:
+        return _LibraryManager.LibraryInfo(
+            lifecycle_state=_LibraryManager.LibraryLifecycleState.LOADED,
+            library_path="/libs/lazy/lib.json",
+            is_sandbox=False,
+            library_name="LazyLib",
+            fitness=_LibraryManager.LibraryFitness.GOOD,
+            problems=[],
+        )
+
+    def test_import_failure_is_recorded_on_the_library(self, griptape_nodes: GriptapeNodes) -> None:
+        library_manager = griptape_nodes.LibraryManager()
+        lib_info = self._lib_info()
+
+        with (
+            patch.object(library_manager, "_load_class_from_file", side_effect=ImportError("No module named 'torch'")),
+            pytest.raises(ImportError),
+        ):
+            library_manager._import_lazy_node_class(Path("/libs/lazy/node.py"), "HeavyNode", "LazyLib", lib_info)
+
+        assert len(lib_info.problems) == 1
+        assert lib_info.fitness == _LibraryManager.LibraryFitness.FLAWED
+
+    def test_import_success_returns_class(self, griptape_nodes: GriptapeNodes) -> None:
+        library_manager = griptape_nodes.LibraryManager()
+        lib_info = self._lib_info()
+
+        with patch.object(library_manager, "_load_class_from_file", return_value=_LifecycleProbe):
+            node_class = library_manager._import_lazy_node_class(
+                Path("/libs/lazy/node.py"), "_LifecycleProbe", "LazyLib", lib_info
+            )
+
+        assert node_class is _LifecycleProbe
+        assert lib_info.problems == []
@@ -9,7 +9,15 @@ from griptape_nodes.retained_mode.events.node_events import (
     BatchSetNodeMetadataResultFailure,
     BatchSetNodeMetadataResultSuccess,
 )
-from griptape_nodes.retained_mode.events.parameter_events import AlterParameterDetailsRequest
+from griptape_nodes.retained_mode.events.parameter_events import (
+    AlterParameterDetailsRequest,
+    BatchSetParameterValuesRequest,
+    BatchSetParameterValuesResultFailure,
+    BatchSetParameterValuesResultSuccess,
+    SetParameterValueRequest,
+    SetParameterValueResultFailure,
+    SetParameterValueResultSuccess,
+)
 from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 
 
@@ -51,6 +59,66 @@ class TestNodeManagerBatchSetNodeMetadata:
         assert "nonexistent_node2" in result_str
 
 
+class TestNodeManagerBatchSetParameterValues:
+    """Test BatchSetParameterValuesRequest in NodeManager."""
+
+    @staticmethod
+    def _set_value(
+        request: SetParameterValueRequest,
+    ) -> SetParameterValueResultSuccess | SetParameterValueResultFailure:
+        if request.parameter_name == "bad":
+            return SetParameterValueResultFailure(result_details="rejected")
+        return SetParameterValueResultSuccess(finalized_value=request.value, data_type="str", result_details="ok")
+
+    def test_sets_every_value_on_the_node(self, griptape_nodes: GriptapeNodes) -> None:
+        """Each value is applied through the single-value handler, in order, on the named node."""
+        from unittest.mock import MagicMock, patch
+
+        from griptape_nodes.exe_types.node_types import BaseNode
+
+        griptape_nodes.ObjectManager().add_object_by_name("test_node", MagicMock(spec=BaseNode))
+        node_manager = griptape_nodes.NodeManager()
+
+        with patch.object(node_manager, "on_set_parameter_value_request", side_effect=self._set_value) as set_value:
+            result = GriptapeNodes.handle_request(
+                BatchSetParameterValuesRequest(node_name="test_node", parameter_values={"a": "1", "b": "2"})
+            )
+
+        assert isinstance(result, BatchSetParameterValuesResultSuccess)
+        assert result.updated_parameters == ["a", "b"]
+        assert [(call.args[0].node_name, call.args[0].parameter_name) for call in set_value.call_args_list] == [
+            ("test_node", "a"),
+            ("test_node", "b"),
+        ]
+
+    def test_reports_failed_values_and_keeps_setting_the_rest(self, griptape_nodes: GriptapeNodes) -> None:
+        """A rejected value fails the batch but doesn't stop later values from being set."""
+        from unittest.mock import MagicMock, patch
+
+        from griptape_nodes.exe_types.node_types import BaseNode
+
+        griptape_nodes.ObjectManager().add_object_by_name("test_node", MagicMock(spec=BaseNode))
+        node_manager = griptape_nodes.NodeManager()
+
+        with patch.object(node_manager, "on_set_parameter_value_request", side_effect=self._set_value) as set_value:
+            result = GriptapeNodes.handle_request(
+                BatchSetParameterValuesRequest(node_name="test_node", parameter_values={"bad": "1", "good": "2"})
+            )
+
+        assert isinstance(result, BatchSetParameterValuesResultFailure)
+        assert result.failed_parameters == {"bad": "rejected"}
+        assert set_value.call_count == 2  # noqa: PLR2004
+
+    def test_missing_node_fails(self) -> None:
+        """The batch fails without setting anything when the node doesn't exist."""
+        result = GriptapeNodes.handle_request(
+            BatchSetParameterValuesRequest(node_name="nonexistent_node", parameter_values={"a": "1"})
+        )
+
+        assert isinstance(result, BatchSetParameterValuesResultFailure)
+        assert "nonexistent_node" in str(result.result_details)
+
+
 class TestNodeManagerResolutionStateSerialization:
     """Test that node resolution states are preserved correctly during serialization."""
 
@@ -0,0 +1,57 @@
+"""Tests for ObjectManager name generation."""
+
+from unittest.mock import patch
+
+from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
+
+
+class TestObjectManagerGenerateNameForObject:
+    """Test that generated names always use the first free index."""
+
+    def test_colliding_names_take_successive_indices(self, griptape_nodes: GriptapeNodes) -> None:
+        """A colliding requested name gets the next free index each time."""
+        obj_mgr = griptape_nodes.ObjectManager()
+        obj_mgr.add_object_by_name("body", object())
+
+        names = []
+        for _ in range(3):
+            name = obj_mgr.generate_name_for_object("ControlFlow", "body")
+            obj_mgr.add_object_by_name(name, object())
+            names.append(name)
+
+        assert names == ["body_1", "body_2", "body_3"]
+
+    def test_deleted_name_is_reused(self, griptape_nodes: GriptapeNodes) -> None:
+        """Deleting an object frees its index for the next generated name."""
+        obj_mgr = griptape_nodes.ObjectManager()
+        for _ in range(3):
+            obj_mgr.add_object_by_name(obj_mgr.generate_name_for_object("ControlFlow"), object())
+
+        obj_mgr.del_obj_by_name("ControlFlow_2")
+
+        assert obj_mgr.generate_name_for_object("ControlFlow") == "ControlFlow_2"
+        obj_mgr.add_object_by_name("ControlFlow_2", object())
+        assert obj_mgr.generate_name_for_object("ControlFlow") == "ControlFlow_4"
+
+    def test_renamed_away_name_is_reused(self, griptape_nodes: GriptapeNodes) -> None:
+        """Renaming an object frees its old index for the next generated name."""
+        from griptape_nodes.exe_types.flow import ControlFlow
+        from griptape_nodes.retained_mode.events.object_events import RenameObjectRequest, RenameObjectResultSuccess
+
+        obj_mgr = griptape_nodes.ObjectManager()
+        obj_mgr.add_object_by_name("Flow1", ControlFlow(name="Flow1"))
+        obj_mgr.add_object_by_name(obj_mgr.generate_name_for_object("ControlFlow", "Flow1"), object())
+
+        with patch.object(griptape_nodes.FlowManager(), "handle_flow_rename"):
+            result = GriptapeNodes.handle_request(RenameObjectRequest(object_name="Flow1", requested_name="Renamed"))
+
+        assert isinstance(result, RenameObjectResultSuccess)
+        assert obj_mgr.generate_name_for_object("ControlFlow", "Flow2") == "Flow1"
+
+    def test_names_taken_outside_generation_are_skipped(self, griptape_nodes: GriptapeNodes) -> None:
+        """Names added directly, not generated, are still treated as taken."""
+        obj_mgr = griptape_nodes.ObjectManager()
+        obj_mgr.add_object_by_name(obj_mgr.generate_name_for_object("ControlFlow"), object())
+        obj_mgr.add_object_by_name("ControlFlow_2", object())
+
+        assert obj_mgr.generate_name_for_object("ControlFlow") == "ControlFlow_3"
@@ -653,23 +653,30 @@ class TestExtensionCoercion:
     """Test extension coercion (rename suffix to match sniffed bytes) inside OSManager."""
 
     @pytest.fixture
-    def temp_dir(self) -> Generator[Path, None, None]:
-        """Create a temporary directory for testing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir).resolve()
+    def temp_dir(self, tmp_path: Path) -> Path:
+        """Use pytest's temporary directory, so sidecars never land in the working directory."""
+        return tmp_path.resolve()
 
     @pytest.fixture(autouse=True)
     def setup_workspace(self, temp_dir: Path, griptape_nodes: GriptapeNodes) -> Generator[None, None, None]:
-        """Set workspace and register the image artifact provider so sniff_extension works."""
+        """Set workspace and project to temp_dir and register the image artifact provider so sniff_extension works."""
         original_workspace = griptape_nodes.ConfigManager().workspace_path
         griptape_nodes.ConfigManager().workspace_path = temp_dir
 
+        # Sidecars resolve against the current project, so it must live in temp_dir too
+        project_yml = temp_dir / "project_template.yml"
+        project_yml.write_text(DEFAULT_PROJECT_TEMPLATE.to_overlay_yaml(DEFAULT_PROJECT_TEMPLATE))
+        load_result = GriptapeNodes.handle_request(LoadProjectTemplateRequest(project_path=project_yml))
+        if isinstance(load_result, LoadProjectTemplateResultSuccess):
+            GriptapeNodes.handle_request(SetCurrentProjectRequest(project_id=load_result.project_id))
+
         griptape_nodes.ArtifactManager().on_handle_register_artifact_provider_request(
             RegisterArtifactProviderRequest(provider_class=ImageArtifactProvider)
         )
 
         yield
 
+        GriptapeNodes.handle_request(SetCurrentProjectRequest(project_id=None))
         griptape_nodes.ConfigManager().workspace_path = original_workspace
 
     def test_default_coerce_renames_jpeg_when_destination_is_png(
@@ -765,6 +772,7 @@ class TestExtensionCoercion:
         assert request.file_metadata.situation is not None
         assert request.file_metadata.situation.variables is not None
         assert request.file_metadata.situation.variables["file_extension"] == "jpg"
+        assert (temp_dir / ".griptape-nodes-metadata" / "image.jpg.json").exists()
 
     def test_coerce_skipped_for_text_content(self, griptape_nodes: GriptapeNodes, temp_dir: Path) -> None:
         """Text writes should never trigger sniffing/rename."""
@@ -3,7 +3,7 @@ import asyncio
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import anyio
 import pytest
@@ -525,6 +525,42 @@ class TestWorkflowManager:
         assert result.new_workflow_name == "subdir/my_workflow"
         mock_rekey.assert_called_once_with("my_workflow", "subdir/my_workflow")
 
+    def test_on_move_workflow_request_takes_value_blobs_along(
+        self, griptape_nodes: GriptapeNodes, tmp_path: Path
+    ) -> None:
+        """A workflow moved to another directory still loads its blobs; the old directory drops them."""
+        import pickle
+
+        from griptape_nodes.common.workflow_value_blobs import (
+            get_workflow_value_blob_dir,
+            load_workflow_value_blob,
+            write_workflow_value_blob,
+        )
+
+        workflow_manager = griptape_nodes.WorkflowManager()
+        source_file = tmp_path / "my_workflow.py"
+        digest = write_workflow_value_blob(get_workflow_value_blob_dir(source_file), pickle.dumps(b"z" * 4096))
+        source_file.write_text(f"value = load_workflow_value_blob(__file__, '{digest}')\n")
+
+        mock_workflow = MagicMock()
+        mock_workflow.file_path = "my_workflow.py"
+
+        config_mgr = griptape_nodes.ConfigManager()
+        with (
+            patch.object(WorkflowRegistry, "get_workflow_by_name", return_value=mock_workflow),
+            patch.object(WorkflowRegistry, "get_complete_file_path", return_value=str(source_file)),
+            patch.object(type(config_mgr), "workspace_path", new_callable=PropertyMock, return_value=tmp_path),
+            patch.object(WorkflowRegistry, "rekey_workflow"),
+            patch.object(config_mgr, "delete_user_workflow"),
+        ):
+            result = workflow_manager.on_move_workflow_request(
+                MoveWorkflowRequest(workflow_name="my_workflow", target_directory="subdir")
+            )
+
+        assert isinstance(result, MoveWorkflowResultSuccess)
+        assert load_workflow_value_blob(tmp_path / "subdir" / "my_workflow.py", digest) == b"z" * 4096
+        assert list(get_workflow_value_blob_dir(source_file).iterdir()) == []
+
     def test_on_move_workflow_request_no_rekey_same_directory(self, griptape_nodes: GriptapeNodes) -> None:
         """Moving within the same directory level produces the same registry key; no rekey occurs."""
         workflow_manager = griptape_nodes.WorkflowManager()
@@ -1540,6 +1576,58 @@ class TestWorkflowManager:
         # ast.parse raises SyntaxError if rewrite_string_comments left bad output behind.
         ast.parse(content)
 
+    def _generate_unique_values(
+        self, griptape_nodes: GriptapeNodes, values: dict, tmp_path: Path
+    ) -> tuple[str, dict[str, set[str]]]:
+        from griptape_nodes.common.workflow_value_blobs import get_workflow_value_blob_dir
+        from griptape_nodes.retained_mode.managers.workflow_manager import ImportRecorder
+
+        import_recorder = ImportRecorder()
+        module = griptape_nodes.WorkflowManager()._generate_unique_values_code(
+            unique_parameter_uuid_to_values=values,
+            prefix="top_level",
+            import_recorder=import_recorder,
+            value_blob_dir=get_workflow_value_blob_dir(tmp_path / "workflow.py"),
+            value_blob_threshold_bytes=1024,
+        )
+        return ast.unparse(module), import_recorder.from_imports
+
+    def test_generate_unique_values_code_stores_large_values_as_blobs(
+        self, griptape_nodes: GriptapeNodes, tmp_path: Path
+    ) -> None:
+        """Values at or above the threshold go to the blob directory; smaller ones stay embedded."""
+        import pickle
+
+        from griptape_nodes.common.workflow_value_blobs import load_workflow_value_blob
+
+        large_value = b"x" * 4096
+        values = {"small": "tiny", "large": large_value}
+        code, from_imports = self._generate_unique_values(griptape_nodes, values, tmp_path)
+
+        assert "load_workflow_value_blob" in from_imports["griptape_nodes.common.workflow_value_blobs"]
+        assert "load_workflow_value_blob(__file__" in code
+        assert large_value not in code.encode("latin1")
+        blobs = list((tmp_path / ".workflow_blobs").iterdir())
+        assert len(blobs) == 1
+
+        namespace = {
+            "__file__": str(tmp_path / "workflow.py"),
+            "pickle": pickle,
+            "load_workflow_value_blob": load_workflow_value_blob,
+        }
+        exec(code, namespace)  # noqa: S102
+        assert namespace["top_level_unique_values_dict"] == values
+
+    def test_generate_unique_values_code_reuses_identical_blobs(
+        self, griptape_nodes: GriptapeNodes, tmp_path: Path
+    ) -> None:
+        """Saving the same large value twice, even from different workflows, stores one blob."""
+        first_code, _ = self._generate_unique_values(griptape_nodes, {"a": b"y" * 4096}, tmp_path)
+        second_code, _ = self._generate_unique_values(griptape_nodes, {"b": b"y" * 4096}, tmp_path)
+
+        assert len(list((tmp_path / ".workflow_blobs").iterdir())) == 1
+        assert first_code.split("load_workflow_value_blob(")[1] == second_code.split("load_workflow_value_blob(")[1]
+
     def test_collect_object_imports_routes_dynamic_module_to_deferred(self, griptape_nodes: GriptapeNodes) -> None:
         """Dynamic library class imports must go into deferred_imports, not import_recorder.
 
@@ -1,9 +1,12 @@
+from collections.abc import AsyncIterator
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import anyio
 import pytest
+from fastapi import HTTPException
 
-from griptape_nodes.servers.static import _serve_external_file
+from griptape_nodes.servers.static import _create_static_file, _list_static_files, _serve_external_file
 
 
 class TestServeExternalFile:
@@ -49,3 +52,113 @@ class TestServeExternalFile:
             # Path() should have been called with the raw path, not with "/" prepended
             mock_path_cls.assert_called_once_with(already_absolute_path)
             mock_response.assert_called_once_with(mock_candidate)
+
+
+def _upload_request(chunks: list[bytes], content_length: int | None = None) -> MagicMock:
+    async def stream() -> AsyncIterator[bytes]:
+        for chunk in chunks:
+            yield chunk
+
+    request = MagicMock()
+    request.headers = {} if content_length is None else {"content-length": str(content_length)}
+    request.stream = stream
+    return request
+
+
+def _griptape_nodes(workspace: Path) -> MagicMock:
+    griptape_nodes = MagicMock()
+    griptape_nodes.ConfigManager.return_value.workspace_path = workspace
+    griptape_nodes.StaticFilesManager.return_value.static_server_base_url = "http://localhost:8124"
+    return griptape_nodes
+
+
+class TestCreateStaticFile:
+    """Test _create_static_file() streaming uploads."""
+
+    @pytest.mark.asyncio
+    async def test_streams_chunks_to_file(self, tmp_path: Path) -> None:
+        with patch("griptape_nodes.servers.static.GriptapeNodes", _griptape_nodes(tmp_path)):
+            result = await _create_static_file(_upload_request([b"abc", b"def"]), "outputs/image.png")
+
+        assert (tmp_path / "outputs" / "image.png").read_bytes() == b"abcdef"
+        assert result["url"].endswith("/workspace/outputs/image.png")
+        assert [path.name async for path in anyio.Path(tmp_path / "outputs").iterdir()] == ["image.png"]
+
+    @pytest.mark.asyncio
+    async def test_rejects_upload_over_limit_and_keeps_existing_file(self, tmp_path: Path) -> None:
+        (tmp_path / "image.png").write_bytes(b"old")
+
+        with (
+            patch("griptape_nodes.servers.static.GriptapeNodes", _griptape_nodes(tmp_path)),
+            patch("griptape_nodes.servers.static.STATIC_SERVER_MAX_UPLOAD_BYTES", 4),
+            pytest.raises(HTTPException) as exc_info,
+        ):
+            await _create_static_file(_upload_request([b"abc", b"def"]), "image.png")
+
+        assert exc_info.value.status_code == 413  # noqa: PLR2004
+        assert [path.name async for path in anyio.Path(tmp_path).iterdir()] == ["image.png"]
+        assert (tmp_path / "image.png").read_bytes() == b"old"
+
+    @pytest.mark.asyncio
+    async def test_rejects_declared_content_length_over_limit(self, tmp_path: Path) -> None:
+        request = _upload_request([b"never read"], content_length=100)
+
+        with (
+            patch("griptape_nodes.servers.static.GriptapeNodes", _griptape_nodes(tmp_path)),
+            patch("griptape_nodes.servers.static.STATIC_SERVER_MAX_UPLOAD_BYTES", 4),
+            pytest.raises(HTTPException) as exc_info,
+        ):
+            await _create_static_file(request, "image.png")
+
+        assert exc_info.value.status_code == 413  # noqa: PLR2004
+        assert not (tmp_path / "image.png").exists()
+
+
+class TestListStaticFiles:
+    """Test _list_static_files() pagination."""
+
+    @pytest.mark.asyncio
+    async def test_pages_through_directory(self, tmp_path: Path) -> None:
+        for name in ["outputs/a.png", "outputs/b.png", "outputs_old/c.png", "d.png"]:
+            (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / name).write_bytes(b"x")
+
+        with patch("griptape_nodes.servers.static.GriptapeNodes", _griptape_nodes(tmp_path)):
+            first = await _list_static_files("outputs", limit=1)
+            second = await _list_static_files("outputs", cursor=first["next_cursor"], limit=1)
+
+        assert first == {"files": ["outputs/a.png"], "next_cursor": "outputs/a.png"}
+        assert second == {"files": ["outputs/b.png"], "next_cursor": None}
+
+    @pytest.mark.asyncio
+    async def test_uploads_appear_without_refresh(self, tmp_path: Path) -> None:
+        with patch("griptape_nodes.servers.static.GriptapeNodes", _griptape_nodes(tmp_path)):
+            assert (await _list_static_files())["files"] == []
+            await _create_static_file(_upload_request([b"x"]), "new.png")
+            listing = await _list_static_files()
+
+        assert listing["files"] == ["new.png"]
+
+    @pytest.mark.asyncio
+    async def test_lists_every_file_without_cursor_or_limit(self, tmp_path: Path) -> None:
+        for index in range(3):
+            (tmp_path / f"{index}.png").write_bytes(b"x")
+
+        with (
+            patch("griptape_nodes.servers.static.GriptapeNodes", _griptape_nodes(tmp_path)),
+            patch("griptape_nodes.servers.static.DEFAULT_LIST_PAGE_SIZE", 1),
+        ):
+            listing = await _list_static_files()
+
+        assert listing == {"files": ["0.png", "1.png", "2.png"], "next_cursor": None}
+
+    @pytest.mark.asyncio
+    async def test_partial_uploads_are_not_listed(self, tmp_path: Path) -> None:
+        (tmp_path / ".new.png.0123.upload").write_bytes(b"x")
+
+        with patch("griptape_nodes.servers.static.GriptapeNodes", _griptape_nodes(tmp_path)):
+            assert (await _list_static_files(refresh=True))["files"] == []
+            await _create_static_file(_upload_request([b"x"]), "new.png")
+            listing = await _list_static_files()
+
+        assert listing["files"] == ["new.png"]
@@ -0,0 +1,23 @@
+"""Tests for the lazy re-exports in `griptape_nodes.utils`."""
+
+import subprocess
+import sys
+
+
+class TestLazyReexports:
+    def test_importing_a_submodule_does_not_load_the_reexported_helpers(self) -> None:
+        code = (
+            "import sys\n"
+            "import griptape_nodes.utils.image_preview_rendering\n"
+            "print(sorted(name for name in ('httpx', 'requests', 'rich', 'click') if name in sys.modules))\n"
+        )
+
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+
+        assert result.stdout.strip() == "[]"
+
+    def test_reexported_helpers_resolve_on_access(self) -> None:
+        from griptape_nodes.utils import install_file_url_support
+        from griptape_nodes.utils.http_file_patch import install_file_url_support as direct
+
+        assert install_file_url_support is direct
@@ -0,0 +1,108 @@
+"""Unit tests for sync_bridge module."""
+
+# ruff: noqa: PLR2004
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from contextvars import ContextVar
+
+import pytest
+
+from griptape_nodes.utils.sync_bridge import SyncBridge
+
+_probe_var: ContextVar[str] = ContextVar("_probe_var", default="unset")
+
+
+class TestSyncBridge:
+    def test_reuses_one_loop_for_sequential_calls(self) -> None:
+        bridge = SyncBridge()
+
+        async def current_loop() -> asyncio.AbstractEventLoop:
+            return asyncio.get_running_loop()
+
+        try:
+            loops = {bridge.run(current_loop()) for _ in range(5)}
+        finally:
+            bridge.close()
+
+        assert len(loops) == 1
+        assert bridge.stats().loops_started == 1
+
+    def test_nested_call_runs_on_another_loop(self) -> None:
+        bridge = SyncBridge()
+
+        async def inner() -> asyncio.AbstractEventLoop:
+            return asyncio.get_running_loop()
+
+        async def outer() -> tuple[asyncio.AbstractEventLoop, asyncio.AbstractEventLoop]:
+            return asyncio.get_running_loop(), bridge.run(inner())
+
+        try:
+            outer_loop, inner_loop = bridge.run(outer())
+        finally:
+            bridge.close()
+
+        assert outer_loop is not inner_loop
+        assert bridge.stats().loops_started == 2
+
+    def test_concurrent_callers_do_not_share_a_loop(self) -> None:
+        bridge = SyncBridge()
+        barrier = threading.Barrier(2)
+        loops: list[asyncio.AbstractEventLoop] = []
+
+        async def wait_for_peer() -> None:
+            loops.append(asyncio.get_running_loop())
+            await asyncio.to_thread(barrier.wait, 5)
+
+        threads = [threading.Thread(target=bridge.run, args=(wait_for_peer(),)) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+        bridge.close()
+
+        assert len(set(loops)) == 2
+
+    def test_propagates_exceptions_and_context(self) -> None:
+        bridge = SyncBridge()
+
+        async def read_var() -> str:
+            return _probe_var.get()
+
+        async def fail() -> None:
+            msg = "boom"
+            raise ValueError(msg)
+
+        token = _probe_var.set("caller")
+        try:
+            assert bridge.run(read_var()) == "caller"
+            with pytest.raises(ValueError, match="boom"):
+                bridge.run(fail())
+        finally:
+            _probe_var.reset(token)
+            bridge.close()
+
+        assert bridge.stats().calls == 2
+
+    def test_records_latency_metrics(self) -> None:
+        bridge = SyncBridge()
+
+        async def nap() -> None:
+            await asyncio.sleep(0.01)
+
+        try:
+            bridge.run(nap())
+            bridge.run(nap())
+            stats = bridge.stats()
+            bridge.reset_stats()
+        finally:
+            bridge.close()
+
+        assert stats.calls == 2
+        assert stats.total_s >= 0.02
+        assert stats.max_total_s >= 0.01
+        assert 0 <= stats.dispatch_s < stats.total_s
+        assert stats.mean_total_s == pytest.approx(stats.total_s / 2)
+        assert bridge.stats().calls == 0
@@ -8,7 +8,17 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from griptape_nodes.utils.uv_utils import find_uv_bin, is_venv_functional, venv_python_path
+from griptape_nodes.utils.uv_utils import (
+    DEPENDENCY_FINGERPRINT_FILE_NAME,
+    DependencyFingerprint,
+    clear_dependency_fingerprint,
+    compute_dependency_fingerprint,
+    find_uv_bin,
+    is_venv_functional,
+    read_dependency_fingerprint,
+    venv_python_path,
+    write_dependency_fingerprint,
+)
 
 
 @pytest.mark.skipif(
@@ -172,3 +182,43 @@ class TestIsVenvFunctional:
         _make_functional_venv(venv_path)
 
         assert is_venv_functional(venv_path) is True
+
+
+class TestDependencyFingerprint:
+    """Test recording and comparing dependency installs in a venv."""
+
+    def test_fingerprint_changes_with_dependencies_flags_and_venv(self, tmp_path: Path) -> None:
+        venv_path = tmp_path / ".venv"
+        base = compute_dependency_fingerprint(["numpy==2.0"], [], venv_path)
+
+        assert compute_dependency_fingerprint(["numpy==2.0"], [], venv_path) == base
+        assert compute_dependency_fingerprint(["numpy==2.1"], [], venv_path) != base
+        assert compute_dependency_fingerprint(["numpy==2.0"], ["--pre"], venv_path) != base
+        assert compute_dependency_fingerprint(["numpy==2.0"], [], tmp_path / "other") != base
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        recorded = DependencyFingerprint(fingerprint="abc", install_duration_s=12.5)
+        write_dependency_fingerprint(tmp_path, "lib_a", recorded)
+
+        assert read_dependency_fingerprint(tmp_path, "lib_a") == recorded
+
+        clear_dependency_fingerprint(tmp_path, "lib_a")
+        assert read_dependency_fingerprint(tmp_path, "lib_a") is None
+
+    def test_libraries_sharing_a_venv_keep_their_own_fingerprints(self, tmp_path: Path) -> None:
+        recorded_a = DependencyFingerprint(fingerprint="abc", install_duration_s=12.5)
+        recorded_b = DependencyFingerprint(fingerprint="def", install_duration_s=3.0)
+        write_dependency_fingerprint(tmp_path, "lib_a", recorded_a)
+        write_dependency_fingerprint(tmp_path, "lib_b", recorded_b)
+
+        assert read_dependency_fingerprint(tmp_path, "lib_a") == recorded_a
+        assert read_dependency_fingerprint(tmp_path, "lib_b") == recorded_b
+
+        clear_dependency_fingerprint(tmp_path, "lib_a")
+        assert read_dependency_fingerprint(tmp_path, "lib_a") is None
+        assert read_dependency_fingerprint(tmp_path, "lib_b") == recorded_b
+
+    def test_unreadable_fingerprint_is_ignored(self, tmp_path: Path) -> None:
+        (tmp_path / DEPENDENCY_FINGERPRINT_FILE_NAME).write_text("{not json")
+
+        assert read_dependency_fingerprint(tmp_path, "lib_a") is None